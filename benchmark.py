@@ -0,0 +1,384 @@
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+
+from core.board import Board
+from core.game import BackgammonGame
+from core.rollout import Z_95, jugar_lote, politica_aleatoria
+
+
+# repeticiones de cada medicion (cada una da una muestra de ops/seg)
+REPETICIONES = 7
+
+# segundos que tiene que durar como minimo cada repeticion
+TIEMPO_MINIMO = 0.2
+
+# operaciones maximas por repeticion (corta la calibracion)
+OPERACIONES_MAXIMAS = 1000000
+
+# caida de la mediana frente a la linea base que cuenta como regresion
+TOLERANCIA = 0.25
+
+# archivo donde se guarda la ultima corrida
+LINEA_BASE = "benchmark_base.json"
+
+# juegos que se preparan juntos para medir hacer_movimiento
+JUEGOS_POR_TANDA = 1000
+
+# version del trabajo de cada medicion (1 si no esta); se sube cuando la
+# medicion cambia lo que hace y la linea base guardada ya no se puede
+# comparar. partidas 2: las negras ya sacan fichas con un dado mayor y los
+# bots no pierden movimientos rechazados, asi las partidas son mas largas
+VERSIONES = {"partidas": 2}
+
+
+def __juego_inicial__(dados):
+    """
+    Crea un juego en la posicion inicial con dados puestos a mano.
+    
+    Recibe: Lista de valores de dados
+    Hace: Crea el juego y le carga los movimientos disponibles
+    Devuelve: BackgammonGame
+    """
+    juego = BackgammonGame("Blanco", "Negro")
+    juego.get_movimientos_disponibles().extend(dados)
+    return juego
+
+
+def medir_construir_tablero(cantidad):
+    """
+    Mide la creacion de tableros.
+    
+    Recibe: Cantidad de operaciones (int)
+    Hace: Crea esa cantidad de Board()
+    Devuelve: Float con los segundos que tardo
+    """
+    inicio = time.perf_counter()
+    veces = 0
+    while veces < cantidad:
+        Board()
+        veces = veces + 1
+    return time.perf_counter() - inicio
+
+
+def medir_puede_hacer_movimiento(cantidad):
+    """
+    Mide la validacion de un movimiento.
+    
+    Recibe: Cantidad de operaciones (int)
+    Hace: Recorre los puntos 0 a 24 con un 6 y un 1 en la posicion inicial
+    Devuelve: Float con los segundos que tardo
+    """
+    juego = __juego_inicial__([6, 1])
+    consultas = []
+    for punto in range(0, 25):
+        consultas.append((punto, 6))
+        consultas.append((punto, 1))
+    
+    inicio = time.perf_counter()
+    veces = 0
+    while veces < cantidad:
+        origen, dado = consultas[veces % len(consultas)]
+        juego.puede_hacer_movimiento(origen, dado)
+        veces = veces + 1
+    return time.perf_counter() - inicio
+
+
+def medir_puede_hacer_algun_movimiento(cantidad):
+    """
+    Mide la busqueda de algun movimiento posible.
+    
+    Recibe: Cantidad de operaciones (int)
+    Hace: Pregunta en la posicion inicial con un 6 y un 5
+    Devuelve: Float con los segundos que tardo
+    """
+    juego = __juego_inicial__([6, 5])
+    
+    inicio = time.perf_counter()
+    veces = 0
+    while veces < cantidad:
+        juego.puede_hacer_algun_movimiento()
+        veces = veces + 1
+    return time.perf_counter() - inicio
+
+
+def medir_hacer_movimiento(cantidad):
+    """
+    Mide la ejecucion de un movimiento.
+    
+    Recibe: Cantidad de operaciones (int)
+    Hace: Prepara tandas de juegos iguales fuera del tiempo medido y en
+          cada uno mueve del 8 con un 3
+    Devuelve: Float con los segundos que tardo
+    """
+    foto = __juego_inicial__([3, 1]).snapshot()
+    total = 0.0
+    restantes = cantidad
+    while restantes > 0:
+        tanda = min(JUEGOS_POR_TANDA, restantes)
+        juegos = []
+        while len(juegos) < tanda:
+            juegos.append(BackgammonGame.from_snapshot(foto))
+        
+        inicio = time.perf_counter()
+        for juego in juegos:
+            juego.hacer_movimiento(8, 3)
+        total = total + time.perf_counter() - inicio
+        restantes = restantes - tanda
+    return total
+
+
+def medir_verificar_victoria(cantidad):
+    """
+    Mide la verificacion de victoria.
+    
+    Recibe: Cantidad de operaciones (int)
+    Hace: La llama en la posicion inicial (nadie gano)
+    Devuelve: Float con los segundos que tardo
+    """
+    juego = __juego_inicial__([])
+    
+    inicio = time.perf_counter()
+    veces = 0
+    while veces < cantidad:
+        juego.verificar_victoria()
+        veces = veces + 1
+    return time.perf_counter() - inicio
+
+
+def medir_partidas(cantidad):
+    """
+    Mide partidas completas entre dos jugadores al azar.
+    
+    Recibe: Cantidad de partidas (int)
+    Hace: Las juega con jugar_lote y una semilla fija, asi cada repeticion
+          juega las mismas partidas
+    Devuelve: Float con los segundos que tardo
+    """
+    juego = BackgammonGame("Blanco", "Negro")
+    
+    inicio = time.perf_counter()
+    jugar_lote(juego, cantidad, 0, politica_aleatoria)
+    return time.perf_counter() - inicio
+
+
+# mediciones disponibles, en el orden en que se corren
+MEDICIONES = {
+    "construir_tablero": medir_construir_tablero,
+    "puede_hacer_movimiento": medir_puede_hacer_movimiento,
+    "puede_hacer_algun_movimiento": medir_puede_hacer_algun_movimiento,
+    "hacer_movimiento": medir_hacer_movimiento,
+    "verificar_victoria": medir_verificar_victoria,
+    "partidas": medir_partidas,
+}
+
+
+def calibrar(medicion, tiempo_minimo=TIEMPO_MINIMO):
+    """
+    Elige cuantas operaciones hace cada repeticion.
+    
+    Recibe: Funcion de medicion y tiempo minimo (float)
+    Hace: Arranca con una operacion y va agrandando la cantidad segun lo
+          que tardo hasta pasar el tiempo minimo
+    Devuelve: Integer con la cantidad de operaciones
+    """
+    cantidad = 1
+    while cantidad < OPERACIONES_MAXIMAS:
+        segundos = medicion(cantidad)
+        if segundos >= tiempo_minimo:
+            break
+        if segundos <= 0:
+            factor = 10
+        else:
+            factor = min(10, max(2, int(math.ceil(tiempo_minimo * 1.2 / segundos))))
+        cantidad = min(OPERACIONES_MAXIMAS, cantidad * factor)
+    return cantidad
+
+
+def resumir(muestras, operaciones):
+    """
+    Calcula el resumen estadistico de las muestras.
+    
+    Recibe: Lista de ops/seg (floats) y operaciones por repeticion (int)
+    Hace: Calcula media, mediana, desvio, extremos y el intervalo del 95%
+          de la media con la aproximacion normal
+    Devuelve: Diccionario con repeticiones, operaciones, media, mediana,
+              desvio, minimo, maximo e intervalo [minimo, maximo]
+    """
+    media = statistics.mean(muestras)
+    if len(muestras) > 1:
+        desvio = statistics.stdev(muestras)
+    else:
+        desvio = 0.0
+    margen = Z_95 * desvio / math.sqrt(len(muestras))
+    return {"repeticiones": len(muestras), "operaciones": operaciones,
+            "media": media, "mediana": statistics.median(muestras), "desvio": desvio,
+            "minimo": min(muestras), "maximo": max(muestras),
+            "intervalo": [media - margen, media + margen]}
+
+
+def medir(medicion, repeticiones=REPETICIONES, tiempo_minimo=TIEMPO_MINIMO):
+    """
+    Mide una operacion varias veces.
+    
+    Recibe: Funcion de medicion, repeticiones (int) y tiempo minimo (float)
+    Hace: Calibra la cantidad de operaciones y repite la medicion
+    Devuelve: Diccionario de resumir con las ops/seg
+    """
+    cantidad = calibrar(medicion, tiempo_minimo)
+    muestras = []
+    while len(muestras) < repeticiones:
+        segundos = medicion(cantidad)
+        muestras.append(cantidad / max(segundos, 1e-9))
+    return resumir(muestras, cantidad)
+
+
+def correr(nombres=None, repeticiones=REPETICIONES, tiempo_minimo=TIEMPO_MINIMO, salida=None):
+    """
+    Corre las mediciones pedidas.
+    
+    Recibe: Lista de nombres (None para todas), repeticiones (int), tiempo
+            minimo (float) y funcion de salida opcional para ir mostrando
+            cada resultado
+    Hace: Mide cada una en el orden de MEDICIONES
+    Devuelve: Diccionario nombre -> resumen
+    """
+    resultados = {}
+    for nombre, medicion in MEDICIONES.items():
+        if nombres != None and nombre not in nombres:
+            continue
+        resultados[nombre] = medir(medicion, repeticiones, tiempo_minimo)
+        if salida != None:
+            salida(formatear(nombre, resultados[nombre]))
+    return resultados
+
+
+def formatear(nombre, resumen):
+    """
+    Arma la linea de un resultado.
+    
+    Recibe: Nombre de la medicion y su resumen
+    Hace: Muestra la mediana, la media con su intervalo y el desvio
+    Devuelve: String
+    """
+    margen = resumen["intervalo"][1] - resumen["media"]
+    return "%-30s %14.1f ops/seg (media %.1f +- %.1f, desvio %.1f, %d x %d)" % (
+        nombre, resumen["mediana"], resumen["media"], margen, resumen["desvio"],
+        resumen["repeticiones"], resumen["operaciones"])
+
+
+def cargar_linea_base(ruta):
+    """
+    Lee la linea base guardada.
+    
+    Recibe: Ruta del archivo JSON
+    Hace: Lo carga si existe y descarta las mediciones guardadas con otra
+          version que la de VERSIONES, asi se vuelven a medir
+    Devuelve: Diccionario nombre -> resumen, o None si no hay archivo
+    """
+    if not os.path.exists(ruta):
+        return None
+    with open(ruta, encoding="utf-8") as archivo:
+        resultados = json.load(archivo)["resultados"]
+    
+    vigentes = {}
+    for nombre, resumen in resultados.items():
+        if resumen.get("version", 1) == VERSIONES.get(nombre, 1):
+            vigentes[nombre] = resumen
+    return vigentes
+
+
+def guardar_linea_base(ruta, resultados):
+    """
+    Guarda los resultados como nueva linea base.
+    
+    Recibe: Ruta del archivo JSON y diccionario nombre -> resumen
+    Hace: Anota la version de cada medicion y lo escribe junto con la
+          version de Python y la maquina
+    Devuelve: Nada
+    """
+    for nombre, resumen in resultados.items():
+        resumen["version"] = VERSIONES.get(nombre, 1)
+    datos = {"python": platform.python_version(), "maquina": platform.platform(),
+             "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"), "resultados": resultados}
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo, indent=2, sort_keys=True)
+        archivo.write("\n")
+
+
+def comparar(resultados, base, tolerancia=TOLERANCIA):
+    """
+    Busca regresiones contra la linea base.
+    
+    Recibe: Resultados actuales, linea base y tolerancia (float, por
+            ejemplo 0.25 permite hasta un 25% menos de ops/seg)
+    Hace: Compara las medianas de las mediciones que estan en los dos
+    Devuelve: Lista de tuplas (nombre, mediana_actual, mediana_base,
+              cambio relativo) de las que cayeron mas que la tolerancia
+    """
+    regresiones = []
+    for nombre, resumen in resultados.items():
+        if nombre not in base:
+            continue
+        anterior = base[nombre]["mediana"]
+        actual = resumen["mediana"]
+        if anterior > 0 and actual < anterior * (1.0 - tolerancia):
+            regresiones.append((nombre, actual, anterior, actual / anterior - 1.0))
+    return regresiones
+
+
+def main(argumentos=None):
+    """
+    Punto de entrada cuando se ejecuta `python -m benchmark`.
+    
+    Mide las operaciones del motor, compara con la linea base y, si no
+    hubo regresiones, la reemplaza con esta corrida. Devuelve 1 si alguna
+    medicion cayo mas que la tolerancia.
+    """
+    parser = argparse.ArgumentParser(description="Mide la velocidad del motor de Backgammon")
+    parser.add_argument("--solo", action="append", choices=list(MEDICIONES),
+                        help="medir solo esta operacion (se puede repetir)")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES,
+                        help="muestras por medicion")
+    parser.add_argument("--tiempo-minimo", type=float, default=TIEMPO_MINIMO,
+                        help="segundos minimos por muestra")
+    parser.add_argument("--linea-base", default=LINEA_BASE,
+                        help="archivo JSON con la corrida anterior")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA,
+                        help="caida relativa permitida de la mediana")
+    parser.add_argument("--no-guardar", action="store_true",
+                        help="no reemplazar la linea base")
+    opciones = parser.parse_args(argumentos)
+    
+    base = cargar_linea_base(opciones.linea_base)
+    resultados = correr(opciones.solo, opciones.repeticiones, opciones.tiempo_minimo, print)
+    
+    if base == None:
+        print("sin linea base en " + opciones.linea_base)
+        regresiones = []
+    else:
+        regresiones = comparar(resultados, base, opciones.tolerancia)
+    
+    if len(regresiones) > 0:
+        for nombre, actual, anterior, cambio in regresiones:
+            print("REGRESION: %s %.1f ops/seg contra %.1f (%+.1f%%)" % (
+                nombre, actual, anterior, cambio * 100), file=sys.stderr)
+        # la linea base no se toca, asi la regresion sigue fallando
+        return 1
+    
+    if opciones.no_guardar == False:
+        if base != None:
+            # se conservan las mediciones que no se corrieron esta vez
+            base.update(resultados)
+            resultados = base
+        guardar_linea_base(opciones.linea_base, resultados)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,15 +10,27 @@ class CLI:
     Devuelve: Nada
     """
     
-    def __init__(self):
+    def __init__(self, bot=None, salida=None, entrada=None, redibujar=True, dados=None):
         """
         Inicializa la interfaz CLI.
         
-        Recibe: Nada
-        Hace: Crea el atributo juego vacío
+        Recibe: Bot (SearchBot) opcional que juega con las fichas negras,
+                funciones opcionales para escribir una línea (en lugar de
+                print) y para pedir una respuesta (en lugar de input), si se
+                muestra el tablero después de cada comando (bool) y dados
+                (Dice) opcionales para los juegos nuevos
+        Hace: Crea el atributo juego vacío y guarda la configuración
         Devuelve: Nada
         """
         self.__juego__ = None
+        self.__bot__ = bot
+        self.__salida__ = salida
+        self.__entrada__ = entrada
+        self.__redibujar__ = redibujar
+        self.__dados__ = dados
+        
+        # comandos que fallaron (para el código de salida del modo batch)
+        self.__errores__ = 0
 
     def __get_juego_privado(self):
         """
@@ -34,6 +46,51 @@ class CLI:
 
     _CLI__juego__ = property(__get_juego_privado, __set_juego_privado)
     
+    def escribir(self, texto):
+        """
+        Escribe una línea de salida.
+        
+        Recibe: String
+        Hace: Usa la función de salida si se pasó una, si no print
+        Devuelve: Nada
+        """
+        if self.__salida__ == None:
+            print(texto)
+        else:
+            self.__salida__(texto)
+    
+    def leer(self, mensaje):
+        """
+        Pide una respuesta al usuario.
+        
+        Recibe: String con el mensaje a mostrar
+        Hace: Usa la función de entrada si se pasó una, si no input
+        Devuelve: String con la respuesta
+        """
+        if self.__entrada__ == None:
+            return input(mensaje)
+        return self.__entrada__(mensaje)
+    
+    def get_errores(self):
+        """
+        Obtiene la cantidad de comandos que fallaron.
+        
+        Recibe: Nada
+        Hace: Devuelve el contador
+        Devuelve: Integer
+        """
+        return self.__errores__
+    
+    def get_juego(self):
+        """
+        Obtiene el juego en curso.
+        
+        Recibe: Nada
+        Hace: Devuelve el juego guardado
+        Devuelve: BackgammonGame o None si no hay juego
+        """
+        return self.__juego__
+    
     def mostrar_bienvenida(self):
         """
         Muestra el mensaje de bienvenida.
@@ -42,16 +99,16 @@ class CLI:
         Hace: Imprime las reglas básicas del juego
         Devuelve: Nada
         """
-        print("=" * 50)
-        print("          BIENVENIDO AL BACKGAMMON")
-        print("=" * 50)
-        print("Reglas básicas:")
-        print("- Cada jugador tiene 15 fichas")
-        print("- El objetivo es sacar todas las fichas del tablero")
-        print("- Los dados determinan cuánto puedes mover")
-        print("- Si sacas dobles, juegas 4 movimientos")
-        print("- Puedes capturar fichas enemigas solitarias")
-        print("=" * 50)
+        self.escribir("=" * 50)
+        self.escribir("          BIENVENIDO AL BACKGAMMON")
+        self.escribir("=" * 50)
+        self.escribir("Reglas básicas:")
+        self.escribir("- Cada jugador tiene 15 fichas")
+        self.escribir("- El objetivo es sacar todas las fichas del tablero")
+        self.escribir("- Los dados determinan cuánto puedes mover")
+        self.escribir("- Si sacas dobles, juegas 4 movimientos")
+        self.escribir("- Puedes capturar fichas enemigas solitarias")
+        self.escribir("=" * 50)
     
     def obtener_nombres_jugadores(self):
         """
@@ -61,15 +118,15 @@ class CLI:
         Hace: Solicita por teclado los nombres
         Devuelve: Tupla con (nombre1, nombre2) como strings
         """
-        print("\nConfigurando jugadores...")
+        self.escribir("\nConfigurando jugadores...")
         
         # pedir nombre del jugador 1
-        nombre1 = input("Nombre del Jugador 1 (fichas blancas): ")
+        nombre1 = self.leer("Nombre del Jugador 1 (fichas blancas): ")
         if nombre1 == "":
             nombre1 = "Jugador 1"
         
         # pedir nombre del jugador 2
-        nombre2 = input("Nombre del Jugador 2 (fichas negras): ")
+        nombre2 = self.leer("Nombre del Jugador 2 (fichas negras): ")
         if nombre2 == "":
             nombre2 = "Jugador 2"
         
@@ -83,12 +140,29 @@ class CLI:
         Hace: Inicializa el juego con los nombres ingresados
         Devuelve: Nada
         """
-        nombre1, nombre2 = self.obtener_nombres_jugadores()
-        self.__juego__ = BackgammonGame(nombre1, nombre2)
+        if self.__bot__ != None:
+            # contra la computadora solo se pide el nombre del jugador 1
+            nombre1 = self.leer("Nombre del Jugador 1 (fichas blancas): ")
+            if nombre1 == "":
+                nombre1 = "Jugador 1"
+            nombre2 = "Computadora"
+        else:
+            nombre1, nombre2 = self.obtener_nombres_jugadores()
+        self.nuevo_juego(nombre1, nombre2)
+    
+    def nuevo_juego(self, nombre1, nombre2):
+        """
+        Crea un juego con nombres ya conocidos.
+        
+        Recibe: Nombres de los dos jugadores (strings)
+        Hace: Crea el juego y anuncia quién juega con cada color
+        Devuelve: Nada
+        """
+        self.__juego__ = BackgammonGame(nombre1, nombre2, self.__dados__)
         
-        print("\n¡Juego creado! " + nombre1 + " vs " + nombre2)
-        print(nombre1 + " juega con fichas blancas (B)")
-        print(nombre2 + " juega con fichas negras (N)")
+        self.escribir("\n¡Juego creado! " + nombre1 + " vs " + nombre2)
+        self.escribir(nombre1 + " juega con fichas blancas (B)")
+        self.escribir(nombre2 + " juega con fichas negras (N)")
     
     def mostrar_tablero(self):
         """
@@ -99,14 +173,25 @@ class CLI:
         Devuelve: Nada
         """
         if self.__juego__ == None:
-            print("No hay juego en curso.")
+            self.escribir("No hay juego en curso.")
             return
         
-        print("\n" + "=" * 60)
+        self.escribir("\n" + "=" * 60)
         # mostrar el tablero usando el metodo str del juego
         tablero_texto = str(self.__juego__)
-        print(tablero_texto)
-        print("=" * 60)
+        self.escribir(tablero_texto)
+        self.escribir("=" * 60)
+    
+    def redibujar(self):
+        """
+        Muestra el tablero después de un comando, si está activado.
+        
+        Recibe: Nada
+        Hace: Llama a mostrar_tablero salvo que se haya pedido no redibujar
+        Devuelve: Nada
+        """
+        if self.__redibujar__ == True:
+            self.mostrar_tablero()
     
     def mostrar_ayuda(self):
         """
@@ -116,16 +201,17 @@ class CLI:
         Hace: Imprime la lista de comandos
         Devuelve: Nada
         """
-        print("\nCOMANDOS DISPONIBLES:")
-        print("tirar - Tira los dados para tu turno")
-        print("mover [origen] [dado] - Mueve una ficha")
-        print("  Ejemplo: mover 13 5")
-        print("  Para sacar de la barra: mover 0 3")
-        print("estado - Muestra información del juego")
-        print("tablero - Muestra el tablero")
-        print("pasar - Termina tu turno (si no puedes mover)")
-        print("ayuda - Muestra esta ayuda")
-        print("salir - Termina el juego")
+        self.escribir("\nCOMANDOS DISPONIBLES:")
+        self.escribir("tirar - Tira los dados para tu turno")
+        self.escribir("mover [origen] [dado] - Mueve una ficha")
+        self.escribir("  Ejemplo: mover 13 5")
+        self.escribir("  Para sacar de la barra: mover 0 3")
+        self.escribir("estado - Muestra información del juego")
+        self.escribir("tablero - Muestra el tablero")
+        self.escribir("pasar - Termina tu turno (si no puedes mover)")
+        self.escribir("nuevo [nombre1] [nombre2] - Empieza otro juego")
+        self.escribir("ayuda - Muestra esta ayuda")
+        self.escribir("salir - Termina el juego")
     
     def mostrar_estado(self):
         """
@@ -136,37 +222,37 @@ class CLI:
         Devuelve: Nada
         """
         if self.__juego__ == None:
-            print("No hay juego en curso.")
+            self.escribir("No hay juego en curso.")
             return
         
         # obtener el estado del juego
         estado = self.__juego__.get_estado_juego()
         
-        print("\n--- ESTADO DEL JUEGO ---")
+        self.escribir("\n--- ESTADO DEL JUEGO ---")
         
         # mostrar de quien es el turno
         jugador_actual = estado.get("jugador_actual", "desconocido")
         color_actual = estado.get("color_actual", "?")
-        print("Turno de: " + jugador_actual + " (" + color_actual + ")")
+        self.escribir("Turno de: " + jugador_actual + " (" + color_actual + ")")
         
         # mostrar movimientos disponibles
         movimientos = estado.get("movimientos_disponibles", [])
         if len(movimientos) > 0:
-            print("Movimientos disponibles: " + str(movimientos))
+            self.escribir("Movimientos disponibles: " + str(movimientos))
         else:
-            print("Tira los dados para comenzar tu turno")
+            self.escribir("Tira los dados para comenzar tu turno")
         
         # mostrar fichas sacadas
-        print("\nFichas sacadas:")
+        self.escribir("\nFichas sacadas:")
         fichas_j1 = estado.get("fichas_sacadas_j1", 0)
         fichas_j2 = estado.get("fichas_sacadas_j2", 0)
         nombre_j1 = self.__juego__.get_jugador1().get_nombre()
         nombre_j2 = self.__juego__.get_jugador2().get_nombre()
-        print("  " + nombre_j1 + ": " + str(fichas_j1) + "/15")
-        print("  " + nombre_j2 + ": " + str(fichas_j2) + "/15")
+        self.escribir("  " + nombre_j1 + ": " + str(fichas_j1) + "/15")
+        self.escribir("  " + nombre_j2 + ": " + str(fichas_j2) + "/15")
         
         # mostrar fichas en barra
-        print("\nFichas en la barra:")
+        self.escribir("\nFichas en la barra:")
         barra_j1 = estado.get("fichas_en_barra_j1", False)
         barra_j2 = estado.get("fichas_en_barra_j2", False)
         
@@ -180,8 +266,32 @@ class CLI:
         else:
             texto_barra_j2 = "NO"
             
-        print("  " + nombre_j1 + ": " + texto_barra_j1)
-        print("  " + nombre_j2 + ": " + texto_barra_j2)
+        self.escribir("  " + nombre_j1 + ": " + texto_barra_j1)
+        self.escribir("  " + nombre_j2 + ": " + texto_barra_j2)
+    
+    def comando_nuevo(self, comando_completo):
+        """
+        Procesa el comando nuevo.
+        
+        Recibe: String con el comando completo
+        Hace: Crea un juego con los nombres dados (o los de siempre); contra
+              la computadora el jugador 2 es siempre ella
+        Devuelve: Nada
+        """
+        partes = comando_completo.split()
+        
+        nombre1 = "Jugador 1"
+        if len(partes) > 1:
+            nombre1 = partes[1]
+        
+        nombre2 = "Jugador 2"
+        if self.__bot__ != None:
+            nombre2 = "Computadora"
+        elif len(partes) > 2:
+            nombre2 = partes[2]
+        
+        self.nuevo_juego(nombre1, nombre2)
+        self.redibujar()
     
     def comando_tirar(self):
         """
@@ -194,28 +304,29 @@ class CLI:
         # verificar si ya se tiraron los dados
         movimientos = self.__juego__.get_movimientos_disponibles()
         if len(movimientos) > 0:
-            print("Ya tiraste los dados este turno. Usa tus movimientos o pasa el turno.")
-            self.mostrar_tablero()
+            self.escribir("Ya tiraste los dados este turno. Usa tus movimientos o pasa el turno.")
+            self.__errores__ = self.__errores__ + 1
+            self.redibujar()
             return
         
         # tirar los dados
         resultado = self.__juego__.tirar_dados()
-        print("\n¡Dados tirados! Resultado: " + str(resultado))
+        self.escribir("\n¡Dados tirados! Resultado: " + str(resultado))
         
         # verificar si son dobles
         dados = self.__juego__.get_dados()
         if dados.es_doble() == True:
-            print("¡DOBLES! Tienes 4 movimientos.")
+            self.escribir("¡DOBLES! Tienes 4 movimientos.")
         else:
-            print("Tienes 2 movimientos.")
+            self.escribir("Tienes 2 movimientos.")
         
         # verificar si hay movimientos posibles
         puede_mover = self.__juego__.puede_hacer_algun_movimiento()
         if puede_mover == False:
-            print("No hay movimientos válidos disponibles. Turno terminado.")
+            self.escribir("No hay movimientos válidos disponibles. Turno terminado.")
             self.__juego__.terminar_turno()
         
-        self.mostrar_tablero()
+        self.redibujar()
     
     def comando_mover(self, comando_completo):
         """
@@ -230,9 +341,10 @@ class CLI:
         
         # verificar que tenga 3 partes
         if len(partes) != 3:
-            print("Uso: mover [punto_origen] [valor_dado]")
-            print("Ejemplo: mover 13 5")
-            self.mostrar_tablero()
+            self.escribir("Uso: mover [punto_origen] [valor_dado]")
+            self.escribir("Ejemplo: mover 13 5")
+            self.__errores__ = self.__errores__ + 1
+            self.redibujar()
             return
         
         # convertir a numeros
@@ -240,42 +352,44 @@ class CLI:
             punto_origen = int(partes[1])
             valor_dado = int(partes[2])
         except:
-            print("Los números deben ser enteros válidos.")
-            self.mostrar_tablero()
+            self.escribir("Los números deben ser enteros válidos.")
+            self.__errores__ = self.__errores__ + 1
+            self.redibujar()
             return
         
         # intentar hacer el movimiento
         movimiento_valido = self.__juego__.hacer_movimiento(punto_origen, valor_dado)
         
         if movimiento_valido == True:
-            print("¡Movimiento exitoso! Ficha movida desde punto " + str(punto_origen))
+            self.escribir("¡Movimiento exitoso! Ficha movida desde punto " + str(punto_origen))
             
             # verificar si el juego termino
             if self.__juego__.esta_terminado() == True:
-                self.mostrar_tablero()
+                self.redibujar()
                 ganador = self.__juego__.get_ganador()
-                print("\n¡FELICITACIONES! " + ganador.get_nombre() + " HA GANADO!")
+                self.escribir("\n¡FELICITACIONES! " + ganador.get_nombre() + " HA GANADO!")
                 return
             
             # verificar si quedan movimientos
             movimientos = self.__juego__.get_movimientos_disponibles()
             if len(movimientos) == 0:
-                print("Se agotaron los movimientos. Turno terminado.")
+                self.escribir("Se agotaron los movimientos. Turno terminado.")
                 self.__juego__.terminar_turno()
             else:
                 # verificar si puede hacer algun movimiento
                 puede_mover = self.__juego__.puede_hacer_algun_movimiento()
                 if puede_mover == False:
-                    print("No hay mas movimientos validos. Turno terminado.")
+                    self.escribir("No hay mas movimientos validos. Turno terminado.")
                     self.__juego__.terminar_turno()
         else:
-            print("Movimiento inválido. Verifica:")
-            print("- Que tengas fichas en el punto origen")
-            print("- Que el valor del dado esté disponible")
-            print("- Que el destino no esté bloqueado")
-            print("- Si tienes fichas en la barra, debes sacarlas primero")
-        
-        self.mostrar_tablero()
+            self.escribir("Movimiento inválido. Verifica:")
+            self.escribir("- Que tengas fichas en el punto origen")
+            self.escribir("- Que el valor del dado esté disponible")
+            self.escribir("- Que el destino no esté bloqueado")
+            self.escribir("- Si tienes fichas en la barra, debes sacarlas primero")
+            self.__errores__ = self.__errores__ + 1
+        
+        self.redibujar()
     
     def comando_pasar(self):
         """
@@ -292,14 +406,56 @@ class CLI:
             # verificar si puede hacer algun movimiento
             puede_mover = self.__juego__.puede_hacer_algun_movimiento()
             if puede_mover == True:
-                respuesta = input("Aún tienes movimientos disponibles. ¿Seguro que quieres pasar? (s/n): ")
+                respuesta = self.leer("Aún tienes movimientos disponibles. ¿Seguro que quieres pasar? (s/n): ")
                 if respuesta != 's':
-                    self.mostrar_tablero()
+                    self.redibujar()
                     return
         
-        print("Turno terminado.")
+        self.escribir("Turno terminado.")
         self.__juego__.terminar_turno()
-        self.mostrar_tablero()
+        self.redibujar()
+    
+    def es_turno_computadora(self):
+        """
+        Verifica si le toca jugar a la computadora.
+        
+        Recibe: Nada
+        Hace: Revisa si hay bot y si el jugador actual es el jugador 2
+        Devuelve: Boolean True si juega la computadora, False si no
+        """
+        if self.__bot__ == None or self.__juego__ == None:
+            return False
+        
+        if self.__juego__.esta_terminado() == True:
+            return False
+        
+        return self.__juego__.get_jugador_actual() == self.__juego__.get_jugador2()
+    
+    def turno_computadora(self):
+        """
+        Juega el turno de la computadora.
+        
+        Recibe: Nada
+        Hace: Tira los dados, deja que el bot elija y muestra la jugada
+        Devuelve: Nada
+        """
+        self.escribir("\nTurno de la computadora...")
+        resultado = self.__juego__.tirar_dados()
+        self.escribir("Dados: " + str(resultado))
+        
+        jugada = self.__bot__.jugar_turno(self.__juego__)
+        
+        if len(jugada) == 0:
+            self.escribir("La computadora no tiene movimientos válidos.")
+        else:
+            for origen, dado in jugada:
+                self.escribir("Computadora mueve desde punto " + str(origen) + " con " + str(dado))
+        
+        self.redibujar()
+        
+        if self.__juego__.esta_terminado() == True:
+            ganador = self.__juego__.get_ganador()
+            self.escribir("\n¡FELICITACIONES! " + ganador.get_nombre() + " HA GANADO!")
     
     def procesar_comando(self, comando):
         """
@@ -313,6 +469,9 @@ class CLI:
         if comando == "":
             return True
         
+        # guardar el original (los nombres de "nuevo" respetan mayusculas)
+        original = comando
+        
         # convertir a minusculas
         comando = comando.lower()
         
@@ -324,12 +483,14 @@ class CLI:
             return False
         elif primera_palabra == "ayuda":
             self.mostrar_ayuda()
-            self.mostrar_tablero()
+            self.redibujar()
+        elif primera_palabra == "nuevo":
+            self.comando_nuevo(original)
         elif primera_palabra == "tablero":
             self.mostrar_tablero()
         elif primera_palabra == "estado":
             self.mostrar_estado()
-            self.mostrar_tablero()
+            self.redibujar()
         elif primera_palabra == "tirar":
             self.comando_tirar()
         elif primera_palabra == "mover":
@@ -337,8 +498,9 @@ class CLI:
         elif primera_palabra == "pasar":
             self.comando_pasar()
         else:
-            print("Comando no reconocido. Escribe 'ayuda' para ver los comandos disponibles.")
-            self.mostrar_tablero()
+            self.escribir("Comando no reconocido. Escribe 'ayuda' para ver los comandos disponibles.")
+            self.__errores__ = self.__errores__ + 1
+            self.redibujar()
         
         return True
     
@@ -359,27 +521,65 @@ class CLI:
         
         # mostrar quien empieza
         jugador_inicial = self.__juego__.get_jugador_actual()
-        print("\n¡Que comience " + jugador_inicial.get_nombre() + "!")
+        self.escribir("\n¡Que comience " + jugador_inicial.get_nombre() + "!")
         
         # bucle principal
         continuar = True
         while continuar == True:
             # verificar si el juego termino
             if self.__juego__.esta_terminado() == True:
-                print("\n¡Juego terminado!")
+                self.escribir("\n¡Juego terminado!")
                 break
             
+            # si le toca a la computadora, juega sola
+            if self.es_turno_computadora() == True:
+                self.turno_computadora()
+                continue
+            
             # obtener el jugador actual
             jugador_actual = self.__juego__.get_jugador_actual()
             nombre_jugador = jugador_actual.get_nombre()
             
             # pedir comando
-            comando = input("\n" + nombre_jugador + "> ")
+            comando = self.leer("\n" + nombre_jugador + "> ")
             
             # procesar el comando
             continuar = self.procesar_comando(comando)
         
-        print("Gracias por jugar Backgammon!")
+        self.escribir("Gracias por jugar Backgammon!")
+    
+    def ejecutar_lote(self, lineas, nombre1="Jugador 1", nombre2="Jugador 2"):
+        """
+        Ejecuta comandos sin pedir nada por teclado.
+        
+        Recibe: Iterable de líneas (archivo, stdin o lista) y nombres de los
+                jugadores del juego inicial
+        Hace: Crea el juego, muestra cada comando con su salida, salta las
+              líneas vacías y las que empiezan con '#', juega los turnos de
+              la computadora y corta en "salir"
+        Devuelve: Integer código de salida (0 si todos los comandos
+                  anduvieron, 1 si alguno falló)
+        """
+        if self.__bot__ != None:
+            nombre2 = "Computadora"
+        self.nuevo_juego(nombre1, nombre2)
+        
+        for linea in lineas:
+            comando = linea.strip()
+            if comando == "" or comando.startswith("#"):
+                continue
+            
+            self.escribir("> " + comando)
+            continuar = self.procesar_comando(comando)
+            if continuar == False:
+                break
+            
+            while self.es_turno_computadora() == True:
+                self.turno_computadora()
+        
+        if self.__errores__ > 0:
+            return 1
+        return 0
     
     def iniciar_juego(self):
         """
@@ -0,0 +1,427 @@
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional, solo lo necesita este modulo
+    np = None
+
+
+# cantidad de fichas por jugador
+FICHAS_POR_JUGADOR = 15
+
+# indices de la posicion desde el punto de vista de cada jugador
+SACADAS = 0
+BARRA = 25
+
+# lados del arreglo de posiciones
+BLANCO = 0
+NEGRO = 1
+
+
+def politica_aleatoria(simulador, legales, azar):
+    """
+    Elige al azar un origen legal en cada juego.
+    
+    Recibe: BatchSimulator, arreglo bool (N, 26) de origenes legales y
+            generador de numpy
+    Hace: Da un puntaje al azar a cada origen legal y toma el mayor
+    Devuelve: Arreglo (N,) con el origen elegido (-1 si no hay legales)
+    """
+    puntajes = azar.random(legales.shape)
+    puntajes[~legales] = -1.0
+    elegidos = puntajes.argmax(axis=1)
+    elegidos[~legales.any(axis=1)] = -1
+    return elegidos
+
+
+def politica_carrera(simulador, legales, azar):
+    """
+    Mueve siempre la ficha mas atrasada que pueda moverse.
+    
+    Recibe: BatchSimulator, arreglo bool (N, 26) de origenes legales y
+            generador de numpy (no se usa)
+    Hace: Toma el origen legal de mayor distancia a casa
+    Devuelve: Arreglo (N,) con el origen elegido (-1 si no hay legales)
+    """
+    indices = np.arange(legales.shape[1])
+    puntajes = np.where(legales, indices[None, :], -1)
+    return puntajes.max(axis=1)
+
+
+class BatchSimulator:
+    """
+    Simulador de muchos juegos a la vez con arreglos de numpy.
+    
+    Recibe: Cantidad de juegos, semilla y politica
+    Hace: Guarda N posiciones en un arreglo (N, 2, 26), tira los dados de
+          todos los juegos juntos y aplica las reglas de
+          BackgammonGame.puede_hacer_movimiento y Board.mover_ficha con
+          operaciones vectorizadas, un dado por vez; con dados distintos
+          se juegan los dos siempre que se pueda, en el orden que lo
+          permita, como en MoveGenerator
+    Devuelve: Nada
+    """
+    
+    def __init__(self, cantidad, semilla=None, politica=politica_aleatoria):
+        """
+        Crea los juegos en la posicion inicial.
+        
+        Recibe: Cantidad de juegos (int), semilla (int) y politica (funcion
+                (simulador, legales, azar) -> origenes)
+        Hace: Arma el arreglo de posiciones; cada lado se guarda desde su
+              punto de vista: indice 25 la barra, 1-24 la distancia a su
+              casa y 0 las fichas sacadas
+        Devuelve: Nada
+        """
+        if np is None:
+            raise ImportError("BatchSimulator necesita numpy (pip install numpy)")
+        
+        self.__cantidad__ = cantidad
+        self.__azar__ = np.random.default_rng(semilla)
+        self.__politica__ = politica
+        
+        inicial = np.zeros(26, dtype=np.int8)
+        inicial[24] = 2
+        inicial[13] = 5
+        inicial[8] = 3
+        inicial[6] = 5
+        
+        self.__posiciones__ = np.zeros((cantidad, 2, 26), dtype=np.int8)
+        self.__posiciones__[:, BLANCO] = inicial
+        self.__posiciones__[:, NEGRO] = inicial
+        
+        self.__turno__ = np.zeros(cantidad, dtype=np.int8)
+        self.__ganador__ = np.full(cantidad, -1, dtype=np.int8)
+        self.__puntos__ = np.zeros(cantidad, dtype=np.int8)
+        self.__turnos_jugados__ = 0
+    
+    def get_posiciones(self):
+        """
+        Obtiene el arreglo de posiciones.
+        
+        Recibe: Nada
+        Hace: Devuelve el arreglo (N, 2, 26) sin copiarlo
+        Devuelve: Arreglo de numpy
+        """
+        return self.__posiciones__
+    
+    def get_turno(self):
+        """
+        Obtiene el lado que mueve en cada juego.
+        
+        Recibe: Nada
+        Hace: Devuelve el arreglo de turnos (0 blanco, 1 negro)
+        Devuelve: Arreglo (N,)
+        """
+        return self.__turno__
+    
+    def get_ganador(self):
+        """
+        Obtiene el ganador de cada juego.
+        
+        Recibe: Nada
+        Hace: Devuelve el arreglo de ganadores
+        Devuelve: Arreglo (N,) con 0 blanco, 1 negro o -1 si sigue
+        """
+        return self.__ganador__
+    
+    def get_puntos(self):
+        """
+        Obtiene los puntos ganados en cada juego.
+        
+        Recibe: Nada
+        Hace: Devuelve 1 simple, 2 gammon, 3 backgammon (0 si sigue)
+        Devuelve: Arreglo (N,)
+        """
+        return self.__puntos__
+    
+    def get_turnos_jugados(self):
+        """
+        Obtiene cuantos turnos se jugaron.
+        
+        Recibe: Nada
+        Hace: Devuelve el contador de turnos
+        Devuelve: Integer
+        """
+        return self.__turnos_jugados__
+    
+    def terminados(self):
+        """
+        Indica que juegos terminaron.
+        
+        Recibe: Nada
+        Hace: Compara el ganador con -1
+        Devuelve: Arreglo bool (N,)
+        """
+        return self.__ganador__ >= 0
+    
+    def conteos_tablero(self, juego):
+        """
+        Pasa un juego del simulador a las coordenadas de Board.
+        
+        Recibe: Indice del juego (int)
+        Hace: Arma los conteos con signo (blanco positivo) y las fichas en
+              barra y sacadas de cada color
+        Devuelve: Tupla (conteos de 26, barra dict, sacadas dict)
+        """
+        blanco = self.__posiciones__[juego, BLANCO]
+        negro = self.__posiciones__[juego, NEGRO]
+        
+        conteos = [0] * 26
+        punto = 1
+        while punto <= 24:
+            conteos[punto] = int(blanco[punto]) - int(negro[25 - punto])
+            punto = punto + 1
+        
+        barra = {'blanco': int(blanco[BARRA]), 'negro': int(negro[BARRA])}
+        sacadas = {'blanco': int(blanco[SACADAS]), 'negro': int(negro[SACADAS])}
+        return conteos, barra, sacadas
+    
+    def origenes_legales(self, propias, rivales, dados):
+        """
+        Calcula los origenes desde los que se puede mover con un dado.
+        
+        Recibe: Arreglos (N, 26) del lado que mueve y del rival (cada uno
+                desde su punto de vista) y arreglo (N,) de dados (0 si el
+                juego no mueve)
+        Hace: Aplica las reglas: con fichas en la barra solo se entra,
+              destino bloqueado con 2 o mas fichas rivales, y sacar fichas
+              solo con todas en casa (con dado mayor, desde el punto mas alto)
+        Devuelve: Arreglo bool (N, 26)
+        """
+        cantidad = propias.shape[0]
+        origenes = np.arange(26)
+        
+        # fichas rivales vistas desde el lado que mueve: punto p es 25 - p
+        rival_en = np.zeros((cantidad, 26), dtype=np.int8)
+        rival_en[:, 1:25] = rivales[:, 24:0:-1]
+        
+        destinos = origenes[None, :] - dados[:, None]
+        legales = propias > 0
+        legales[:, SACADAS] = False
+        legales &= (dados > 0)[:, None]
+        
+        # con fichas en la barra solo se puede mover desde la barra
+        en_barra = propias[:, BARRA] > 0
+        legales[en_barra, :BARRA] = False
+        
+        # movimientos dentro del tablero: bloqueado con 2 o mas rivales
+        bloqueado = np.take_along_axis(rival_en, np.clip(destinos, 0, 25), axis=1) >= 2
+        legales &= ~((destinos >= 1) & bloqueado)
+        
+        # sacar fichas: todas en casa y, si sobra dado, desde el mas alto
+        en_casa = propias[:, 7:26].sum(axis=1) == 0
+        ocupados = np.where(propias[:, 1:7] > 0, np.arange(1, 7)[None, :], 0)
+        mas_alto = ocupados.max(axis=1)
+        saca = destinos <= 0
+        permitido = en_casa[:, None] & ((destinos == 0) | (origenes[None, :] == mas_alto[:, None]))
+        legales &= ~saca | permitido
+        
+        return legales
+    
+    def tirar_dados(self):
+        """
+        Tira los dados de todos los juegos juntos.
+        
+        Recibe: Nada
+        Hace: Genera dos dados por juego y arma los 4 movimientos (los dos
+              ultimos en 0 si no son dobles)
+        Devuelve: Arreglo (N, 4) de dados a jugar en orden
+        """
+        tirada = self.__azar__.integers(1, 7, size=(self.__cantidad__, 2), dtype=np.int8)
+        dados = np.zeros((self.__cantidad__, 4), dtype=np.int8)
+        dados[:, 0:2] = tirada
+        dobles = tirada[:, 0] == tirada[:, 1]
+        dados[dobles, 2] = tirada[dobles, 0]
+        dados[dobles, 3] = tirada[dobles, 0]
+        return dados
+    
+    def primer_movimiento(self, dados):
+        """
+        Elige que dado se juega primero y desde donde se puede mover.
+        
+        Recibe: Arreglo (N, 4) de dados de tirar_dados (0 donde no se
+                mueve)
+        Hace: Con dados distintos prueba los dos ordenes: si algun orden
+              usa los dos dados, el primer movimiento tiene que dejar
+              jugar el otro (si los dos ordenes sirven se elige uno al
+              azar); si no, se juega solo el dado mayor o, si no puede
+              moverse, el menor. Deja primero el dado elegido
+        Devuelve: Tupla (dados reordenados (N, 4), origenes legales del
+                  primer movimiento (N, 26))
+        """
+        filas = np.arange(self.__cantidad__)
+        turno = self.__turno__.astype(np.intp)
+        propias = self.__posiciones__[filas, turno]
+        rivales = self.__posiciones__[filas, 1 - turno]
+        
+        dados = dados.copy()
+        distintos = (dados[:, 0] != dados[:, 1]) & (dados[:, 0] > 0)
+        legales = []
+        siguen = []
+        for dado, otro in ((0, 1), (1, 0)):
+            primero = np.where(distintos, dados[:, dado], 0)
+            legales_dado = self.origenes_legales(propias, rivales, primero)
+            
+            # cada movimiento posible se prueba en una copia de su juego
+            juegos, origenes = np.nonzero(legales_dado)
+            copia_propias = propias[juegos]
+            copia_rivales = rivales[juegos]
+            self.__aplicar__(copia_propias, copia_rivales, np.arange(len(juegos)), origenes,
+                             primero[juegos])
+            despues = self.origenes_legales(copia_propias, copia_rivales, dados[juegos, otro])
+            
+            sigue = np.zeros_like(legales_dado)
+            sigue[juegos, origenes] = despues.any(axis=1)
+            legales.append(legales_dado)
+            siguen.append(sigue)
+        
+        ambos = np.stack([siguen[0].any(axis=1), siguen[1].any(axis=1)], axis=1)
+        usa_ambos = ambos.any(axis=1)
+        
+        # si los dos ordenes usan ambos dados se elige uno al azar
+        segundo = ambos[:, 1] & (~ambos[:, 0] | (self.__azar__.random(self.__cantidad__) < 0.5))
+        
+        # si solo se puede jugar un dado, el mayor si puede moverse
+        mayor = np.where(dados[:, 1] > dados[:, 0], 1, 0)
+        puede = np.stack([legales[0].any(axis=1), legales[1].any(axis=1)], axis=1)
+        solo = np.where(puede[filas, mayor], mayor, 1 - mayor)
+        segundo = np.where(usa_ambos, segundo, solo == 1) & distintos
+        
+        dados[segundo, 0:2] = dados[segundo, 1::-1]
+        mascara = self.origenes_legales(propias, rivales, dados[:, 0])
+        mascara[distintos & usa_ambos & ~segundo] = siguen[0][distintos & usa_ambos & ~segundo]
+        mascara[distintos & usa_ambos & segundo] = siguen[1][distintos & usa_ambos & segundo]
+        return dados, mascara
+    
+    def mover(self, dados, legales=None):
+        """
+        Juega un dado en todos los juegos activos.
+        
+        Recibe: Arreglo (N,) de dados (0 donde no se mueve) y arreglo bool
+                (N, 26) opcional de origenes permitidos (si es None se
+                calculan con origenes_legales)
+        Hace: Pide un origen a la politica y hace los movimientos, capturas
+              y fichas sacadas juntos
+        Devuelve: Arreglo bool (N,) de juegos que movieron
+        """
+        filas = np.arange(self.__cantidad__)
+        turno = self.__turno__.astype(np.intp)
+        propias = self.__posiciones__[filas, turno]
+        rivales = self.__posiciones__[filas, 1 - turno]
+        
+        if legales is None:
+            legales = self.origenes_legales(propias, rivales, dados)
+        elegidos = self.__politica__(self, legales, self.__azar__)
+        
+        mueve = elegidos >= 0
+        if not mueve.any():
+            return mueve
+        
+        self.__aplicar__(propias, rivales, filas[mueve], elegidos[mueve], dados[mueve])
+        
+        self.__posiciones__[filas, turno] = propias
+        self.__posiciones__[filas, 1 - turno] = rivales
+        return mueve
+    
+    def __aplicar__(self, propias, rivales, filas, origen, dados):
+        """
+        Hace un movimiento en cada fila pedida.
+        
+        Recibe: Arreglos (K, 26) del lado que mueve y del rival (se
+                modifican), filas que mueven, origen y dado de cada una
+        Hace: Saca la ficha del origen y la pone en el destino, capturando
+              fichas solas, o la cuenta como sacada
+        Devuelve: Nada
+        """
+        destino = origen - dados
+        
+        # sacar la ficha del origen
+        propias[filas, origen] -= 1
+        
+        # fichas que salen del tablero
+        sale = destino <= 0
+        propias[filas[sale], SACADAS] += 1
+        
+        # movimientos dentro del tablero, con captura de fichas solas
+        queda = ~sale
+        filas_queda = filas[queda]
+        destino_queda = destino[queda]
+        punto_rival = 25 - destino_queda
+        captura = rivales[filas_queda, punto_rival] == 1
+        rivales[filas_queda[captura], punto_rival[captura]] = 0
+        rivales[filas_queda[captura], BARRA] += 1
+        propias[filas_queda, destino_queda] += 1
+    
+    def jugar_turno(self):
+        """
+        Juega un turno completo en todos los juegos que siguen.
+        
+        Recibe: Nada
+        Hace: Tira los dados, elige el orden con primer_movimiento, juega
+              cada dado, registra los ganadores con su puntaje y pasa el
+              turno
+        Devuelve: Nada
+        """
+        activos = ~self.terminados()
+        dados = self.tirar_dados()
+        dados[~activos] = 0
+        dados, legales = self.primer_movimiento(dados)
+        
+        paso = 0
+        while paso < 4:
+            # un juego que ya termino en este turno no sigue moviendo
+            dados[self.terminados(), paso] = 0
+            if paso == 0:
+                self.mover(dados[:, paso], legales)
+            elif dados[:, paso].any():
+                self.mover(dados[:, paso])
+            self.__registrar_ganadores__()
+            paso = paso + 1
+        
+        self.__turno__[activos & ~self.terminados()] = 1 - self.__turno__[activos & ~self.terminados()]
+        self.__turnos_jugados__ = self.__turnos_jugados__ + 1
+    
+    def jugar_hasta_el_final(self, turnos_maximos=1000):
+        """
+        Juega todos los juegos hasta que terminen.
+        
+        Recibe: Turnos maximos (int) por seguridad
+        Hace: Repite jugar_turno mientras quede algun juego activo
+        Devuelve: Integer con la cantidad de juegos terminados
+        """
+        turnos = 0
+        while turnos < turnos_maximos and not self.terminados().all():
+            self.jugar_turno()
+            turnos = turnos + 1
+        
+        return int(self.terminados().sum())
+    
+    def __registrar_ganadores__(self):
+        """
+        Marca los juegos donde alguien saco todas sus fichas.
+        
+        Recibe: Nada
+        Hace: Busca los lados con 15 fichas sacadas y calcula gammon (el
+              rival no saco ninguna) y backgammon (ademas tiene fichas en
+              la barra o en la casa del ganador)
+        Devuelve: Nada
+        """
+        posiciones = self.__posiciones__
+        nuevos = (self.__ganador__ < 0)
+        
+        for lado in (BLANCO, NEGRO):
+            gana = nuevos & (posiciones[:, lado, SACADAS] == FICHAS_POR_JUGADOR)
+            if not gana.any():
+                continue
+            
+            rival = posiciones[gana, 1 - lado]
+            gammon = rival[:, SACADAS] == 0
+            # la casa del ganador son los puntos 19-24 del rival, y la barra
+            backgammon = gammon & (rival[:, 19:26].sum(axis=1) > 0)
+            
+            puntos = np.ones(rival.shape[0], dtype=np.int8)
+            puntos[gammon] = 2
+            puntos[backgammon] = 3
+            
+            self.__ganador__[gana] = lado
+            self.__puntos__[gana] = puntos
+            nuevos = nuevos & ~gana
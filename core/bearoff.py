@@ -0,0 +1,423 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from core.dice import TIRADAS_DISTINTAS
+
+
+# puntos de la casa
+PUNTOS_CASA = 6
+
+# cantidad maxima de tiradas guardadas por posicion (la ultima acumula el resto)
+TIRADAS_MAXIMAS = 32
+
+# escala de las probabilidades guardadas en 16 bits
+ESCALA = 65535
+
+# encabezado del archivo: marca, version, puntos, fichas, tiradas, posiciones
+MARCA = b'BGBO'
+VERSION = 1
+FORMATO_ENCABEZADO = '<4sHHHHI'
+TAMANO_ENCABEZADO = struct.calcsize(FORMATO_ENCABEZADO)
+
+
+def combinaciones(n, k):
+    """
+    Calcula el numero combinatorio n sobre k.
+    
+    Recibe: Enteros n y k
+    Hace: Multiplica y divide de a un factor para no usar factoriales
+    Devuelve: Integer (0 si k > n)
+    """
+    if k < 0 or k > n:
+        return 0
+    resultado = 1
+    i = 0
+    while i < k:
+        resultado = resultado * (n - i) // (i + 1)
+        i = i + 1
+    return resultado
+
+
+def cantidad_posiciones(fichas_maximas):
+    """
+    Cuenta las posiciones de la casa con hasta cierta cantidad de fichas.
+    
+    Recibe: Fichas maximas (int)
+    Hace: Cuenta las formas de repartir hasta esas fichas en 6 puntos
+    Devuelve: Integer
+    """
+    return combinaciones(fichas_maximas + PUNTOS_CASA, PUNTOS_CASA)
+
+
+def indice_posicion(posicion):
+    """
+    Calcula el indice de una posicion de la casa.
+    
+    Recibe: Tupla de 6 cantidades (puntos 1 a 6 desde el punto de vista
+            del jugador)
+    Hace: Usa el sistema combinatorio: la posicion se escribe como fichas
+          y separadores y el indice sale de donde caen los separadores.
+          Las posiciones con menos fichas tienen indices menores, asi una
+          base chica es el comienzo de una mas grande
+    Devuelve: Integer
+    """
+    indice = 0
+    lugar = 0
+    punto = 0
+    while punto < PUNTOS_CASA:
+        lugar = lugar + posicion[punto]
+        indice = indice + combinaciones(lugar, punto + 1)
+        lugar = lugar + 1
+        punto = punto + 1
+    return indice
+
+
+def posicion_de_tablero(tablero, color):
+    """
+    Lee la casa de un jugador desde un tablero.
+    
+    Recibe: Board y color (string) del jugador
+    Hace: Cuenta las fichas en los puntos 1-6 (blanco) o 24-19 (negro)
+    Devuelve: Tupla de 6 cantidades, o None si tiene fichas fuera de casa
+    """
+    if tablero.puede_sacar_fichas(color) == False:
+        return None
+    
+    posicion = []
+    punto = 1
+    while punto <= PUNTOS_CASA:
+        if color == 'blanco':
+            posicion.append(tablero.contar_fichas_en_punto(punto))
+        else:
+            posicion.append(tablero.contar_fichas_en_punto(25 - punto))
+        punto = punto + 1
+    return tuple(posicion)
+
+
+def __mover_un_dado__(posicion, dado):
+    """
+    Calcula las posiciones a las que se llega con un dado sacando fichas.
+    
+    Recibe: Tupla de 6 cantidades y valor del dado
+    Hace: Mueve o saca cada ficha que se pueda; con un dado mayor que el
+          punto mas alto solo se saca desde ese punto
+    Devuelve: Set de tuplas resultantes
+    """
+    resultados = set()
+    mas_alto = PUNTOS_CASA
+    while mas_alto > 0 and posicion[mas_alto - 1] == 0:
+        mas_alto = mas_alto - 1
+    
+    if mas_alto == 0:
+        resultados.add(posicion)
+        return resultados
+    
+    punto = 1
+    while punto <= mas_alto:
+        if posicion[punto - 1] > 0:
+            if punto > dado or punto == dado or punto == mas_alto:
+                nueva = list(posicion)
+                nueva[punto - 1] = nueva[punto - 1] - 1
+                if punto > dado:
+                    nueva[punto - dado - 1] = nueva[punto - dado - 1] + 1
+                resultados.add(tuple(nueva))
+        punto = punto + 1
+    return resultados
+
+
+def generar_distribuciones(fichas_maximas=15):
+    """
+    Calcula la distribucion de tiradas para sacar todas las fichas.
+    
+    Recibe: Fichas maximas (int) de la base
+    Hace: Recorre las posiciones de menos a mas pips; para cada tirada elige
+          la jugada que deja menos tiradas esperadas y arma la distribucion
+          con la de esa posicion
+    Devuelve: Lista de distribuciones (listas de TIRADAS_MAXIMAS floats)
+              ordenadas por indice de posicion
+    """
+    total = cantidad_posiciones(fichas_maximas)
+    
+    # todas las posiciones, de menos a mas pips
+    posiciones = []
+    pendientes = [()]
+    while len(pendientes) > 0:
+        parcial = pendientes.pop()
+        if len(parcial) == PUNTOS_CASA:
+            posiciones.append(parcial)
+            continue
+        usadas = sum(parcial)
+        cantidad = 0
+        while usadas + cantidad <= fichas_maximas:
+            pendientes.append(parcial + (cantidad,))
+            cantidad = cantidad + 1
+    
+    def pips(posicion):
+        return sum((punto + 1) * posicion[punto] for punto in range(PUNTOS_CASA))
+    posiciones.sort(key=pips)
+    
+    distribuciones = [None] * total
+    esperadas = [0.0] * total
+    
+    vacia = [0.0] * TIRADAS_MAXIMAS
+    vacia[0] = 1.0
+    distribuciones[0] = vacia
+    
+    movidas = {}
+    for posicion in posiciones:
+        indice = indice_posicion(posicion)
+        if indice == 0:
+            continue
+        
+        distribucion = [0.0] * TIRADAS_MAXIMAS
+        esperada = 1.0
+        for dados, probabilidad in TIRADAS_DISTINTAS:
+            # posiciones alcanzables jugando los dados en cualquier orden
+            if len(dados) == 4:
+                ordenes = [dados]
+            else:
+                ordenes = [dados, [dados[1], dados[0]]]
+            finales = set()
+            for orden in ordenes:
+                actuales = set([posicion])
+                for dado in orden:
+                    siguientes = set()
+                    for actual in actuales:
+                        clave = (actual, dado)
+                        if clave not in movidas:
+                            movidas[clave] = __mover_un_dado__(actual, dado)
+                        siguientes.update(movidas[clave])
+                    actuales = siguientes
+                finales.update(actuales)
+            
+            mejor = None
+            for final in finales:
+                indice_final = indice_posicion(final)
+                if mejor == None or esperadas[indice_final] < esperadas[mejor]:
+                    mejor = indice_final
+            
+            esperada = esperada + probabilidad * esperadas[mejor]
+            anterior = distribuciones[mejor]
+            tirada = 0
+            while tirada < TIRADAS_MAXIMAS:
+                destino = min(tirada + 1, TIRADAS_MAXIMAS - 1)
+                distribucion[destino] = distribucion[destino] + probabilidad * anterior[tirada]
+                tirada = tirada + 1
+        
+        distribuciones[indice] = distribucion
+        esperadas[indice] = esperada
+        
+        # se vacia de vez en cuando para acotar la memoria
+        if len(movidas) > 200000:
+            movidas = {}
+    
+    return distribuciones
+
+
+def generar_base(ruta, fichas_maximas=15):
+    """
+    Genera el archivo binario de la base de datos de bear-off.
+    
+    Recibe: Ruta (string) del archivo y fichas maximas (int)
+    Hace: Calcula las distribuciones y las guarda en 16 bits, solo el
+          tramo de tiradas con probabilidad distinta de cero, con una
+          tabla de desplazamientos para ubicar cada posicion
+    Devuelve: Integer con la cantidad de posiciones guardadas
+    """
+    distribuciones = generar_distribuciones(fichas_maximas)
+    total = len(distribuciones)
+    
+    desplazamientos = array('I')
+    datos = bytearray()
+    for distribucion in distribuciones:
+        enteros = []
+        for probabilidad in distribucion:
+            enteros.append(int(round(probabilidad * ESCALA)))
+        
+        inicio = 0
+        while inicio < TIRADAS_MAXIMAS - 1 and enteros[inicio] == 0:
+            inicio = inicio + 1
+        fin = TIRADAS_MAXIMAS
+        while fin > inicio + 1 and enteros[fin - 1] == 0:
+            fin = fin - 1
+        
+        desplazamientos.append(len(datos))
+        datos.extend(struct.pack('<BB', inicio, fin - inicio))
+        datos.extend(struct.pack('<%dH' % (fin - inicio), *enteros[inicio:fin]))
+    desplazamientos.append(len(datos))
+    
+    if sys.byteorder != 'little':
+        desplazamientos.byteswap()
+    
+    with open(ruta, 'wb') as archivo:
+        archivo.write(struct.pack(FORMATO_ENCABEZADO, MARCA, VERSION, PUNTOS_CASA,
+                                  fichas_maximas, TIRADAS_MAXIMAS, total))
+        archivo.write(desplazamientos.tobytes())
+        archivo.write(bytes(datos))
+    
+    return total
+
+
+class BearoffDatabase:
+    """
+    Base de datos de bear-off de un solo lado leida con mmap.
+    
+    Recibe: Ruta del archivo generado con generar_base
+    Hace: Mapea el archivo en memoria (varios procesos comparten la misma
+          copia) y lee las distribuciones sin cargarlas en listas
+    Devuelve: Nada
+    """
+    
+    def __init__(self, ruta):
+        """
+        Abre y mapea el archivo.
+        
+        Recibe: Ruta (string)
+        Hace: Valida el encabezado y guarda donde empiezan los datos
+        Devuelve: Nada
+        """
+        with open(ruta, 'rb') as archivo:
+            self.__mapa__ = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        marca, version, puntos, fichas, tiradas, total = struct.unpack_from(
+            FORMATO_ENCABEZADO, self.__mapa__, 0)
+        if marca != MARCA or version != VERSION or puntos != PUNTOS_CASA:
+            self.__mapa__.close()
+            raise ValueError("Archivo de bear-off invalido: " + str(ruta))
+        
+        self.__fichas_maximas__ = fichas
+        self.__tiradas__ = tiradas
+        self.__total__ = total
+        self.__inicio_datos__ = TAMANO_ENCABEZADO + 4 * (total + 1)
+    
+    def get_fichas_maximas(self):
+        """
+        Obtiene la cantidad maxima de fichas de la base.
+        
+        Recibe: Nada
+        Hace: Devuelve el valor del encabezado
+        Devuelve: Integer
+        """
+        return self.__fichas_maximas__
+    
+    def get_cantidad_posiciones(self):
+        """
+        Obtiene la cantidad de posiciones de la base.
+        
+        Recibe: Nada
+        Hace: Devuelve el valor del encabezado
+        Devuelve: Integer
+        """
+        return self.__total__
+    
+    def contiene(self, posicion):
+        """
+        Verifica si una posicion esta en la base.
+        
+        Recibe: Tupla de 6 cantidades o None
+        Hace: Revisa que la cantidad de fichas no supere la de la base
+        Devuelve: Boolean
+        """
+        if posicion == None:
+            return False
+        return sum(posicion) <= self.__fichas_maximas__
+    
+    def distribucion(self, posicion):
+        """
+        Obtiene la probabilidad de sacar todas las fichas en cada tirada.
+        
+        Recibe: Tupla de 6 cantidades
+        Hace: Ubica el registro con la tabla de desplazamientos y lo lee
+        Devuelve: Lista de TIRADAS_MAXIMAS floats (indice = tiradas)
+        """
+        if self.contiene(posicion) == False:
+            raise ValueError("Posicion fuera de la base de bear-off")
+        
+        indice = indice_posicion(posicion)
+        desplazamiento = struct.unpack_from('<I', self.__mapa__, TAMANO_ENCABEZADO + 4 * indice)[0]
+        lugar = self.__inicio_datos__ + desplazamiento
+        inicio, largo = struct.unpack_from('<BB', self.__mapa__, lugar)
+        valores = struct.unpack_from('<%dH' % largo, self.__mapa__, lugar + 2)
+        
+        resultado = [0.0] * self.__tiradas__
+        i = 0
+        while i < largo:
+            resultado[inicio + i] = valores[i] / ESCALA
+            i = i + 1
+        return resultado
+    
+    def tiradas_esperadas(self, posicion):
+        """
+        Calcula cuantas tiradas se esperan para sacar todas las fichas.
+        
+        Recibe: Tupla de 6 cantidades
+        Hace: Promedia la distribucion
+        Devuelve: Float
+        """
+        total = 0.0
+        tirada = 0
+        for probabilidad in self.distribucion(posicion):
+            total = total + tirada * probabilidad
+            tirada = tirada + 1
+        return total
+    
+    def probabilidad_ganar(self, tablero, color_en_turno):
+        """
+        Calcula la probabilidad de ganar la carrera del jugador que tira.
+        
+        Recibe: Board con las dos casas dentro de la base y color (string)
+                del jugador al que le toca tirar
+        Hace: Gana si termina en a lo sumo las mismas tiradas que el rival
+              necesita menos una (tira primero)
+        Devuelve: Float entre 0 y 1, o None si alguna casa no esta en la base
+        """
+        if color_en_turno == 'blanco':
+            rival = 'negro'
+        else:
+            rival = 'blanco'
+        
+        propia = posicion_de_tablero(tablero, color_en_turno)
+        ajena = posicion_de_tablero(tablero, rival)
+        if self.contiene(propia) == False or self.contiene(ajena) == False:
+            return None
+        
+        mia = self.distribucion(propia)
+        suya = self.distribucion(ajena)
+        
+        # probabilidad de que el rival necesite al menos i tiradas
+        al_menos = [0.0] * (self.__tiradas__ + 1)
+        i = self.__tiradas__ - 1
+        while i >= 0:
+            al_menos[i] = al_menos[i + 1] + suya[i]
+            i = i - 1
+        
+        ganar = 0.0
+        i = 0
+        while i < self.__tiradas__:
+            ganar = ganar + mia[i] * al_menos[i]
+            i = i + 1
+        return min(1.0, ganar)
+    
+    def cerrar(self):
+        """
+        Libera el mapa de memoria.
+        
+        Recibe: Nada
+        Hace: Cierra el mmap
+        Devuelve: Nada
+        """
+        self.__mapa__.close()
+
+
+if __name__ == "__main__":
+    # python -m core.bearoff [ruta] [fichas_maximas]
+    ruta_salida = "bearoff.bin"
+    maximo = 15
+    if len(sys.argv) > 1:
+        ruta_salida = sys.argv[1]
+    if len(sys.argv) > 2:
+        maximo = int(sys.argv[2])
+    cantidad = generar_base(ruta_salida, maximo)
+    print("Base de bear-off con " + str(cantidad) + " posiciones en " + ruta_salida)
@@ -1,4 +1,120 @@
 from core.checker import Checker
+from core.exceptions import PuntoInvalidoError
+from core.zobrist import CLAVES_ZOBRIST
+
+
+# pips de una ficha en cada lugar (0 barra, 1-24 puntos, 25 sacadas)
+PIPS_POR_PUNTO = {
+    'blanco': [25] + list(range(1, 25)) + [0],
+    'negro': [25] + list(range(24, 0, -1)) + [0],
+}
+
+# 1 si una ficha en ese lugar esta fuera del cuadrante final
+FUERA_DE_CASA_POR_PUNTO = {
+    'blanco': [0] * 7 + [1] * 18 + [0],
+    'negro': [0] + [1] * 18 + [0] * 7,
+}
+
+
+class PuntoTablero:
+    """
+    Vista de un punto del tablero que se comporta como una lista de fichas.
+    
+    Recibe: El tablero y el número del punto
+    Hace: Expone los conteos del tablero como si fueran objetos Checker
+    Devuelve: Nada
+    """
+    
+    def __init__(self, tablero, punto):
+        """
+        Inicializa la vista sobre un punto.
+        
+        Recibe: Tablero (Board) y número del punto (int)
+        Hace: Guarda la referencia al tablero y al punto
+        Devuelve: Nada
+        """
+        self.__tablero__ = tablero
+        self.__punto__ = punto
+    
+    def __len__(self):
+        """
+        Cuenta las fichas del punto.
+        
+        Recibe: Nada
+        Hace: Consulta el conteo en el tablero
+        Devuelve: Cantidad de fichas (int)
+        """
+        return self.__tablero__.contar_fichas_en_punto(self.__punto__)
+    
+    def __color_en_indice__(self, indice):
+        """
+        Calcula el color de la ficha en una posición de la vista.
+        
+        Recibe: Índice (int), puede ser negativo como en las listas
+        Hace: En barra y sacadas van primero las blancas y luego las negras
+        Devuelve: String con el color
+        """
+        cantidad = len(self)
+        if indice < 0:
+            indice = indice + cantidad
+        if indice < 0 or indice >= cantidad:
+            raise IndexError("indice fuera del punto")
+        
+        if self.__punto__ == 0 or self.__punto__ == 25:
+            blancas = self.__tablero__.__contar_por_color__(self.__punto__, 'blanco')
+            if indice < blancas:
+                return 'blanco'
+            return 'negro'
+        
+        return self.__tablero__.get_color_en_punto(self.__punto__)
+    
+    def __getitem__(self, indice):
+        """
+        Obtiene la ficha en una posición.
+        
+        Recibe: Índice (int)
+        Hace: Crea un Checker con el color y la posición del punto
+        Devuelve: Objeto Checker
+        """
+        color = self.__color_en_indice__(indice)
+        ficha = Checker(color)
+        ficha.set_posicion(self.__punto__)
+        return ficha
+    
+    def __iter__(self):
+        """
+        Recorre las fichas del punto.
+        
+        Recibe: Nada
+        Hace: Devuelve cada ficha en orden
+        Devuelve: Iterador de Checker
+        """
+        i = 0
+        while i < len(self):
+            yield self[i]
+            i = i + 1
+    
+    def append(self, ficha):
+        """
+        Agrega una ficha al punto.
+        
+        Recibe: Objeto Checker
+        Hace: Suma la ficha al conteo del tablero
+        Devuelve: Nada
+        """
+        self.__tablero__.__agregar_ficha__(self.__punto__, ficha.get_color())
+    
+    def pop(self, indice=-1):
+        """
+        Saca una ficha del punto.
+        
+        Recibe: Índice (int), por defecto la última
+        Hace: Resta la ficha del conteo del tablero
+        Devuelve: Objeto Checker sin posición
+        """
+        color = self.__color_en_indice__(indice)
+        self.__tablero__.__quitar_ficha__(self.__punto__, color)
+        return Checker(color)
 
 
 class Board:
@@ -15,19 +131,123 @@ class Board:
         Inicializa el tablero con 26 puntos vacios.
         
         Recibe: Nada
-        Hace: Crea 26 listas vacias y coloca las fichas iniciales
+        Hace: Crea el arreglo de conteos y coloca las fichas iniciales
         Devuelve: Nada
         """
-        # crear 26 puntos vacios (0 es la barra, 25 es fichas sacadas)
-        self.__puntos__ = []
-        contador = 0
-        while contador < 26:
-            self.__puntos__.append([])
-            contador = contador + 1
+        # conteo con signo por punto (positivo blanco, negativo negro)
+        # los indices 0 y 25 no se usan, barra y sacadas van por color
+        self.__conteos__ = [0] * 26
+        self.__barra__ = {'blanco': 0, 'negro': 0}
+        self.__sacadas__ = {'blanco': 0, 'negro': 0}
+        
+        # hash Zobrist de la posicion, se actualiza en cada cambio
+        self.__claves__ = CLAVES_ZOBRIST.get_tabla()
+        self.__hash_posicion__ = 0
+        
+        # contadores por color que se actualizan en cada cambio
+        self.__pips__ = {'blanco': 0, 'negro': 0}
+        self.__fichas_en_tablero__ = {'blanco': 0, 'negro': 0}
+        self.__fichas_fuera_de_casa__ = {'blanco': 0, 'negro': 0}
+        
+        # registros de los movimientos aplicados con aplicar()
+        self.__pila_deshacer__ = []
         
         # colocar las fichas en posicion inicial
         self.colocar_fichas_iniciales()
     
+    def __contar_por_color__(self, punto, color_jugador):
+        """
+        Cuenta las fichas de un color en un punto.
+        
+        Recibe: Número del punto (int) y color (string)
+        Hace: Lee el conteo sin recorrer fichas
+        Devuelve: Cantidad de fichas (int)
+        """
+        if punto == 0:
+            return self.__barra__[color_jugador]
+        if punto == 25:
+            return self.__sacadas__[color_jugador]
+        
+        valor = self.__conteos__[punto]
+        if color_jugador == 'blanco':
+            if valor > 0:
+                return valor
+            return 0
+        if valor < 0:
+            return -valor
+        return 0
+    
+    def __agregar_ficha__(self, punto, color_jugador):
+        """
+        Suma una ficha de un color a un punto.
+        
+        Recibe: Número del punto (int) y color (string)
+        Hace: Actualiza el conteo correspondiente y el hash
+        Devuelve: Nada
+        """
+        if punto == 0:
+            antes = self.__barra__[color_jugador]
+            self.__barra__[color_jugador] = antes + 1
+        elif punto == 25:
+            antes = self.__sacadas__[color_jugador]
+            self.__sacadas__[color_jugador] = antes + 1
+        else:
+            valor = self.__conteos__[punto]
+            if color_jugador == 'blanco':
+                if valor < 0:
+                    raise PuntoInvalidoError("No se pueden mezclar colores en un punto")
+                antes = valor
+                self.__conteos__[punto] = valor + 1
+            else:
+                if valor > 0:
+                    raise PuntoInvalidoError("No se pueden mezclar colores en un punto")
+                antes = -valor
+                self.__conteos__[punto] = valor - 1
+            self.__fichas_en_tablero__[color_jugador] = self.__fichas_en_tablero__[color_jugador] + 1
+        
+        # cambiar la clave de 'antes' fichas por la de 'antes + 1'
+        claves = self.__claves__[color_jugador][punto]
+        self.__hash_posicion__ = self.__hash_posicion__ ^ claves[antes] ^ claves[antes + 1]
+        
+        # actualizar pips y fichas fuera de casa
+        self.__pips__[color_jugador] = self.__pips__[color_jugador] + PIPS_POR_PUNTO[color_jugador][punto]
+        self.__fichas_fuera_de_casa__[color_jugador] = (
+            self.__fichas_fuera_de_casa__[color_jugador] + FUERA_DE_CASA_POR_PUNTO[color_jugador][punto]
+        )
+    
+    def __quitar_ficha__(self, punto, color_jugador):
+        """
+        Resta una ficha de un color de un punto.
+        
+        Recibe: Número del punto (int) y color (string)
+        Hace: Actualiza el conteo correspondiente y el hash
+        Devuelve: Nada
+        """
+        if punto == 0:
+            antes = self.__barra__[color_jugador]
+            self.__barra__[color_jugador] = antes - 1
+        elif punto == 25:
+            antes = self.__sacadas__[color_jugador]
+            self.__sacadas__[color_jugador] = antes - 1
+        else:
+            if color_jugador == 'blanco':
+                antes = self.__conteos__[punto]
+                self.__conteos__[punto] = antes - 1
+            else:
+                antes = -self.__conteos__[punto]
+                self.__conteos__[punto] = self.__conteos__[punto] + 1
+            self.__fichas_en_tablero__[color_jugador] = self.__fichas_en_tablero__[color_jugador] - 1
+        
+        # cambiar la clave de 'antes' fichas por la de 'antes - 1'
+        claves = self.__claves__[color_jugador][punto]
+        self.__hash_posicion__ = self.__hash_posicion__ ^ claves[antes] ^ claves[antes - 1]
+        
+        # actualizar pips y fichas fuera de casa
+        self.__pips__[color_jugador] = self.__pips__[color_jugador] - PIPS_POR_PUNTO[color_jugador][punto]
+        self.__fichas_fuera_de_casa__[color_jugador] = (
+            self.__fichas_fuera_de_casa__[color_jugador] - FUERA_DE_CASA_POR_PUNTO[color_jugador][punto]
+        )
+    
     def colocar_fichas_iniciales(self):
         """
         Coloca las 15 fichas de cada jugador en posición inicial.
@@ -36,95 +256,122 @@ class Board:
         Hace: Pone las fichas blancas y negras en sus posiciones iniciales
         Devuelve: Nada
         """
-        # fichas blancas - 2 en punto 24
-        contador = 0
-        while contador < 2:
-            ficha = Checker('blanco')
-            ficha.set_posicion(24)
-            self.__puntos__[24].append(ficha)
-            contador = contador + 1
-        
-        # fichas blancas - 5 en punto 13
-        contador = 0
-        while contador < 5:
-            ficha = Checker('blanco')
-            ficha.set_posicion(13)
-            self.__puntos__[13].append(ficha)
-            contador = contador + 1
-        
-        # fichas blancas - 3 en punto 8
-        contador = 0
-        while contador < 3:
-            ficha = Checker('blanco')
-            ficha.set_posicion(8)
-            self.__puntos__[8].append(ficha)
-            contador = contador + 1
-        
-        # fichas blancas - 5 en punto 6
-        contador = 0
-        while contador < 5:
-            ficha = Checker('blanco')
-            ficha.set_posicion(6)
-            self.__puntos__[6].append(ficha)
-            contador = contador + 1
-        
-        # fichas negras - 2 en punto 1
-        contador = 0
-        while contador < 2:
-            ficha = Checker('negro')
-            ficha.set_posicion(1)
-            self.__puntos__[1].append(ficha)
-            contador = contador + 1
-        
-        # fichas negras - 5 en punto 12
-        contador = 0
-        while contador < 5:
-            ficha = Checker('negro')
-            ficha.set_posicion(12)
-            self.__puntos__[12].append(ficha)
-            contador = contador + 1
-        
-        # fichas negras - 3 en punto 17
-        contador = 0
-        while contador < 3:
-            ficha = Checker('negro')
-            ficha.set_posicion(17)
-            self.__puntos__[17].append(ficha)
-            contador = contador + 1
-        
-        # fichas negras - 5 en punto 19
-        contador = 0
-        while contador < 5:
-            ficha = Checker('negro')
-            ficha.set_posicion(19)
-            self.__puntos__[19].append(ficha)
-            contador = contador + 1
+        # fichas blancas - 2 en 24, 5 en 13, 3 en 8, 5 en 6
+        self.__conteos__[24] = self.__conteos__[24] + 2
+        self.__conteos__[13] = self.__conteos__[13] + 5
+        self.__conteos__[8] = self.__conteos__[8] + 3
+        self.__conteos__[6] = self.__conteos__[6] + 5
+        
+        # fichas negras - 2 en 1, 5 en 12, 3 en 17, 5 en 19
+        self.__conteos__[1] = self.__conteos__[1] - 2
+        self.__conteos__[12] = self.__conteos__[12] - 5
+        self.__conteos__[17] = self.__conteos__[17] - 3
+        self.__conteos__[19] = self.__conteos__[19] - 5
+        
+        # hash y contadores se calculan una sola vez para toda la posicion
+        self.__recalcular_contadores__()
+    
+    def cargar_posicion(self, conteos, barra, sacadas):
+        """
+        Reemplaza la posición entera del tablero.
+        
+        Recibe: Conteos (lista de 26 con signo, positivo blanco), fichas en
+                barra y fichas sacadas (diccionarios por color)
+        Hace: Copia los valores, recalcula hash y contadores una sola vez y
+              vacía la pila de deshacer
+        Devuelve: Nada
+        """
+        self.__conteos__ = list(conteos)
+        self.__conteos__[0] = 0
+        self.__conteos__[25] = 0
+        self.__barra__ = {'blanco': barra['blanco'], 'negro': barra['negro']}
+        self.__sacadas__ = {'blanco': sacadas['blanco'], 'negro': sacadas['negro']}
+        self.__pila_deshacer__ = []
+        self.__recalcular_contadores__()
+    
+    def __recalcular_contadores__(self):
+        """
+        Calcula desde cero el hash y los contadores por color.
+        
+        Recibe: Nada
+        Hace: Recorre los 26 lugares una vez (solo al armar posiciones)
+        Devuelve: Nada
+        """
+        self.__hash_posicion__ = CLAVES_ZOBRIST.calcular_hash(self)
+        
+        for color in ('blanco', 'negro'):
+            pips = 0
+            en_tablero = 0
+            fuera_de_casa = 0
+            punto = 0
+            while punto < 26:
+                cantidad = self.__contar_por_color__(punto, color)
+                pips = pips + cantidad * PIPS_POR_PUNTO[color][punto]
+                fuera_de_casa = fuera_de_casa + cantidad * FUERA_DE_CASA_POR_PUNTO[color][punto]
+                if punto >= 1 and punto <= 24:
+                    en_tablero = en_tablero + cantidad
+                punto = punto + 1
+            self.__pips__[color] = pips
+            self.__fichas_en_tablero__[color] = en_tablero
+            self.__fichas_fuera_de_casa__[color] = fuera_de_casa
+    
+    def get_hash(self):
+        """
+        Obtiene el hash Zobrist de 64 bits de la posicion.
+        
+        Recibe: Nada
+        Hace: Devuelve el valor mantenido en cada movimiento (O(1))
+        Devuelve: Entero de 64 bits
+        """
+        return self.__hash_posicion__
+    
+    def get_conteos(self):
+        """
+        Obtiene una copia del arreglo de conteos con signo.
+        
+        Recibe: Nada
+        Hace: Copia los 26 conteos (positivo blanco, negativo negro)
+        Devuelve: Lista de 26 enteros
+        """
+        return list(self.__conteos__)
     
     def get_fichas_en_punto(self, punto):
         """
         Obtiene las fichas en un punto específico.
         
         Recibe: Número del punto (int)
-        Hace: Busca las fichas en ese punto
-        Devuelve: Lista de fichas en el punto
+        Hace: Crea una vista del punto que se usa como lista de fichas
+        Devuelve: PuntoTablero con las fichas del punto
         """
         if punto < 0:
             return []
         if punto > 25:
             return []
         
-        return self.__puntos__[punto]
+        return PuntoTablero(self, punto)
     
     def contar_fichas_en_punto(self, punto):
         """
         Cuenta cuántas fichas hay en un punto.
         
         Recibe: Número del punto (int)
-        Hace: Cuenta las fichas en ese punto
+        Hace: Lee el conteo de ese punto
         Devuelve: Cantidad de fichas (int)
         """
-        fichas = self.get_fichas_en_punto(punto)
-        return len(fichas)
+        if punto < 0:
+            return 0
+        if punto > 25:
+            return 0
+        
+        if punto == 0:
+            return self.__barra__['blanco'] + self.__barra__['negro']
+        if punto == 25:
+            return self.__sacadas__['blanco'] + self.__sacadas__['negro']
+        
+        valor = self.__conteos__[punto]
+        if valor < 0:
+            return -valor
+        return valor
     
     def punto_esta_vacio(self, punto):
         """
@@ -145,17 +392,27 @@ class Board:
         Obtiene el color de las fichas en un punto.
         
         Recibe: Número del punto (int)
-        Hace: Busca el color de la primera ficha
+        Hace: Mira el signo del conteo (en barra y sacadas, primero blanco)
         Devuelve: String con el color o None si está vacío
         """
-        fichas = self.get_fichas_en_punto(punto)
+        if punto < 0:
+            return None
+        if punto > 25:
+            return None
         
-        if len(fichas) == 0:
+        if punto == 0 or punto == 25:
+            if self.__contar_por_color__(punto, 'blanco') > 0:
+                return 'blanco'
+            if self.__contar_por_color__(punto, 'negro') > 0:
+                return 'negro'
             return None
         
-        primera_ficha = fichas[0]
-        color = primera_ficha.get_color()
-        return color
+        valor = self.__conteos__[punto]
+        if valor > 0:
+            return 'blanco'
+        if valor < 0:
+            return 'negro'
+        return None
     
     def puede_mover_a_punto(self, punto, color_jugador):
         """
@@ -214,8 +471,8 @@ class Board:
         if puede_mover == False:
             return False
         
-        # sacar la ultima ficha del origen
-        ficha = self.__puntos__[punto_origen].pop()
+        # sacar la ficha del origen
+        self.__quitar_ficha__(punto_origen, color_jugador)
         
         # verificar si hay que capturar
         cantidad_destino = self.contar_fichas_en_punto(punto_destino)
@@ -224,13 +481,11 @@ class Board:
         if cantidad_destino == 1:
             if color_destino != color_jugador:
                 # capturar la ficha enemiga
-                ficha_capturada = self.__puntos__[punto_destino].pop()
-                ficha_capturada.set_posicion(0)
-                self.__puntos__[0].append(ficha_capturada)
+                self.__quitar_ficha__(punto_destino, color_destino)
+                self.__agregar_ficha__(0, color_destino)
         
         # mover la ficha al destino
-        ficha.set_posicion(punto_destino)
-        self.__puntos__[punto_destino].append(ficha)
+        self.__agregar_ficha__(punto_destino, color_jugador)
         
         return True
     
@@ -253,10 +508,10 @@ class Board:
         if puede_mover == False:
             return False
         
-        # buscar una ficha del jugador en la barra
-        ficha = self.sacar_ficha_de_barra(color_jugador)
-        if ficha == None:
+        # verificar que hay una ficha del jugador en la barra
+        if self.__barra__[color_jugador] == 0:
             return False
+        self.__quitar_ficha__(0, color_jugador)
         
         # verificar si hay que capturar
         cantidad_destino = self.contar_fichas_en_punto(destino)
@@ -265,31 +520,104 @@ class Board:
         if cantidad_destino == 1:
             if color_destino != color_jugador:
                 # capturar la ficha enemiga
-                ficha_capturada = self.__puntos__[destino].pop()
-                ficha_capturada.set_posicion(0)
-                self.__puntos__[0].append(ficha_capturada)
+                self.__quitar_ficha__(destino, color_destino)
+                self.__agregar_ficha__(0, color_destino)
         
         # poner la ficha en el destino
-        ficha.set_posicion(destino)
-        self.__puntos__[destino].append(ficha)
+        self.__agregar_ficha__(destino, color_jugador)
         
         return True
     
+    def aplicar(self, movimiento):
+        """
+        Aplica un movimiento y guarda lo necesario para deshacerlo.
+        
+        Recibe: Tupla (punto_origen, punto_destino, color_jugador), donde
+                origen 0 es la barra y destino 25 es sacar la ficha
+        Hace: Mueve la ficha, captura si corresponde y apila el registro
+        Devuelve: Tupla registro para deshacer(), o None si no es válido
+        """
+        punto_origen, punto_destino, color_jugador = movimiento
+        
+        # verificar que hay una ficha del jugador en el origen
+        if punto_origen < 0 or punto_origen > 24:
+            return None
+        if self.__contar_por_color__(punto_origen, color_jugador) == 0:
+            return None
+        
+        # verificar el destino (25 es sacar la ficha)
+        if punto_destino != 25:
+            if self.puede_mover_a_punto(punto_destino, color_jugador) == False:
+                return None
+        
+        self.__quitar_ficha__(punto_origen, color_jugador)
+        
+        # capturar si hay una sola ficha del rival
+        capturo = False
+        if punto_destino != 25:
+            color_destino = self.get_color_en_punto(punto_destino)
+            if color_destino != None and color_destino != color_jugador:
+                self.__quitar_ficha__(punto_destino, color_destino)
+                self.__agregar_ficha__(0, color_destino)
+                capturo = True
+        
+        self.__agregar_ficha__(punto_destino, color_jugador)
+        
+        registro = (punto_origen, punto_destino, color_jugador, capturo)
+        self.__pila_deshacer__.append(registro)
+        return registro
+    
+    def deshacer(self, registro=None):
+        """
+        Deshace el último movimiento aplicado con aplicar().
+        
+        Recibe: Registro devuelto por aplicar() (opcional, por defecto el último)
+        Hace: Devuelve la ficha al origen y la capturada a su punto, dejando
+              conteos, hash y contadores exactamente como estaban
+        Devuelve: True si deshizo, False si el registro no es el último
+        """
+        if len(self.__pila_deshacer__) == 0:
+            return False
+        if registro != None and registro is not self.__pila_deshacer__[-1]:
+            return False
+        
+        punto_origen, punto_destino, color_jugador, capturo = self.__pila_deshacer__.pop()
+        
+        self.__quitar_ficha__(punto_destino, color_jugador)
+        
+        # devolver la ficha capturada desde la barra del rival
+        if capturo == True:
+            if color_jugador == 'blanco':
+                color_rival = 'negro'
+            else:
+                color_rival = 'blanco'
+            self.__quitar_ficha__(0, color_rival)
+            self.__agregar_ficha__(punto_destino, color_rival)
+        
+        self.__agregar_ficha__(punto_origen, color_jugador)
+        
+        return True
+    
+    def contar_movimientos_aplicados(self):
+        """
+        Cuenta los movimientos que se pueden deshacer.
+        
+        Recibe: Nada
+        Hace: Mide la pila de registros
+        Devuelve: Cantidad de movimientos (int)
+        """
+        return len(self.__pila_deshacer__)
+    
     def jugador_tiene_fichas_en_barra(self, color_jugador):
         """
         Verifica si el jugador tiene fichas en la barra.
         
         Recibe: Color del jugador (string)
-        Hace: Busca fichas del color en el punto 0 (barra)
+        Hace: Mira el contador de barra del color
         Devuelve: True si tiene fichas, False si no tiene
         """
-        fichas_barra = self.get_fichas_en_punto(0)
-        
-        i = 0
-        while i < len(fichas_barra):
-            if fichas_barra[i].get_color() == color_jugador:
-                return True
-            i = i + 1
+        if self.__barra__[color_jugador] > 0:
+            return True
         
         return False
     
@@ -298,39 +626,26 @@ class Board:
         Saca una ficha del jugador de la barra.
         
         Recibe: Color del jugador (string)
-        Hace: Busca y extrae una ficha del color de la barra
+        Hace: Resta una ficha del color del contador de barra
         Devuelve: Objeto Checker si encontró, None si no hay
         """
-        fichas_barra = self.get_fichas_en_punto(0)
-        
-        i = 0
-        while i < len(fichas_barra):
-            if fichas_barra[i].get_color() == color_jugador:
-                # sacar esta ficha de la lista
-                ficha = self.__puntos__[0].pop(i)
-                return ficha
-            i = i + 1
+        if self.__barra__[color_jugador] == 0:
+            return None
         
-        return None
+        self.__quitar_ficha__(0, color_jugador)
+        ficha = Checker(color_jugador)
+        ficha.set_posicion(0)
+        return ficha
     
     def contar_fichas_en_barra(self, color_jugador):
         """
         Cuenta cuántas fichas del jugador hay en la barra.
         
         Recibe: Color del jugador (string)
-        Hace: Recorre las fichas del punto 0 y cuenta las del color
+        Hace: Lee el contador de barra del color
         Devuelve: Cantidad de fichas (int)
         """
-        fichas_barra = self.get_fichas_en_punto(0)
-        
-        contador = 0
-        i = 0
-        while i < len(fichas_barra):
-            if fichas_barra[i].get_color() == color_jugador:
-                contador = contador + 1
-            i = i + 1
-        
-        return contador
+        return self.__barra__[color_jugador]
     
     def puede_sacar_fichas(self, color_jugador):
         """
@@ -341,32 +656,12 @@ class Board:
         Devuelve: True si puede sacar, False si no puede
         """
         # no puede sacar si tiene fichas en barra
-        if self.jugador_tiene_fichas_en_barra(color_jugador) == True:
+        if self.__barra__[color_jugador] > 0:
             return False
         
         # verificar que todas las fichas esten en el cuadrante final
-        if color_jugador == 'blanco':
-            # blancos deben estar en puntos 1-6
-            punto = 7
-            while punto <= 24:
-                fichas = self.get_fichas_en_punto(punto)
-                i = 0
-                while i < len(fichas):
-                    if fichas[i].get_color() == color_jugador:
-                        return False
-                    i = i + 1
-                punto = punto + 1
-        else:
-            # negros deben estar en puntos 19-24
-            punto = 1
-            while punto <= 18:
-                fichas = self.get_fichas_en_punto(punto)
-                i = 0
-                while i < len(fichas):
-                    if fichas[i].get_color() == color_jugador:
-                        return False
-                    i = i + 1
-                punto = punto + 1
+        if self.__fichas_fuera_de_casa__[color_jugador] > 0:
+            return False
         
         return True
     
@@ -393,9 +688,8 @@ class Board:
             return False
         
         # sacar la ficha y moverla al punto 25
-        ficha = self.__puntos__[punto].pop()
-        ficha.set_posicion(25)
-        self.__puntos__[25].append(ficha)
+        self.__quitar_ficha__(punto, color_jugador)
+        self.__agregar_ficha__(25, color_jugador)
         
         return True
     
@@ -404,19 +698,40 @@ class Board:
         Cuenta cuántas fichas ha sacado un jugador.
         
         Recibe: Color del jugador (string)
-        Hace: Cuenta las fichas del color en el punto 25
+        Hace: Lee el contador de sacadas del color
         Devuelve: Cantidad de fichas sacadas (int)
         """
-        fichas_sacadas = self.get_fichas_en_punto(25)
+        return self.__sacadas__[color_jugador]
+    
+    def contar_fichas_en_tablero(self, color_jugador):
+        """
+        Cuenta cuántas fichas tiene un jugador en los puntos 1 a 24.
         
-        contador = 0
-        i = 0
-        while i < len(fichas_sacadas):
-            if fichas_sacadas[i].get_color() == color_jugador:
-                contador = contador + 1
-            i = i + 1
+        Recibe: Color del jugador (string)
+        Hace: Lee el contador mantenido en cada movimiento
+        Devuelve: Cantidad de fichas (int), sin contar barra ni sacadas
+        """
+        return self.__fichas_en_tablero__[color_jugador]
+    
+    def contar_fichas_fuera_de_casa(self, color_jugador):
+        """
+        Cuenta las fichas del jugador fuera de su cuadrante final.
+        
+        Recibe: Color del jugador (string)
+        Hace: Lee el contador mantenido en cada movimiento
+        Devuelve: Cantidad de fichas (int), sin contar la barra
+        """
+        return self.__fichas_fuera_de_casa__[color_jugador]
+    
+    def get_pips(self, color_jugador):
+        """
+        Obtiene el conteo de pips de un jugador.
         
-        return contador
+        Recibe: Color del jugador (string)
+        Hace: Lee el contador mantenido en cada movimiento (barra vale 25)
+        Devuelve: Cantidad de pips que le faltan para sacar todo (int)
+        """
+        return self.__pips__[color_jugador]
     
     def __str__(self):
         """
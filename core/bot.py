@@ -0,0 +1,483 @@
+import random
+import time
+
+from core.dice import TIRADAS_DISTINTAS
+from core.exceptions import MovimientoInvalidoError
+from core.move_generator import MoveGenerator
+from core.transposition import TranspositionTable
+from core.zobrist import CLAVES_ZOBRIST
+
+
+# valor de una posicion ganada (mucho mayor que cualquier evaluacion)
+VALOR_VICTORIA = 10000.0
+
+# valor de ganar la carrera con seguridad cuando se usa la base de bear-off
+VALOR_CARRERA = 100.0
+
+# segundos por decision si no se pide otro tiempo (una busqueda a 2 ply
+# sin limite puede tardar varios segundos)
+TIEMPO_MAXIMO = 2.0
+
+
+def aplicar_jugada(juego, jugada):
+    """
+    Hace una jugada completa en el juego.
+    
+    Recibe:
+        juego (BackgammonGame): juego con los dados ya tirados
+        jugada (tuple): movimientos (punto_origen, valor_dado)
+    Hace:
+        Hace cada movimiento con hacer_movimiento y termina el turno si
+        quedaron dados sin poder usar. Lanza MovimientoInvalidoError si el
+        juego rechaza un movimiento, asi nunca se juega medio turno sin
+        avisar.
+    Devuelve:
+        Nada.
+    """
+    for origen, dado in jugada:
+        if juego.hacer_movimiento(origen, dado) == False:
+            raise MovimientoInvalidoError("El juego rechazo el movimiento " + str((origen, dado))
+                                          + " de la jugada " + str(jugada))
+    
+    if len(juego.get_movimientos_disponibles()) > 0:
+        juego.terminar_turno()
+
+
+class SearchBot:
+    """
+    Jugador automatico que elige la jugada con busqueda expectiminimax.
+    
+    Recibe:
+        Nada directamente (se usa en __init__).
+    Hace:
+        Prueba cada jugada legal sobre el tablero con aplicar/deshacer y la
+        valora mirando las 21 tiradas distintas del rival (nodos de azar)
+        hasta la profundidad pedida, dentro de un tiempo maximo.
+    Devuelve:
+        Nada (es una clase).
+    """
+    
+    def __init__(self, profundidad=1, tiempo_maximo=TIEMPO_MAXIMO, candidatos=8, candidatos_internos=2,
+                 tabla=None, base_bearoff=None):
+        """
+        Crea el bot.
+        
+        Recibe:
+            profundidad (int): 0, 1 o 2 ply de busqueda
+            tiempo_maximo (float): segundos por decision (TIEMPO_MAXIMO por
+                                   defecto); None busca sin limite
+            candidatos (int): jugadas que se buscan en profundidad (las
+                              mejores segun la evaluacion estatica)
+            candidatos_internos (int): lo mismo dentro de los nodos de azar
+            tabla (TranspositionTable): tabla de transposicion a usar; si es
+                                        None se crea una con la memoria por
+                                        defecto
+            base_bearoff (BearoffDatabase): base para evaluar exacto cuando
+                                            los dos tienen todo en casa
+        Hace:
+            Guarda la configuracion y toma la tabla de las 21 tiradas distintas.
+        Devuelve:
+            Nada (es el constructor).
+        """
+        if profundidad < 0:
+            profundidad = 0
+        if profundidad > 2:
+            profundidad = 2
+        
+        self.__profundidad__ = profundidad
+        self.__tiempo_maximo__ = tiempo_maximo
+        self.__candidatos__ = candidatos
+        self.__candidatos_internos__ = candidatos_internos
+        self.__generador__ = MoveGenerator()
+        
+        if tabla == None:
+            tabla = TranspositionTable()
+        self.__tabla__ = tabla
+        self.__base_bearoff__ = base_bearoff
+        
+        # momento limite de la decision actual
+        self.__limite__ = None
+        self.__tiempo_agotado__ = False
+        
+        # profundidad completada en la ultima decision
+        self.__profundidad_alcanzada__ = 0
+        
+        # las 21 tiradas distintas con su probabilidad (tabla compartida)
+        self.__tiradas__ = TIRADAS_DISTINTAS
+    
+    def get_profundidad(self):
+        """
+        Devuelve la profundidad configurada.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Obtiene la profundidad maxima de busqueda.
+        Devuelve:
+            int: profundidad en ply (0, 1 o 2).
+        """
+        return self.__profundidad__
+    
+    def get_tiempo_maximo(self):
+        """
+        Devuelve el tiempo por decision.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Obtiene el limite de tiempo configurado.
+        Devuelve:
+            float: segundos por decision, o None si busca sin limite.
+        """
+        return self.__tiempo_maximo__
+    
+    def get_profundidad_alcanzada(self):
+        """
+        Devuelve la profundidad completada en la ultima decision.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Indica hasta donde llego la busqueda antes del tiempo limite.
+        Devuelve:
+            int: profundidad completada en ply.
+        """
+        return self.__profundidad_alcanzada__
+    
+    def get_tabla(self):
+        """
+        Devuelve la tabla de transposicion del bot.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Permite consultar sus estadisticas o compartirla con otro bot.
+        Devuelve:
+            TranspositionTable: la tabla usada en la busqueda.
+        """
+        return self.__tabla__
+    
+    def evaluar(self, tablero, color):
+        """
+        Evalua una posicion desde el punto de vista de un jugador.
+        
+        Recibe:
+            tablero (Board): la posicion
+            color (str): el jugador para quien se evalua
+        Hace:
+            Combina diferencia de pips, fichas solas, puntos hechos y fichas
+            en barra. Es antisimetrica: evaluar para el rival da el opuesto.
+            Con base de bear-off y las dos casas dentro de la base usa la
+            probabilidad exacta de ganar, con el rival tirando primero.
+        Devuelve:
+            float: valor de la posicion (mayor es mejor para color).
+        """
+        if color == 'blanco':
+            rival = 'negro'
+        else:
+            rival = 'blanco'
+        
+        # posiciones terminadas
+        if tablero.contar_fichas_en_tablero(color) + tablero.contar_fichas_en_barra(color) == 0:
+            return VALOR_VICTORIA
+        if tablero.contar_fichas_en_tablero(rival) + tablero.contar_fichas_en_barra(rival) == 0:
+            return -VALOR_VICTORIA
+        
+        # carrera sin contacto: probabilidad exacta de la base
+        if self.__base_bearoff__ != None:
+            ganar_rival = self.__base_bearoff__.probabilidad_ganar(tablero, rival)
+            if ganar_rival != None:
+                return VALOR_CARRERA * (1.0 - 2.0 * ganar_rival)
+        
+        # fichas solas y puntos hechos (blanco positivo en los conteos)
+        conteos = tablero.get_conteos()
+        solas = 0
+        hechos = 0
+        punto = 1
+        while punto <= 24:
+            valor = conteos[punto]
+            if valor == 1:
+                solas = solas + 1
+            elif valor == -1:
+                solas = solas - 1
+            elif valor >= 2:
+                hechos = hechos + 1
+            elif valor <= -2:
+                hechos = hechos - 1
+            punto = punto + 1
+        
+        barra = tablero.contar_fichas_en_barra('blanco') - tablero.contar_fichas_en_barra('negro')
+        
+        puntaje = tablero.get_pips('negro') - tablero.get_pips('blanco')
+        puntaje = puntaje - 4.0 * solas + 2.0 * hechos - 6.0 * barra
+        
+        if color == 'blanco':
+            return puntaje
+        return -puntaje
+    
+    def elegir_jugada(self, juego):
+        """
+        Elige la mejor jugada para el jugador actual con sus dados.
+        
+        Recibe:
+            juego (BackgammonGame): juego con los dados ya tirados
+        Hace:
+            Busca primero a 0 ply y luego mas profundo mientras quede
+            tiempo; se queda con la ultima profundidad completa. Si la
+            tabla ya tiene la posicion con estos dados a la profundidad
+            pedida, devuelve esa jugada sin buscar.
+        Devuelve:
+            tuple: jugada como tupla de movimientos (punto_origen, valor_dado).
+        """
+        tablero = juego.get_tablero()
+        color = juego.get_color_jugador_actual()
+        dados = list(juego.get_movimientos_disponibles())
+        
+        if self.__tiempo_maximo__ == None:
+            self.__limite__ = None
+        else:
+            self.__limite__ = time.perf_counter() + self.__tiempo_maximo__
+        self.__tiempo_agotado__ = False
+        
+        jugadas = self.__generador__.generar_jugadas(tablero, color, dados)
+        if len(jugadas) == 1:
+            self.__profundidad_alcanzada__ = 0
+            return jugadas[0]
+        
+        # la posicion con los dados que quedan identifica la decision
+        clave = juego.get_hash() ^ CLAVES_ZOBRIST.get_clave_dados(dados)
+        guardada = None
+        if self.__profundidad__ > 0:
+            entrada = self.__tabla__.buscar(clave)
+            if entrada != None and entrada[2] in jugadas:
+                if entrada[0] >= self.__profundidad__:
+                    self.__profundidad_alcanzada__ = entrada[0]
+                    return entrada[2]
+                guardada = entrada[2]
+        
+        # 0 ply: evaluacion estatica de cada jugada, siempre se completa
+        valoradas = []
+        for jugada in jugadas:
+            valor = self.__valor_jugada__(tablero, color, jugada, 0)
+            valoradas.append((valor, jugada))
+        valoradas.sort(key=lambda par: par[0], reverse=True)
+        
+        mejor = valoradas[0][1]
+        self.__profundidad_alcanzada__ = 0
+        
+        # mas profundidad solo para las mejores candidatas; la jugada de
+        # una busqueda anterior va primera
+        candidatas = []
+        if guardada != None:
+            candidatas.append(guardada)
+        for _, jugada in valoradas:
+            if len(candidatas) >= self.__candidatos__:
+                break
+            if jugada != guardada:
+                candidatas.append(jugada)
+        
+        profundidad = 1
+        while profundidad <= self.__profundidad__:
+            mejor_valor = None
+            mejor_actual = None
+            for jugada in candidatas:
+                valor = self.__valor_jugada__(tablero, color, jugada, profundidad)
+                if self.__tiempo_agotado__:
+                    break
+                if mejor_valor == None or valor > mejor_valor:
+                    mejor_valor = valor
+                    mejor_actual = jugada
+            
+            if self.__tiempo_agotado__:
+                break
+            
+            mejor = mejor_actual
+            self.__profundidad_alcanzada__ = profundidad
+            self.__tabla__.guardar(clave, profundidad, mejor_valor, mejor)
+            profundidad = profundidad + 1
+        
+        return mejor
+    
+    def jugar_turno(self, juego):
+        """
+        Juega el turno completo del jugador actual.
+        
+        Recibe:
+            juego (BackgammonGame): juego con los dados ya tirados
+        Hace:
+            Elige la jugada y la hace con aplicar_jugada, que termina el
+            turno si quedaron dados y lanza MovimientoInvalidoError si el
+            juego rechaza un movimiento.
+        Devuelve:
+            tuple: la jugada realizada.
+        """
+        jugada = self.elegir_jugada(juego)
+        aplicar_jugada(juego, jugada)
+        return jugada
+    
+    def __se_agoto_el_tiempo__(self):
+        """
+        Verifica si se paso el tiempo limite de la decision.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Compara el reloj con el limite y recuerda si se paso.
+        Devuelve:
+            bool: True si se agoto el tiempo, False si no.
+        """
+        if self.__limite__ == None:
+            return False
+        if time.perf_counter() > self.__limite__:
+            self.__tiempo_agotado__ = True
+        return self.__tiempo_agotado__
+    
+    def __valor_jugada__(self, tablero, color, jugada, profundidad):
+        """
+        Valora una jugada aplicandola sobre el tablero y deshaciendola.
+        
+        Recibe:
+            tablero (Board): la posicion actual
+            color (str): el jugador que mueve
+            jugada (tuple): movimientos (punto_origen, valor_dado)
+            profundidad (int): ply que quedan por buscar
+        Hace:
+            Aplica la jugada, evalua (o baja un nivel de azar) y deshace.
+            Los valores de los niveles de azar se guardan en la tabla de
+            transposicion por hash de la posicion y jugador que tira.
+        Devuelve:
+            float: valor de la jugada para color.
+        """
+        movimientos = self.__generador__.a_movimientos_tablero(jugada, color)
+        aplicados = 0
+        for movimiento in movimientos:
+            if tablero.aplicar(movimiento) != None:
+                aplicados = aplicados + 1
+        
+        valor = self.evaluar(tablero, color)
+        if profundidad > 0 and valor != VALOR_VICTORIA:
+            if color == 'blanco':
+                rival = 'negro'
+            else:
+                rival = 'blanco'
+            
+            clave = tablero.get_hash()
+            if rival == 'negro':
+                clave = clave ^ CLAVES_ZOBRIST.get_clave_turno()
+            
+            entrada = self.__tabla__.buscar(clave)
+            if entrada != None and entrada[0] >= profundidad:
+                valor = entrada[1]
+            else:
+                valor = -self.__valor_esperado__(tablero, rival, profundidad - 1)
+                # un valor cortado por el tiempo no se guarda
+                if self.__tiempo_agotado__ == False:
+                    self.__tabla__.guardar(clave, profundidad, valor)
+        
+        while aplicados > 0:
+            tablero.deshacer()
+            aplicados = aplicados - 1
+        
+        return valor
+    
+    def __valor_esperado__(self, tablero, color, profundidad):
+        """
+        Nodo de azar: promedio sobre las 21 tiradas del jugador que tira.
+        
+        Recibe:
+            tablero (Board): la posicion
+            color (str): el jugador que tira los dados
+            profundidad (int): ply que quedan despues de esta jugada
+        Hace:
+            Para cada tirada busca la mejor jugada y pondera su valor.
+        Devuelve:
+            float: valor esperado para color.
+        """
+        total = 0.0
+        for dados, probabilidad in self.__tiradas__:
+            if self.__se_agoto_el_tiempo__():
+                return 0.0
+            
+            jugadas = self.__generador__.generar_jugadas(tablero, color, dados)
+            
+            # si hay que seguir bajando, solo las mejores segun 0 ply
+            if profundidad > 0 and len(jugadas) > self.__candidatos_internos__:
+                valoradas = []
+                for jugada in jugadas:
+                    valor = self.__valor_jugada__(tablero, color, jugada, 0)
+                    valoradas.append((valor, jugada))
+                valoradas.sort(key=lambda par: par[0], reverse=True)
+                jugadas = []
+                for _, jugada in valoradas[:self.__candidatos_internos__]:
+                    jugadas.append(jugada)
+            
+            mejor = None
+            for jugada in jugadas:
+                valor = self.__valor_jugada__(tablero, color, jugada, profundidad)
+                if mejor == None or valor > mejor:
+                    mejor = valor
+            
+            total = total + probabilidad * mejor
+        
+        return total
+
+
+class RandomBot:
+    """
+    Jugador automatico que elige una jugada legal al azar.
+    
+    Recibe:
+        Nada directamente (se usa en __init__).
+    Hace:
+        Usa su propio generador de numeros al azar para poder repetir las
+        partidas con la misma semilla.
+    Devuelve:
+        Nada (es una clase).
+    """
+    
+    def __init__(self, semilla=None):
+        """
+        Crea el bot.
+        
+        Recibe:
+            semilla (int): semilla del generador, None para una al azar
+        Hace:
+            Prepara el generador de jugadas y el de numeros al azar.
+        Devuelve:
+            Nada (es el constructor).
+        """
+        self.__azar__ = random.Random(semilla)
+        self.__generador__ = MoveGenerator()
+    
+    def elegir_jugada(self, juego):
+        """
+        Elige una jugada legal al azar.
+        
+        Recibe:
+            juego (BackgammonGame): juego con los dados ya tirados
+        Hace:
+            Genera todas las jugadas y toma una.
+        Devuelve:
+            tuple: jugada como tupla de movimientos (punto_origen, valor_dado).
+        """
+        jugadas = self.__generador__.generar_jugadas(juego.get_tablero(),
+                                                     juego.get_color_jugador_actual(),
+                                                     juego.get_movimientos_disponibles())
+        return jugadas[self.__azar__.randrange(len(jugadas))]
+    
+    def jugar_turno(self, juego):
+        """
+        Juega el turno completo del jugador actual.
+        
+        Recibe:
+            juego (BackgammonGame): juego con los dados ya tirados
+        Hace:
+            Hace la jugada elegida con aplicar_jugada (termina el turno si
+            quedaron dados y lanza MovimientoInvalidoError si el juego
+            rechaza un movimiento).
+        Devuelve:
+            tuple: la jugada realizada.
+        """
+        jugada = self.elegir_jugada(juego)
+        aplicar_jugada(juego, jugada)
+        return jugada
@@ -1,6 +1,23 @@
 import random
 
 
+# las 36 tiradas posibles en orden (dado1, dado2), para llenar el buffer
+TIRADAS_POSIBLES = []
+for _dado1 in range(1, 7):
+    for _dado2 in range(1, 7):
+        TIRADAS_POSIBLES.append((_dado1, _dado2))
+
+# las 21 tiradas distintas con su probabilidad (1/36 los dobles, 2/36 el
+# resto), con los dados ya expandidos como en BackgammonGame.tirar_dados
+# (4 valores si son dobles); es una tupla de tuplas, asi se comparte sin
+# copiarla en todos los nodos de azar
+TIRADAS_DISTINTAS = tuple(
+    ((_dado1,) * 4, 1.0 / 36.0) if _dado1 == _dado2 else ((_dado1, _dado2), 2.0 / 36.0)
+    for _dado1 in range(1, 7)
+    for _dado2 in range(_dado1, 7)
+)
+
+
 class Dice:
     """
     Clase que representa los dados del juego.
@@ -10,29 +27,71 @@ class Dice:
     Devuelve: Nada
     """
     
-    def __init__(self):
+    def __init__(self, semilla=None, azar=None, tamano_buffer=0, tiradas=None, antitetico=False):
         """
         Inicializa los dados. 
         
-        Recibe: Nada
-        Hace: Crea el atributo para guardar la última tirada
+        Recibe: Semilla (int) o generador propio (random.Random) opcionales,
+                tamaño del buffer de tiradas pregeneradas (0 sin buffer),
+                tiradas fijas (lista de tuplas (dado1, dado2)) que salen
+                antes que las del generador y si los dados son antiteticos
+        Hace: Crea el atributo para guardar la última tirada y elige el
+              generador: el propio, uno nuevo con la semilla, o el random
+              global si no se pasa ninguno. Los dados antiteticos dan
+              7 - valor en cada dado, asi dos partidas con la misma semilla
+              (una normal y otra antitetica) salen con tiradas opuestas
         Devuelve: Nada
         """
         self.__ultima_tirada__ = None
+        
+        # tiradas fijas (de un rollout estratificado) y la siguiente a usar
+        if tiradas == None:
+            tiradas = ()
+        self.__fijas__ = tuple(tiradas)
+        self.__siguiente_fija__ = 0
+        self.__antitetico__ = antitetico
+        
+        if azar == None and semilla != None:
+            azar = random.Random(semilla)
+        self.__azar__ = azar
+        
+        # tiradas generadas de una vez y el lugar de la siguiente
+        self.__tamano_buffer__ = tamano_buffer
+        self.__buffer__ = []
+        self.__siguiente__ = 0
     
     def tirar(self):
         """
         Realiza una tirada de dos dados.
         
         Recibe: Nada
-        Hace: Tira dos dados y devuelve los valores (4 si son dobles)
+        Hace: Tira dos dados y devuelve los valores (4 si son dobles); usa
+              primero las tiradas fijas y, con buffer, toma la siguiente
+              tirada pregenerada
         Devuelve: Lista con los valores de los dados
         """
-        # tirar el primer dado
-        dado1 = random.randint(1, 6)
+        if self.__siguiente_fija__ < len(self.__fijas__):
+            dado1, dado2 = self.__fijas__[self.__siguiente_fija__]
+            self.__siguiente_fija__ = self.__siguiente_fija__ + 1
+        elif self.__tamano_buffer__ > 0:
+            if self.__siguiente__ >= len(self.__buffer__):
+                self.__buffer__ = self.generar_tiradas(self.__tamano_buffer__)
+                self.__siguiente__ = 0
+            dado1, dado2 = self.__buffer__[self.__siguiente__]
+            self.__siguiente__ = self.__siguiente__ + 1
+        elif self.__azar__ == None:
+            # tirar el primer dado
+            dado1 = random.randint(1, 6)
+            
+            # tirar el segundo dado
+            dado2 = random.randint(1, 6)
+        else:
+            dado1 = self.__azar__.randint(1, 6)
+            dado2 = self.__azar__.randint(1, 6)
         
-        # tirar el segundo dado
-        dado2 = random.randint(1, 6)
+        if self.__antitetico__ == True:
+            dado1 = 7 - dado1
+            dado2 = 7 - dado2
         
         # verificar si son dobles
         if dado1 == dado2:
@@ -53,6 +112,28 @@ class Dice:
         
         return resultado
     
+    def generar_tiradas(self, cantidad):
+        """
+        Genera muchas tiradas de una sola vez.
+        
+        Recibe: Cantidad de tiradas (int)
+        Hace: Elige todas las tiradas en una sola llamada al generador
+        Devuelve: Lista de tuplas (dado1, dado2)
+        """
+        if self.__azar__ == None:
+            return random.choices(TIRADAS_POSIBLES, k=cantidad)
+        return self.__azar__.choices(TIRADAS_POSIBLES, k=cantidad)
+    
+    def get_tiradas_en_buffer(self):
+        """
+        Cuenta las tiradas pregeneradas que quedan sin usar.
+        
+        Recibe: Nada
+        Hace: Resta las usadas al total del buffer
+        Devuelve: Integer
+        """
+        return len(self.__buffer__) - self.__siguiente__
+    
     def get_ultima_tirada(self):
         """
         Obtiene la última tirada realizada.
@@ -77,4 +158,130 @@ class Dice:
         if len(self.__ultima_tirada__) == 4:
             return True
         else:
-            return False
\ No newline at end of file
+            return False
+
+
+# formas de elegir las tiradas de las partidas de un rollout
+MODOS_TIRADAS = ('azar', 'estratificado', 'hipercubo')
+
+# turnos de cada partida que se reparten con hipercubo latino
+TURNOS_HIPERCUBO = 8
+
+
+class StratifiedRolls:
+    """
+    Plan de tiradas con varianza reducida para las partidas de un rollout.
+    
+    Recibe: Cantidad de partidas, modo, semilla, si se usan pares
+            antiteticos y turnos del hipercubo
+    Hace: Reparte las 36 tiradas por partes iguales entre las partidas en
+          el primer turno ('estratificado') o en cada uno de los primeros
+          turnos, mezclando cada turno por separado ('hipercubo'); con
+          antiteticos cada partida impar juega las tiradas opuestas
+          (7 - valor) de la anterior. Despues del plan cada partida sigue
+          con su propia semilla
+    Devuelve: Nada
+    """
+    
+    def __init__(self, partidas, modo='estratificado', semilla=None, antiteticos=False,
+                 turnos=TURNOS_HIPERCUBO):
+        """
+        Arma el plan.
+        
+        Recibe: Partidas (int), modo (uno de MODOS_TIRADAS), semilla (int),
+                antiteticos (bool) y turnos del hipercubo (int)
+        Hace: Para cada turno estratificado asigna a las partidas base (la
+              mitad si hay antiteticos) las 36 tiradas en cantidades que
+              difieren a lo sumo en 1, en orden mezclado, y saca una
+              semilla por partida base
+        Devuelve: Nada
+        """
+        if modo not in MODOS_TIRADAS:
+            raise ValueError("modo de tiradas desconocido: " + str(modo))
+        
+        azar = random.Random(semilla)
+        if antiteticos == True:
+            bases = (partidas + 1) // 2
+        else:
+            bases = partidas
+        
+        if modo == 'azar':
+            estratificados = 0
+        elif modo == 'estratificado':
+            estratificados = 1
+        else:
+            estratificados = turnos
+        
+        # columnas[turno][base] es el indice en TIRADAS_POSIBLES
+        columnas = []
+        while len(columnas) < estratificados:
+            columna = [(base * 36) // max(bases, 1) for base in range(bases)]
+            azar.shuffle(columna)
+            columnas.append(columna)
+        
+        self.__partidas__ = partidas
+        self.__modo__ = modo
+        self.__antiteticos__ = antiteticos
+        self.__columnas__ = columnas
+        self.__semillas__ = [azar.getrandbits(63) for _ in range(bases)]
+    
+    def get_partidas(self):
+        """
+        Obtiene la cantidad de partidas del plan.
+        
+        Recibe: Nada
+        Hace: Devuelve la cantidad guardada
+        Devuelve: Integer
+        """
+        return self.__partidas__
+    
+    def es_antitetico(self):
+        """
+        Verifica si el plan usa pares antiteticos.
+        
+        Recibe: Nada
+        Hace: Devuelve la configuracion
+        Devuelve: Boolean
+        """
+        return self.__antiteticos__
+    
+    def tiradas_partida(self, indice):
+        """
+        Obtiene lo necesario para armar los dados de una partida.
+        
+        Recibe: Indice de la partida (0 a partidas - 1)
+        Hace: Busca su partida base, sus tiradas fijas y su semilla
+        Devuelve: Tupla (tiradas fijas, semilla, antitetico)
+        """
+        if self.__antiteticos__ == True:
+            base = indice // 2
+            antitetico = indice % 2 == 1
+        else:
+            base = indice
+            antitetico = False
+        
+        fijas = tuple(TIRADAS_POSIBLES[columna[base]] for columna in self.__columnas__)
+        return (fijas, self.__semillas__[base], antitetico)
+    
+    def lote(self, inicio, cantidad):
+        """
+        Obtiene las tiradas de un lote de partidas.
+        
+        Recibe: Indice de la primera partida y cantidad (int)
+        Hace: Llama a tiradas_partida para cada una (es lo que se manda a
+              los procesos, sin copiar el plan entero)
+        Devuelve: Lista de tuplas (tiradas fijas, semilla, antitetico)
+        """
+        return [self.tiradas_partida(indice) for indice in range(inicio, inicio + cantidad)]
+    
+    def dados_partida(self, indice, tamano_buffer=0):
+        """
+        Arma los dados de una partida.
+        
+        Recibe: Indice de la partida y tamaño del buffer (int)
+        Hace: Crea un Dice con sus tiradas fijas, su semilla y el sentido
+        Devuelve: Dice
+        """
+        fijas, semilla, antitetico = self.tiradas_partida(indice)
+        return Dice(semilla=semilla, tamano_buffer=tamano_buffer, tiradas=fijas,
+                    antitetico=antitetico)
@@ -156,4 +156,24 @@ class BearOffInvalidoError(BackgammonError):
         Hace: Guarda el mensaje sobre bear off inválido
         Devuelve: Nada
         """
-        super().__init__(mensaje)
\ No newline at end of file
+        super().__init__(mensaje)
+
+
+class PosicionInvalidaError(BackgammonError):
+    """
+    Error cuando un identificador de posición no se puede leer.
+    
+    Recibe: String con el mensaje de error (opcional)
+    Hace: Crea una excepción para identificadores de posición inválidos
+    Devuelve: Nada
+    """
+    
+    def __init__(self, mensaje="Identificador de posicion invalido"):
+        """
+        Inicializa la excepción de posición inválida.
+        
+        Recibe: String con el mensaje de error
+        Hace: Guarda el mensaje sobre la posición inválida
+        Devuelve: Nada
+        """
+        super().__init__(mensaje)
@@ -1,6 +1,10 @@
 from core.board import Board
 from core.player import Player
 from core.dice import Dice
+from core.move_generator import MoveGenerator
+from core.position import Position
+from core.snapshot import GameSnapshot
+from core.zobrist import CLAVES_ZOBRIST
 
 
 class BackgammonGame:
@@ -15,13 +19,14 @@ class BackgammonGame:
         Nada (es una clase).
     """
 
-    def __init__(self, nombre_jugador1, nombre_jugador2):
+    def __init__(self, nombre_jugador1, nombre_jugador2, dados=None):
         """
         Crea un nuevo juego de Backgammon con dos jugadores.
         
         Recibe:
             nombre_jugador1 (str): nombre del primer jugador
             nombre_jugador2 (str): nombre del segundo jugador
+            dados (Dice): dados a usar; si es None se crean unos nuevos
         Hace:
             Crea el tablero, los jugadores, los dados y prepara todo para jugar.
         Devuelve:
@@ -39,8 +44,10 @@ class BackgammonGame:
         # el jugador 1 empieza jugando primero
         self.__jugador_actual__ = self.__jugador1__
         
-        # creo los dados para tirar
-        self.__dados__ = Dice()
+        # creo los dados para tirar (o uso los que me pasaron)
+        if dados == None:
+            dados = Dice()
+        self.__dados__ = dados
         
         # lista vacia para guardar los valores de dados que puedo usar
         self.__movimientos_disponibles__ = []
@@ -53,6 +60,9 @@ class BackgammonGame:
         
         # variable para saber si el turno cambio solo
         self.__turno_paso_automatico__ = False
+        
+        # generador de jugadas legales completas
+        self.__generador__ = MoveGenerator()
 
     def get_tablero(self):
         """
@@ -119,6 +129,19 @@ class BackgammonGame:
         """
         return self.__dados__
 
+    def set_dados(self, dados):
+        """
+        Cambia los dados del juego.
+        
+        Recibe:
+            dados (Dice): los dados nuevos
+        Hace:
+            Reemplaza los dados, por ejemplo para simular con otra semilla.
+        Devuelve:
+            Nada.
+        """
+        self.__dados__ = dados
+
     def get_movimientos_disponibles(self):
         """
         Devuelve la lista de movimientos disponibles.
@@ -194,6 +217,133 @@ class BackgammonGame:
         
         return color
 
+    def get_hash(self):
+        """
+        Devuelve el hash Zobrist de la posicion con el lado a mover.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Toma el hash del tablero (mantenido en cada movimiento) y le
+            suma con XOR la clave de turno si le toca mover a negro.
+        Devuelve:
+            int: hash de 64 bits de la posicion.
+        """
+        valor = self.__tablero__.get_hash()
+        
+        if self.__jugador_actual__ == self.__jugador2__:
+            valor = valor ^ CLAVES_ZOBRIST.get_clave_turno()
+        
+        return valor
+
+    def get_posicion(self):
+        """
+        Devuelve la posicion actual como valor inmutable.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Copia el tablero y el lado a mover en una Position (O(26)).
+        Devuelve:
+            Position: posicion que se puede usar como clave de cache.
+        """
+        return Position.desde_tablero(self.__tablero__, self.get_color_jugador_actual())
+
+    def cargar_estado(self, conteos, barra, sacadas, color_en_turno, movimientos):
+        """
+        Carga una posicion completa sin reproducir movimientos.
+        
+        Recibe:
+            conteos (list): 26 conteos con signo (positivo blanco)
+            barra (dict): fichas en barra por color
+            sacadas (dict): fichas sacadas por color
+            color_en_turno (str): 'blanco' o 'negro'
+            movimientos (list): dados que quedan por jugar
+        Hace:
+            Carga el tablero, crea los jugadores de nuevo con sus fichas
+            sacadas, pone el turno y los dados y revisa si ya termino.
+        Devuelve:
+            Nada.
+        """
+        self.__tablero__.cargar_posicion(conteos, barra, sacadas)
+        
+        # los jugadores llevan su propia cuenta de fichas sacadas
+        self.__jugador1__ = Player(self.__jugador1__.get_nombre(), 1)
+        self.__jugador2__ = Player(self.__jugador2__.get_nombre(), -1)
+        for jugador, color in ((self.__jugador1__, 'blanco'), (self.__jugador2__, 'negro')):
+            while jugador.get_fichas_sacadas() < sacadas[color]:
+                jugador.agregar_ficha_sacada()
+        
+        if color_en_turno == 'blanco':
+            self.__jugador_actual__ = self.__jugador1__
+        else:
+            self.__jugador_actual__ = self.__jugador2__
+        
+        self.__movimientos_disponibles__ = list(movimientos)
+        
+        self.__juego_terminado__ = False
+        self.__ganador__ = None
+        self.__turno_paso_automatico__ = False
+        self.verificar_victoria()
+
+    def snapshot(self):
+        """
+        Saca una foto inmutable del estado del juego.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Copia los conteos del tablero, la barra, las sacadas, el turno,
+            los dados que quedan y las banderas de fin de juego.
+        Devuelve:
+            GameSnapshot: foto que se puede guardar y volver a cargar.
+        """
+        tablero = self.__tablero__
+        
+        ganador = None
+        if self.__ganador__ == self.__jugador1__:
+            ganador = 'blanco'
+        elif self.__ganador__ == self.__jugador2__:
+            ganador = 'negro'
+        
+        return GameSnapshot(self.__jugador1__.get_nombre(), self.__jugador2__.get_nombre(),
+                            tablero.get_conteos(),
+                            (tablero.contar_fichas_en_barra('blanco'), tablero.contar_fichas_en_barra('negro')),
+                            (tablero.contar_fichas_sacadas('blanco'), tablero.contar_fichas_sacadas('negro')),
+                            self.get_color_jugador_actual(), self.__movimientos_disponibles__,
+                            self.__juego_terminado__, ganador, self.__turno_paso_automatico__)
+
+    @classmethod
+    def from_snapshot(cls, foto, dados=None):
+        """
+        Crea un juego a partir de una foto.
+        
+        Recibe:
+            foto (GameSnapshot): estado sacado con snapshot()
+            dados (Dice): dados a usar; si es None se crean unos nuevos
+        Hace:
+            Crea el juego y carga la posicion de una sola vez con
+            cargar_estado, sin reproducir movimientos; despues pone las
+            banderas de fin de juego tal como estaban.
+        Devuelve:
+            BackgammonGame: juego listo para seguir jugando.
+        """
+        nombre1, nombre2 = foto.get_nombres()
+        juego = cls(nombre1, nombre2, dados)
+        juego.cargar_estado(foto.get_conteos(), foto.get_barra(), foto.get_sacadas(),
+                            foto.get_color_en_turno(), foto.get_movimientos())
+        
+        juego.__juego_terminado__ = foto.esta_terminado()
+        if foto.get_ganador() == 'blanco':
+            juego.__ganador__ = juego.__jugador1__
+        elif foto.get_ganador() == 'negro':
+            juego.__ganador__ = juego.__jugador2__
+        else:
+            juego.__ganador__ = None
+        juego.__turno_paso_automatico__ = foto.turno_paso_automaticamente()
+        
+        return juego
+
     def tirar_dados(self):
         """
         Tira los dados para empezar un turno.
@@ -303,12 +453,8 @@ class BackgammonGame:
                 # dado mayor al necesario: solo si no hay fichas en puntos superiores
                 punto_revision = punto_origen + 1
                 while punto_revision <= 6:
-                    fichas_revision = tablero.get_fichas_en_punto(punto_revision)
-                    indice_revision = 0
-                    while indice_revision < len(fichas_revision):
-                        if fichas_revision[indice_revision].get_color() == color:
-                            return False
-                        indice_revision = indice_revision + 1
+                    if tablero.get_color_en_punto(punto_revision) == color:
+                        return False
                     punto_revision = punto_revision + 1
                 
                 return True
@@ -325,15 +471,12 @@ class BackgammonGame:
                 if destino == 25:
                     return True
                 
-                # dado mayor al necesario: solo si no hay fichas en puntos superiores
-                punto_revision = punto_origen + 1
-                while punto_revision <= 24:
-                    fichas_revision = tablero.get_fichas_en_punto(punto_revision)
-                    indice_revision = 0
-                    while indice_revision < len(fichas_revision):
-                        if fichas_revision[indice_revision].get_color() == color:
-                            return False
-                        indice_revision = indice_revision + 1
+                # dado mayor al necesario: solo si no hay fichas mas lejos de
+                # la salida (para negro, los puntos de 19 al anterior al origen)
+                punto_revision = 19
+                while punto_revision < punto_origen:
+                    if tablero.get_color_en_punto(punto_revision) == color:
+                        return False
                     punto_revision = punto_revision + 1
                 
                 return True
@@ -391,6 +534,25 @@ class BackgammonGame:
         # si llego aca, no encontre ningun movimiento valido
         return False
 
+    def obtener_jugadas_legales(self):
+        """
+        Devuelve todas las jugadas completas posibles con los dados actuales.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Usa el generador de jugadas sobre el tablero y los dados
+            disponibles del jugador actual, respetando la regla de usar
+            la mayor cantidad de dados y el dado mayor.
+        Devuelve:
+            list: lista de jugadas distintas; cada jugada es una tupla de
+                  movimientos (punto_origen, valor_dado).
+        """
+        color = self.get_color_jugador_actual()
+        return self.__generador__.generar_jugadas(
+            self.__tablero__, color, self.__movimientos_disponibles__
+        )
+
     def hacer_movimiento(self, punto_origen, valor_dado):
         """
         Ejecuta un movimiento en el tablero.
@@ -530,16 +692,10 @@ class BackgammonGame:
         tablero = self.__tablero__
         
         # verifico si el jugador 1 (blanco) gano
-        fichas_blancas_en_tablero = 0
+        # (el tablero mantiene los contadores, no hace falta recorrer puntos)
+        fichas_blancas_en_tablero = tablero.contar_fichas_en_tablero('blanco')
         fichas_blancas_en_barra = tablero.contar_fichas_en_barra('blanco')
         
-        # cuento las fichas blancas en todos los puntos
-        for punto in range(1, 25):
-            color_punto = tablero.get_color_en_punto(punto)
-            if color_punto == 'blanco':
-                cantidad = tablero.contar_fichas_en_punto(punto)
-                fichas_blancas_en_tablero = fichas_blancas_en_tablero + cantidad
-        
         # sumo las fichas en la barra
         total_fichas_blancas = fichas_blancas_en_tablero + fichas_blancas_en_barra
         
@@ -552,16 +708,9 @@ class BackgammonGame:
                 return
         
         # verifico si el jugador 2 (negro) gano
-        fichas_negras_en_tablero = 0
+        fichas_negras_en_tablero = tablero.contar_fichas_en_tablero('negro')
         fichas_negras_en_barra = tablero.contar_fichas_en_barra('negro')
         
-        # cuento las fichas negras en todos los puntos
-        for punto in range(1, 25):
-            color_punto = tablero.get_color_en_punto(punto)
-            if color_punto == 'negro':
-                cantidad = tablero.contar_fichas_en_punto(punto)
-                fichas_negras_en_tablero = fichas_negras_en_tablero + cantidad
-        
         # sumo las fichas en la barra
         total_fichas_negras = fichas_negras_en_tablero + fichas_negras_en_barra
         
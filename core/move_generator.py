@@ -0,0 +1,328 @@
+class MoveGenerator:
+    """
+    Generador de todas las jugadas legales para una tirada.
+    
+    Recibe:
+        Nada directamente (se usa en __init__).
+    Hace:
+        Trabaja sobre los conteos del tablero, sin copiar ni reproducir
+        movimientos sobre BackgammonGame, y aplica las reglas de usar la
+        mayor cantidad de dados posible y de preferir el dado mayor.
+    Devuelve:
+        Nada (es una clase).
+    """
+    
+    def __init__(self):
+        """
+        Crea el generador.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Prepara el estado interno usado durante la busqueda.
+        Devuelve:
+            Nada (es el constructor).
+        """
+        # posicion desde el punto de vista del jugador que mueve:
+        # indice 25 es su barra, 0 sus fichas sacadas, 1-24 su distancia a casa
+        self.__posicion__ = [0] * 26
+        
+        # fichas del rival en su barra (cambian al capturar)
+        self.__barra_rival__ = 0
+        
+        # mejores jugadas encontradas, por posicion resultante
+        self.__resultados__ = {}
+    
+    def generar_jugadas(self, tablero, color, dados):
+        """
+        Genera todas las jugadas completas distintas para una tirada.
+        
+        Recibe:
+            tablero (Board): la posicion de partida
+            color (str): 'blanco' o 'negro', el jugador que mueve
+            dados (list): valores a jugar (2, o 4 si son dobles)
+        Hace:
+            Busca todas las secuencias de movimientos, se queda con las que
+            usan la mayor cantidad de dados (y el dado mayor si solo se puede
+            usar uno) y elimina las que terminan en la misma posicion.
+        Devuelve:
+            list: lista de jugadas; cada jugada es una tupla de movimientos
+                  (punto_origen, valor_dado) listos para hacer_movimiento.
+                  Si no se puede mover, devuelve [()].
+        """
+        self.__cargar_posicion__(tablero, color)
+        self.__resultados__ = {}
+        
+        restantes = list(dados)
+        es_doble = len(restantes) > 0 and restantes.count(restantes[0]) == len(restantes)
+        self.__buscar__(restantes, [], 25, es_doble)
+        
+        # me quedo con las jugadas que usan mas dados
+        maximo = 0
+        for usados, _, _ in self.__resultados__.values():
+            if usados > maximo:
+                maximo = usados
+        
+        # si solo se puede usar un dado de dos distintos, debe ser el mayor
+        dado_mayor = 0
+        if maximo == 1 and es_doble == False:
+            for usados, suma, _ in self.__resultados__.values():
+                if usados == 1 and suma > dado_mayor:
+                    dado_mayor = suma
+        
+        jugadas = []
+        for usados, suma, jugada in self.__resultados__.values():
+            if usados != maximo:
+                continue
+            if dado_mayor > 0 and suma != dado_mayor:
+                continue
+            jugadas.append(self.__a_coordenadas_tablero__(jugada, color))
+        
+        return jugadas
+    
+    def __cargar_posicion__(self, tablero, color):
+        """
+        Copia el tablero al punto de vista del jugador que mueve.
+        
+        Recibe:
+            tablero (Board): la posicion de partida
+            color (str): el jugador que mueve
+        Hace:
+            Deja las fichas propias en positivo y las del rival en negativo,
+            numeradas por distancia a la casa del jugador.
+        Devuelve:
+            Nada.
+        """
+        conteos = tablero.get_conteos()
+        posicion = self.__posicion__
+        
+        if color == 'blanco':
+            rival = 'negro'
+            punto = 1
+            while punto <= 24:
+                posicion[punto] = conteos[punto]
+                punto = punto + 1
+        else:
+            rival = 'blanco'
+            punto = 1
+            while punto <= 24:
+                posicion[punto] = -conteos[25 - punto]
+                punto = punto + 1
+        
+        posicion[25] = tablero.contar_fichas_en_barra(color)
+        posicion[0] = tablero.contar_fichas_sacadas(color)
+        self.__barra_rival__ = tablero.contar_fichas_en_barra(rival)
+    
+    def __puede_sacar__(self):
+        """
+        Verifica si el jugador tiene todas sus fichas en casa.
+        
+        Recibe:
+            Nada.
+        Hace:
+            Revisa la barra y los puntos 7 a 24.
+        Devuelve:
+            bool: True si puede sacar fichas, False si no.
+        """
+        posicion = self.__posicion__
+        if posicion[25] > 0:
+            return False
+        
+        punto = 7
+        while punto <= 24:
+            if posicion[punto] > 0:
+                return False
+            punto = punto + 1
+        
+        return True
+    
+    def __destino__(self, origen, dado):
+        """
+        Calcula el destino de un movimiento si es legal.
+        
+        Recibe:
+            origen (int): punto de origen (25 es la barra)
+            dado (int): valor del dado
+        Hace:
+            Aplica las reglas de BackgammonGame.puede_hacer_movimiento sobre
+            la posicion vista desde el que mueve: no puede caer en un punto
+            con 2 o mas fichas rivales, solo saca con todas las fichas en
+            casa y con un dado mayor al necesario solo si no tiene fichas
+            en puntos mas lejos de la salida (para negro, 19 al origen - 1).
+        Devuelve:
+            int: destino (0 si saca la ficha), o -1 si no es legal.
+        """
+        posicion = self.__posicion__
+        destino = origen - dado
+        
+        if destino >= 1:
+            # bloqueado si el rival tiene 2 o mas fichas
+            if posicion[destino] <= -2:
+                return -1
+            return destino
+        
+        # sacar ficha del tablero
+        if self.__puede_sacar__() == False:
+            return -1
+        
+        if destino < 0:
+            # dado mayor al necesario: solo sin fichas en puntos superiores
+            punto = origen + 1
+            while punto <= 6:
+                if posicion[punto] > 0:
+                    return -1
+                punto = punto + 1
+        
+        return 0
+    
+    def __buscar__(self, restantes, jugada, tope, es_doble):
+        """
+        Recorre en profundidad todas las secuencias de movimientos.
+        
+        Recibe:
+            restantes (list): dados que faltan jugar
+            jugada (list): movimientos hechos hasta ahora
+            tope (int): origen maximo permitido (ordena los dobles)
+            es_doble (bool): si la tirada es doble
+        Hace:
+            Prueba cada dado distinto desde cada origen legal, aplica el
+            movimiento sobre la posicion, sigue buscando y lo deshace.
+        Devuelve:
+            Nada.
+        """
+        posicion = self.__posicion__
+        hubo_movimiento = False
+        
+        probados = []
+        for dado in restantes:
+            if dado in probados:
+                continue
+            probados.append(dado)
+            
+            # con fichas en barra solo se puede entrar
+            if posicion[25] > 0:
+                origenes = [25]
+            else:
+                origenes = range(min(tope, 24), 0, -1)
+            
+            for origen in origenes:
+                if posicion[origen] <= 0:
+                    continue
+                
+                destino = self.__destino__(origen, dado)
+                if destino < 0:
+                    continue
+                
+                hubo_movimiento = True
+                
+                # aplicar el movimiento
+                capturo = posicion[destino] == -1 and destino > 0
+                posicion[origen] = posicion[origen] - 1
+                if capturo:
+                    posicion[destino] = 0
+                    self.__barra_rival__ = self.__barra_rival__ + 1
+                posicion[destino] = posicion[destino] + 1
+                
+                nuevos_restantes = list(restantes)
+                nuevos_restantes.remove(dado)
+                jugada.append((origen, dado))
+                
+                if es_doble:
+                    self.__buscar__(nuevos_restantes, jugada, origen, es_doble)
+                else:
+                    self.__buscar__(nuevos_restantes, jugada, 25, es_doble)
+                
+                # deshacer el movimiento
+                jugada.pop()
+                posicion[destino] = posicion[destino] - 1
+                if capturo:
+                    posicion[destino] = -1
+                    self.__barra_rival__ = self.__barra_rival__ - 1
+                posicion[origen] = posicion[origen] + 1
+        
+        if hubo_movimiento == False:
+            self.__guardar_jugada__(jugada)
+    
+    def __guardar_jugada__(self, jugada):
+        """
+        Guarda una jugada terminada, una sola por posicion resultante.
+        
+        Recibe:
+            jugada (list): movimientos de la jugada
+        Hace:
+            Si ya habia una jugada que llega a la misma posicion, se queda
+            con la que usa mas dados y, a igualdad, la de dados mayores.
+        Devuelve:
+            Nada.
+        """
+        clave = tuple(self.__posicion__) + (self.__barra_rival__,)
+        usados = len(jugada)
+        suma = 0
+        for _, dado in jugada:
+            suma = suma + dado
+        
+        anterior = self.__resultados__.get(clave)
+        if anterior != None:
+            if anterior[0] > usados:
+                return
+            if anterior[0] == usados and anterior[1] >= suma:
+                return
+        
+        self.__resultados__[clave] = (usados, suma, tuple(jugada))
+    
+    def __a_coordenadas_tablero__(self, jugada, color):
+        """
+        Pasa una jugada del punto de vista del jugador al del tablero.
+        
+        Recibe:
+            jugada (tuple): movimientos (origen, dado) en distancia a casa
+            color (str): el jugador que mueve
+        Hace:
+            Convierte la barra al punto 0 y, para negro, invierte los puntos.
+        Devuelve:
+            tuple: movimientos (punto_origen, valor_dado) del tablero.
+        """
+        convertida = []
+        for origen, dado in jugada:
+            if origen == 25:
+                punto = 0
+            elif color == 'blanco':
+                punto = origen
+            else:
+                punto = 25 - origen
+            convertida.append((punto, dado))
+        
+        return tuple(convertida)
+    
+    def a_movimientos_tablero(self, jugada, color):
+        """
+        Convierte una jugada en movimientos para Board.aplicar.
+        
+        Recibe:
+            jugada (tuple): movimientos (punto_origen, valor_dado)
+            color (str): el jugador que mueve
+        Hace:
+            Calcula el destino de cada movimiento; la barra es el origen 0
+            y sacar la ficha es el destino 25.
+        Devuelve:
+            list: lista de tuplas (punto_origen, punto_destino, color).
+        """
+        movimientos = []
+        for origen, dado in jugada:
+            if color == 'blanco':
+                if origen == 0:
+                    destino = 25 - dado
+                else:
+                    destino = origen - dado
+                    if destino < 1:
+                        destino = 25
+            else:
+                if origen == 0:
+                    destino = dado
+                else:
+                    destino = origen + dado
+                    if destino > 24:
+                        destino = 25
+            movimientos.append((origen, destino, color))
+        
+        return movimientos
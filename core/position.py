@@ -0,0 +1,267 @@
+from core.board import Board, PIPS_POR_PUNTO
+from core.zobrist import CLAVES_ZOBRIST
+
+
+# lugares de la tupla de datos despues de los 24 conteos
+BARRA_BLANCO = 24
+BARRA_NEGRO = 25
+SACADAS_BLANCO = 26
+SACADAS_NEGRO = 27
+COLOR = 28
+
+
+class Position:
+    """
+    Posicion inmutable del tablero con el lado a mover.
+    
+    Recibe: Los 24 conteos con signo (positivo blanco), fichas en barra y
+            sacadas por color y color en turno
+    Hace: Guarda todo en una sola tupla plana y su hash; no se puede
+          modificar despues de creada, asi se puede usar como clave de
+          diccionario, compartir entre hilos y guardar con pickle
+    Devuelve: Nada
+    """
+    
+    __slots__ = ('__datos__', '__clave__')
+    
+    def __init__(self, conteos, barra, sacadas, color_en_turno='blanco'):
+        """
+        Crea la posicion.
+        
+        Recibe: Conteos (26 con signo como Board.get_conteos, los lugares 0
+                y 25 no se usan), barra y sacadas (tuplas (blanco, negro))
+                y color en turno (string)
+        Hace: Arma la tupla y calcula su hash una sola vez
+        Devuelve: Nada
+        """
+        datos = tuple(conteos[1:25]) + (barra[0], barra[1], sacadas[0], sacadas[1], color_en_turno)
+        object.__setattr__(self, '__datos__', datos)
+        object.__setattr__(self, '__clave__', hash(datos))
+    
+    @classmethod
+    def desde_tablero(cls, tablero, color_en_turno='blanco'):
+        """
+        Crea la posicion de un tablero.
+        
+        Recibe: Board y color en turno (string)
+        Hace: Copia los 26 conteos, la barra y las sacadas
+        Devuelve: Position
+        """
+        return cls(tablero.get_conteos(),
+                   (tablero.contar_fichas_en_barra('blanco'), tablero.contar_fichas_en_barra('negro')),
+                   (tablero.contar_fichas_sacadas('blanco'), tablero.contar_fichas_sacadas('negro')),
+                   color_en_turno)
+    
+    def __setattr__(self, nombre, valor):
+        """
+        Impide modificar la posicion.
+        
+        Recibe: Nombre y valor del atributo
+        Hace: Lanza el error siempre
+        Devuelve: Nada
+        """
+        raise AttributeError("Position es inmutable")
+    
+    def __reduce__(self):
+        """
+        Indica a pickle como recrear la posicion.
+        
+        Recibe: Nada
+        Hace: Usa los conteos, la barra, las sacadas y el turno guardados
+        Devuelve: Tupla (clase, argumentos)
+        """
+        return (Position, (self.get_conteos(), self.__datos__[24:26], self.__datos__[26:28],
+                           self.__datos__[COLOR]))
+    
+    def __eq__(self, otra):
+        """
+        Compara dos posiciones.
+        
+        Recibe: Otro objeto
+        Hace: Compara primero los hash guardados y despues las tuplas
+        Devuelve: Boolean
+        """
+        if not isinstance(otra, Position):
+            return NotImplemented
+        return self.__clave__ == otra.__clave__ and self.__datos__ == otra.__datos__
+    
+    def __hash__(self):
+        """
+        Obtiene el hash de la posicion.
+        
+        Recibe: Nada
+        Hace: Devuelve el hash calculado al crearla
+        Devuelve: Integer
+        """
+        return self.__clave__
+    
+    def __repr__(self):
+        """
+        Muestra la posicion como texto.
+        
+        Recibe: Nada
+        Hace: Muestra el turno y los pips de cada color
+        Devuelve: String
+        """
+        return ("Position(" + self.__datos__[COLOR] + ", pips blanco=" + str(self.get_pips('blanco'))
+                + ", pips negro=" + str(self.get_pips('negro')) + ")")
+    
+    def get_conteos(self):
+        """
+        Obtiene los conteos del tablero.
+        
+        Recibe: Nada
+        Hace: Agrega los lugares 0 y 25 vacios, como en Board
+        Devuelve: Tupla de 26 conteos con signo
+        """
+        return (0,) + self.__datos__[0:24] + (0,)
+    
+    def get_barra(self):
+        """
+        Obtiene las fichas en barra.
+        
+        Recibe: Nada
+        Hace: Arma un diccionario nuevo por color
+        Devuelve: Diccionario {'blanco': int, 'negro': int}
+        """
+        return {'blanco': self.__datos__[BARRA_BLANCO], 'negro': self.__datos__[BARRA_NEGRO]}
+    
+    def get_sacadas(self):
+        """
+        Obtiene las fichas sacadas.
+        
+        Recibe: Nada
+        Hace: Arma un diccionario nuevo por color
+        Devuelve: Diccionario {'blanco': int, 'negro': int}
+        """
+        return {'blanco': self.__datos__[SACADAS_BLANCO], 'negro': self.__datos__[SACADAS_NEGRO]}
+    
+    def get_color_en_turno(self):
+        """
+        Obtiene el color que tiene el turno.
+        
+        Recibe: Nada
+        Hace: Devuelve el color guardado
+        Devuelve: String 'blanco' o 'negro'
+        """
+        return self.__datos__[COLOR]
+    
+    def contar_fichas(self, punto, color):
+        """
+        Cuenta las fichas de un color en un lugar.
+        
+        Recibe: Punto (0 barra, 1 a 24, 25 sacadas) y color (string)
+        Hace: Lee la tupla segun el signo del conteo
+        Devuelve: Integer
+        """
+        if punto == 0:
+            if color == 'blanco':
+                return self.__datos__[BARRA_BLANCO]
+            return self.__datos__[BARRA_NEGRO]
+        if punto == 25:
+            if color == 'blanco':
+                return self.__datos__[SACADAS_BLANCO]
+            return self.__datos__[SACADAS_NEGRO]
+        
+        valor = self.__datos__[punto - 1]
+        if color == 'blanco':
+            return max(valor, 0)
+        return max(-valor, 0)
+    
+    def get_pips(self, color):
+        """
+        Calcula los pips que le faltan a un color.
+        
+        Recibe: Color (string)
+        Hace: Recorre los 26 lugares con la tabla de pips de Board
+        Devuelve: Integer
+        """
+        pips = PIPS_POR_PUNTO[color]
+        total = 0
+        punto = 0
+        while punto < 26:
+            total = total + self.contar_fichas(punto, color) * pips[punto]
+            punto = punto + 1
+        return total
+    
+    def get_hash(self):
+        """
+        Calcula el hash Zobrist de 64 bits de la posicion con el turno.
+        
+        Recibe: Nada
+        Hace: Combina las claves de cada lugar como Board y suma la clave de
+              turno si mueve negro, asi da lo mismo que
+              BackgammonGame.get_hash y sirve para la TranspositionTable
+        Devuelve: Entero de 64 bits
+        """
+        tabla = CLAVES_ZOBRIST.get_tabla()
+        valor = 0
+        for color in ('blanco', 'negro'):
+            claves = tabla[color]
+            punto = 0
+            while punto < 26:
+                valor = valor ^ claves[punto][self.contar_fichas(punto, color)]
+                punto = punto + 1
+        
+        if self.__datos__[COLOR] == 'negro':
+            valor = valor ^ CLAVES_ZOBRIST.get_clave_turno()
+        return valor
+    
+    def espejar(self):
+        """
+        Cambia los colores de la posicion.
+        
+        Recibe: Nada
+        Hace: Las fichas blancas del punto p pasan a ser negras en el punto
+              25 - p (y al reves), se cambian barra y sacadas y pasa el
+              turno al otro color; espejar dos veces da la misma posicion
+        Devuelve: Position
+        """
+        datos = self.__datos__
+        conteos = [0] * 26
+        punto = 1
+        while punto <= 24:
+            conteos[25 - punto] = -datos[punto - 1]
+            punto = punto + 1
+        
+        if datos[COLOR] == 'blanco':
+            color = 'negro'
+        else:
+            color = 'blanco'
+        return Position(conteos, (datos[BARRA_NEGRO], datos[BARRA_BLANCO]),
+                        (datos[SACADAS_NEGRO], datos[SACADAS_BLANCO]), color)
+    
+    def desde_el_turno(self):
+        """
+        Obtiene la posicion vista desde el lado a mover.
+        
+        Recibe: Nada
+        Hace: Si mueve negro la espeja, asi el que mueve siempre es blanco y
+              dos posiciones iguales para el que mueve dan la misma clave
+        Devuelve: Position (la misma si ya mueve blanco)
+        """
+        if self.__datos__[COLOR] == 'blanco':
+            return self
+        return self.espejar()
+    
+    def crear_tablero(self):
+        """
+        Crea un tablero con esta posicion.
+        
+        Recibe: Nada
+        Hace: Carga los conteos, la barra y las sacadas en un Board nuevo
+        Devuelve: Board
+        """
+        tablero = Board()
+        self.cargar_en(tablero)
+        return tablero
+    
+    def cargar_en(self, tablero):
+        """
+        Carga la posicion en un tablero existente.
+        
+        Recibe: Board
+        Hace: Usa Board.cargar_posicion (recalcula hash y contadores una vez)
+        Devuelve: Nada
+        """
+        tablero.cargar_posicion(self.get_conteos(), self.get_barra(), self.get_sacadas())
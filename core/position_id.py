@@ -0,0 +1,198 @@
+import base64
+import binascii
+
+from core.board import Board
+from core.exceptions import PosicionInvalidaError
+
+
+# fichas por jugador y lugares por jugador (24 puntos y la barra)
+FICHAS_POR_JUGADOR = 15
+LUGARES_POR_JUGADOR = 25
+
+# el identificador usa 80 bits (10 bytes) y 14 caracteres en base64
+BYTES_ID = 10
+LARGO_ID = 14
+
+
+def __lugares_de__(tablero, color):
+    """
+    Lista las fichas de un jugador desde su punto de vista.
+    
+    Recibe: Board y color (string)
+    Hace: Recorre sus puntos 1 a 24 (el 1 es el mas cercano a sacar) y
+          agrega la barra al final
+    Devuelve: Lista de 25 cantidades
+    """
+    conteos = tablero.get_conteos()
+    lugares = []
+    punto = 1
+    while punto <= 24:
+        if color == 'blanco':
+            cantidad = conteos[punto]
+        else:
+            cantidad = -conteos[25 - punto]
+        if cantidad < 0:
+            cantidad = 0
+        lugares.append(cantidad)
+        punto = punto + 1
+    lugares.append(tablero.contar_fichas_en_barra(color))
+    return lugares
+
+
+def codificar_posicion(tablero, color_en_turno):
+    """
+    Calcula el identificador de posicion estilo GNU Backgammon.
+    
+    Recibe: Board y color (string) del jugador en turno
+    Hace: Escribe, primero para el jugador en turno y despues para el
+          rival, sus 25 lugares como tantos bits 1 como fichas seguidos de
+          un 0; los 80 bits se guardan del bit menos significativo al mas
+          significativo y se pasan a base64 sin el relleno
+    Devuelve: String de 14 caracteres
+    """
+    if color_en_turno == 'blanco':
+        rival = 'negro'
+    else:
+        rival = 'blanco'
+    
+    clave = 0
+    bit = 0
+    for color in (color_en_turno, rival):
+        for cantidad in __lugares_de__(tablero, color):
+            clave = clave | (((1 << cantidad) - 1) << bit)
+            bit = bit + cantidad + 1
+    
+    texto = base64.b64encode(clave.to_bytes(BYTES_ID, 'little')).decode('ascii')
+    return texto[:LARGO_ID]
+
+
+def decodificar_lugares(identificador):
+    """
+    Lee los lugares de los dos jugadores de un identificador.
+    
+    Recibe: String de 14 caracteres
+    Hace: Pasa de base64 a 80 bits y cuenta los bits 1 de cada lugar
+    Devuelve: Tupla (lugares del jugador en turno, lugares del rival),
+              cada una lista de 25 cantidades (la ultima es la barra)
+    """
+    if len(identificador) != LARGO_ID:
+        raise PosicionInvalidaError("El identificador debe tener " + str(LARGO_ID) + " caracteres")
+    try:
+        datos = base64.b64decode(identificador + "==", validate=True)
+    except (binascii.Error, ValueError):
+        raise PosicionInvalidaError("El identificador no es base64 valido")
+    
+    clave = int.from_bytes(datos, 'little')
+    jugadores = []
+    for _ in range(2):
+        lugares = []
+        while len(lugares) < LUGARES_POR_JUGADOR:
+            cantidad = 0
+            while clave & 1:
+                cantidad = cantidad + 1
+                clave = clave >> 1
+            clave = clave >> 1
+            lugares.append(cantidad)
+        if sum(lugares) > FICHAS_POR_JUGADOR:
+            raise PosicionInvalidaError("Hay mas de " + str(FICHAS_POR_JUGADOR) + " fichas de un jugador")
+        jugadores.append(lugares)
+    
+    return jugadores[0], jugadores[1]
+
+
+def conteos_desde_id(identificador, color_en_turno):
+    """
+    Arma los conteos de un tablero desde un identificador.
+    
+    Recibe: String de 14 caracteres y color (string) del jugador en turno
+    Hace: Pasa los lugares de cada jugador a coordenadas del tablero; las
+          fichas que faltan de 15 son las sacadas
+    Devuelve: Tupla (conteos de 26 con signo, barra dict, sacadas dict)
+    """
+    if color_en_turno == 'blanco':
+        rival = 'negro'
+    else:
+        rival = 'blanco'
+    
+    en_turno, del_rival = decodificar_lugares(identificador)
+    conteos = [0] * 26
+    barra = {}
+    sacadas = {}
+    for color, lugares in ((color_en_turno, en_turno), (rival, del_rival)):
+        punto = 1
+        while punto <= 24:
+            cantidad = lugares[punto - 1]
+            if cantidad > 0:
+                if color == 'blanco':
+                    indice = punto
+                    signo = 1
+                else:
+                    indice = 25 - punto
+                    signo = -1
+                # un punto no puede tener fichas de los dos colores
+                if conteos[indice] * signo < 0:
+                    raise PosicionInvalidaError("Un punto tiene fichas de los dos colores")
+                conteos[indice] = conteos[indice] + signo * cantidad
+            punto = punto + 1
+        barra[color] = lugares[24]
+        sacadas[color] = FICHAS_POR_JUGADOR - sum(lugares)
+    
+    return conteos, barra, sacadas
+
+
+def tablero_desde_id(identificador, color_en_turno):
+    """
+    Crea un tablero con la posicion de un identificador.
+    
+    Recibe: String de 14 caracteres y color (string) del jugador en turno
+    Hace: Carga los conteos en un Board nuevo
+    Devuelve: Board
+    """
+    conteos, barra, sacadas = conteos_desde_id(identificador, color_en_turno)
+    tablero = Board()
+    tablero.cargar_posicion(conteos, barra, sacadas)
+    return tablero
+
+
+def id_juego(juego):
+    """
+    Calcula el identificador completo de un juego.
+    
+    Recibe: BackgammonGame
+    Hace: Junta el identificador de posicion, el jugador en turno (b o n)
+          y los dados que quedan por jugar
+    Devuelve: String como "4HPwATDgc/ABMA:b31" (sin dados: "...:b")
+    """
+    color = juego.get_color_jugador_actual()
+    texto = codificar_posicion(juego.get_tablero(), color) + ":" + color[0]
+    for dado in juego.get_movimientos_disponibles():
+        texto = texto + str(dado)
+    return texto
+
+
+def cargar_id_juego(juego, identificador):
+    """
+    Carga en un juego la posicion de un identificador completo.
+    
+    Recibe: BackgammonGame y string generado por id_juego
+    Hace: Lee la posicion, el turno y los dados y los carga sin
+          reproducir movimientos
+    Devuelve: Nada
+    """
+    partes = identificador.split(":")
+    if len(partes) != 2 or len(partes[1]) == 0 or partes[1][0] not in ('b', 'n'):
+        raise PosicionInvalidaError("Formato esperado: <posicion>:<b|n><dados>")
+    
+    if partes[1][0] == 'b':
+        color = 'blanco'
+    else:
+        color = 'negro'
+    
+    dados = []
+    for caracter in partes[1][1:]:
+        if caracter < '1' or caracter > '6':
+            raise PosicionInvalidaError("Dado invalido en el identificador: " + caracter)
+        dados.append(int(caracter))
+    
+    conteos, barra, sacadas = conteos_desde_id(partes[0], color)
+    juego.cargar_estado(conteos, barra, sacadas, color, dados)
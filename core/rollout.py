@@ -0,0 +1,326 @@
+import copy
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from core.bot import RandomBot, SearchBot
+from core.dice import Dice, StratifiedRolls
+from core.transposition import TranspositionTable
+
+
+# partidas por lote: cada lote tiene su propia semilla, asi el resultado
+# no depende de cuantos procesos se usen
+TAMANO_LOTE = 100
+
+# tiradas que cada lote genera de una vez
+TAMANO_BUFFER = 4096
+
+# turnos maximos por partida (corta partidas que no terminan)
+TURNOS_MAXIMOS = 2000
+
+# valor de z para intervalos de confianza del 95%
+Z_95 = 1.96
+
+
+def politica_aleatoria(semilla):
+    """
+    Crea una politica que juega al azar.
+    
+    Recibe: Semilla (int)
+    Hace: Crea un RandomBot con esa semilla
+    Devuelve: Objeto con jugar_turno(juego)
+    """
+    return RandomBot(semilla)
+
+
+def politica_voraz(semilla):
+    """
+    Crea una politica que elige la mejor jugada a 0 ply.
+    
+    Recibe: Semilla (int), no se usa porque la politica no tiene azar
+    Hace: Crea un SearchBot de profundidad 0 con una tabla minima
+    Devuelve: Objeto con jugar_turno(juego)
+    """
+    return SearchBot(profundidad=0, tabla=TranspositionTable(1024))
+
+
+def resultado_partida(juego):
+    """
+    Clasifica el final de una partida.
+    
+    Recibe: BackgammonGame terminado
+    Hace: Mira si el perdedor saco alguna ficha (gammon) y si ademas tiene
+          fichas en la barra o en la casa del ganador (backgammon)
+    Devuelve: Tupla (color_ganador, puntos) con puntos 1, 2 o 3
+    """
+    tablero = juego.get_tablero()
+    if juego.get_ganador() == juego.get_jugador1():
+        ganador = 'blanco'
+        perdedor = 'negro'
+        casa_ganador = range(1, 7)
+    else:
+        ganador = 'negro'
+        perdedor = 'blanco'
+        casa_ganador = range(19, 25)
+    
+    if tablero.contar_fichas_sacadas(perdedor) > 0:
+        return (ganador, 1)
+    
+    if tablero.contar_fichas_en_barra(perdedor) > 0:
+        return (ganador, 3)
+    for punto in casa_ganador:
+        if tablero.get_color_en_punto(punto) == perdedor:
+            return (ganador, 3)
+    
+    return (ganador, 2)
+
+
+def jugar_lote(juego, cantidad, semilla, politica, tiradas=None):
+    """
+    Juega un lote de partidas desde una posicion.
+    
+    Recibe: BackgammonGame con la posicion inicial, cantidad de partidas
+            (int), semilla del lote (int), fabrica de politicas y, para
+            rollouts con varianza reducida, la lista de StratifiedRolls.lote
+            con las tiradas de cada partida
+    Hace: Copia el juego para cada partida, le pone dados con la semilla
+          del lote (o los del plan) y juega hasta el final con la politica
+          en los dos lados
+    Devuelve: Diccionario con partidas, ganadas, gammons, backgammons,
+              puntos y cortadas, desde el punto de vista del jugador que
+              tiene el turno en la posicion inicial, y unidades,
+              suma_unidades y cuadrados_unidades para el error de la
+              equidad (una unidad es una partida, o un par antitetico)
+    """
+    color = juego.get_color_jugador_actual()
+    dados = Dice(semilla=semilla, tamano_buffer=TAMANO_BUFFER)
+    jugador = politica(semilla)
+    
+    totales = {"partidas": 0, "ganadas": 0, "gammons": 0, "backgammons": 0,
+               "gammons_rival": 0, "backgammons_rival": 0, "puntos": 0, "cortadas": 0,
+               "unidades": 0, "suma_unidades": 0.0, "cuadrados_unidades": 0.0}
+    
+    # puntos y partidas de la unidad que se esta jugando
+    unidad = [0, 0]
+    
+    partida = 0
+    while partida < cantidad:
+        simulado = copy.deepcopy(juego)
+        if tiradas == None:
+            simulado.set_dados(dados)
+        else:
+            fijas, semilla_partida, antitetico = tiradas[partida]
+            simulado.set_dados(Dice(semilla=semilla_partida, tamano_buffer=TAMANO_BUFFER,
+                                    tiradas=fijas, antitetico=antitetico))
+            # una partida normal empieza una unidad nueva
+            if antitetico == False:
+                __cerrar_unidad__(totales, unidad)
+        
+        turnos = 0
+        while simulado.esta_terminado() == False and turnos < TURNOS_MAXIMOS:
+            if len(simulado.get_movimientos_disponibles()) == 0:
+                simulado.tirar_dados()
+            jugador.jugar_turno(simulado)
+            turnos = turnos + 1
+        
+        totales["partidas"] = totales["partidas"] + 1
+        unidad[1] = unidad[1] + 1
+        if simulado.esta_terminado() == False:
+            totales["cortadas"] = totales["cortadas"] + 1
+        else:
+            ganador, puntos = resultado_partida(simulado)
+            if ganador != color:
+                puntos = -puntos
+            unidad[0] = unidad[0] + puntos
+            totales["puntos"] = totales["puntos"] + puntos
+            if puntos > 0:
+                totales["ganadas"] = totales["ganadas"] + 1
+                if puntos >= 2:
+                    totales["gammons"] = totales["gammons"] + 1
+                if puntos == 3:
+                    totales["backgammons"] = totales["backgammons"] + 1
+            else:
+                if puntos <= -2:
+                    totales["gammons_rival"] = totales["gammons_rival"] + 1
+                if puntos == -3:
+                    totales["backgammons_rival"] = totales["backgammons_rival"] + 1
+        
+        # sin plan cada partida es su propia unidad
+        if tiradas == None:
+            __cerrar_unidad__(totales, unidad)
+        
+        partida = partida + 1
+    
+    __cerrar_unidad__(totales, unidad)
+    return totales
+
+
+def __cerrar_unidad__(totales, unidad):
+    """
+    Suma a los totales la equidad media de una unidad terminada.
+    
+    Recibe: Diccionario de totales y lista [puntos, partidas] de la unidad
+    Hace: Si la unidad tiene partidas, suma su media y su cuadrado, y la
+          deja vacia
+    Devuelve: Nada
+    """
+    if unidad[1] == 0:
+        return
+    media = unidad[0] / unidad[1]
+    totales["unidades"] = totales["unidades"] + 1
+    totales["suma_unidades"] = totales["suma_unidades"] + media
+    totales["cuadrados_unidades"] = totales["cuadrados_unidades"] + media * media
+    unidad[0] = 0
+    unidad[1] = 0
+
+
+class RolloutEngine:
+    """
+    Motor de rollouts Monte Carlo con procesos en paralelo.
+    
+    Recibe: Fabrica de politicas, cantidad de procesos, tamaño de lote y
+            forma de elegir las tiradas
+    Hace: Reparte las partidas en lotes con semillas propias sobre un
+          ProcessPoolExecutor y junta las probabilidades de ganar, gammon
+          y backgammon con sus intervalos de confianza
+    Devuelve: Nada
+    """
+    
+    def __init__(self, politica=politica_voraz, procesos=None, tamano_lote=TAMANO_LOTE,
+                 modo_tiradas='azar', antiteticos=False):
+        """
+        Configura el motor.
+        
+        Recibe: Politica (funcion de nivel de modulo que recibe una semilla
+                y devuelve un objeto con jugar_turno), procesos (int, None
+                para usar todos los nucleos, 1 para no crear procesos),
+                tamano_lote (int), modo_tiradas ('azar', 'estratificado' o
+                'hipercubo', ver StratifiedRolls) y antiteticos (bool)
+        Hace: Guarda la configuracion; con antiteticos el lote se redondea
+              a par para no separar las dos partidas de un par
+        Devuelve: Nada
+        """
+        if procesos == None:
+            procesos = os.cpu_count() or 1
+        if antiteticos == True and tamano_lote % 2 == 1:
+            tamano_lote = tamano_lote + 1
+        
+        self.__politica__ = politica
+        self.__procesos__ = procesos
+        self.__tamano_lote__ = tamano_lote
+        self.__modo_tiradas__ = modo_tiradas
+        self.__antiteticos__ = antiteticos
+    
+    def get_procesos(self):
+        """
+        Obtiene la cantidad de procesos.
+        
+        Recibe: Nada
+        Hace: Devuelve la configuracion
+        Devuelve: Integer
+        """
+        return self.__procesos__
+    
+    def ejecutar(self, juego, partidas=10000, semilla=0):
+        """
+        Hace un rollout de la posicion del juego.
+        
+        Recibe: BackgammonGame con la posicion (si tiene dados disponibles
+                se juegan en la primera jugada), cantidad de partidas (int)
+                y semilla (int)
+        Hace: Arma los lotes con semillas sacadas de la semilla principal
+              (y, si no son tiradas al azar sin pares, el plan de tiradas
+              de todas las partidas), los juega en paralelo y suma los
+              resultados
+        Devuelve: Diccionario de resultados (ver resumir)
+        """
+        azar = random.Random(semilla)
+        plan = None
+        if self.__modo_tiradas__ != 'azar' or self.__antiteticos__ == True:
+            plan = StratifiedRolls(partidas, self.__modo_tiradas__, azar.getrandbits(63),
+                                   self.__antiteticos__)
+        
+        lotes = []
+        restantes = partidas
+        while restantes > 0:
+            cantidad = min(self.__tamano_lote__, restantes)
+            tiradas = None
+            if plan != None:
+                tiradas = plan.lote(partidas - restantes, cantidad)
+            lotes.append((cantidad, azar.getrandbits(63), tiradas))
+            restantes = restantes - cantidad
+        
+        parciales = []
+        if self.__procesos__ <= 1 or len(lotes) <= 1:
+            for cantidad, semilla_lote, tiradas in lotes:
+                parciales.append(jugar_lote(juego, cantidad, semilla_lote, self.__politica__,
+                                            tiradas))
+        else:
+            with ProcessPoolExecutor(max_workers=self.__procesos__) as ejecutor:
+                futuros = []
+                for cantidad, semilla_lote, tiradas in lotes:
+                    futuros.append(ejecutor.submit(jugar_lote, juego, cantidad,
+                                                   semilla_lote, self.__politica__, tiradas))
+                for futuro in futuros:
+                    parciales.append(futuro.result())
+        
+        totales = {}
+        for parcial in parciales:
+            for clave, valor in parcial.items():
+                totales[clave] = totales.get(clave, 0) + valor
+        
+        return self.resumir(totales)
+    
+    def resumir(self, totales):
+        """
+        Calcula probabilidades e intervalos de confianza.
+        
+        Recibe: Diccionario con los conteos sumados de los lotes
+        Hace: Divide por la cantidad de partidas y calcula el intervalo del
+              95% con la aproximacion normal; el de la equidad sale de la
+              varianza entre unidades (partidas, o pares antiteticos); con
+              tiradas estratificadas ese intervalo queda conservador
+        Devuelve: Diccionario con partidas, cortadas, equidad,
+                  intervalo_equidad (minimo, maximo) y, para ganar, gammon,
+                  backgammon, gammon_rival y backgammon_rival, una tupla
+                  (probabilidad, minimo, maximo)
+        """
+        partidas = totales.get("partidas", 0)
+        resultado = {"partidas": partidas, "cortadas": totales.get("cortadas", 0)}
+        
+        nombres = (("ganar", "ganadas"), ("gammon", "gammons"), ("backgammon", "backgammons"),
+                   ("gammon_rival", "gammons_rival"), ("backgammon_rival", "backgammons_rival"))
+        for nombre, clave in nombres:
+            resultado[nombre] = self.intervalo(totales.get(clave, 0), partidas)
+        
+        if partidas > 0:
+            resultado["equidad"] = totales.get("puntos", 0) / partidas
+        else:
+            resultado["equidad"] = 0.0
+        
+        unidades = totales.get("unidades", 0)
+        margen = 0.0
+        if unidades > 1:
+            media = totales["suma_unidades"] / unidades
+            varianza = (totales["cuadrados_unidades"] - unidades * media * media) / (unidades - 1)
+            margen = Z_95 * math.sqrt(max(varianza, 0.0) / unidades)
+        resultado["intervalo_equidad"] = (resultado["equidad"] - margen,
+                                          resultado["equidad"] + margen)
+        
+        return resultado
+    
+    def intervalo(self, exitos, partidas):
+        """
+        Calcula una proporcion con su intervalo de confianza del 95%.
+        
+        Recibe: Cantidad de exitos y de partidas (int)
+        Hace: Usa p +- 1.96 * sqrt(p * (1 - p) / n), recortado a [0, 1]
+        Devuelve: Tupla (probabilidad, minimo, maximo)
+        """
+        if partidas == 0:
+            return (0.0, 0.0, 1.0)
+        
+        probabilidad = exitos / partidas
+        margen = Z_95 * math.sqrt(probabilidad * (1.0 - probabilidad) / partidas)
+        return (probabilidad, max(0.0, probabilidad - margen), min(1.0, probabilidad + margen))
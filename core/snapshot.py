@@ -0,0 +1,189 @@
+# el juego todavia no usa el cubo: se guarda centrado en 1 y sin dueño
+CUBO_INICIAL = 1
+
+
+class GameSnapshot:
+    """
+    Foto inmutable del estado de un juego.
+    
+    Recibe: Nombres, conteos del tablero, barra, sacadas, turno, dados que
+            quedan, banderas de fin de juego y el cubo
+    Hace: Guarda todo en una sola tupla; no se puede modificar despues de
+          creada, asi se puede compartir, usar como clave y guardar con
+          pickle
+    Devuelve: Nada
+    """
+    
+    __slots__ = ('__datos__',)
+    
+    def __init__(self, nombre1, nombre2, conteos, barra, sacadas, color_en_turno,
+                 movimientos, terminado=False, ganador=None, paso_automatico=False,
+                 cubo=CUBO_INICIAL, duenio_cubo=None):
+        """
+        Crea la foto.
+        
+        Recibe: Nombres (string), conteos (26 con signo, positivo blanco),
+                barra y sacadas (tuplas (blanco, negro)), color en turno
+                (string), movimientos (dados que quedan), terminado (bool),
+                ganador (color o None), paso_automatico (bool), cubo (int) y
+                duenio_cubo (color o None)
+        Hace: Pasa todo a tuplas y lo guarda sin pasar por __setattr__
+        Devuelve: Nada
+        """
+        datos = (nombre1, nombre2, tuple(conteos), tuple(barra), tuple(sacadas),
+                 color_en_turno, tuple(movimientos), terminado, ganador,
+                 paso_automatico, cubo, duenio_cubo)
+        object.__setattr__(self, '__datos__', datos)
+    
+    def __setattr__(self, nombre, valor):
+        """
+        Impide modificar la foto.
+        
+        Recibe: Nombre y valor del atributo
+        Hace: Lanza el error siempre
+        Devuelve: Nada
+        """
+        raise AttributeError("GameSnapshot es inmutable")
+    
+    def __reduce__(self):
+        """
+        Indica a pickle como recrear la foto.
+        
+        Recibe: Nada
+        Hace: Usa los datos guardados como argumentos del constructor
+        Devuelve: Tupla (clase, argumentos)
+        """
+        return (GameSnapshot, self.__datos__)
+    
+    def __eq__(self, otra):
+        """
+        Compara dos fotos.
+        
+        Recibe: Otro objeto
+        Hace: Compara las tuplas de datos
+        Devuelve: Boolean
+        """
+        if not isinstance(otra, GameSnapshot):
+            return NotImplemented
+        return self.__datos__ == otra.__datos__
+    
+    def __hash__(self):
+        """
+        Calcula el hash de la foto.
+        
+        Recibe: Nada
+        Hace: Usa el hash de la tupla de datos
+        Devuelve: Integer
+        """
+        return hash(self.__datos__)
+    
+    def __repr__(self):
+        """
+        Muestra la foto como texto.
+        
+        Recibe: Nada
+        Hace: Muestra el turno, los dados y si termino
+        Devuelve: String
+        """
+        return ("GameSnapshot(" + self.__datos__[5] + ", dados=" + str(list(self.__datos__[6]))
+                + ", terminado=" + str(self.__datos__[7]) + ")")
+    
+    def get_nombres(self):
+        """
+        Obtiene los nombres de los jugadores.
+        
+        Recibe: Nada
+        Hace: Devuelve los dos nombres guardados
+        Devuelve: Tupla (nombre blanco, nombre negro)
+        """
+        return (self.__datos__[0], self.__datos__[1])
+    
+    def get_conteos(self):
+        """
+        Obtiene los conteos del tablero.
+        
+        Recibe: Nada
+        Hace: Devuelve la tupla guardada
+        Devuelve: Tupla de 26 conteos con signo
+        """
+        return self.__datos__[2]
+    
+    def get_barra(self):
+        """
+        Obtiene las fichas en barra.
+        
+        Recibe: Nada
+        Hace: Arma un diccionario nuevo por color
+        Devuelve: Diccionario {'blanco': int, 'negro': int}
+        """
+        return {'blanco': self.__datos__[3][0], 'negro': self.__datos__[3][1]}
+    
+    def get_sacadas(self):
+        """
+        Obtiene las fichas sacadas.
+        
+        Recibe: Nada
+        Hace: Arma un diccionario nuevo por color
+        Devuelve: Diccionario {'blanco': int, 'negro': int}
+        """
+        return {'blanco': self.__datos__[4][0], 'negro': self.__datos__[4][1]}
+    
+    def get_color_en_turno(self):
+        """
+        Obtiene el color que tiene el turno.
+        
+        Recibe: Nada
+        Hace: Devuelve el color guardado
+        Devuelve: String 'blanco' o 'negro'
+        """
+        return self.__datos__[5]
+    
+    def get_movimientos(self):
+        """
+        Obtiene los dados que quedan por jugar.
+        
+        Recibe: Nada
+        Hace: Devuelve la tupla guardada
+        Devuelve: Tupla de integers
+        """
+        return self.__datos__[6]
+    
+    def esta_terminado(self):
+        """
+        Indica si el juego estaba terminado.
+        
+        Recibe: Nada
+        Hace: Devuelve la bandera guardada
+        Devuelve: Boolean
+        """
+        return self.__datos__[7]
+    
+    def get_ganador(self):
+        """
+        Obtiene el color del ganador.
+        
+        Recibe: Nada
+        Hace: Devuelve el color guardado
+        Devuelve: String o None si no hay ganador
+        """
+        return self.__datos__[8]
+    
+    def turno_paso_automaticamente(self):
+        """
+        Indica si el ultimo turno paso solo.
+        
+        Recibe: Nada
+        Hace: Devuelve la bandera guardada
+        Devuelve: Boolean
+        """
+        return self.__datos__[9]
+    
+    def get_cubo(self):
+        """
+        Obtiene el cubo de doblar.
+        
+        Recibe: Nada
+        Hace: Devuelve el valor y el dueño guardados
+        Devuelve: Tupla (valor, color del dueño o None si esta centrado)
+        """
+        return (self.__datos__[10], self.__datos__[11])
@@ -0,0 +1,221 @@
+from array import array
+
+
+# memoria por defecto de la tabla (bytes)
+MEMORIA_POR_DEFECTO = 8 * 1024 * 1024
+
+# entradas por bucket: 0 prefiere profundidad, 1 se reemplaza siempre
+ENTRADAS_POR_BUCKET = 2
+
+# profundidad que marca una entrada vacia
+VACIA = -1
+
+
+class TranspositionTable:
+    """
+    Tabla de transposicion de tamaño fijo para la busqueda.
+    
+    Recibe: Memoria maxima en bytes
+    Hace: Guarda profundidad, valor y mejor jugada por hash de posicion en
+          arreglos de tamaño fijo, con buckets de dos entradas: una que
+          prefiere la profundidad mayor y otra que se reemplaza siempre
+    Devuelve: Nada
+    """
+    
+    def __init__(self, memoria_maxima=MEMORIA_POR_DEFECTO):
+        """
+        Reserva los arreglos de la tabla.
+        
+        Recibe: Memoria maxima (int) en bytes
+        Hace: Calcula la mayor cantidad de buckets (potencia de 2) que entra
+              en la memoria y crea los arreglos
+        Devuelve: Nada
+        """
+        bytes_por_entrada = (array('Q').itemsize + array('b').itemsize +
+                             array('d').itemsize + array('L').itemsize)
+        
+        # cantidad de buckets: potencia de 2 para indexar con una mascara
+        buckets = 1
+        while buckets * 2 * ENTRADAS_POR_BUCKET * bytes_por_entrada <= memoria_maxima:
+            buckets = buckets * 2
+        
+        self.__mascara__ = buckets - 1
+        total = buckets * ENTRADAS_POR_BUCKET
+        
+        self.__claves__ = array('Q', [0]) * total
+        self.__profundidades__ = array('b', [VACIA]) * total
+        self.__valores__ = array('d', [0.0]) * total
+        self.__jugadas__ = array('L', [0]) * total
+        
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+        self.__escrituras__ = 0
+        self.__reemplazos__ = 0
+    
+    def get_capacidad(self):
+        """
+        Obtiene la cantidad de entradas de la tabla.
+        
+        Recibe: Nada
+        Hace: Cuenta las entradas de todos los buckets
+        Devuelve: Integer
+        """
+        return len(self.__claves__)
+    
+    def get_memoria(self):
+        """
+        Obtiene la memoria que ocupan los arreglos.
+        
+        Recibe: Nada
+        Hace: Suma el tamaño de los cuatro arreglos
+        Devuelve: Integer con la cantidad de bytes
+        """
+        total = 0
+        for arreglo in (self.__claves__, self.__profundidades__, self.__valores__, self.__jugadas__):
+            total = total + arreglo.itemsize * len(arreglo)
+        
+        return total
+    
+    def buscar(self, clave):
+        """
+        Busca una posicion en la tabla.
+        
+        Recibe: Clave (int de 64 bits) de la posicion
+        Hace: Revisa las dos entradas del bucket y cuenta acierto o fallo
+        Devuelve: Tupla (profundidad, valor, jugada) o None si no esta
+        """
+        indice = (clave & self.__mascara__) * ENTRADAS_POR_BUCKET
+        fin = indice + ENTRADAS_POR_BUCKET
+        while indice < fin:
+            if self.__profundidades__[indice] != VACIA and self.__claves__[indice] == clave:
+                self.__aciertos__ = self.__aciertos__ + 1
+                return (self.__profundidades__[indice], self.__valores__[indice],
+                        self.decodificar_jugada(self.__jugadas__[indice]))
+            indice = indice + 1
+        
+        self.__fallos__ = self.__fallos__ + 1
+        return None
+    
+    def guardar(self, clave, profundidad, valor, jugada=()):
+        """
+        Guarda el resultado de buscar una posicion.
+        
+        Recibe: Clave (int), profundidad (int), valor (float) y mejor
+                jugada (tupla de movimientos, puede ser vacia)
+        Hace: Si la profundidad es mayor o igual que la de la primera entrada
+              la reemplaza (y baja la anterior a la segunda); si no, escribe
+              en la segunda entrada, que se reemplaza siempre
+        Devuelve: Nada
+        """
+        primera = (clave & self.__mascara__) * ENTRADAS_POR_BUCKET
+        segunda = primera + 1
+        codigo = self.codificar_jugada(jugada)
+        
+        self.__escrituras__ = self.__escrituras__ + 1
+        
+        profundidad_primera = self.__profundidades__[primera]
+        if profundidad_primera == VACIA or profundidad >= profundidad_primera or \
+                self.__claves__[primera] == clave:
+            misma = self.__claves__[primera] == clave
+            if misma and profundidad < profundidad_primera:
+                # ya hay un resultado mas profundo de la misma posicion
+                return
+            
+            if profundidad_primera != VACIA and misma == False:
+                # la entrada desplazada pasa a la de reemplazo
+                self.__escribir__(segunda, self.__claves__[primera], profundidad_primera,
+                                  self.__valores__[primera], self.__jugadas__[primera])
+            
+            self.__escribir__(primera, clave, profundidad, valor, codigo)
+            return
+        
+        self.__escribir__(segunda, clave, profundidad, valor, codigo)
+    
+    def limpiar(self):
+        """
+        Vacia la tabla sin liberar la memoria.
+        
+        Recibe: Nada
+        Hace: Marca todas las entradas como vacias y reinicia estadisticas
+        Devuelve: Nada
+        """
+        total = len(self.__profundidades__)
+        self.__profundidades__ = array('b', [VACIA]) * total
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+        self.__escrituras__ = 0
+        self.__reemplazos__ = 0
+    
+    def get_estadisticas(self):
+        """
+        Obtiene las estadisticas de uso de la tabla.
+        
+        Recibe: Nada
+        Hace: Junta aciertos, fallos, escrituras, reemplazos y ocupacion
+        Devuelve: Diccionario con las estadisticas
+        """
+        consultas = self.__aciertos__ + self.__fallos__
+        tasa = 0.0
+        if consultas > 0:
+            tasa = self.__aciertos__ / consultas
+        
+        ocupadas = len(self.__profundidades__) - self.__profundidades__.count(VACIA)
+        
+        return {
+            "aciertos": self.__aciertos__,
+            "fallos": self.__fallos__,
+            "tasa_aciertos": tasa,
+            "escrituras": self.__escrituras__,
+            "reemplazos": self.__reemplazos__,
+            "ocupadas": ocupadas,
+            "capacidad": len(self.__profundidades__),
+            "memoria": self.get_memoria(),
+        }
+    
+    def codificar_jugada(self, jugada):
+        """
+        Convierte una jugada en un entero para guardarla en el arreglo.
+        
+        Recibe: Tupla de hasta 4 movimientos (punto_origen, valor_dado)
+        Hace: Guarda cada movimiento en 8 bits (origen * 8 + dado)
+        Devuelve: Integer de 32 bits (0 es la jugada vacia)
+        """
+        codigo = 0
+        desplazamiento = 0
+        for origen, dado in jugada:
+            codigo = codigo | ((origen * 8 + dado) << desplazamiento)
+            desplazamiento = desplazamiento + 8
+        
+        return codigo
+    
+    def decodificar_jugada(self, codigo):
+        """
+        Convierte un entero guardado en la jugada original.
+        
+        Recibe: Integer generado por codificar_jugada
+        Hace: Separa los movimientos de a 8 bits
+        Devuelve: Tupla de movimientos (punto_origen, valor_dado)
+        """
+        jugada = []
+        while codigo != 0:
+            movimiento = codigo & 255
+            jugada.append((movimiento // 8, movimiento % 8))
+            codigo = codigo >> 8
+        
+        return tuple(jugada)
+    
+    def __escribir__(self, indice, clave, profundidad, valor, codigo):
+        """
+        Escribe una entrada en los arreglos.
+        
+        Recibe: Indice (int), clave, profundidad, valor y jugada codificada
+        Hace: Cuenta como reemplazo si pisa otra posicion
+        Devuelve: Nada
+        """
+        if self.__profundidades__[indice] != VACIA and self.__claves__[indice] != clave:
+            self.__reemplazos__ = self.__reemplazos__ + 1
+        
+        self.__claves__[indice] = clave
+        self.__profundidades__[indice] = profundidad
+        self.__valores__[indice] = valor
+        self.__jugadas__[indice] = codigo
@@ -0,0 +1,126 @@
+import random
+
+
+# cantidad maxima de fichas de un color en un mismo lugar
+MAXIMO_FICHAS = 15
+
+
+class Zobrist:
+    """
+    Tabla de claves aleatorias para el hash Zobrist de las posiciones.
+    
+    Recibe: Semilla (int) para generar siempre las mismas claves
+    Hace: Guarda una clave de 64 bits por color, punto y cantidad de fichas
+    Devuelve: Nada
+    """
+    
+    def __init__(self, semilla=2025):
+        """
+        Genera las claves.
+        
+        Recibe: Semilla (int)
+        Hace: Crea las claves con un generador propio (no toca random global)
+        Devuelve: Nada
+        """
+        azar = random.Random(semilla)
+        
+        # tabla[color][punto][cantidad], la cantidad 0 vale 0 para que
+        # un punto vacio no cambie el hash
+        self.__tabla__ = {}
+        for color in ('blanco', 'negro'):
+            puntos = []
+            punto = 0
+            while punto < 26:
+                claves = [0]
+                cantidad = 1
+                while cantidad <= MAXIMO_FICHAS:
+                    claves.append(azar.getrandbits(64))
+                    cantidad = cantidad + 1
+                puntos.append(claves)
+                punto = punto + 1
+            self.__tabla__[color] = puntos
+        
+        # clave que se suma cuando le toca mover a negro
+        self.__clave_turno__ = azar.getrandbits(64)
+        
+        # claves de los dados que quedan por jugar: claves_dados[valor][cantidad],
+        # para guardar la mejor jugada de una posicion con ciertos dados
+        self.__claves_dados__ = [[0] * 5]
+        valor = 1
+        while valor <= 6:
+            claves = [0]
+            cantidad = 1
+            while cantidad <= 4:
+                claves.append(azar.getrandbits(64))
+                cantidad = cantidad + 1
+            self.__claves_dados__.append(claves)
+            valor = valor + 1
+    
+    def get_tabla(self):
+        """
+        Obtiene la tabla de claves.
+        
+        Recibe: Nada
+        Hace: Devuelve la tabla para usarla sin llamadas extra
+        Devuelve: Diccionario color -> lista de 26 listas de claves
+        """
+        return self.__tabla__
+    
+    def get_clave(self, color, punto, cantidad):
+        """
+        Obtiene la clave de tener cierta cantidad de fichas en un punto.
+        
+        Recibe: Color (string), punto (int 0-25) y cantidad (int)
+        Hace: Busca la clave en la tabla
+        Devuelve: Entero de 64 bits
+        """
+        return self.__tabla__[color][punto][cantidad]
+    
+    def get_clave_turno(self):
+        """
+        Obtiene la clave del turno de negro.
+        
+        Recibe: Nada
+        Hace: Devuelve la clave de lado a mover
+        Devuelve: Entero de 64 bits
+        """
+        return self.__clave_turno__
+    
+    def get_clave_dados(self, dados):
+        """
+        Obtiene la clave de los dados que quedan por jugar.
+        
+        Recibe: Lista de valores de dados (hasta 4)
+        Hace: Combina con XOR la clave de cada valor segun cuantas veces esta
+        Devuelve: Entero de 64 bits
+        """
+        valor_clave = 0
+        valor = 1
+        while valor <= 6:
+            valor_clave = valor_clave ^ self.__claves_dados__[valor][dados.count(valor)]
+            valor = valor + 1
+        
+        return valor_clave
+    
+    def calcular_hash(self, tablero):
+        """
+        Calcula el hash de un tablero desde cero.
+        
+        Recibe: Board
+        Hace: Combina con XOR las claves de todos los puntos
+        Devuelve: Entero de 64 bits
+        """
+        valor = 0
+        for color in ('blanco', 'negro'):
+            claves = self.__tabla__[color]
+            punto = 0
+            while punto < 26:
+                cantidad = tablero.__contar_por_color__(punto, color)
+                valor = valor ^ claves[punto][cantidad]
+                punto = punto + 1
+        
+        return valor
+
+
+# claves compartidas por todos los tableros
+CLAVES_ZOBRIST = Zobrist()
@@ -1,13 +1,149 @@
+import argparse
+import sys
+
 from cli.cli import CLI
+from core.bot import SearchBot, TIEMPO_MAXIMO
+from core.dice import Dice
+
+
+# lineas que junta el modo batch antes de escribirlas de una vez
+LINEAS_POR_ESCRITURA = 1000
+
+
+class SalidaBuffer:
+    """
+    Salida de texto que escribe por bloques.
+    
+    Recibe: Archivo de destino y cantidad de lineas por escritura
+    Hace: Junta las lineas en una lista y las escribe juntas cuando se
+          llena o cuando se vacia a mano
+    Devuelve: Nada
+    """
+    
+    def __init__(self, destino, lineas_por_escritura=LINEAS_POR_ESCRITURA):
+        """
+        Crea la salida vacia.
+        
+        Recibe: Archivo de texto (como sys.stdout) y lineas por escritura
+        Hace: Guarda el destino y prepara la lista
+        Devuelve: Nada
+        """
+        self.__destino__ = destino
+        self.__lineas_por_escritura__ = lineas_por_escritura
+        self.__lineas__ = []
+    
+    def agregar(self, texto):
+        """
+        Agrega una linea.
+        
+        Recibe: String
+        Hace: La guarda y escribe el bloque si se lleno
+        Devuelve: Nada
+        """
+        self.__lineas__.append(texto)
+        if len(self.__lineas__) >= self.__lineas_por_escritura__:
+            self.volcar()
+    
+    def volcar(self):
+        """
+        Escribe las lineas pendientes.
+        
+        Recibe: Nada
+        Hace: Las une con saltos de linea en una sola escritura
+        Devuelve: Nada
+        """
+        if len(self.__lineas__) > 0:
+            self.__destino__.write("\n".join(str(linea) for linea in self.__lineas__) + "\n")
+            self.__lineas__ = []
+        self.__destino__.flush()
+
+
+def __confirmar__(mensaje):
+    """
+    Responde que si a las preguntas del modo batch.
+    
+    Recibe: String con la pregunta
+    Hace: Nada, el comando del archivo ya es la confirmacion
+    Devuelve: String 's'
+    """
+    return 's'
+
+
+def ejecutar_batch(ruta, bot=None, redibujar=True, dados=None):
+    """
+    Ejecuta un archivo de comandos sin interaccion.
+    
+    Recibe: Ruta del archivo ('-' para stdin), bot opcional, si se
+            redibuja el tablero despues de cada comando y dados opcionales
+    Hace: Arma una CLI que escribe en un SalidaBuffer y confirma sola las
+          preguntas, y le pasa las lineas del archivo
+    Devuelve: Integer codigo de salida (0 bien, 1 algun comando fallo,
+              2 no se pudo leer el archivo)
+    """
+    if ruta == "-":
+        archivo = sys.stdin
+    else:
+        try:
+            archivo = open(ruta, encoding="utf-8")
+        except OSError as error:
+            sys.stderr.write("No se pudo abrir " + ruta + ": " + str(error) + "\n")
+            return 2
+    
+    salida = SalidaBuffer(sys.stdout)
+    interfaz = CLI(bot, salida=salida.agregar, entrada=__confirmar__,
+                   redibujar=redibujar, dados=dados)
+    try:
+        codigo = interfaz.ejecutar_lote(archivo)
+    finally:
+        salida.volcar()
+        if archivo != sys.stdin:
+            archivo.close()
+    return codigo
 
 
-def main():
+def main(argumentos=None):
     """
     Punto de entrada del juego cuando se ejecuta `python -m`.
+    
+    Con --bot el jugador 2 es la computadora, que busca con la
+    profundidad (--profundidad) y el tiempo por jugada (--tiempo, 2
+    segundos por defecto y 0 sin limite) pedidos.
+    Con --batch los comandos se leen de un archivo (o de stdin) y se
+    devuelve el codigo de salida.
     """
-    interfaz = CLI()
+    parser = argparse.ArgumentParser(description="Backgammon por consola")
+    parser.add_argument("--bot", action="store_true",
+                        help="jugar contra la computadora")
+    parser.add_argument("--profundidad", type=int, default=1, choices=[0, 1, 2],
+                        help="ply de busqueda de la computadora")
+    parser.add_argument("--tiempo", type=float, default=TIEMPO_MAXIMO,
+                        help="segundos maximos por jugada de la computadora (0 sin limite)")
+    parser.add_argument("--batch", nargs="?", const="-", default=None, metavar="ARCHIVO",
+                        help="leer los comandos de ARCHIVO (o de stdin) sin pedir nada")
+    parser.add_argument("--sin-tablero", action="store_true",
+                        help="no mostrar el tablero despues de cada comando")
+    parser.add_argument("--semilla", type=int, default=None,
+                        help="semilla de los dados, para repetir partidas")
+    opciones = parser.parse_args(argumentos)
+    
+    bot = None
+    if opciones.bot:
+        tiempo = opciones.tiempo
+        if tiempo <= 0:
+            tiempo = None
+        bot = SearchBot(profundidad=opciones.profundidad, tiempo_maximo=tiempo)
+    
+    dados = None
+    if opciones.semilla != None:
+        dados = Dice(semilla=opciones.semilla)
+    
+    if opciones.batch != None:
+        return ejecutar_batch(opciones.batch, bot, not opciones.sin_tablero, dados)
+    
+    interfaz = CLI(bot, redibujar=not opciones.sin_tablero, dados=dados)
     interfaz.iniciar_juego()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,149 @@
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# sin ventana: pygame dibuja en memoria con el driver de video "dummy"
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core.game import BackgammonGame
+from core.position_id import cargar_id_juego
+from pygame_ui import PygameUI
+
+
+# posiciones que cada proceso dibuja por tarea
+TAMANO_LOTE = 50
+
+# interfaz sin ventana de cada proceso (se crea una sola vez)
+__interfaz__ = None
+
+
+def __obtener_interfaz__():
+    """
+    Obtiene la interfaz sin ventana del proceso.
+    
+    Recibe: Nada
+    Hace: La crea la primera vez (o si se cerro pygame), asi pygame, las
+          fuentes y el tablero estatico se preparan una sola vez por proceso
+    Devuelve: PygameUI
+    """
+    global __interfaz__
+    if __interfaz__ == None or pygame.get_init() == False:
+        __interfaz__ = PygameUI(ventana=False)
+    return __interfaz__
+
+
+def __juego_desde__(posicion):
+    """
+    Arma un juego con la posicion pedida.
+    
+    Recibe: BackgammonGame, GameSnapshot o string generado por id_juego
+    Hace: Usa el juego tal cual, lo crea desde la foto o carga el ID
+    Devuelve: BackgammonGame
+    """
+    if isinstance(posicion, BackgammonGame):
+        return posicion
+    if isinstance(posicion, str):
+        juego = BackgammonGame("Blanco", "Negro")
+        cargar_id_juego(juego, posicion)
+        return juego
+    return BackgammonGame.from_snapshot(posicion)
+
+
+def renderizar_png(posicion, ruta):
+    """
+    Guarda una posicion como imagen PNG sin abrir ninguna ventana.
+    
+    Recibe: BackgammonGame, GameSnapshot o ID de juego, y ruta del archivo
+    Hace: Dibuja tablero, fichas e informacion con la interfaz del proceso
+    Devuelve: Nada
+    """
+    interfaz = __obtener_interfaz__()
+    interfaz.set_juego(__juego_desde__(posicion))
+    interfaz.guardar_png(ruta)
+
+
+def renderizar_trabajos(trabajos):
+    """
+    Dibuja un lote de posiciones.
+    
+    Recibe: Lista de tuplas (posicion, ruta)
+    Hace: Llama a renderizar_png con cada una
+    Devuelve: Integer con la cantidad de imagenes guardadas
+    """
+    for posicion, ruta in trabajos:
+        renderizar_png(posicion, ruta)
+    return len(trabajos)
+
+
+def renderizar_lote(trabajos, procesos=None, tamano_lote=TAMANO_LOTE):
+    """
+    Guarda muchas posiciones como PNG en paralelo.
+    
+    Recibe: Lista de tuplas (posicion, ruta), donde la posicion es un ID
+            de juego o un GameSnapshot (se mandan a los procesos sin copiar
+            juegos enteros), procesos (int, None para usar todos los
+            nucleos, 1 para no crear procesos) y tamano_lote (int)
+    Hace: Parte los trabajos en lotes y los reparte en un
+          ProcessPoolExecutor; cada proceso crea su interfaz una sola vez
+    Devuelve: Integer con la cantidad de imagenes guardadas
+    """
+    if procesos == None:
+        procesos = os.cpu_count() or 1
+    
+    trabajos = list(trabajos)
+    lotes = []
+    inicio = 0
+    while inicio < len(trabajos):
+        lotes.append(trabajos[inicio:inicio + tamano_lote])
+        inicio = inicio + tamano_lote
+    
+    guardadas = 0
+    if procesos <= 1 or len(lotes) <= 1:
+        for lote in lotes:
+            guardadas = guardadas + renderizar_trabajos(lote)
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            for cantidad in ejecutor.map(renderizar_trabajos, lotes):
+                guardadas = guardadas + cantidad
+    return guardadas
+
+
+def main(argumentos=None):
+    """
+    Punto de entrada cuando se ejecuta `python -m pygame_render`.
+    
+    Lee un ID de juego por linea (como "4HPwATDgc/ABMA:b31") y guarda
+    cada posicion como posicion_00001.png, posicion_00002.png, ... en el
+    directorio pedido.
+    """
+    parser = argparse.ArgumentParser(description="Guarda posiciones de Backgammon como PNG")
+    parser.add_argument("archivo", help="archivo con un ID de juego por linea ('-' para stdin)")
+    parser.add_argument("directorio", help="directorio donde guardar las imagenes")
+    parser.add_argument("--procesos", type=int, default=None,
+                        help="procesos en paralelo (por defecto todos los nucleos)")
+    opciones = parser.parse_args(argumentos)
+    
+    if opciones.archivo == "-":
+        lineas = sys.stdin.read().splitlines()
+    else:
+        with open(opciones.archivo, encoding="utf-8") as archivo:
+            lineas = archivo.read().splitlines()
+    
+    os.makedirs(opciones.directorio, exist_ok=True)
+    trabajos = []
+    for linea in lineas:
+        identificador = linea.strip()
+        if identificador != "":
+            nombre = "posicion_%05d.png" % (len(trabajos) + 1)
+            trabajos.append((identificador, os.path.join(opciones.directorio, nombre)))
+    
+    guardadas = renderizar_lote(trabajos, opciones.procesos)
+    print(str(guardadas) + " imagenes guardadas en " + opciones.directorio)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,352 @@
 import pygame
 import sys
+from collections import OrderedDict
 
 # importar desde core y game
 from core.game import BackgammonGame
 
 
+# textos renderizados que se guardan como maximo
+CAPACIDAD_TEXTOS = 256
+
+# fichas por jugador (pilas mas altas que se precalculan)
+FICHAS_POR_JUGADOR = 15
+
+
+class TextCache:
+    """
+    Cache LRU de textos ya renderizados.
+    
+    Recibe: Capacidad maxima de superficies
+    Hace: Guarda la superficie de cada (fuente, texto, antialias, color) y
+          la devuelve sin volver a llamar a font.render; cuando se llena
+          descarta la que se uso hace mas tiempo
+    Devuelve: Nada
+    """
+    
+    def __init__(self, capacidad=CAPACIDAD_TEXTOS):
+        """
+        Crea la cache vacia.
+        
+        Recibe: Capacidad (int)
+        Hace: Prepara el diccionario ordenado y los contadores
+        Devuelve: Nada
+        """
+        self.__capacidad__ = capacidad
+        self.__superficies__ = OrderedDict()
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+        self.__descartes__ = 0
+    
+    def render(self, fuente, texto, antialias, color):
+        """
+        Devuelve el texto renderizado, usando la cache si ya estaba.
+        
+        Recibe: Fuente (pygame.font.Font), texto (string), antialias (bool)
+                y color (tupla), en el mismo orden que font.render
+        Hace: Busca la clave; si esta la marca como recien usada, si no
+              renderiza, guarda y descarta la mas vieja si se paso
+        Devuelve: pygame.Surface (compartida: solo para hacer blit)
+        """
+        clave = (fuente, texto, antialias, tuple(color))
+        superficie = self.__superficies__.get(clave)
+        if superficie != None:
+            self.__superficies__.move_to_end(clave)
+            self.__aciertos__ = self.__aciertos__ + 1
+            return superficie
+        
+        self.__fallos__ = self.__fallos__ + 1
+        superficie = fuente.render(texto, antialias, color)
+        self.__superficies__[clave] = superficie
+        if len(self.__superficies__) > self.__capacidad__:
+            self.__superficies__.popitem(last=False)
+            self.__descartes__ = self.__descartes__ + 1
+        return superficie
+    
+    def limpiar(self):
+        """
+        Vacia la cache.
+        
+        Recibe: Nada
+        Hace: Borra las superficies guardadas (los contadores siguen)
+        Devuelve: Nada
+        """
+        self.__superficies__.clear()
+    
+    def get_estadisticas(self):
+        """
+        Obtiene los contadores de uso.
+        
+        Recibe: Nada
+        Hace: Calcula la tasa de aciertos sobre el total de pedidos
+        Devuelve: Diccionario con aciertos, fallos, descartes, tasa_aciertos,
+                  tamano y capacidad
+        """
+        pedidos = self.__aciertos__ + self.__fallos__
+        tasa = 0.0
+        if pedidos > 0:
+            tasa = self.__aciertos__ / pedidos
+        return {"aciertos": self.__aciertos__, "fallos": self.__fallos__,
+                "descartes": self.__descartes__, "tasa_aciertos": tasa,
+                "tamano": len(self.__superficies__), "capacidad": self.__capacidad__}
+
+
+class BoardGeometry:
+    """
+    Geometria del tablero calculada una sola vez por tamaño de ventana.
+    
+    Recibe: Ancho y alto de la ventana y margenes del tablero
+    Hace: Precalcula el centro de cada lugar de ficha (puntos, barra y
+          zona de salida, para cada cantidad de fichas), los contornos de
+          seleccion y una tabla por columna de pixeles que dice que punto
+          hay en cada x; el dibujado, los clicks y la seleccion la comparten
+    Devuelve: Nada
+    """
+    
+    def __init__(self, ancho, alto, margen_x, margen_y):
+        """
+        Calcula toda la geometria.
+        
+        Recibe: Ancho, alto, margen_x y margen_y (int)
+        Hace: Arma las tablas de fichas, de seleccion y de clicks
+        Devuelve: Nada
+        """
+        self.__tamano__ = (ancho, alto)
+        self.__margen_x__ = margen_x
+        self.__margen_y__ = margen_y
+        self.__ancho_tablero__ = ancho - 2 * margen_x
+        self.__alto_tablero__ = alto - 2 * margen_y
+        self.__ancho_punto__ = self.__ancho_tablero__ / 14.0
+        self.__radio__ = int(self.__ancho_punto__ * 0.42)
+        self.__mitad__ = margen_y + self.__alto_tablero__ // 2
+        
+        self.__fichas__ = {}
+        self.__calcular_fichas__()
+        self.__contornos__ = {}
+        self.__calcular_contornos__()
+        self.__columnas_arriba__ = []
+        self.__columnas_abajo__ = []
+        self.__calcular_columnas__()
+    
+    def get_tamano(self):
+        """
+        Obtiene el tamaño de ventana de esta geometria.
+        
+        Recibe: Nada
+        Hace: Devuelve el tamaño guardado
+        Devuelve: Tupla (ancho, alto)
+        """
+        return self.__tamano__
+    
+    def get_radio(self):
+        """
+        Obtiene el radio de las fichas.
+        
+        Recibe: Nada
+        Hace: Devuelve el radio calculado
+        Devuelve: Integer
+        """
+        return self.__radio__
+    
+    def __centro_x__(self, punto):
+        """
+        Calcula el centro horizontal de un punto.
+        
+        Recibe: Punto del tablero (1 a 24)
+        Hace: Ubica la columna saltando la barra
+        Devuelve: Float
+        """
+        if punto <= 12:
+            posicion = 12 - punto
+        else:
+            posicion = punto - 13
+        x_base = self.__margen_x__ + posicion * self.__ancho_punto__
+        if posicion >= 6:
+            x_base += self.__ancho_punto__
+        return x_base + self.__ancho_punto__ / 2.0
+    
+    def __pila__(self, x, base_y, sentido, paso_maximo, altura_disponible):
+        """
+        Calcula los centros de una pila de fichas para cada cantidad.
+        
+        Recibe: Centro x, y de la primera ficha, sentido (1 baja, -1 sube),
+                paso maximo entre fichas y altura disponible
+        Hace: Para 1 a FICHAS_POR_JUGADOR fichas achica el paso si no
+              entran, igual que al dibujar
+        Devuelve: Lista donde el indice es la cantidad y el valor la tupla
+                  de centros (x, y) enteros
+        """
+        x_entero = int(round(x))
+        pilas = [()]
+        cantidad = 1
+        while cantidad <= FICHAS_POR_JUGADOR:
+            paso = 0 if cantidad <= 1 else min(paso_maximo, altura_disponible / (cantidad - 1))
+            centros = []
+            indice = 0
+            while indice < cantidad:
+                centros.append((x_entero, int(round(base_y + sentido * paso * indice))))
+                indice = indice + 1
+            pilas.append(tuple(centros))
+            cantidad = cantidad + 1
+        return pilas
+    
+    def __calcular_fichas__(self):
+        """
+        Precalcula los centros de las fichas de cada lugar.
+        
+        Recibe: Nada
+        Hace: Guarda las pilas de los puntos 1 a 24, de la barra (blancas
+              arriba, negras abajo) y de la zona de salida (negras arriba,
+              blancas abajo)
+        Devuelve: Nada
+        """
+        margen_x = self.__margen_x__
+        margen_y = self.__margen_y__
+        alto_tablero = self.__alto_tablero__
+        ancho_punto = self.__ancho_punto__
+        radio = self.__radio__
+        altura_punto = alto_tablero / 2.0 - 40
+        altura_disponible = max(altura_punto - 52, radio)
+        
+        punto = 1
+        while punto <= 24:
+            if punto <= 12:
+                base_y = margen_y + 26 + radio
+                sentido = 1
+            else:
+                base_y = margen_y + alto_tablero - 26 - radio
+                sentido = -1
+            self.__fichas__[punto] = self.__pila__(self.__centro_x__(punto), base_y, sentido,
+                                                   radio * 2 + 6, altura_disponible)
+            punto = punto + 1
+        
+        x_barra = margen_x + 6 * ancho_punto + ancho_punto / 2.0
+        self.__fichas__[(0, 'blanco')] = self.__pila__(x_barra, margen_y + 55 + radio, 1,
+                                                       radio * 2 + 8, alto_tablero - 80)
+        self.__fichas__[(0, 'negro')] = self.__pila__(x_barra, margen_y + alto_tablero - 55 - radio, -1,
+                                                      radio * 2 + 8, alto_tablero - 80)
+        
+        x_salida = margen_x + 13 * ancho_punto + ancho_punto / 2.0
+        altura_salida = alto_tablero / 2 - 60
+        self.__fichas__[(25, 'negro')] = self.__pila__(x_salida, margen_y + 36 + radio, 1,
+                                                       radio * 2 + 10, altura_salida)
+        self.__fichas__[(25, 'blanco')] = self.__pila__(x_salida, margen_y + alto_tablero - 36 - radio, -1,
+                                                        radio * 2 + 10, altura_salida)
+    
+    def posiciones_fichas(self, lugar, cantidad):
+        """
+        Obtiene los centros de las fichas de un lugar.
+        
+        Recibe: Lugar (punto 1 a 24, o tupla (0, color) para la barra y
+                (25, color) para la salida) y cantidad de fichas
+        Hace: Busca la pila ya calculada
+        Devuelve: Tupla de centros (x, y)
+        """
+        return self.__fichas__[lugar][cantidad]
+    
+    def __calcular_contornos__(self):
+        """
+        Precalcula lo que se resalta al seleccionar cada punto.
+        
+        Recibe: Nada
+        Hace: Guarda el rectangulo de la barra (punto 0) y el triangulo de
+              los puntos 1 a 24, con el ancho de punto entero de los clicks
+        Devuelve: Nada
+        """
+        margen_x = self.__margen_x__
+        margen_y = self.__margen_y__
+        alto_tablero = self.__alto_tablero__
+        ancho_punto = int(self.__ancho_tablero__ / 14)
+        alto_punto = int(alto_tablero / 2 - 40)
+        
+        self.__contornos__[0] = (margen_x + 6 * ancho_punto, margen_y, ancho_punto, alto_tablero)
+        
+        punto = 1
+        while punto <= 24:
+            if punto <= 12:
+                posicion = 12 - punto
+                y_base = margen_y
+                y_punta = margen_y + alto_punto
+            else:
+                posicion = punto - 13
+                y_base = margen_y + alto_tablero
+                y_punta = margen_y + alto_tablero - alto_punto
+            base = margen_x + posicion * ancho_punto
+            if posicion >= 6:
+                base += ancho_punto
+            self.__contornos__[punto] = ((int(base), y_base), (int(base + ancho_punto), y_base),
+                                         (int(base + ancho_punto / 2), y_punta))
+            punto = punto + 1
+    
+    def contorno_seleccion(self, punto):
+        """
+        Obtiene el contorno a resaltar de un punto.
+        
+        Recibe: Punto (0 para la barra, 1 a 24)
+        Hace: Busca el contorno ya calculado
+        Devuelve: Tupla (x, y, ancho, alto) para la barra, tupla de tres
+                  vertices para un punto o None
+        """
+        return self.__contornos__.get(punto)
+    
+    def __calcular_columnas__(self):
+        """
+        Precalcula que hay en cada columna de pixeles del tablero.
+        
+        Recibe: Nada
+        Hace: Para cada x relativo al margen guarda el punto de la mitad de
+              arriba y el de abajo (0 la barra, 25 la zona de salida)
+        Devuelve: Nada
+        """
+        ancho_punto = int(self.__ancho_tablero__ / 14)
+        x_relativo = 0
+        while x_relativo <= self.__ancho_tablero__:
+            if 6 * ancho_punto <= x_relativo <= 7 * ancho_punto:
+                arriba = 0
+                abajo = 0
+            elif x_relativo >= 13 * ancho_punto:
+                arriba = 25
+                abajo = 25
+            else:
+                columna = x_relativo
+                if columna > 7 * ancho_punto:
+                    columna = columna - ancho_punto
+                columna = columna // ancho_punto
+                arriba = 12 - columna
+                abajo = 13 + columna
+            self.__columnas_arriba__.append(arriba)
+            self.__columnas_abajo__.append(abajo)
+            x_relativo = x_relativo + 1
+    
+    def punto_en(self, x, y, color_actual=None):
+        """
+        Obtiene el punto que hay en una posicion de la ventana.
+        
+        Recibe: Integer x, Integer y y color del jugador en turno (la zona
+                de salida solo cuenta en su mitad; None si no hay juego)
+        Hace: Mira la tabla de columnas y la mitad del tablero
+        Devuelve: Integer con el numero de punto (0 barra, 25 salida) o None
+        """
+        x_relativo = int(x) - self.__margen_x__
+        if x_relativo < 0 or x_relativo > self.__ancho_tablero__:
+            return None
+        if y < self.__margen_y__ or y > self.__margen_y__ + self.__alto_tablero__:
+            return None
+        
+        if y < self.__mitad__:
+            punto = self.__columnas_arriba__[x_relativo]
+        else:
+            punto = self.__columnas_abajo__[x_relativo]
+        
+        if punto == 25:
+            if color_actual == 'blanco' and y >= self.__mitad__:
+                return 25
+            if color_actual == 'negro' and y <= self.__mitad__:
+                return 25
+            return None
+        return punto
+
+
 class PygameUI:
     """
     Clase que representa la interfaz grafica del juego.
@@ -14,11 +356,15 @@ class PygameUI:
     Devuelve: Nada
     """
     
-    def __init__(self):
+    def __init__(self, bot=None, por_eventos=False, ventana=True):
         """
         Inicializa la interfaz grafica.
         
-        Recibe: Nada
+        Recibe: Bot (SearchBot) opcional que juega con las fichas negras,
+                por_eventos (bool): si es True el loop espera eventos en
+                lugar de correr a 30 cuadros por segundo, y ventana (bool):
+                si es False se dibuja en una superficie en memoria sin
+                abrir ninguna ventana (para guardar imagenes)
         Hace: Configura pygame y crea el juego
         Devuelve: Nada
         """
@@ -28,13 +374,18 @@ class PygameUI:
         # configuracion de la ventana
         self.__ancho__ = 1300
         self.__alto__ = 900
-        self.__pantalla__ = pygame.display.set_mode((self.__ancho__, self.__alto__))
-        pygame.display.set_caption("Backgammon")
+        self.__ventana__ = ventana
+        if ventana == True:
+            self.__pantalla__ = pygame.display.set_mode((self.__ancho__, self.__alto__))
+            pygame.display.set_caption("Backgammon")
+        else:
+            self.__pantalla__ = pygame.Surface((self.__ancho__, self.__alto__))
         self.__margen_x__ = 70
         self.__margen_y__ = 110
         
-        # reloj para controlar fps
+        # reloj para controlar fps (solo sin por_eventos)
         self.__reloj__ = pygame.time.Clock()
+        self.__por_eventos__ = por_eventos
         
         # colores - paleta con tonos madera y contraste claro/oscuro
         self.__color_fondo__ = (233, 224, 207)  # beige suave de fondo
@@ -59,6 +410,9 @@ class PygameUI:
         self.__fuente_mediana__ = pygame.font.SysFont('Arial', 24)
         self.__fuente_pequena__ = pygame.font.SysFont('Arial', 18)
         
+        # textos ya renderizados (numeros, botones, nombres)
+        self.__textos__ = TextCache()
+        
         # el juego
         self.__juego__ = None
         
@@ -70,10 +424,94 @@ class PygameUI:
         self.__mensaje_error__ = ""
         self.__tiempo_error__ = 0
         
+        # computadora que juega como jugador 2 (None si son dos personas)
+        self.__bot__ = bot
+        
         # ejecutando
         self.__ejecutando__ = True
         self.__areas_botones__ = {}
+        
+        # tablero estatico (fondo, triangulos y numeros) dibujado una vez
+        self.__superficie_tablero__ = None
+        self.__tamano_superficie__ = None
+        
+        # posiciones de fichas, clicks y seleccion (se arma por tamaño)
+        self.__geometria__ = None
+        
+        # firmas de lo que se mostro en cada region (None: redibujar todo)
+        self.__firmas__ = None
 
+    def get_estadisticas_textos(self):
+        """
+        Obtiene las estadisticas de la cache de textos.
+        
+        Recibe: Nada
+        Hace: Se las pide a la cache
+        Devuelve: Diccionario (ver TextCache.get_estadisticas)
+        """
+        return self.__textos__.get_estadisticas()
+    
+    def get_pantalla(self):
+        """
+        Obtiene la superficie donde se dibuja.
+        
+        Recibe: Nada
+        Hace: Devuelve la ventana o la superficie en memoria
+        Devuelve: pygame.Surface
+        """
+        return self.__pantalla__
+    
+    def set_juego(self, juego):
+        """
+        Cambia el juego que se muestra.
+        
+        Recibe: BackgammonGame
+        Hace: Lo guarda sin pedir nombres y borra la seleccion
+        Devuelve: Nada
+        """
+        self.__juego__ = juego
+        self.__punto_seleccionado__ = None
+        self.__firmas__ = None
+    
+    def dibujar_posicion(self):
+        """
+        Dibuja la posicion del juego sin botones ni mensajes.
+        
+        Recibe: Nada
+        Hace: Dibuja tablero, fichas e informacion del turno en la
+              pantalla, sin mostrarla ni leer el mouse
+        Devuelve: Nada
+        """
+        self.dibujar_tablero()
+        self.dibujar_fichas()
+        self.dibujar_info()
+    
+    def guardar_png(self, ruta):
+        """
+        Guarda la posicion del juego como imagen.
+        
+        Recibe: Ruta del archivo (string)
+        Hace: Dibuja la posicion y la guarda con pygame.image.save
+        Devuelve: Nada
+        """
+        self.dibujar_posicion()
+        pygame.image.save(self.__pantalla__, ruta)
+
+    def get_geometria(self):
+        """
+        Obtiene la geometria del tablero.
+        
+        Recibe: Nada
+        Hace: La calcula la primera vez y solo la vuelve a calcular si
+              cambio el tamaño de la ventana
+        Devuelve: BoardGeometry
+        """
+        tamano = (self.__ancho__, self.__alto__)
+        if self.__geometria__ == None or self.__geometria__.get_tamano() != tamano:
+            self.__geometria__ = BoardGeometry(self.__ancho__, self.__alto__,
+                                               self.__margen_x__, self.__margen_y__)
+        return self.__geometria__
+    
     def __geom_tablero__(self):
         """
         Devuelve la geometría actual del tablero (márgenes y dimensiones).
@@ -92,7 +530,10 @@ class PygameUI:
         """
         # pedir nombres de jugadores
         nombre1 = self.pedir_nombre("Ingrese nombre del Jugador 1 (Blanco)")
-        nombre2 = self.pedir_nombre("Ingrese nombre del Jugador 2 (Negro)")
+        if self.__bot__ != None:
+            nombre2 = "Computadora"
+        else:
+            nombre2 = self.pedir_nombre("Ingrese nombre del Jugador 2 (Negro)")
         
         # crear el juego
         self.__juego__ = BackgammonGame(nombre1, nombre2)
@@ -102,6 +543,9 @@ class PygameUI:
         self.__dados_tirados__ = False
         self.__mensaje_error__ = ""
         self.__tiempo_error__ = 0
+        
+        # la pantalla de nombres tapo todo: redibujar la ventana entera
+        self.__firmas__ = None
     
     def pedir_nombre(self, mensaje):
         """
@@ -115,21 +559,6 @@ class PygameUI:
         ingresando = True
         
         while ingresando:
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_RETURN:
-                        if nombre != "":
-                            ingresando = False
-                    elif evento.key == pygame.K_BACKSPACE:
-                        nombre = nombre[0:len(nombre)-1]
-                    else:
-                        if len(nombre) < 20:
-                            nombre = nombre + evento.unicode
-            
             # dibujar pantalla
             self.__pantalla__.fill(self.__color_fondo__)
             
@@ -147,11 +576,11 @@ class PygameUI:
                            (x_cuadro, y_cuadro, ancho_cuadro, alto_cuadro), border_radius=22)
             
             # dibujar mensaje
-            titulo = self.__fuente_grande__.render("Configuración de jugadores", True, self.__color_texto__)
+            titulo = self.__textos__.render(self.__fuente_grande__, "Configuración de jugadores", True, self.__color_texto__)
             rect_titulo = titulo.get_rect(center=(self.__ancho__ // 2, y_cuadro + 55))
             self.__pantalla__.blit(titulo, rect_titulo)
             
-            texto_mensaje = self.__fuente_mediana__.render(mensaje, True, self.__color_texto_secundario__)
+            texto_mensaje = self.__textos__.render(self.__fuente_mediana__, mensaje, True, self.__color_texto_secundario__)
             rectangulo_mensaje = texto_mensaje.get_rect(center=(self.__ancho__ // 2, y_cuadro + 110))
             self.__pantalla__.blit(texto_mensaje, rectangulo_mensaje)
             
@@ -168,16 +597,31 @@ class PygameUI:
             
             # dibujar nombre
             if nombre == "":
-                texto_nombre = self.__fuente_mediana__.render("_", True, (150, 150, 150))
+                texto_nombre = self.__textos__.render(self.__fuente_mediana__, "_", True, (150, 150, 150))
             else:
-                texto_nombre = self.__fuente_mediana__.render(nombre + "_", True, self.__color_borde__)
+                texto_nombre = self.__textos__.render(self.__fuente_mediana__, nombre + "_", True, self.__color_borde__)
             
             rectangulo_nombre = texto_nombre.get_rect()
             rectangulo_nombre.midleft = (x_campo + 16, y_campo + alto_campo // 2)
             self.__pantalla__.blit(texto_nombre, rectangulo_nombre)
             
             pygame.display.flip()
-            self.__reloj__.tick(30)
+            
+            # esperar teclas
+            for evento in self.leer_eventos():
+                if evento.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                
+                if evento.type == pygame.KEYDOWN:
+                    if evento.key == pygame.K_RETURN:
+                        if nombre != "":
+                            ingresando = False
+                    elif evento.key == pygame.K_BACKSPACE:
+                        nombre = nombre[0:len(nombre)-1]
+                    else:
+                        if len(nombre) < 20:
+                            nombre = nombre + evento.unicode
         
         return nombre
     
@@ -186,31 +630,51 @@ class PygameUI:
         Dibuja el tablero de backgammon.
         
         Recibe: Nada
-        Hace: Dibuja el tablero con todos los puntos
+        Hace: Copia el tablero estatico ya dibujado; solo lo vuelve a crear
+              si cambio el tamaño de la ventana
         Devuelve: Nada
         """
+        tamano = (self.__ancho__, self.__alto__)
+        if self.__superficie_tablero__ == None or self.__tamano_superficie__ != tamano:
+            self.__superficie_tablero__ = self.__crear_superficie_tablero__()
+            self.__tamano_superficie__ = tamano
+        self.__pantalla__.blit(self.__superficie_tablero__, (0, 0))
+    
+    def __crear_superficie_tablero__(self):
+        """
+        Dibuja la parte fija del tablero en una superficie aparte.
+        
+        Recibe: Nada
+        Hace: Dibuja fondo, marco, triangulos, numeros de los puntos, barra
+              y zona de salida, que no cambian durante el juego
+        Devuelve: pygame.Surface del tamaño de la ventana
+        """
+        superficie = pygame.Surface((self.__ancho__, self.__alto__))
+        if pygame.display.get_surface() != None:
+            superficie = superficie.convert()
+        
         # fondo
-        self.__pantalla__.fill(self.__color_fondo__)
+        superficie.fill(self.__color_fondo__)
         
         # rectangulo del tablero
         margen_x, margen_y, ancho_tablero, alto_tablero = self.__geom_tablero__()
         ancho_punto = ancho_tablero / 14.0
         alto_punto = alto_tablero / 2.0 - 40
         
-        pygame.draw.rect(self.__pantalla__, self.__color_sombra__, 
+        pygame.draw.rect(superficie, self.__color_sombra__, 
                         (margen_x + 6, margen_y + 10, ancho_tablero, alto_tablero), border_radius=20)
-        pygame.draw.rect(self.__pantalla__, self.__color_tablero__, 
+        pygame.draw.rect(superficie, self.__color_tablero__, 
                         (margen_x, margen_y, ancho_tablero, alto_tablero), border_radius=22)
-        pygame.draw.rect(self.__pantalla__, self.__color_tablero_claro__, 
+        pygame.draw.rect(superficie, self.__color_tablero_claro__, 
                         (margen_x + 14, margen_y + 14, ancho_tablero - 28, alto_tablero - 28), border_radius=18)
-        pygame.draw.rect(self.__pantalla__, self.__color_borde__, 
+        pygame.draw.rect(superficie, self.__color_borde__, 
                         (margen_x, margen_y, ancho_tablero, alto_tablero), 4, border_radius=22)
 
         # sombreado lateral para efecto 3D
         sombra_rect = pygame.Rect(margen_x - 8, margen_y + 20, 16, alto_tablero - 40)
-        pygame.draw.ellipse(self.__pantalla__, self.__color_sombra__, sombra_rect)
+        pygame.draw.ellipse(superficie, self.__color_sombra__, sombra_rect)
         cuerpo_rect = pygame.Rect(margen_x - 4, margen_y + 12, 12, alto_tablero - 24)
-        pygame.draw.rect(self.__pantalla__, (120, 96, 70), cuerpo_rect, border_radius=8)
+        pygame.draw.rect(superficie, (120, 96, 70), cuerpo_rect, border_radius=8)
         
         # puntos superiores (12 a 1)
         posicion = 0
@@ -232,16 +696,16 @@ class PygameUI:
             punto_1 = (base_izq + 3, margen_y + 8)
             punto_2 = (base_der - 3, margen_y + 8)
             punto_3 = (punta, margen_y + alto + 2)
-            pygame.draw.polygon(self.__pantalla__, color, [punto_1, punto_2, punto_3])
-            pygame.draw.polygon(self.__pantalla__, self.__color_borde__, 
+            pygame.draw.polygon(superficie, color, [punto_1, punto_2, punto_3])
+            pygame.draw.polygon(superficie, self.__color_borde__, 
                               [punto_1, punto_2, punto_3], 2)
             
             # numero del punto
             numero = 12 - posicion
-            texto = self.__fuente_pequena__.render(str(numero), True, self.__color_texto_secundario__)
+            texto = self.__textos__.render(self.__fuente_pequena__, str(numero), True, self.__color_texto_secundario__)
             rect_texto = texto.get_rect()
             rect_texto.center = (punta, margen_y + alto + 20)
-            self.__pantalla__.blit(texto, rect_texto)
+            superficie.blit(texto, rect_texto)
             
             posicion = posicion + 1
         
@@ -265,216 +729,86 @@ class PygameUI:
             punto_1 = (base_izq + 3, int(margen_y + alto_tablero) - 8)
             punto_2 = (base_der - 3, int(margen_y + alto_tablero) - 8)
             punto_3 = (punta, int(margen_y + alto_tablero - alto) - 2)
-            pygame.draw.polygon(self.__pantalla__, color, [punto_1, punto_2, punto_3])
-            pygame.draw.polygon(self.__pantalla__, self.__color_borde__, 
+            pygame.draw.polygon(superficie, color, [punto_1, punto_2, punto_3])
+            pygame.draw.polygon(superficie, self.__color_borde__, 
                               [punto_1, punto_2, punto_3], 2)
             
             # numero del punto
             numero = 13 + posicion
-            texto = self.__fuente_pequena__.render(str(numero), True, self.__color_texto_secundario__)
+            texto = self.__textos__.render(self.__fuente_pequena__, str(numero), True, self.__color_texto_secundario__)
             rect_texto = texto.get_rect()
             rect_texto.center = (punta, margen_y + alto_tablero - alto - 20)
-            self.__pantalla__.blit(texto, rect_texto)
+            superficie.blit(texto, rect_texto)
             
             posicion = posicion + 1
         
         # barra central
         x_barra = margen_x + 6 * ancho_punto
-        pygame.draw.rect(self.__pantalla__, self.__color_borde__, 
+        pygame.draw.rect(superficie, self.__color_borde__, 
                         (x_barra, margen_y, ancho_punto, alto_tablero))
-        pygame.draw.rect(self.__pantalla__, (120, 90, 65), 
+        pygame.draw.rect(superficie, (120, 90, 65), 
                         (x_barra + 6, margen_y + 6, ancho_punto - 12, alto_tablero - 12), border_radius=6)
         
         # zona de salida para fichas (bear off)
         x_salida = margen_x + 13 * ancho_punto
         ancho_salida = ancho_punto
-        pygame.draw.rect(self.__pantalla__, self.__color_borde__,
+        pygame.draw.rect(superficie, self.__color_borde__,
                          (x_salida, margen_y, ancho_salida, alto_tablero), border_radius=10)
-        pygame.draw.rect(self.__pantalla__, (214, 198, 171),
+        pygame.draw.rect(superficie, (214, 198, 171),
                          (x_salida + 4, margen_y + 8, ancho_salida - 8, alto_tablero - 16), border_radius=12)
         # linea divisoria para separar zona superior e inferior
-        pygame.draw.line(self.__pantalla__, (196, 172, 140),
+        pygame.draw.line(superficie, (196, 172, 140),
                          (x_salida + 6, margen_y + alto_tablero // 2),
                          (x_salida + ancho_salida - 6, margen_y + alto_tablero // 2), 3)
+        
+        return superficie
     
     def dibujar_fichas(self):
         """
         Dibuja todas las fichas en el tablero.
         
         Recibe: Nada
-        Hace: Dibuja cada ficha en su posicion correspondiente
+        Hace: Dibuja cada ficha en el centro que da la geometria
         Devuelve: Nada
         """
         if self.__juego__ == None:
             return
         
-        margen_x, margen_y, ancho_tablero, alto_tablero = self.__geom_tablero__()
-        ancho_punto = ancho_tablero / 14.0
-        radio = int(ancho_punto * 0.42)
-        altura_punto = alto_tablero / 2.0 - 40
-
-        def centro_x(punto_tablero):
-            if punto_tablero <= 12:
-                posicion = 12 - punto_tablero
-            else:
-                posicion = punto_tablero - 13
-            x_base = margen_x + posicion * ancho_punto
-            if posicion >= 6:
-                x_base += ancho_punto
-            return x_base + ancho_punto / 2.0
-        
+        geometria = self.get_geometria()
         tablero = self.__juego__.get_tablero()
         
         # dibujar fichas en cada punto (1 a 24)
         punto = 1
         while punto <= 24:
-            fichas = tablero.get_fichas_en_punto(punto)
+            cantidad = tablero.contar_fichas_en_punto(punto)
             
-            if len(fichas) > 0:
-                # determinar posicion x del punto
-                if punto <= 12:
-                    x = centro_x(punto)
-                    altura_disponible = max(altura_punto - 52, radio)
-                    paso = 0 if len(fichas) <= 1 else min(radio * 2 + 6, altura_disponible / (len(fichas) - 1))
-                    base_y = margen_y + 26 + radio
-                    sentido = 1
+            if cantidad > 0:
+                # determinar color
+                if tablero.get_color_en_punto(punto) == 'blanco':
+                    color = self.__color_blanco__
+                    color_texto = self.__color_negro__
                 else:
-                    x = centro_x(punto)
-                    altura_disponible = max(altura_punto - 52, radio)
-                    paso = 0 if len(fichas) <= 1 else min(radio * 2 + 6, altura_disponible / (len(fichas) - 1))
-                    base_y = margen_y + alto_tablero - 26 - radio
-                    sentido = -1
+                    color = self.__color_negro__
+                    color_texto = self.__color_blanco__
                 
-                # dibujar cada ficha
-                indice = 0
-                while indice < len(fichas):
-                    ficha = fichas[indice]
-                    
-                    # determinar color
-                    if ficha.get_color() == 'blanco':
-                        color = self.__color_blanco__
-                    else:
-                        color = self.__color_negro__
-                    
-                    y = int(round(base_y + sentido * paso * indice))
-                    x_int = int(round(x))
-                    
-                    # dibujar ficha con pequeña sombra
-                    pygame.draw.circle(self.__pantalla__, self.__color_sombra__, (x_int + 2, y + 3), radio)
-                    pygame.draw.circle(self.__pantalla__, color, (x_int, y), radio)
-                    pygame.draw.circle(self.__pantalla__, self.__color_borde__, (x_int, y), radio, 3)
-                    
-                    # si hay muchas fichas, mostrar numero
-                    if len(fichas) > 7 and indice == 6:
-                        texto = self.__fuente_pequena__.render(str(len(fichas) - 6), True, 
-                                                               self.__color_negro__ if color == self.__color_blanco__ else self.__color_blanco__)
-                        rect_texto = texto.get_rect()
-                        rect_texto.center = (x_int, y)
-                        self.__pantalla__.blit(texto, rect_texto)
-                        break
-                    
-                    indice = indice + 1
+                # mas de 7 fichas: la septima muestra cuantas faltan
+                self.__dibujar_pila__(geometria.posiciones_fichas(punto, cantidad),
+                                      color, color_texto, 7)
             
             punto = punto + 1
         
-        # dibujar fichas en la barra (punto 0)
-        fichas_barra = tablero.get_fichas_en_punto(0)
-        if len(fichas_barra) > 0:
-            x_barra = margen_x + 6 * ancho_punto + ancho_punto / 2.0
-            
-            # separar por color
-            fichas_blancas = []
-            fichas_negras = []
-            i = 0
-            while i < len(fichas_barra):
-                if fichas_barra[i].get_color() == 'blanco':
-                    fichas_blancas.append(fichas_barra[i])
-                else:
-                    fichas_negras.append(fichas_barra[i])
-                i = i + 1
-            
-            def dibujar_stack_barra(fichas_color, arriba=True):
-                if not fichas_color:
-                    return
-                altura_disponible = alto_tablero - 80
-                paso = 0 if len(fichas_color) <= 1 else min(radio * 2 + 8, altura_disponible / (len(fichas_color) - 1))
-                if arriba:
-                    base_y = margen_y + 55 + radio
-                    sentido = 1
-                    color_ficha = self.__color_blanco__
-                    color_texto = self.__color_negro__
-                else:
-                    base_y = margen_y + alto_tablero - 55 - radio
-                    sentido = -1
-                    color_ficha = self.__color_negro__
-                    color_texto = self.__color_blanco__
-                for idx in range(len(fichas_color)):
-                    y = int(round(base_y + sentido * paso * idx))
-                    x_centro = int(round(x_barra))
-                    pygame.draw.circle(self.__pantalla__, self.__color_sombra__, (x_centro + 2, y + 3), radio)
-                    pygame.draw.circle(self.__pantalla__, color_ficha, (x_centro, y), radio)
-                    pygame.draw.circle(self.__pantalla__, self.__color_borde__, (x_centro, y), radio, 3)
-                    if len(fichas_color) > 7 and idx == 6:
-                        texto = self.__fuente_pequena__.render(str(len(fichas_color) - 6), True, color_texto)
-                        rect_texto = texto.get_rect()
-                        rect_texto.center = (x_centro, y)
-                        self.__pantalla__.blit(texto, rect_texto)
-                        break
-            
-            dibujar_stack_barra(fichas_blancas, arriba=True)
-            dibujar_stack_barra(fichas_negras, arriba=False)
-        
-        # dibujar fichas sacadas (a la derecha del tablero)
-        fichas_fuera = tablero.get_fichas_en_punto(25)
-        if len(fichas_fuera) > 0:
-            fichas_fuera_blancas = []
-            fichas_fuera_negras = []
-            indice_fuera = 0
-            while indice_fuera < len(fichas_fuera):
-                ficha = fichas_fuera[indice_fuera]
-                if ficha.get_color() == 'blanco':
-                    fichas_fuera_blancas.append(ficha)
-                else:
-                    fichas_fuera_negras.append(ficha)
-                indice_fuera = indice_fuera + 1
-            
-            x_salida = margen_x + 13 * ancho_punto + ancho_punto / 2.0
-            altura_salida = alto_tablero / 2 - 60
-            paso_base = radio * 2 + 10
-            
-            if len(fichas_fuera_negras) > 0:
-                paso = 0 if len(fichas_fuera_negras) <= 1 else min(paso_base, altura_salida / (len(fichas_fuera_negras) - 1))
-                base_y = margen_y + 36 + radio
-                idx = 0
-                while idx < len(fichas_fuera_negras):
-                    y = int(round(base_y + paso * idx))
-                    x_centro = int(round(x_salida))
-                    pygame.draw.circle(self.__pantalla__, self.__color_sombra__, (x_centro + 2, y + 3), radio)
-                    pygame.draw.circle(self.__pantalla__, self.__color_negro__, (x_centro, y), radio)
-                    pygame.draw.circle(self.__pantalla__, self.__color_borde__, (x_centro, y), radio, 3)
-                    if len(fichas_fuera_negras) > 6 and idx == 5:
-                        texto = self.__fuente_pequena__.render(str(len(fichas_fuera_negras) - 5), True, self.__color_blanco__)
-                        rect_texto = texto.get_rect(center=(x_centro, y))
-                        self.__pantalla__.blit(texto, rect_texto)
-                        break
-                    idx = idx + 1
-            
-            if len(fichas_fuera_blancas) > 0:
-                paso = 0 if len(fichas_fuera_blancas) <= 1 else min(paso_base, altura_salida / (len(fichas_fuera_blancas) - 1))
-                base_y = margen_y + alto_tablero - 36 - radio
-                idx = 0
-                while idx < len(fichas_fuera_blancas):
-                    y = int(round(base_y - paso * idx))
-                    x_centro = int(round(x_salida))
-                    pygame.draw.circle(self.__pantalla__, self.__color_sombra__, (x_centro + 2, y + 3), radio)
-                    pygame.draw.circle(self.__pantalla__, self.__color_blanco__, (x_centro, y), radio)
-                    pygame.draw.circle(self.__pantalla__, self.__color_borde__, (x_centro, y), radio, 3)
-                    if len(fichas_fuera_blancas) > 6 and idx == 5:
-                        texto = self.__fuente_pequena__.render(str(len(fichas_fuera_blancas) - 5), True, self.__color_negro__)
-                        rect_texto = texto.get_rect(center=(x_centro, y))
-                        self.__pantalla__.blit(texto, rect_texto)
-                        break
-                    idx = idx + 1
+        # dibujar fichas en la barra (punto 0) y sacadas (zona de salida);
+        # en la salida las pilas se tocan en el medio y las blancas van encima
+        colores = {'blanco': (self.__color_blanco__, self.__color_negro__),
+                   'negro': (self.__color_negro__, self.__color_blanco__)}
+        contar = {0: tablero.contar_fichas_en_barra, 25: tablero.contar_fichas_sacadas}
+        for lugar, limite, orden in ((0, 7, ('blanco', 'negro')), (25, 6, ('negro', 'blanco'))):
+            for color in orden:
+                cantidad = contar[lugar](color)
+                if cantidad > 0:
+                    color_ficha, color_texto = colores[color]
+                    self.__dibujar_pila__(geometria.posiciones_fichas((lugar, color), cantidad),
+                                          color_ficha, color_texto, limite)
         
         jugador1 = self.__juego__.get_jugador1()
         jugador2 = self.__juego__.get_jugador2()
@@ -484,7 +818,7 @@ class PygameUI:
         # fichas blancas sacadas (arriba)
         fichas_sacadas_blanco = jugador1.get_fichas_sacadas()
         if fichas_sacadas_blanco > 0:
-            texto = self.__fuente_mediana__.render(f"Sacadas: {fichas_sacadas_blanco}", True, self.__color_texto__)
+            texto = self.__textos__.render(self.__fuente_mediana__, f"Sacadas: {fichas_sacadas_blanco}", True, self.__color_texto__)
             rect_texto = texto.get_rect()
             rect_texto.midright = (x_sacadas, 50)
             self.__pantalla__.blit(texto, rect_texto)
@@ -492,11 +826,35 @@ class PygameUI:
         # fichas negras sacadas (abajo)
         fichas_sacadas_negro = jugador2.get_fichas_sacadas()
         if fichas_sacadas_negro > 0:
-            texto = self.__fuente_mediana__.render(f"Sacadas: {fichas_sacadas_negro}", True, self.__color_texto__)
+            texto = self.__textos__.render(self.__fuente_mediana__, f"Sacadas: {fichas_sacadas_negro}", True, self.__color_texto__)
             rect_texto = texto.get_rect()
             rect_texto.midright = (x_sacadas, self.__alto__ - 50)
             self.__pantalla__.blit(texto, rect_texto)
     
+    def __dibujar_pila__(self, centros, color, color_texto, limite):
+        """
+        Dibuja una pila de fichas.
+        
+        Recibe: Tupla de centros (x, y), color de las fichas, color del
+                numero y limite de fichas visibles
+        Hace: Dibuja cada ficha con su sombra; si hay mas fichas que el
+              limite, la ultima visible muestra cuantas quedan
+        Devuelve: Nada
+        """
+        radio = self.get_geometria().get_radio()
+        indice = 0
+        while indice < len(centros):
+            x, y = centros[indice]
+            pygame.draw.circle(self.__pantalla__, self.__color_sombra__, (x + 2, y + 3), radio)
+            pygame.draw.circle(self.__pantalla__, color, (x, y), radio)
+            pygame.draw.circle(self.__pantalla__, self.__color_borde__, (x, y), radio, 3)
+            if len(centros) > limite and indice == limite - 1:
+                texto = self.__textos__.render(self.__fuente_pequena__, str(len(centros) - limite + 1),
+                                               True, color_texto)
+                self.__pantalla__.blit(texto, texto.get_rect(center=(x, y)))
+                break
+            indice = indice + 1
+    
     def dibujar_seleccion(self):
         """
         Dibuja el indicador de punto seleccionado.
@@ -509,41 +867,15 @@ class PygameUI:
             return
         
         punto = self.__punto_seleccionado__
-        
-        # si es barra
-        margen_x, margen_y, ancho_tablero, alto_tablero = self.__geom_tablero__()
-        ancho_punto = int(ancho_tablero / 14)
-        alto_punto = int(alto_tablero / 2 - 40)
-
-        if punto == 0:
-            x_barra = margen_x + 6 * ancho_punto
-            pygame.draw.rect(self.__pantalla__, self.__color_seleccion__, 
-                           (x_barra, margen_y, ancho_punto, alto_tablero), 5)
+        contorno = self.get_geometria().contorno_seleccion(punto)
+        if contorno == None:
             return
         
-        # punto normal
-        if punto <= 12:
-            posicion = 12 - punto
-            base = margen_x + posicion * ancho_punto
-            if posicion >= 6:
-                base += ancho_punto
-            base_izq = int(base)
-            base_der = int(base + ancho_punto)
-            punta = int(base + ancho_punto / 2)
-            pygame.draw.polygon(self.__pantalla__, self.__color_seleccion__,
-                              [(base_izq, margen_y), (base_der, margen_y), (punta, margen_y + alto_punto)], 5)
+        # la barra es un rectangulo, los puntos son triangulos
+        if punto == 0:
+            pygame.draw.rect(self.__pantalla__, self.__color_seleccion__, contorno, 5)
         else:
-            posicion = punto - 13
-            base = margen_x + posicion * ancho_punto
-            if posicion >= 6:
-                base += ancho_punto
-            base_izq = int(base)
-            base_der = int(base + ancho_punto)
-            punta = int(base + ancho_punto / 2)
-            pygame.draw.polygon(self.__pantalla__, self.__color_seleccion__,
-                              [(base_izq, margen_y + alto_tablero),
-                               (base_der, margen_y + alto_tablero),
-                               (punta, margen_y + alto_tablero - alto_punto)], 5)
+            pygame.draw.polygon(self.__pantalla__, self.__color_seleccion__, contorno, 5)
     
     def dibujar_info(self):
         """
@@ -570,13 +902,13 @@ class PygameUI:
         pygame.draw.rect(self.__pantalla__, (244, 236, 221), decor, border_radius=12)
         pygame.draw.rect(self.__pantalla__, (210, 190, 160), decor, 1, border_radius=12)
         
-        texto = self.__fuente_mediana__.render(texto_turno, True, self.__color_texto__)
+        texto = self.__textos__.render(self.__fuente_mediana__, texto_turno, True, self.__color_texto__)
         self.__pantalla__.blit(texto, (decor.x + 14, decor.y + 6))
 
         dados = self.__juego__.get_movimientos_disponibles()
         if dados:
             texto_dados = "Dados: " + ", ".join(str(d) for d in dados)
-            texto = self.__fuente_pequena__.render(texto_dados, True, self.__color_texto_secundario__)
+            texto = self.__textos__.render(self.__fuente_pequena__, texto_dados, True, self.__color_texto_secundario__)
             
             # calcular espacio disponible entre la info del turno y el panel de acciones
             ancho_botones = max(int(ancho_tablero - 360), 320)
@@ -611,13 +943,13 @@ class PygameUI:
         jugador2 = self.__juego__.get_jugador2()
         
         if jugador1.get_fichas_en_barra() > 0:
-            texto = self.__fuente_pequena__.render(
+            texto = self.__textos__.render(self.__fuente_pequena__, 
                 f"{jugador1.get_nombre()} - fichas en barra: {jugador1.get_fichas_en_barra()}", 
                 True, self.__color_texto_secundario__)
             self.__pantalla__.blit(texto, (panel_rect.x + 320, panel_rect.y + 12))
         
         if jugador2.get_fichas_en_barra() > 0:
-            texto = self.__fuente_pequena__.render(
+            texto = self.__textos__.render(self.__fuente_pequena__, 
                 f"{jugador2.get_nombre()} - fichas en barra: {jugador2.get_fichas_en_barra()}", 
                 True, self.__color_texto_secundario__)
             self.__pantalla__.blit(texto, (panel_rect.x + 320, panel_rect.y + 40))
@@ -635,7 +967,7 @@ class PygameUI:
         panel_rect = pygame.Rect(margen_x + ancho_info + 30, 26, ancho_tablero - ancho_info - 40, 64)
         pygame.draw.rect(self.__pantalla__, self.__color_panel__, panel_rect, border_radius=18)
         pygame.draw.rect(self.__pantalla__, self.__color_borde__, panel_rect, 2, border_radius=18)
-        titulo = self.__fuente_pequena__.render("Acciones", True, self.__color_texto_secundario__)
+        titulo = self.__textos__.render(self.__fuente_pequena__, "Acciones", True, self.__color_texto_secundario__)
         self.__pantalla__.blit(titulo, (panel_rect.centerx - titulo.get_width() // 2, panel_rect.y + 8))
 
         botones = []
@@ -687,7 +1019,7 @@ class PygameUI:
             pygame.draw.rect(self.__pantalla__, color_relleno, rect, border_radius=12)
             pygame.draw.rect(self.__pantalla__, self.__color_borde__, rect, 2, border_radius=12)
 
-            texto = self.__fuente_pequena__.render(boton["texto"], True, color_texto)
+            texto = self.__textos__.render(self.__fuente_pequena__, boton["texto"], True, color_texto)
             rect_texto = texto.get_rect(center=rect.center)
             self.__pantalla__.blit(texto, rect_texto)
     
@@ -717,7 +1049,7 @@ class PygameUI:
                                (x_recuadro, y_recuadro, ancho_recuadro, alto_recuadro), 3, border_radius=8)
                 
                 # dibujar texto
-                texto = self.__fuente_pequena__.render(self.__mensaje_error__, True, self.__color_blanco__)
+                texto = self.__textos__.render(self.__fuente_pequena__, self.__mensaje_error__, True, self.__color_blanco__)
                 rect_texto = texto.get_rect()
                 rect_texto.center = (self.__ancho__ // 2, y_recuadro + alto_recuadro // 2)
                 self.__pantalla__.blit(texto, rect_texto)
@@ -749,7 +1081,7 @@ class PygameUI:
                        (x_recuadro, y_recuadro, ancho_recuadro, alto_recuadro), 4, border_radius=18)
         
         # texto ganador
-        texto1 = self.__fuente_grande__.render("JUEGO TERMINADO", True, self.__color_texto__)
+        texto1 = self.__textos__.render(self.__fuente_grande__, "JUEGO TERMINADO", True, self.__color_texto__)
         rect_texto1 = texto1.get_rect()
         rect_texto1.center = (self.__ancho__ // 2, y_recuadro + 50)
         self.__pantalla__.blit(texto1, rect_texto1)
@@ -757,7 +1089,7 @@ class PygameUI:
         ganador = self.__juego__.get_ganador()
         nombre_ganador = ganador.get_nombre()
         
-        texto2 = self.__fuente_mediana__.render(f"Ganador: {nombre_ganador}", True, self.__color_texto__)
+        texto2 = self.__textos__.render(self.__fuente_mediana__, f"Ganador: {nombre_ganador}", True, self.__color_texto__)
         rect_texto2 = texto2.get_rect()
         rect_texto2.center = (self.__ancho__ // 2, y_recuadro + 110)
         self.__pantalla__.blit(texto2, rect_texto2)
@@ -767,53 +1099,13 @@ class PygameUI:
         Obtiene el numero de punto clickeado.
         
         Recibe: Integer x, Integer y (coordenadas del click)
-        Hace: Calcula que punto fue clickeado
+        Hace: Busca el punto en la tabla de columnas de la geometria
         Devuelve: Integer con el numero de punto o None
         """
-        margen_x, margen_y, ancho_tablero, alto_tablero = self.__geom_tablero__()
-        ancho_punto = int(ancho_tablero / 14)
-        
-        # verificar si click esta en tablero
-        if x < margen_x or x > margen_x + ancho_tablero:
-            return None
-        if y < margen_y or y > margen_y + alto_tablero:
-            return None
-        
-        # calcular columna
-        x_relativo = x - margen_x
-        
-        # verificar si es la barra
-        if 6 * ancho_punto <= x_relativo <= 7 * ancho_punto:
-            return 0
-        
-        # verificar si es la zona de salida (bear off) en la ultima columna
-        if x_relativo >= 13 * ancho_punto:
-            if self.__juego__ != None:
-                mitad = margen_y + alto_tablero // 2
-                color_actual = self.__juego__.get_color_jugador_actual()
-                if color_actual == 'blanco' and y >= mitad:
-                    return 25
-                if color_actual == 'negro' and y <= mitad:
-                    return 25
-            return None
-        
-        # calcular columna sin la barra
-        if x_relativo > 7 * ancho_punto:
-            x_relativo = x_relativo - ancho_punto
-        
-        columna = x_relativo // ancho_punto
-        
-        # verificar si es parte superior o inferior
-        mitad = margen_y + alto_tablero // 2
-        
-        if y < mitad:
-            # parte superior (puntos 12 a 1)
-            punto = 12 - columna
-        else:
-            # parte inferior (puntos 13 a 24)
-            punto = 13 + columna
-        
-        return punto
+        color_actual = None
+        if self.__juego__ != None:
+            color_actual = self.__juego__.get_color_jugador_actual()
+        return self.get_geometria().punto_en(x, y, color_actual)
     
     def calcular_valor_dado_necesario(self, origen, destino):
         """
@@ -978,6 +1270,169 @@ class PygameUI:
             self.iniciar_juego()
             return
     
+    def turno_computadora(self):
+        """
+        Juega el turno de la computadora si le toca.
+        
+        Recibe: Nada
+        Hace: Tira los dados y deja que el bot haga su jugada
+        Devuelve: Nada
+        """
+        if self.__bot__ == None or self.__juego__ == None:
+            return
+        if self.__juego__.esta_terminado():
+            return
+        if self.__juego__.get_jugador_actual() != self.__juego__.get_jugador2():
+            return
+        
+        resultado = self.__juego__.tirar_dados()
+        jugada = self.__bot__.jugar_turno(self.__juego__)
+        
+        if len(jugada) == 0:
+            self.__mensaje_error__ = "La computadora sacó " + str(resultado) + " y no puede mover."
+        else:
+            self.__mensaje_error__ = "La computadora sacó " + str(resultado) + " y movió."
+        self.__tiempo_error__ = pygame.time.get_ticks()
+        self.__dados_tirados__ = False
+        self.__punto_seleccionado__ = None
+    
+    def __regiones__(self):
+        """
+        Devuelve las regiones de la ventana que se actualizan por separado.
+        
+        Recibe: Nada
+        Hace: Separa la franja de paneles de arriba (turno, dados, botones)
+              del tablero (fichas, seleccion, mensajes y ganador)
+        Devuelve: Diccionario nombre -> pygame.Rect
+        """
+        # el corte queda un poco arriba del tablero porque el borde de la
+        # seleccion se dibuja sobre el margen
+        _, margen_y, _, _ = self.__geom_tablero__()
+        corte = margen_y - 10
+        return {
+            "paneles": pygame.Rect(0, 0, self.__ancho__, corte),
+            "tablero": pygame.Rect(0, corte, self.__ancho__, self.__alto__ - corte),
+        }
+    
+    def __mensaje_visible__(self):
+        """
+        Indica que mensaje se muestra ahora.
+        
+        Recibe: Nada
+        Hace: Revisa si el mensaje todavia no cumplio sus 3 segundos
+        Devuelve: String con el mensaje o "" si no hay
+        """
+        if self.__mensaje_error__ == "":
+            return ""
+        if pygame.time.get_ticks() - self.__tiempo_error__ < 3000:
+            return self.__mensaje_error__
+        return ""
+    
+    def __firmas_regiones__(self):
+        """
+        Resume lo que hay que mostrar en cada region.
+        
+        Recibe: Nada
+        Hace: Junta en tuplas el estado que dibuja cada region; si la tupla
+              no cambio, la region se ve igual que en el cuadro anterior
+        Devuelve: Diccionario nombre de region -> tupla
+        """
+        juego = self.__juego__
+        tablero = juego.get_tablero()
+        sacadas = (tablero.contar_fichas_sacadas('blanco'), tablero.contar_fichas_sacadas('negro'))
+        
+        boton_bajo_mouse = None
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        for nombre, rect in self.__areas_botones__.items():
+            if rect.collidepoint(mouse_x, mouse_y):
+                boton_bajo_mouse = nombre
+        
+        return {
+            "paneles": (juego.get_color_jugador_actual(), tuple(juego.get_movimientos_disponibles()),
+                        self.__dados_tirados__, boton_bajo_mouse, sacadas),
+            "tablero": (tuple(tablero.get_conteos()), tablero.contar_fichas_en_barra('blanco'),
+                        tablero.contar_fichas_en_barra('negro'), sacadas,
+                        self.__punto_seleccionado__, self.__mensaje_visible__(),
+                        juego.esta_terminado()),
+        }
+    
+    def dibujar_cuadro(self):
+        """
+        Dibuja un cuadro y actualiza solo lo que cambio.
+        
+        Recibe: Nada
+        Hace: Si ninguna region cambio no hace nada; si cambio alguna,
+              copia el tablero estatico, dibuja fichas y paneles encima y
+              le pasa a pygame.display.update solo los rectangulos de las
+              regiones que cambiaron (la primera vez, la ventana entera)
+        Devuelve: Lista de pygame.Rect actualizados (vacia si no cambio nada)
+        """
+        firmas = self.__firmas_regiones__()
+        if firmas == self.__firmas__:
+            return []
+        
+        self.dibujar_tablero()
+        self.dibujar_fichas()
+        self.dibujar_seleccion()
+        self.dibujar_info()
+        self.dibujar_botones()
+        self.dibujar_mensaje_error()
+        self.dibujar_ganador()
+        
+        regiones = self.__regiones__()
+        if self.__firmas__ == None:
+            sucias = [pygame.Rect(0, 0, self.__ancho__, self.__alto__)]
+        else:
+            sucias = []
+            for nombre, rect in regiones.items():
+                if firmas[nombre] != self.__firmas__[nombre]:
+                    sucias.append(rect)
+        
+        pygame.display.update(sucias)
+        self.__firmas__ = firmas
+        return sucias
+    
+    def __milisegundos_hasta_cambio__(self):
+        """
+        Calcula cuanto falta para que la pantalla cambie sola.
+        
+        Recibe: Nada
+        Hace: Mira si hay un mensaje que todavia se esta mostrando (es lo
+              unico que cambia sin que llegue un evento)
+        Devuelve: Integer con milisegundos o None si nada cambia solo
+        """
+        if self.__mensaje_visible__() == "":
+            return None
+        restante = 3000 - (pygame.time.get_ticks() - self.__tiempo_error__)
+        return max(restante, 1)
+    
+    def leer_eventos(self):
+        """
+        Obtiene los eventos pendientes.
+        
+        Recibe: Nada
+        Hace: Con por_eventos se bloquea en pygame.event.wait hasta que
+              llegue un evento, con un limite de tiempo solo mientras se
+              muestra un mensaje; sin por_eventos espera el cuadro de 30
+              fps y devuelve lo que haya
+        Devuelve: Lista de eventos (puede estar vacia)
+        """
+        if self.__por_eventos__ == False:
+            self.__reloj__.tick(30)
+            return pygame.event.get()
+        
+        espera = self.__milisegundos_hasta_cambio__()
+        if espera == None:
+            primero = pygame.event.wait()
+        else:
+            primero = pygame.event.wait(espera)
+        
+        eventos = []
+        if primero.type != pygame.NOEVENT:
+            eventos.append(primero)
+        eventos.extend(pygame.event.get())
+        return eventos
+    
     def ejecutar(self):
         """
         Ejecuta el loop principal del juego.
@@ -991,8 +1446,14 @@ class PygameUI:
         
         # loop principal
         while self.__ejecutando__:
-            # manejar eventos
-            for evento in pygame.event.get():
+            # si le toca a la computadora, juega sola
+            self.turno_computadora()
+            
+            # dibujar solo si algo cambio
+            self.dibujar_cuadro()
+            
+            # esperar y manejar eventos
+            for evento in self.leer_eventos():
                 if evento.type == pygame.QUIT:
                     self.__ejecutando__ = False
                 
@@ -1001,19 +1462,10 @@ class PygameUI:
                         x, y = evento.pos
                         self.manejar_click_tablero(x, y)
                         self.manejar_click_boton(x, y)
-            
-            # dibujar todo
-            self.dibujar_tablero()
-            self.dibujar_fichas()
-            self.dibujar_seleccion()
-            self.dibujar_info()
-            self.dibujar_botones()
-            self.dibujar_mensaje_error()
-            self.dibujar_ganador()
-            
-            # actualizar pantalla
-            pygame.display.flip()
-            self.__reloj__.tick(30)
+                
+                # si la ventana se tapo o cambio, redibujar todo
+                if evento.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.__firmas__ = None
         
         # cerrar pygame
         pygame.quit()
@@ -1022,5 +1474,9 @@ class PygameUI:
 
 # punto de entrada
 if __name__ == "__main__":
-    interfaz = PygameUI()
+    bot = None
+    if "--bot" in sys.argv:
+        from core.bot import SearchBot
+        bot = SearchBot(profundidad=1, tiempo_maximo=2.0)
+    interfaz = PygameUI(bot, por_eventos="--eventos" in sys.argv)
     interfaz.ejecutar()
@@ -0,0 +1,206 @@
+import argparse
+import json
+import random
+import sys
+import time
+
+from core.bot import SearchBot
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.position_id import id_juego
+from core.rollout import TURNOS_MAXIMOS, resultado_partida, politica_aleatoria, politica_voraz
+from core.transposition import TranspositionTable
+
+
+# tiradas que los dados de cada partida generan de una vez
+TAMANO_BUFFER = 4096
+
+# segundos por decision del bot de busqueda
+TIEMPO_BUSQUEDA = 0.5
+
+
+def politica_busqueda(semilla):
+    """
+    Crea una politica que busca a 1 ply.
+    
+    Recibe: Semilla (int), no se usa porque la politica no tiene azar
+    Hace: Crea un SearchBot de profundidad 1 con tiempo por decision
+    Devuelve: Objeto con jugar_turno(juego)
+    """
+    return SearchBot(profundidad=1, tiempo_maximo=TIEMPO_BUSQUEDA, tabla=TranspositionTable())
+
+
+# politicas que se pueden elegir por nombre
+POLITICAS = {
+    "azar": politica_aleatoria,
+    "voraz": politica_voraz,
+    "busqueda": politica_busqueda,
+}
+
+
+def jugar_partida(blanco, negro, dados, turnos_maximos=TURNOS_MAXIMOS):
+    """
+    Juega una partida completa sin interfaz.
+    
+    Recibe: Jugador de las blancas y de las negras (objetos con
+            jugar_turno), Dice y turnos maximos (int)
+    Hace: Tira los dados y deja que juegue el que tiene el turno hasta que
+          alguien gana o se llega al maximo; si el juego rechaza un
+          movimiento el jugador lanza MovimientoInvalidoError y la partida
+          falla, asi el registro solo tiene movimientos aplicados
+    Devuelve: Diccionario con ganador (color o None si se corto), puntos
+              (1, 2 o 3), turnos, movimientos, jugadas (una lista de
+              [color, tirada, [[origen, dado], ...]] por turno) y
+              posicion_final (ID de juego de core.position_id)
+    """
+    juego = BackgammonGame("Blanco", "Negro", dados)
+    jugadores = {'blanco': blanco, 'negro': negro}
+    jugadas = []
+    movimientos = 0
+    
+    while juego.esta_terminado() == False and len(jugadas) < turnos_maximos:
+        color = juego.get_color_jugador_actual()
+        tirada = list(juego.tirar_dados())
+        jugada = jugadores[color].jugar_turno(juego)
+        jugadas.append([color, tirada, [list(movimiento) for movimiento in jugada]])
+        movimientos = movimientos + len(jugada)
+    
+    ganador = None
+    puntos = 0
+    if juego.esta_terminado() == True:
+        ganador, puntos = resultado_partida(juego)
+    return {"ganador": ganador, "puntos": puntos, "turnos": len(jugadas),
+            "movimientos": movimientos, "jugadas": jugadas, "posicion_final": id_juego(juego)}
+
+
+def generar_partidas(cantidad, archivo, blanco="azar", negro="azar", semilla=0, informar=None,
+                     cada=100):
+    """
+    Juega muchas partidas y escribe cada una apenas termina.
+    
+    Recibe: Cantidad de partidas (int), archivo de texto abierto, nombres
+            de las politicas de cada color, semilla (int), funcion opcional
+            para informar el avance y cada cuantas partidas llamarla (0 o
+            menos no informa)
+    Hace: Juega cada partida con dados y politicas de semilla propia
+          (sacada de la principal) y escribe su registro como una linea
+          JSON
+    Devuelve: Diccionario con partidas, cortadas, ganadas por color,
+              movimientos, segundos, partidas_por_segundo y
+              movimientos_por_segundo
+    """
+    azar = random.Random(semilla)
+    totales = {"partidas": 0, "cortadas": 0, "blanco": 0, "negro": 0, "movimientos": 0}
+    inicio = time.perf_counter()
+    
+    while totales["partidas"] < cantidad:
+        semilla_partida = azar.getrandbits(63)
+        dados = Dice(semilla=semilla_partida, tamano_buffer=TAMANO_BUFFER)
+        registro = jugar_partida(POLITICAS[blanco](semilla_partida),
+                                 POLITICAS[negro](semilla_partida + 1), dados)
+        registro["partida"] = totales["partidas"] + 1
+        registro["semilla"] = semilla_partida
+        registro["blanco"] = blanco
+        registro["negro"] = negro
+        archivo.write(json.dumps(registro, sort_keys=True) + "\n")
+        
+        totales["partidas"] = totales["partidas"] + 1
+        totales["movimientos"] = totales["movimientos"] + registro["movimientos"]
+        if registro["ganador"] == None:
+            totales["cortadas"] = totales["cortadas"] + 1
+        else:
+            totales[registro["ganador"]] = totales[registro["ganador"]] + 1
+        
+        # la ultima linea la muestra el que llama con el resultado final
+        if (informar != None and cada > 0 and totales["partidas"] % cada == 0
+                and totales["partidas"] < cantidad):
+            informar(velocidad(totales, time.perf_counter() - inicio))
+    
+    archivo.flush()
+    return velocidad(totales, time.perf_counter() - inicio)
+
+
+def velocidad(totales, segundos):
+    """
+    Agrega las velocidades a los totales.
+    
+    Recibe: Diccionario de totales y segundos transcurridos (float)
+    Hace: Divide partidas y movimientos por el tiempo
+    Devuelve: Diccionario nuevo con segundos, partidas_por_segundo y
+              movimientos_por_segundo ademas de los totales
+    """
+    resultado = dict(totales)
+    resultado["segundos"] = segundos
+    if segundos > 0:
+        resultado["partidas_por_segundo"] = totales["partidas"] / segundos
+        resultado["movimientos_por_segundo"] = totales["movimientos"] / segundos
+    else:
+        resultado["partidas_por_segundo"] = 0.0
+        resultado["movimientos_por_segundo"] = 0.0
+    return resultado
+
+
+def formatear(resultado):
+    """
+    Arma la linea de avance.
+    
+    Recibe: Diccionario de generar_partidas
+    Hace: Muestra partidas, ganadas y velocidades
+    Devuelve: String
+    """
+    return "%d partidas (blanco %d, negro %d, cortadas %d) en %.1f s: %.1f partidas/seg, %.1f movimientos/seg" % (
+        resultado["partidas"], resultado["blanco"], resultado["negro"], resultado["cortadas"],
+        resultado["segundos"], resultado["partidas_por_segundo"], resultado["movimientos_por_segundo"])
+
+
+def entero_positivo(texto):
+    """
+    Convierte un argumento a un entero mayor que 0.
+    
+    Recibe: String de la linea de comandos
+    Hace: Lo convierte y rechaza los valores menores que 1
+    Devuelve: Integer
+    """
+    valor = int(texto)
+    if valor < 1:
+        raise argparse.ArgumentTypeError("tiene que ser mayor que 0: " + texto)
+    return valor
+
+
+def main(argumentos=None):
+    """
+    Punto de entrada cuando se ejecuta `python -m selfplay`.
+    
+    Juega partidas entre dos politicas y guarda una linea JSON por partida
+    en el archivo pedido ('-' para stdout); el avance y la velocidad se
+    muestran por stderr.
+    """
+    parser = argparse.ArgumentParser(description="Juega partidas de Backgammon sin interfaz")
+    parser.add_argument("archivo", help="archivo JSON lines de salida ('-' para stdout)")
+    parser.add_argument("--partidas", type=int, default=100, help="cantidad de partidas")
+    parser.add_argument("--blanco", choices=list(POLITICAS), default="azar",
+                        help="politica de las blancas")
+    parser.add_argument("--negro", choices=list(POLITICAS), default="azar",
+                        help="politica de las negras")
+    parser.add_argument("--semilla", type=int, default=0, help="semilla principal")
+    parser.add_argument("--cada", type=entero_positivo, default=100,
+                        help="partidas entre cada linea de avance")
+    opciones = parser.parse_args(argumentos)
+    
+    def informar(resultado):
+        print(formatear(resultado), file=sys.stderr)
+    
+    if opciones.archivo == "-":
+        resultado = generar_partidas(opciones.partidas, sys.stdout, opciones.blanco,
+                                     opciones.negro, opciones.semilla, informar, opciones.cada)
+    else:
+        with open(opciones.archivo, "w", encoding="utf-8") as archivo:
+            resultado = generar_partidas(opciones.partidas, archivo, opciones.blanco,
+                                         opciones.negro, opciones.semilla, informar, opciones.cada)
+    
+    print(formatear(resultado), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
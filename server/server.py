@@ -0,0 +1,374 @@
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from cli.cli import CLI
+from core.bot import SearchBot, TIEMPO_MAXIMO
+
+
+# puerto por defecto del servidor
+PUERTO_POR_DEFECTO = 4040
+
+# largo maximo de una linea recibida (bytes)
+LARGO_MAXIMO_LINEA = 1024
+
+# linea que marca el final de cada respuesta
+FIN_RESPUESTA = "."
+
+
+class Session:
+    """
+    Sesion de juego de una conexion.
+    
+    Recibe: Numero de sesion y bot opcional
+    Hace: Tiene su propia CLI con la salida guardada en una lista, asi los
+          comandos son los mismos que en la consola (nuevo, tirar, mover,
+          pasar, estado, tablero, ayuda, salir)
+    Devuelve: Nada
+    """
+    
+    def __init__(self, numero, bot=None):
+        """
+        Crea la sesion sin juego.
+        
+        Recibe: Numero (int) y bot (SearchBot) opcional
+        Hace: Crea la CLI que escribe en la lista de lineas y que confirma
+              sola las preguntas (el cliente ya pidio el comando)
+        Devuelve: Nada
+        """
+        self.__numero__ = numero
+        self.__bot__ = bot
+        self.__lineas__ = []
+        self.__cli__ = CLI(bot, salida=self.__lineas__.append, entrada=self.__confirmar__)
+    
+    def __confirmar__(self, mensaje):
+        """
+        Responde las preguntas de la CLI.
+        
+        Recibe: String con la pregunta
+        Hace: Nada, el comando remoto ya es la confirmacion
+        Devuelve: String 's'
+        """
+        return 's'
+    
+    def get_numero(self):
+        """
+        Obtiene el numero de la sesion.
+        
+        Recibe: Nada
+        Hace: Devuelve el numero guardado
+        Devuelve: Integer
+        """
+        return self.__numero__
+    
+    def get_juego(self):
+        """
+        Obtiene el juego de la sesion.
+        
+        Recibe: Nada
+        Hace: Lo pide a la CLI
+        Devuelve: BackgammonGame o None
+        """
+        return self.__cli__.get_juego()
+    
+    def __sacar_lineas__(self):
+        """
+        Junta la salida acumulada.
+        
+        Recibe: Nada
+        Hace: Copia las lineas (partiendo las que tienen saltos) y vacia la
+              lista
+        Devuelve: Lista de strings
+        """
+        lineas = []
+        for texto in self.__lineas__:
+            lineas.extend(str(texto).split("\n"))
+        del self.__lineas__[:]
+        return lineas
+    
+    def bienvenida(self):
+        """
+        Arma el mensaje de bienvenida.
+        
+        Recibe: Nada
+        Hace: Usa el mensaje de la CLI y explica como crear el juego
+        Devuelve: Lista de strings
+        """
+        self.__cli__.mostrar_bienvenida()
+        if self.__bot__ == None:
+            self.__cli__.escribir("Usa: nuevo [nombre1] [nombre2]")
+        else:
+            self.__cli__.escribir("Usa: nuevo [nombre] (juegas contra la computadora)")
+        return self.__sacar_lineas__()
+    
+    def procesar(self, linea):
+        """
+        Procesa una linea del cliente.
+        
+        Recibe: String con el comando
+        Hace: Cierra con "salir", avisa si se quiere jugar sin juego y pasa
+              el resto (incluido "nuevo") a CLI.procesar_comando
+        Devuelve: Tupla (lineas de respuesta, True para seguir o False
+                  para cerrar la conexion)
+        """
+        partes = linea.split()
+        palabra = ""
+        if len(partes) > 0:
+            palabra = partes[0].lower()
+        continuar = True
+        
+        if palabra == "salir":
+            self.__cli__.escribir("Gracias por jugar Backgammon!")
+            continuar = False
+        elif self.__cli__.get_juego() == None and palabra in ("tirar", "mover", "pasar"):
+            self.__cli__.escribir("No hay juego en curso. Usa: nuevo [nombre1] [nombre2]")
+        else:
+            continuar = self.__cli__.procesar_comando(linea)
+        
+        juego = self.__cli__.get_juego()
+        if juego != None and juego.esta_terminado() == True:
+            self.__cli__.escribir("¡Juego terminado! Usa 'nuevo' para otra partida.")
+        
+        return self.__sacar_lineas__(), continuar
+    
+    def es_turno_computadora(self):
+        """
+        Verifica si le toca jugar a la computadora.
+        
+        Recibe: Nada
+        Hace: Le pregunta a la CLI
+        Devuelve: Boolean
+        """
+        return self.__cli__.es_turno_computadora()
+    
+    def turno_computadora(self):
+        """
+        Juega el turno de la computadora.
+        
+        Recibe: Nada
+        Hace: Usa CLI.turno_computadora y junta lo que escribio
+        Devuelve: Lista de strings
+        """
+        self.__cli__.turno_computadora()
+        return self.__sacar_lineas__()
+
+
+class GameServer:
+    """
+    Servidor TCP de muchas partidas con asyncio.
+    
+    Recibe: Host, puerto, bot opcional y segundos de inactividad
+    Hace: Atiende cada conexion con una corrutina y una Session propia, sin
+          un hilo por conexion; el protocolo es de lineas de texto y cada
+          respuesta termina con una linea "."
+    Devuelve: Nada
+    """
+    
+    def __init__(self, host="127.0.0.1", puerto=PUERTO_POR_DEFECTO, bot=None, tiempo_inactivo=None):
+        """
+        Configura el servidor.
+        
+        Recibe: Host (string), puerto (int, 0 elige uno libre), bot
+                (SearchBot) opcional compartido por todas las sesiones y
+                tiempo_inactivo (segundos, None para no cortar)
+        Hace: Guarda la configuracion; los turnos del bot corren en un
+              solo hilo aparte, de a uno, para no frenar las conexiones.
+              Es un solo hilo porque el bot compartido guarda el estado
+              de la decision en curso y la busqueda usa solo CPU (con el
+              GIL mas hilos no la aceleran); por eso el bot tiene que
+              tener tiempo_maximo: con N sesiones esperando, una jugada
+              de la computadora tarda a lo sumo N veces ese tiempo
+        Devuelve: Nada
+        """
+        self.__host__ = host
+        self.__puerto__ = puerto
+        self.__bot__ = bot
+        self.__tiempo_inactivo__ = tiempo_inactivo
+        self.__servidor__ = None
+        self.__sesiones__ = {}
+        self.__escritores__ = {}
+        self.__siguiente_sesion__ = 1
+        self.__ejecutor_bot__ = None
+        if bot != None:
+            self.__ejecutor_bot__ = ThreadPoolExecutor(max_workers=1)
+    
+    def get_puerto(self):
+        """
+        Obtiene el puerto en el que escucha el servidor.
+        
+        Recibe: Nada
+        Hace: Lee el puerto real del socket si ya se inicio
+        Devuelve: Integer
+        """
+        if self.__servidor__ != None and len(self.__servidor__.sockets) > 0:
+            return self.__servidor__.sockets[0].getsockname()[1]
+        return self.__puerto__
+    
+    def get_cantidad_sesiones(self):
+        """
+        Cuenta las conexiones abiertas.
+        
+        Recibe: Nada
+        Hace: Mide el diccionario de sesiones
+        Devuelve: Integer
+        """
+        return len(self.__sesiones__)
+    
+    def get_sesiones(self):
+        """
+        Obtiene las sesiones abiertas.
+        
+        Recibe: Nada
+        Hace: Copia los valores del diccionario
+        Devuelve: Lista de Session
+        """
+        return list(self.__sesiones__.values())
+    
+    async def iniciar(self):
+        """
+        Empieza a escuchar conexiones.
+        
+        Recibe: Nada
+        Hace: Abre el socket con asyncio.start_server
+        Devuelve: Integer con el puerto
+        """
+        self.__servidor__ = await asyncio.start_server(self.atender, self.__host__, self.__puerto__,
+                                                       limit=LARGO_MAXIMO_LINEA)
+        return self.get_puerto()
+    
+    async def servir(self):
+        """
+        Inicia el servidor y atiende hasta que lo cancelen.
+        
+        Recibe: Nada
+        Hace: Llama a iniciar y a serve_forever
+        Devuelve: Nada
+        """
+        await self.iniciar()
+        try:
+            await self.__servidor__.serve_forever()
+        finally:
+            await self.detener()
+    
+    async def detener(self):
+        """
+        Cierra el servidor y las conexiones abiertas.
+        
+        Recibe: Nada
+        Hace: Deja de aceptar conexiones, cierra los escritores y apaga el
+              hilo del bot
+        Devuelve: Nada
+        """
+        if self.__servidor__ != None:
+            self.__servidor__.close()
+            await self.__servidor__.wait_closed()
+        for escritor in list(self.__escritores__.values()):
+            escritor.close()
+        if self.__ejecutor_bot__ != None:
+            self.__ejecutor_bot__.shutdown(wait=True)
+    
+    async def __enviar__(self, escritor, lineas):
+        """
+        Manda una respuesta completa.
+        
+        Recibe: StreamWriter y lista de lineas
+        Hace: Agrega la linea de fin y espera a que se vacie el buffer
+        Devuelve: Nada
+        """
+        texto = "\n".join(lineas + [FIN_RESPUESTA]) + "\n"
+        escritor.write(texto.encode("utf-8"))
+        await escritor.drain()
+    
+    async def __leer_linea__(self, lector):
+        """
+        Lee una linea del cliente.
+        
+        Recibe: StreamReader
+        Hace: Espera la linea con el limite de inactividad, si hay
+        Devuelve: Bytes (vacio si el cliente cerro)
+        """
+        if self.__tiempo_inactivo__ == None:
+            return await lector.readline()
+        return await asyncio.wait_for(lector.readline(), self.__tiempo_inactivo__)
+    
+    async def atender(self, lector, escritor):
+        """
+        Atiende una conexion de principio a fin.
+        
+        Recibe: StreamReader y StreamWriter de la conexion
+        Hace: Crea la sesion, manda la bienvenida y procesa linea por linea;
+              despues de cada comando juega los turnos de la computadora
+        Devuelve: Nada
+        """
+        numero = self.__siguiente_sesion__
+        self.__siguiente_sesion__ = self.__siguiente_sesion__ + 1
+        sesion = Session(numero, self.__bot__)
+        self.__sesiones__[numero] = sesion
+        self.__escritores__[numero] = escritor
+        
+        try:
+            await self.__enviar__(escritor, sesion.bienvenida())
+            continuar = True
+            while continuar == True:
+                try:
+                    datos = await self.__leer_linea__(lector)
+                except asyncio.TimeoutError:
+                    await self.__enviar__(escritor, ["Conexion cerrada por inactividad."])
+                    break
+                except ValueError:
+                    # la linea supero LARGO_MAXIMO_LINEA
+                    await self.__enviar__(escritor, ["Linea demasiado larga."])
+                    break
+                if datos == b"":
+                    break
+                
+                linea = datos.decode("utf-8", errors="replace").strip()
+                lineas, continuar = sesion.procesar(linea)
+                
+                while continuar == True and sesion.es_turno_computadora() == True:
+                    bucle = asyncio.get_running_loop()
+                    lineas.extend(await bucle.run_in_executor(self.__ejecutor_bot__,
+                                                              sesion.turno_computadora))
+                
+                await self.__enviar__(escritor, lineas)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self.__sesiones__[numero]
+            del self.__escritores__[numero]
+            escritor.close()
+
+
+def main(argumentos=None):
+    """
+    Punto de entrada del servidor cuando se ejecuta `python -m server.server`.
+    
+    Con --bot cada sesion juega contra la computadora, que busca con la
+    profundidad (--profundidad) y el tiempo por jugada (--tiempo) pedidos.
+    """
+    parser = argparse.ArgumentParser(description="Servidor de Backgammon por TCP")
+    parser.add_argument("--host", default="127.0.0.1", help="direccion donde escuchar")
+    parser.add_argument("--puerto", type=int, default=PUERTO_POR_DEFECTO, help="puerto TCP")
+    parser.add_argument("--bot", action="store_true", help="jugar contra la computadora")
+    parser.add_argument("--profundidad", type=int, default=1, choices=[0, 1, 2],
+                        help="ply de busqueda de la computadora")
+    parser.add_argument("--tiempo", type=float, default=TIEMPO_MAXIMO,
+                        help="segundos maximos por jugada de la computadora (las jugadas de "
+                             "todas las sesiones se hacen de a una)")
+    parser.add_argument("--inactivo", type=float, default=None,
+                        help="segundos sin comandos antes de cerrar una conexion")
+    opciones = parser.parse_args(argumentos)
+    
+    bot = None
+    if opciones.bot:
+        bot = SearchBot(profundidad=opciones.profundidad, tiempo_maximo=opciones.tiempo)
+    
+    servidor = GameServer(opciones.host, opciones.puerto, bot, opciones.inactivo)
+    try:
+        asyncio.run(servidor.servir())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
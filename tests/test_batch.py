@@ -0,0 +1,247 @@
+import unittest
+from core.batch import BatchSimulator, politica_carrera, np, BLANCO, BARRA, SACADAS
+from core.board import Board
+from core.checker import Checker
+from core.move_generator import MoveGenerator
+
+
+@unittest.skipIf(np is None, "numpy no esta instalado")
+class TestBatchSimulator(unittest.TestCase):
+    """
+    Clase de pruebas para el simulador vectorizado.
+    
+    Recibe: Nada
+    Hace: Compara las reglas con MoveGenerator y revisa los resultados
+    Devuelve: Nada
+    """
+    
+    def armar_tablero(self, simulador, juego):
+        """
+        Arma un Board con la posicion de un juego del simulador.
+        
+        Recibe: BatchSimulator e indice del juego
+        Hace: Limpia un tablero y pone las fichas de los conteos
+        Devuelve: Board
+        """
+        conteos, barra, sacadas = simulador.conteos_tablero(juego)
+        tablero = Board()
+        punto = 0
+        while punto < 26:
+            fichas = tablero.get_fichas_en_punto(punto)
+            while len(fichas) > 0:
+                fichas.pop()
+            punto = punto + 1
+        
+        for punto in range(1, 25):
+            for _ in range(abs(conteos[punto])):
+                if conteos[punto] > 0:
+                    tablero.get_fichas_en_punto(punto).append(Checker('blanco'))
+                else:
+                    tablero.get_fichas_en_punto(punto).append(Checker('negro'))
+        for color in ('blanco', 'negro'):
+            for _ in range(barra[color]):
+                tablero.get_fichas_en_punto(0).append(Checker(color))
+            for _ in range(sacadas[color]):
+                tablero.get_fichas_en_punto(25).append(Checker(color))
+        return tablero
+    
+    def test_posicion_inicial(self):
+        """
+        Prueba que todos los juegos empiezan como Board.
+        
+        Recibe: Nada
+        Hace: Compara los conteos con los de un tablero nuevo
+        Devuelve: Nada
+        """
+        simulador = BatchSimulator(3, semilla=1)
+        conteos, barra, sacadas = simulador.conteos_tablero(2)
+        
+        self.assertEqual(conteos, Board().get_conteos())
+        self.assertEqual(barra, {'blanco': 0, 'negro': 0})
+        self.assertEqual(simulador.get_posiciones().shape, (3, 2, 26))
+    
+    def test_origenes_legales_coinciden_con_move_generator(self):
+        """
+        Prueba las reglas vectorizadas contra el generador de jugadas.
+        
+        Recibe: Nada
+        Hace: Juega turnos al azar y compara cada dado en varios juegos
+        Devuelve: Nada
+        """
+        generador = MoveGenerator()
+        simulador = BatchSimulator(40, semilla=5)
+        turno = 0
+        while turno < 40:
+            posiciones = simulador.get_posiciones()
+            for juego in range(0, 40, 4):
+                if simulador.terminados()[juego]:
+                    continue
+                tablero = self.armar_tablero(simulador, juego)
+                lado = int(simulador.get_turno()[juego])
+                if lado == BLANCO:
+                    color = 'blanco'
+                else:
+                    color = 'negro'
+                
+                for dado in range(1, 7):
+                    esperados = set()
+                    for jugada in generador.generar_jugadas(tablero, color, [dado]):
+                        for origen, _ in jugada:
+                            if origen == 0:
+                                esperados.add(BARRA)
+                            elif color == 'blanco':
+                                esperados.add(origen)
+                            else:
+                                esperados.add(25 - origen)
+                    
+                    legales = simulador.origenes_legales(posiciones[[juego], lado],
+                                                         posiciones[[juego], 1 - lado],
+                                                         np.array([dado]))
+                    self.assertEqual(set(np.nonzero(legales[0])[0].tolist()), esperados)
+            simulador.jugar_turno()
+            turno = turno + 1
+    
+    def test_entrar_con_el_segundo_dado_usa_los_dos(self):
+        """
+        Prueba una tirada donde solo sirve jugar primero el segundo dado.
+        
+        Recibe: Nada
+        Hace: Pone una ficha blanca en la barra con el 19 bloqueado y tira
+              6 y 3: el 6 no entra, pero entrando con el 3 despues se
+              puede jugar el 6
+        Devuelve: Nada
+        """
+        simulador = BatchSimulator(1, semilla=1)
+        posiciones = simulador.get_posiciones()
+        posiciones[0, BLANCO, 24] = 1
+        posiciones[0, BLANCO, BARRA] = 1
+        pips_antes = int((posiciones[0, BLANCO] * np.arange(26)).sum())
+        
+        simulador.tirar_dados = lambda: np.array([[6, 3, 0, 0]], dtype=np.int8)
+        simulador.jugar_turno()
+        
+        posiciones = simulador.get_posiciones()
+        self.assertEqual(posiciones[0, BLANCO, BARRA], 0)
+        self.assertEqual(int((posiciones[0, BLANCO] * np.arange(26)).sum()), pips_antes - 9)
+    
+    def test_turnos_coinciden_con_move_generator(self):
+        """
+        Prueba que cada turno con dados distintos termina en una jugada
+        legal completa.
+        
+        Recibe: Nada
+        Hace: Juega turnos al azar y compara cada posicion resultante con
+              las de las jugadas de MoveGenerator con los mismos dados
+        Devuelve: Nada
+        """
+        generador = MoveGenerator()
+        simulador = BatchSimulator(40, semilla=7)
+        tirar = simulador.tirar_dados
+        tiradas = []
+        
+        def registrar():
+            dados = tirar()
+            tiradas.append(dados.copy())
+            return dados
+        simulador.tirar_dados = registrar
+        
+        revisados = 0
+        turno = 0
+        while turno < 60:
+            antes = {}
+            for juego in range(40):
+                if not simulador.terminados()[juego]:
+                    antes[juego] = (self.armar_tablero(simulador, juego),
+                                    int(simulador.get_turno()[juego]))
+            simulador.jugar_turno()
+            dados = tiradas[-1]
+            
+            for juego, (tablero, lado) in antes.items():
+                if dados[juego, 0] == dados[juego, 1]:
+                    continue
+                if lado == BLANCO:
+                    color = 'blanco'
+                else:
+                    color = 'negro'
+                
+                esperadas = []
+                for jugada in generador.generar_jugadas(tablero, color, list(dados[juego, 0:2])):
+                    aplicados = 0
+                    for movimiento in generador.a_movimientos_tablero(jugada, color):
+                        if tablero.aplicar(movimiento) != None:
+                            aplicados = aplicados + 1
+                    esperadas.append((list(tablero.get_conteos()),
+                                      tablero.contar_fichas_en_barra('blanco'),
+                                      tablero.contar_fichas_en_barra('negro')))
+                    while aplicados > 0:
+                        tablero.deshacer()
+                        aplicados = aplicados - 1
+                
+                conteos, barra, _ = simulador.conteos_tablero(juego)
+                self.assertIn((conteos, barra['blanco'], barra['negro']), esperadas)
+                revisados = revisados + 1
+            turno = turno + 1
+        
+        self.assertGreater(revisados, 500)
+    
+    def test_juegos_terminan_y_conservan_fichas(self):
+        """
+        Prueba jugar todos los juegos hasta el final.
+        
+        Recibe: Nada
+        Hace: Revisa ganadores, puntajes y que no se pierdan fichas
+        Devuelve: Nada
+        """
+        simulador = BatchSimulator(200, semilla=3, politica=politica_carrera)
+        terminados = simulador.jugar_hasta_el_final()
+        
+        self.assertEqual(terminados, 200)
+        posiciones = simulador.get_posiciones()
+        self.assertTrue((posiciones.sum(axis=2) == 15).all())
+        
+        ganador = simulador.get_ganador()
+        filas = np.arange(200)
+        self.assertTrue((posiciones[filas, ganador, SACADAS] == 15).all())
+        self.assertTrue(((simulador.get_puntos() >= 1) & (simulador.get_puntos() <= 3)).all())
+        
+        # gammon: el perdedor no saco ninguna ficha
+        gammon = simulador.get_puntos() >= 2
+        self.assertTrue((posiciones[filas, 1 - ganador, SACADAS][gammon] == 0).all())
+    
+    def test_misma_semilla_mismo_resultado(self):
+        """
+        Prueba que la semilla hace repetibles las simulaciones.
+        
+        Recibe: Nada
+        Hace: Simula dos veces con la misma semilla y una con otra
+        Devuelve: Nada
+        """
+        simulador1 = BatchSimulator(50, semilla=9)
+        simulador2 = BatchSimulator(50, semilla=9)
+        simulador3 = BatchSimulator(50, semilla=10)
+        for simulador in (simulador1, simulador2, simulador3):
+            simulador.jugar_hasta_el_final()
+        
+        self.assertTrue((simulador1.get_posiciones() == simulador2.get_posiciones()).all())
+        self.assertTrue((simulador1.get_ganador() == simulador2.get_ganador()).all())
+        self.assertFalse((simulador1.get_posiciones() == simulador3.get_posiciones()).all())
+    
+    def test_tirar_dados_dobles(self):
+        """
+        Prueba el armado de los cuatro movimientos por tirada.
+        
+        Recibe: Nada
+        Hace: Revisa que solo los dobles tienen tercer y cuarto dado
+        Devuelve: Nada
+        """
+        dados = BatchSimulator(500, semilla=2).tirar_dados()
+        dobles = dados[:, 0] == dados[:, 1]
+        
+        self.assertTrue(dobles.any())
+        self.assertTrue((dados[dobles, 3] == dados[dobles, 0]).all())
+        self.assertTrue((dados[~dobles, 2:] == 0).all())
+        self.assertTrue(((dados[:, :2] >= 1) & (dados[:, :2] <= 6)).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
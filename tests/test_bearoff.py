@@ -0,0 +1,194 @@
+import itertools
+import os
+import shutil
+import tempfile
+import unittest
+from core.bearoff import (BearoffDatabase, generar_base, indice_posicion,
+                          cantidad_posiciones, posicion_de_tablero)
+from core.board import Board
+from core.bot import SearchBot, VALOR_CARRERA
+from core.checker import Checker
+
+
+class TestBearoff(unittest.TestCase):
+    """
+    Clase de pruebas para la base de datos de bear-off.
+    
+    Recibe: Nada
+    Hace: Genera una base chica en un directorio temporal y la consulta
+    Devuelve: Nada
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Genera la base una sola vez para todas las pruebas.
+        
+        Recibe: Nada
+        Hace: Escribe una base de hasta 4 fichas
+        Devuelve: Nada
+        """
+        cls.directorio = tempfile.mkdtemp()
+        cls.ruta = os.path.join(cls.directorio, "bearoff.bin")
+        cls.cantidad = generar_base(cls.ruta, 4)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Borra el directorio temporal.
+        
+        Recibe: Nada
+        Hace: Elimina la base generada
+        Devuelve: Nada
+        """
+        shutil.rmtree(cls.directorio)
+    
+    def setUp(self):
+        """
+        Abre la base antes de cada prueba.
+        
+        Recibe: Nada
+        Hace: Mapea el archivo
+        Devuelve: Nada
+        """
+        self.__base__ = BearoffDatabase(self.ruta)
+    
+    def tearDown(self):
+        """
+        Cierra la base despues de cada prueba.
+        
+        Recibe: Nada
+        Hace: Libera el mmap
+        Devuelve: Nada
+        """
+        self.__base__.cerrar()
+    
+    def limpiar_tablero(self, tablero):
+        """
+        Limpia todas las fichas del tablero.
+        
+        Recibe: Board a limpiar
+        Hace: Deja todos los puntos sin fichas
+        Devuelve: Nada
+        """
+        punto = 0
+        while punto < 26:
+            fichas = tablero.get_fichas_en_punto(punto)
+            while len(fichas) > 0:
+                fichas.pop()
+            punto = punto + 1
+    
+    def test_indices_son_unicos_y_consecutivos(self):
+        """
+        Prueba que cada posicion tiene un indice distinto.
+        
+        Recibe: Nada
+        Hace: Recorre todas las posiciones de hasta 4 fichas
+        Devuelve: Nada
+        """
+        indices = set()
+        for posicion in itertools.product(range(5), repeat=6):
+            if sum(posicion) <= 4:
+                indices.add(indice_posicion(posicion))
+        
+        self.assertEqual(indices, set(range(cantidad_posiciones(4))))
+        self.assertEqual(indice_posicion((0, 0, 0, 0, 0, 0)), 0)
+        self.assertEqual(self.cantidad, cantidad_posiciones(4))
+        self.assertEqual(self.__base__.get_cantidad_posiciones(), 210)
+    
+    def test_una_ficha_en_el_punto_1(self):
+        """
+        Prueba la posicion mas simple.
+        
+        Recibe: Nada
+        Hace: Verifica que sale en una tirada
+        Devuelve: Nada
+        """
+        distribucion = self.__base__.distribucion((1, 0, 0, 0, 0, 0))
+        self.assertEqual(distribucion[1], 1.0)
+        self.assertEqual(self.__base__.tiradas_esperadas((1, 0, 0, 0, 0, 0)), 1.0)
+    
+    def test_una_ficha_en_el_punto_6(self):
+        """
+        Prueba la probabilidad de sacar una ficha del punto 6 en una tirada.
+        
+        Recibe: Nada
+        Hace: Compara con las 27 de 36 tiradas que suman 6 o mas
+        Devuelve: Nada
+        """
+        distribucion = self.__base__.distribucion((0, 0, 0, 0, 0, 1))
+        self.assertAlmostEqual(distribucion[1], 27.0 / 36.0, places=4)
+        self.assertAlmostEqual(distribucion[2], 9.0 / 36.0, places=4)
+        self.assertAlmostEqual(sum(distribucion), 1.0, places=3)
+    
+    def test_posicion_fuera_de_la_base(self):
+        """
+        Prueba consultar una posicion con mas fichas que la base.
+        
+        Recibe: Nada
+        Hace: Pide 5 fichas a una base de 4
+        Devuelve: Nada
+        """
+        self.assertFalse(self.__base__.contiene((5, 0, 0, 0, 0, 0)))
+        self.assertFalse(self.__base__.contiene(None))
+        with self.assertRaises(ValueError):
+            self.__base__.distribucion((5, 0, 0, 0, 0, 0))
+    
+    def test_archivo_invalido(self):
+        """
+        Prueba abrir un archivo que no es una base.
+        
+        Recibe: Nada
+        Hace: Escribe bytes cualquiera
+        Devuelve: Nada
+        """
+        ruta = os.path.join(self.directorio, "otro.bin")
+        with open(ruta, 'wb') as archivo:
+            archivo.write(b'x' * 64)
+        with self.assertRaises(ValueError):
+            BearoffDatabase(ruta)
+    
+    def test_probabilidad_ganar_desde_tablero(self):
+        """
+        Prueba la carrera a partir de un Board.
+        
+        Recibe: Nada
+        Hace: Deja una ficha de cada color en su punto 1 y 6
+        Devuelve: Nada
+        """
+        tablero = Board()
+        self.limpiar_tablero(tablero)
+        tablero.get_fichas_en_punto(1).append(Checker('blanco'))
+        tablero.get_fichas_en_punto(19).append(Checker('negro'))
+        
+        self.assertEqual(posicion_de_tablero(tablero, 'blanco'), (1, 0, 0, 0, 0, 0))
+        self.assertEqual(posicion_de_tablero(tablero, 'negro'), (0, 0, 0, 0, 0, 1))
+        self.assertIsNone(posicion_de_tablero(Board(), 'blanco'))
+        
+        self.assertEqual(self.__base__.probabilidad_ganar(tablero, 'blanco'), 1.0)
+        self.assertAlmostEqual(self.__base__.probabilidad_ganar(tablero, 'negro'), 27.0 / 36.0, places=4)
+        self.assertIsNone(self.__base__.probabilidad_ganar(Board(), 'blanco'))
+    
+    def test_bot_evalua_la_carrera_con_la_base(self):
+        """
+        Prueba que el bot usa la base cuando las dos casas estan dentro.
+        
+        Recibe: Nada
+        Hace: Evalua una carrera ganada para blanco
+        Devuelve: Nada
+        """
+        tablero = Board()
+        self.limpiar_tablero(tablero)
+        tablero.get_fichas_en_punto(1).append(Checker('blanco'))
+        tablero.get_fichas_en_punto(1).append(Checker('blanco'))
+        tablero.get_fichas_en_punto(19).append(Checker('negro'))
+        
+        bot = SearchBot(base_bearoff=self.__base__)
+        
+        # negro tira primero: gana si saca la del 6 con una tirada
+        esperado = VALOR_CARRERA * (1.0 - 2.0 * 27.0 / 36.0)
+        self.assertAlmostEqual(bot.evaluar(tablero, 'blanco'), esperado, places=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
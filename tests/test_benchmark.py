@@ -0,0 +1,166 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+
+from benchmark import (MEDICIONES, calibrar, comparar, correr, resumir, medir,
+                       cargar_linea_base, guardar_linea_base, main, VERSIONES)
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Clase de pruebas para las mediciones de velocidad.
+    
+    Recibe: Nada
+    Hace: Corre mediciones muy cortas y compara lineas base armadas a mano
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Crea un directorio para las lineas base.
+        
+        Recibe: Nada
+        Hace: Guarda la ruta del archivo JSON
+        Devuelve: Nada
+        """
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, "base.json")
+    
+    def tearDown(self):
+        """
+        Borra el directorio.
+        
+        Recibe: Nada
+        Hace: Elimina los archivos creados
+        Devuelve: Nada
+        """
+        shutil.rmtree(self.directorio)
+    
+    def test_resumir(self):
+        """
+        Prueba el resumen estadistico.
+        
+        Recibe: Nada
+        Hace: Resume muestras conocidas
+        Devuelve: Nada
+        """
+        resumen = resumir([10.0, 20.0, 30.0], 5)
+        self.assertEqual(resumen["repeticiones"], 3)
+        self.assertEqual(resumen["operaciones"], 5)
+        self.assertEqual(resumen["media"], 20.0)
+        self.assertEqual(resumen["mediana"], 20.0)
+        self.assertEqual(resumen["desvio"], 10.0)
+        self.assertEqual(resumen["minimo"], 10.0)
+        self.assertEqual(resumen["maximo"], 30.0)
+        self.assertLess(resumen["intervalo"][0], 20.0)
+        self.assertGreater(resumen["intervalo"][1], 20.0)
+        
+        unica = resumir([7.0], 1)
+        self.assertEqual(unica["desvio"], 0.0)
+        self.assertEqual(unica["intervalo"], [7.0, 7.0])
+    
+    def test_calibrar_agranda_la_cantidad(self):
+        """
+        Prueba que la calibracion llega al tiempo minimo.
+        
+        Recibe: Nada
+        Hace: Usa una medicion falsa que tarda 1 ms por operacion
+        Devuelve: Nada
+        """
+        cantidad = calibrar(lambda cantidad: cantidad * 0.001, 0.05)
+        self.assertGreaterEqual(cantidad * 0.001, 0.05)
+        
+        resumen = medir(lambda cantidad: cantidad * 0.001, 2, 0.05)
+        self.assertAlmostEqual(resumen["mediana"], 1000.0)
+    
+    def test_todas_las_mediciones_corren(self):
+        """
+        Prueba cada medicion con pocas operaciones.
+        
+        Recibe: Nada
+        Hace: Llama a cada una con 2 operaciones
+        Devuelve: Nada
+        """
+        for nombre, medicion in MEDICIONES.items():
+            self.assertGreaterEqual(medicion(2), 0.0, nombre)
+        
+        resultados = correr(["construir_tablero"], 2, 0.001)
+        self.assertEqual(list(resultados), ["construir_tablero"])
+        self.assertGreater(resultados["construir_tablero"]["mediana"], 0)
+    
+    def test_comparar(self):
+        """
+        Prueba la deteccion de regresiones.
+        
+        Recibe: Nada
+        Hace: Compara medianas que caen mas y menos que la tolerancia
+        Devuelve: Nada
+        """
+        base = {"a": {"mediana": 100.0}, "b": {"mediana": 100.0}}
+        actuales = {"a": {"mediana": 50.0}, "b": {"mediana": 90.0}, "c": {"mediana": 1.0}}
+        regresiones = comparar(actuales, base, 0.25)
+        self.assertEqual(len(regresiones), 1)
+        self.assertEqual(regresiones[0][0], "a")
+        self.assertAlmostEqual(regresiones[0][3], -0.5)
+    
+    def test_linea_base_en_json(self):
+        """
+        Prueba guardar y leer la linea base.
+        
+        Recibe: Nada
+        Hace: Guarda un resultado y lo vuelve a cargar
+        Devuelve: Nada
+        """
+        self.assertEqual(cargar_linea_base(self.ruta), None)
+        guardar_linea_base(self.ruta, {"a": resumir([1.0, 2.0], 1)})
+        self.assertEqual(cargar_linea_base(self.ruta)["a"]["mediana"], 1.5)
+    
+    def test_linea_base_descarta_otra_version(self):
+        """
+        Prueba que una medicion de otra version se vuelve a medir.
+        
+        Recibe: Nada
+        Hace: Escribe a mano una base vieja sin versiones, que partidas no
+              carga, y revisa que guardar anota la version actual
+        Devuelve: Nada
+        """
+        with open(self.ruta, "w", encoding="utf-8") as archivo:
+            json.dump({"resultados": {"partidas": {"mediana": 1e15},
+                                      "verificar_victoria": {"mediana": 1.0}}}, archivo)
+        base = cargar_linea_base(self.ruta)
+        self.assertNotIn("partidas", base)
+        self.assertEqual(base["verificar_victoria"]["mediana"], 1.0)
+        
+        guardar_linea_base(self.ruta, {"partidas": {"mediana": 2.0}})
+        base = cargar_linea_base(self.ruta)
+        self.assertEqual(base["partidas"]["version"], VERSIONES["partidas"])
+    
+    def test_main_falla_con_regresion(self):
+        """
+        Prueba el codigo de salida y que la linea base no se pisa.
+        
+        Recibe: Nada
+        Hace: Corre main sin base, luego contra una base inalcanzable
+        Devuelve: Nada
+        """
+        argumentos = ["--solo", "verificar_victoria", "--repeticiones", "2",
+                      "--tiempo-minimo", "0.001", "--linea-base", self.ruta]
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(argumentos), 0)
+        self.assertIn("verificar_victoria", cargar_linea_base(self.ruta))
+        
+        guardar_linea_base(self.ruta, {"verificar_victoria": {"mediana": 1e15}})
+        errores = io.StringIO()
+        with redirect_stdout(io.StringIO()), redirect_stderr(errores):
+            self.assertEqual(main(argumentos), 1)
+        self.assertIn("REGRESION: verificar_victoria", errores.getvalue())
+        with open(self.ruta, encoding="utf-8") as archivo:
+            self.assertEqual(json.load(archivo)["resultados"]["verificar_victoria"]["mediana"], 1e15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from core.board import Board
 from core.checker import Checker
+from core.exceptions import PuntoInvalidoError
+from core.zobrist import CLAVES_ZOBRIST
 
 
 class TestBoard(unittest.TestCase):
@@ -720,6 +722,296 @@ class TestBoard(unittest.TestCase):
         else:
             muestra_sacadas = False
         self.assertEqual(muestra_sacadas, True)
+    
+    def test_get_conteos_inicial(self):
+        """
+        Prueba el arreglo de conteos con signo del tablero inicial.
+        
+        Recibe: Nada
+        Hace: Verifica blancas positivas y negras negativas
+        Devuelve: Nada
+        """
+        conteos = self.__board__.get_conteos()
+        self.assertEqual(len(conteos), 26)
+        self.assertEqual(conteos[24], 2)
+        self.assertEqual(conteos[6], 5)
+        self.assertEqual(conteos[1], -2)
+        self.assertEqual(conteos[19], -5)
+        self.assertEqual(conteos[0], 0)
+        self.assertEqual(conteos[25], 0)
+        
+        # es una copia, no cambia el tablero
+        conteos[24] = 0
+        self.assertEqual(self.__board__.contar_fichas_en_punto(24), 2)
+    
+    def test_vista_punto_sigue_al_tablero(self):
+        """
+        Prueba que la vista de un punto refleja los cambios del tablero.
+        
+        Recibe: Nada
+        Hace: Mueve fichas y revisa la vista obtenida antes
+        Devuelve: Nada
+        """
+        fichas_24 = self.__board__.get_fichas_en_punto(24)
+        self.assertEqual(len(fichas_24), 2)
+        
+        self.__board__.mover_ficha(24, 23, "blanco")
+        self.assertEqual(len(fichas_24), 1)
+        self.assertEqual(fichas_24[0].get_color(), "blanco")
+        self.assertEqual(fichas_24[-1].get_posicion(), 24)
+        
+        colores = []
+        for ficha in self.__board__.get_fichas_en_punto(19):
+            colores.append(ficha.get_color())
+        self.assertEqual(colores, ["negro"] * 5)
+        
+        with self.assertRaises(IndexError):
+            fichas_24[1]
+    
+    def test_vista_barra_ordena_blancas_primero(self):
+        """
+        Prueba el orden de las fichas en la barra.
+        
+        Recibe: Nada
+        Hace: Pone una negra y una blanca en barra y saca por indice
+        Devuelve: Nada
+        """
+        barra = self.__board__.get_fichas_en_punto(0)
+        barra.append(Checker("negro"))
+        barra.append(Checker("blanco"))
+        
+        self.assertEqual(barra[0].get_color(), "blanco")
+        self.assertEqual(barra[1].get_color(), "negro")
+        
+        ficha = barra.pop(0)
+        self.assertEqual(ficha.get_color(), "blanco")
+        self.assertEqual(self.__board__.contar_fichas_en_barra("blanco"), 0)
+        self.assertEqual(self.__board__.contar_fichas_en_barra("negro"), 1)
+    
+    def test_vista_no_mezcla_colores(self):
+        """
+        Prueba que no se puede agregar una ficha a un punto del rival.
+        
+        Recibe: Nada
+        Hace: Intenta poner una blanca en un punto negro
+        Devuelve: Nada
+        """
+        with self.assertRaises(PuntoInvalidoError):
+            self.__board__.get_fichas_en_punto(19).append(Checker("blanco"))
+        
+        self.assertEqual(self.__board__.contar_fichas_en_punto(19), 5)
+    
+    def test_hash_se_actualiza_en_cada_movimiento(self):
+        """
+        Prueba que el hash incremental coincide con el calculado desde cero.
+        
+        Recibe: Nada
+        Hace: Mueve, captura, reingresa y saca fichas comparando hashes
+        Devuelve: Nada
+        """
+        hash_inicial = self.__board__.get_hash()
+        self.assertEqual(hash_inicial, CLAVES_ZOBRIST.calcular_hash(self.__board__))
+        self.assertEqual(hash_inicial, Board().get_hash())
+        
+        # mover y capturar
+        self.__board__.mover_ficha(1, 3, "negro")
+        self.__board__.mover_ficha(8, 3, "blanco")
+        self.assertNotEqual(self.__board__.get_hash(), hash_inicial)
+        self.assertEqual(self.__board__.get_hash(), CLAVES_ZOBRIST.calcular_hash(self.__board__))
+        
+        # reingresar desde la barra
+        self.__board__.reingresar_desde_barra("negro", 2)
+        self.assertEqual(self.__board__.get_hash(), CLAVES_ZOBRIST.calcular_hash(self.__board__))
+        
+        # sacar una ficha del tablero
+        punto = 0
+        while punto < 26:
+            fichas = self.__board__.get_fichas_en_punto(punto)
+            while len(fichas) > 0:
+                fichas.pop()
+            punto = punto + 1
+        self.assertEqual(self.__board__.get_hash(), 0)
+        
+        self.__board__.get_fichas_en_punto(3).append(Checker("blanco"))
+        self.__board__.sacar_ficha_del_tablero(3, "blanco")
+        self.assertEqual(self.__board__.get_hash(), CLAVES_ZOBRIST.calcular_hash(self.__board__))
+    
+    def test_hash_depende_solo_de_la_posicion(self):
+        """
+        Prueba que distintos ordenes de movimientos dan el mismo hash.
+        
+        Recibe: Nada
+        Hace: Juega 13/8 6/5 y 6/5 13/8 en dos tableros
+        Devuelve: Nada
+        """
+        otro = Board()
+        
+        self.__board__.mover_ficha(13, 8, "blanco")
+        self.__board__.mover_ficha(6, 5, "blanco")
+        otro.mover_ficha(6, 5, "blanco")
+        otro.mover_ficha(13, 8, "blanco")
+        
+        self.assertEqual(self.__board__.get_hash(), otro.get_hash())
+    
+    def test_contadores_iniciales(self):
+        """
+        Prueba pips y conteos de fichas del tablero inicial.
+        
+        Recibe: Nada
+        Hace: Verifica 167 pips, 15 fichas en tablero y 10 fuera de casa
+        Devuelve: Nada
+        """
+        for color in ("blanco", "negro"):
+            self.assertEqual(self.__board__.get_pips(color), 167)
+            self.assertEqual(self.__board__.contar_fichas_en_tablero(color), 15)
+            self.assertEqual(self.__board__.contar_fichas_fuera_de_casa(color), 10)
+    
+    def test_contadores_siguen_movimientos(self):
+        """
+        Prueba que los contadores cambian al mover, capturar y sacar.
+        
+        Recibe: Nada
+        Hace: Mueve fichas y revisa cada contador
+        Devuelve: Nada
+        """
+        # 8/3 para blanco: 5 pips menos y una ficha entra a casa
+        self.__board__.mover_ficha(1, 3, "negro")
+        self.__board__.mover_ficha(8, 3, "blanco")
+        self.assertEqual(self.__board__.get_pips("blanco"), 162)
+        self.assertEqual(self.__board__.contar_fichas_fuera_de_casa("blanco"), 9)
+        
+        # la negra capturada pasa de 22 pips (punto 3) a 25 (barra)
+        self.assertEqual(self.__board__.get_pips("negro"), 167 - 2 + 3)
+        self.assertEqual(self.__board__.contar_fichas_en_tablero("negro"), 14)
+        self.assertEqual(self.__board__.contar_fichas_fuera_de_casa("negro"), 9)
+        
+        # reingresar la negra en el punto 2
+        self.__board__.reingresar_desde_barra("negro", 2)
+        self.assertEqual(self.__board__.get_pips("negro"), 167 - 2 + 3 - 2)
+        self.assertEqual(self.__board__.contar_fichas_en_tablero("negro"), 15)
+        self.assertEqual(self.__board__.contar_fichas_fuera_de_casa("negro"), 10)
+    
+    def test_contadores_con_bear_off(self):
+        """
+        Prueba los contadores al sacar fichas del tablero.
+        
+        Recibe: Nada
+        Hace: Arma una posicion de bear off y saca una ficha
+        Devuelve: Nada
+        """
+        punto = 0
+        while punto < 26:
+            fichas = self.__board__.get_fichas_en_punto(punto)
+            while len(fichas) > 0:
+                fichas.pop()
+            punto = punto + 1
+        self.assertEqual(self.__board__.get_pips("blanco"), 0)
+        
+        self.__board__.get_fichas_en_punto(4).append(Checker("blanco"))
+        self.__board__.get_fichas_en_punto(9).append(Checker("blanco"))
+        self.assertEqual(self.__board__.contar_fichas_fuera_de_casa("blanco"), 1)
+        self.assertEqual(self.__board__.puede_sacar_fichas("blanco"), False)
+        
+        self.__board__.mover_ficha(9, 5, "blanco")
+        self.assertEqual(self.__board__.contar_fichas_fuera_de_casa("blanco"), 0)
+        self.assertEqual(self.__board__.puede_sacar_fichas("blanco"), True)
+        
+        self.__board__.sacar_ficha_del_tablero(5, "blanco")
+        self.assertEqual(self.__board__.get_pips("blanco"), 4)
+        self.assertEqual(self.__board__.contar_fichas_en_tablero("blanco"), 1)
+        self.assertEqual(self.__board__.contar_fichas_sacadas("blanco"), 1)
+    
+    def foto(self):
+        """
+        Toma una foto completa del estado del tablero.
+        
+        Recibe: Nada
+        Hace: Junta conteos, barra, sacadas, hash y contadores
+        Devuelve: Tupla comparable
+        """
+        datos = [tuple(self.__board__.get_conteos()), self.__board__.get_hash()]
+        for color in ("blanco", "negro"):
+            datos.append(self.__board__.contar_fichas_en_barra(color))
+            datos.append(self.__board__.contar_fichas_sacadas(color))
+            datos.append(self.__board__.get_pips(color))
+            datos.append(self.__board__.contar_fichas_en_tablero(color))
+            datos.append(self.__board__.contar_fichas_fuera_de_casa(color))
+        return tuple(datos)
+    
+    def test_aplicar_y_deshacer_con_captura(self):
+        """
+        Prueba aplicar una captura y deshacerla.
+        
+        Recibe: Nada
+        Hace: Deja una negra sola, la captura y deshace los movimientos
+        Devuelve: Nada
+        """
+        inicial = self.foto()
+        
+        registro1 = self.__board__.aplicar((1, 3, "negro"))
+        self.assertNotEqual(registro1, None)
+        registro2 = self.__board__.aplicar((8, 3, "blanco"))
+        self.assertEqual(registro2[3], True)
+        self.assertEqual(self.__board__.contar_fichas_en_barra("negro"), 1)
+        self.assertEqual(self.__board__.contar_movimientos_aplicados(), 2)
+        
+        # solo se puede deshacer el ultimo
+        self.assertEqual(self.__board__.deshacer(registro1), False)
+        
+        self.assertEqual(self.__board__.deshacer(registro2), True)
+        self.assertEqual(self.__board__.get_color_en_punto(3), "negro")
+        self.assertEqual(self.__board__.deshacer(), True)
+        
+        self.assertEqual(self.foto(), inicial)
+        self.assertEqual(self.__board__.deshacer(), False)
+    
+    def test_aplicar_invalido(self):
+        """
+        Prueba movimientos que aplicar no acepta.
+        
+        Recibe: Nada
+        Hace: Origen sin fichas propias y destino bloqueado
+        Devuelve: Nada
+        """
+        inicial = self.foto()
+        
+        self.assertEqual(self.__board__.aplicar((2, 1, "blanco")), None)
+        self.assertEqual(self.__board__.aplicar((1, 3, "blanco")), None)
+        self.assertEqual(self.__board__.aplicar((0, 20, "blanco")), None)
+        self.assertEqual(self.__board__.aplicar((13, 12, "blanco")), None)
+        
+        self.assertEqual(self.foto(), inicial)
+        self.assertEqual(self.__board__.contar_movimientos_aplicados(), 0)
+    
+    def test_aplicar_y_deshacer_reingreso_y_bear_off(self):
+        """
+        Prueba aplicar reingresos desde la barra y sacar fichas.
+        
+        Recibe: Nada
+        Hace: Aplica varios movimientos y los deshace en orden inverso
+        Devuelve: Nada
+        """
+        punto = 0
+        while punto < 26:
+            fichas = self.__board__.get_fichas_en_punto(punto)
+            while len(fichas) > 0:
+                fichas.pop()
+            punto = punto + 1
+        self.__board__.get_fichas_en_punto(0).append(Checker("negro"))
+        self.__board__.get_fichas_en_punto(4).append(Checker("blanco"))
+        self.__board__.get_fichas_en_punto(2).append(Checker("blanco"))
+        inicial = self.foto()
+        
+        registros = []
+        registros.append(self.__board__.aplicar((0, 4, "negro")))
+        registros.append(self.__board__.aplicar((2, 25, "blanco")))
+        self.assertEqual(self.__board__.contar_fichas_sacadas("blanco"), 1)
+        self.assertEqual(self.__board__.contar_fichas_en_barra("blanco"), 1)
+        
+        while len(registros) > 0:
+            self.assertEqual(self.__board__.deshacer(registros.pop()), True)
+        
+        self.assertEqual(self.foto(), inicial)
 
 
 if __name__ == "__main__":
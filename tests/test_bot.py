@@ -0,0 +1,267 @@
+import unittest
+from core.board import Board
+from core.bot import RandomBot, SearchBot, TIEMPO_MAXIMO, VALOR_VICTORIA
+from core.checker import Checker
+from core.dice import Dice
+from core.exceptions import MovimientoInvalidoError
+from core.game import BackgammonGame
+
+
+class TestSearchBot(unittest.TestCase):
+    """
+    Clase de pruebas para el bot de busqueda expectiminimax.
+    
+    Recibe: Nada
+    Hace: Prueba la evaluacion, la eleccion de jugadas y el tiempo limite
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Prepara el ambiente antes de cada prueba.
+        
+        Recibe: Nada
+        Hace: Crea un juego nuevo con dados 3 y 1 para blanco
+        Devuelve: Nada
+        """
+        self.__juego__ = BackgammonGame("Ana", "Luis")
+        movimientos = self.__juego__.get_movimientos_disponibles()
+        movimientos.append(3)
+        movimientos.append(1)
+    
+    def limpiar_tablero(self, tablero):
+        """
+        Limpia todas las fichas del tablero.
+        
+        Recibe: Board a limpiar
+        Hace: Deja todos los puntos sin fichas
+        Devuelve: Nada
+        """
+        punto = 0
+        while punto < 26:
+            fichas = tablero.get_fichas_en_punto(punto)
+            while len(fichas) > 0:
+                fichas.pop()
+            punto = punto + 1
+    
+    def test_profundidad_se_limita(self):
+        """
+        Prueba que la profundidad queda entre 0 y 2.
+        
+        Recibe: Nada
+        Hace: Crea bots con profundidades fuera de rango
+        Devuelve: Nada
+        """
+        self.assertEqual(SearchBot(profundidad=5).get_profundidad(), 2)
+        self.assertEqual(SearchBot(profundidad=-1).get_profundidad(), 0)
+    
+    def test_tiempo_por_defecto_es_finito(self):
+        """
+        Prueba que cada decision tiene un tiempo limite salvo que se pida.
+        
+        Recibe: Nada
+        Hace: Crea un bot sin tiempo y otro con None explicito
+        Devuelve: Nada
+        """
+        self.assertEqual(SearchBot(profundidad=2).get_tiempo_maximo(), TIEMPO_MAXIMO)
+        self.assertEqual(SearchBot(profundidad=2, tiempo_maximo=None).get_tiempo_maximo(), None)
+    
+    def test_evaluacion_antisimetrica(self):
+        """
+        Prueba que evaluar para el rival da el valor opuesto.
+        
+        Recibe: Nada
+        Hace: Evalua la posicion inicial y una modificada
+        Devuelve: Nada
+        """
+        bot = SearchBot()
+        tablero = Board()
+        self.assertEqual(bot.evaluar(tablero, 'blanco'), 0)
+        
+        tablero.mover_ficha(8, 5, 'blanco')
+        self.assertEqual(bot.evaluar(tablero, 'blanco'), -bot.evaluar(tablero, 'negro'))
+        self.assertNotEqual(bot.evaluar(tablero, 'blanco'), 0)
+    
+    def test_evaluacion_posicion_ganada(self):
+        """
+        Prueba la evaluacion cuando un jugador saco todas sus fichas.
+        
+        Recibe: Nada
+        Hace: Deja a blanco sin fichas en el tablero
+        Devuelve: Nada
+        """
+        bot = SearchBot()
+        tablero = Board()
+        self.limpiar_tablero(tablero)
+        tablero.get_fichas_en_punto(20).append(Checker('negro'))
+        
+        self.assertEqual(bot.evaluar(tablero, 'blanco'), VALOR_VICTORIA)
+        self.assertEqual(bot.evaluar(tablero, 'negro'), -VALOR_VICTORIA)
+    
+    def test_elige_jugada_legal_en_cada_profundidad(self):
+        """
+        Prueba que la jugada elegida es una de las legales.
+        
+        Recibe: Nada
+        Hace: Busca a 0, 1 y 2 ply y verifica el tablero despues
+        Devuelve: Nada
+        """
+        legales = self.__juego__.obtener_jugadas_legales()
+        tablero = self.__juego__.get_tablero()
+        hash_antes = tablero.get_hash()
+        
+        for profundidad in (0, 1, 2):
+            bot = SearchBot(profundidad=profundidad, tiempo_maximo=None, candidatos=3)
+            jugada = bot.elegir_jugada(self.__juego__)
+            self.assertIn(jugada, legales)
+            self.assertEqual(bot.get_profundidad_alcanzada(), profundidad)
+            
+            # la busqueda deja el tablero como estaba
+            self.assertEqual(tablero.get_hash(), hash_antes)
+            self.assertEqual(tablero.contar_movimientos_aplicados(), 0)
+    
+    def test_apertura_3_1_hace_el_punto_5(self):
+        """
+        Prueba la jugada clasica de apertura con 3 y 1.
+        
+        Recibe: Nada
+        Hace: Verifica que el bot arma el punto 5 con 8/5 y 6/5
+        Devuelve: Nada
+        """
+        bot = SearchBot(profundidad=0)
+        jugada = bot.elegir_jugada(self.__juego__)
+        self.assertEqual(sorted(jugada), [(6, 1), (8, 3)])
+    
+    def test_tiempo_agotado_devuelve_jugada(self):
+        """
+        Prueba que sin tiempo se usa la jugada de 0 ply.
+        
+        Recibe: Nada
+        Hace: Busca a 2 ply con tiempo maximo 0
+        Devuelve: Nada
+        """
+        bot = SearchBot(profundidad=2, tiempo_maximo=0.0)
+        jugada = bot.elegir_jugada(self.__juego__)
+        
+        self.assertIn(jugada, self.__juego__.obtener_jugadas_legales())
+        self.assertEqual(bot.get_profundidad_alcanzada(), 0)
+        self.assertEqual(self.__juego__.get_tablero().contar_movimientos_aplicados(), 0)
+    
+    def test_jugar_turno_pasa_el_turno(self):
+        """
+        Prueba que jugar_turno hace la jugada y cambia de jugador.
+        
+        Recibe: Nada
+        Hace: Juega el turno de blanco con 3 y 1
+        Devuelve: Nada
+        """
+        bot = SearchBot(profundidad=0)
+        jugada = bot.jugar_turno(self.__juego__)
+        
+        self.assertEqual(len(jugada), 2)
+        self.assertEqual(self.__juego__.get_jugador_actual(), self.__juego__.get_jugador2())
+        self.assertEqual(self.__juego__.get_tablero().contar_fichas_en_punto(5), 2)
+    
+    def test_jugar_turno_sin_movimientos(self):
+        """
+        Prueba jugar_turno cuando no hay jugada posible.
+        
+        Recibe: Nada
+        Hace: Bloquea la entrada desde la barra
+        Devuelve: Nada
+        """
+        tablero = self.__juego__.get_tablero()
+        self.limpiar_tablero(tablero)
+        tablero.get_fichas_en_punto(0).append(Checker('blanco'))
+        tablero.get_fichas_en_punto(22).append(Checker('negro'))
+        tablero.get_fichas_en_punto(22).append(Checker('negro'))
+        tablero.get_fichas_en_punto(24).append(Checker('negro'))
+        tablero.get_fichas_en_punto(24).append(Checker('negro'))
+        
+        bot = SearchBot()
+        jugada = bot.jugar_turno(self.__juego__)
+        
+        self.assertEqual(jugada, ())
+        self.assertEqual(self.__juego__.get_jugador_actual(), self.__juego__.get_jugador2())
+    
+    def test_movimiento_rechazado_lanza_error(self):
+        """
+        Prueba que un bot no juega medio turno sin avisar.
+        
+        Recibe: Nada
+        Hace: Hace que los bots elijan un movimiento con un dado que no
+              salio y revisa que lanzan el error sin pasar el turno
+        Devuelve: Nada
+        """
+        for bot in (SearchBot(profundidad=0), RandomBot(1)):
+            bot.elegir_jugada = lambda juego: ((13, 3), (8, 6))
+            with self.assertRaises(MovimientoInvalidoError):
+                bot.jugar_turno(self.__juego__)
+            self.assertEqual(self.__juego__.get_jugador_actual(), self.__juego__.get_jugador1())
+            self.__juego__ = BackgammonGame("Ana", "Luis")
+            self.__juego__.get_movimientos_disponibles().extend([3, 1])
+    
+    def test_partidas_completas_aplican_cada_movimiento(self):
+        """
+        Prueba que en partidas enteras se aplica cada movimiento elegido.
+        
+        Recibe: Nada
+        Hace: Juega partidas al azar y a 0 ply registrando lo que devuelve
+              hacer_movimiento, y revisa que se conservan las 15 fichas
+        Devuelve: Nada
+        """
+        partida = 0
+        while partida < 12:
+            if partida % 4 == 3:
+                bots = (SearchBot(profundidad=0), SearchBot(profundidad=0))
+            else:
+                bots = (RandomBot(partida), RandomBot(partida + 100))
+            juego = BackgammonGame("Ana", "Luis", Dice(semilla=partida))
+            
+            resultados = []
+            original = juego.hacer_movimiento
+            
+            def registrar(origen, dado, original=original, resultados=resultados):
+                resultado = original(origen, dado)
+                resultados.append(resultado)
+                return resultado
+            juego.hacer_movimiento = registrar
+            
+            elegidos = 0
+            while not juego.esta_terminado():
+                juego.tirar_dados()
+                if juego.get_color_jugador_actual() == 'blanco':
+                    jugada = bots[0].jugar_turno(juego)
+                else:
+                    jugada = bots[1].jugar_turno(juego)
+                elegidos = elegidos + len(jugada)
+            
+            self.assertEqual(len(resultados), elegidos)
+            self.assertNotIn(False, resultados)
+            tablero = juego.get_tablero()
+            for color in ('blanco', 'negro'):
+                total = (tablero.contar_fichas_en_tablero(color) + tablero.contar_fichas_en_barra(color)
+                         + tablero.contar_fichas_sacadas(color))
+                self.assertEqual(total, 15)
+            partida = partida + 1
+    
+    def test_tabla_de_transposicion_reusa_la_decision(self):
+        """
+        Prueba que repetir la misma decision usa la tabla.
+        
+        Recibe: Nada
+        Hace: Elige dos veces en la misma posicion con los mismos dados
+        Devuelve: Nada
+        """
+        bot = SearchBot(profundidad=1)
+        primera = bot.elegir_jugada(self.__juego__)
+        aciertos = bot.get_tabla().get_estadisticas()["aciertos"]
+        
+        segunda = bot.elegir_jugada(self.__juego__)
+        self.assertEqual(primera, segunda)
+        self.assertEqual(bot.get_tabla().get_estadisticas()["aciertos"], aciertos + 1)
+        self.assertEqual(bot.get_profundidad_alcanzada(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
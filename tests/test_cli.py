@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch
 from cli.cli import CLI
+from core.bot import SearchBot
+from core.transposition import TranspositionTable
 
 
 class JugadorStub:
@@ -104,6 +106,25 @@ class JuegoStub:
         return self.jugador2
 
 
+class BotStub:
+    """
+    Bot falso que siempre hace la misma jugada.
+    
+    Recibe: Nada
+    Hace: Cuenta las llamadas y mueve con hacer_movimiento
+    Devuelve: Nada
+    """
+    def __init__(self):
+        self.llamadas = 0
+    
+    def jugar_turno(self, juego):
+        self.llamadas = self.llamadas + 1
+        jugada = ((13, 1), (8, 2))
+        for origen, dado in jugada:
+            juego.hacer_movimiento(origen, dado)
+        return jugada
+
+
 class TestCLI(unittest.TestCase):
     """
     Pruebas unitarias para la clase CLI.
@@ -695,6 +716,149 @@ class TestCLI(unittest.TestCase):
         with patch.object(self.__cli__, "ejecutar") as ejecutar:
             self.__cli__.iniciar_juego()
         ejecutar.assert_called_once()
+    
+    def test_crear_juego_con_bot_pide_un_nombre(self):
+        """
+        Prueba crear_juego contra la computadora.
+        
+        Recibe: Nada
+        Hace: Verifica que solo se pide el nombre del jugador 1
+        Devuelve: Nada
+        """
+        cli = CLI(BotStub())
+        with patch("builtins.input", side_effect=["Ana"]):
+            cli.crear_juego()
+        juego = cli._CLI__juego__
+        self.assertEqual(juego.get_jugador1().get_nombre(), "Ana")
+        self.assertEqual(juego.get_jugador2().get_nombre(), "Computadora")
+    
+    def test_es_turno_computadora(self):
+        """
+        Prueba es_turno_computadora con y sin bot.
+        
+        Recibe: Nada
+        Hace: Cambia el jugador actual del stub
+        Devuelve: Nada
+        """
+        stub = JuegoStub()
+        self.__cli__._CLI__juego__ = stub
+        stub.jugador_actual = stub.jugador2
+        self.assertFalse(self.__cli__.es_turno_computadora())
+        
+        cli = CLI(BotStub())
+        cli._CLI__juego__ = stub
+        self.assertTrue(cli.es_turno_computadora())
+        stub.jugador_actual = stub.jugador1
+        self.assertFalse(cli.es_turno_computadora())
+    
+    def test_turno_computadora_tira_y_juega(self):
+        """
+        Prueba turno_computadora con un bot falso.
+        
+        Recibe: Nada
+        Hace: Verifica que tira los dados y muestra la jugada
+        Devuelve: Nada
+        """
+        bot = BotStub()
+        cli = CLI(bot)
+        stub = JuegoStub()
+        stub.jugador_actual = stub.jugador2
+        cli._CLI__juego__ = stub
+        
+        mensajes = self.capturar_prints(cli.turno_computadora)
+        self.assertEqual(bot.llamadas, 1)
+        self.assertEqual(stub.hacer_llamadas, [(13, 1), (8, 2)])
+        self.assertTrue(any("Dados: [1, 2]" in linea for linea in mensajes))
+        self.assertTrue(any("punto 13" in linea for linea in mensajes))
+    
+    def test_salida_y_entrada_propias(self):
+        """
+        Prueba usar funciones propias en lugar de print e input.
+        
+        Recibe: Nada
+        Hace: Crea una CLI que escribe en una lista y responde sola
+        Devuelve: Nada
+        """
+        lineas = []
+        cli = CLI(salida=lineas.append, entrada=lambda mensaje: "Ana")
+        cli.escribir("hola")
+        self.assertEqual(lineas, ["hola"])
+        self.assertEqual(cli.leer("Nombre: "), "Ana")
+        self._print_mock.assert_not_called()
+    
+    def test_comando_nuevo_respeta_nombres(self):
+        """
+        Prueba el comando nuevo.
+        
+        Recibe: Nada
+        Hace: Crea un juego con nombres en mayusculas y otro contra el bot
+        Devuelve: Nada
+        """
+        self.__cli__.procesar_comando("nuevo Ana Luis")
+        self.assertEqual(self.__cli__.get_juego().get_jugador1().get_nombre(), "Ana")
+        self.assertEqual(self.__cli__.get_juego().get_jugador2().get_nombre(), "Luis")
+        
+        cli_bot = CLI(bot=BotStub())
+        cli_bot.procesar_comando("nuevo Ana Luis")
+        self.assertEqual(cli_bot.get_juego().get_jugador2().get_nombre(), "Computadora")
+    
+    def test_sin_redibujar(self):
+        """
+        Prueba que redibujar=False no muestra el tablero solo.
+        
+        Recibe: Nada
+        Hace: Procesa comandos y revisa las llamadas a mostrar_tablero
+        Devuelve: Nada
+        """
+        cli = CLI(redibujar=False)
+        cli._CLI__juego__ = JuegoStub()
+        with patch.object(cli, "mostrar_tablero") as mostrar_tablero:
+            cli.procesar_comando("tirar")
+            cli.procesar_comando("estado")
+            mostrar_tablero.assert_not_called()
+            cli.procesar_comando("tablero")
+            mostrar_tablero.assert_called_once()
+    
+    def test_ejecutar_lote(self):
+        """
+        Prueba ejecutar comandos de una lista.
+        
+        Recibe: Nada
+        Hace: Corre un lote con comentarios, errores y salir
+        Devuelve: Nada
+        """
+        lineas = []
+        cli = CLI(salida=lineas.append, entrada=lambda mensaje: "s", redibujar=False)
+        codigo = cli.ejecutar_lote(["# comentario", "", "nuevo Ana Luis", "tirar", "pasar",
+                                    "estado", "salir", "tirar"])
+        self.assertEqual(codigo, 0)
+        self.assertIn("> nuevo Ana Luis", lineas)
+        self.assertIn("Turno de: Luis (negro)", lineas)
+        self.assertNotIn("> # comentario", lineas)
+        # despues de salir no se procesa nada
+        self.assertEqual(lineas[-1], "> salir")
+        
+        cli = CLI(salida=lineas.append, redibujar=False)
+        codigo = cli.ejecutar_lote(["mover 1", "volar"])
+        self.assertEqual(codigo, 1)
+        self.assertEqual(cli.get_errores(), 2)
+    
+    def test_ejecutar_lote_con_bot(self):
+        """
+        Prueba que el lote juega los turnos de la computadora.
+        
+        Recibe: Nada
+        Hace: Pasa el turno del jugador y revisa que el bot jugo
+        Devuelve: Nada
+        """
+        lineas = []
+        bot = SearchBot(profundidad=0, tabla=TranspositionTable(1024))
+        cli = CLI(bot=bot, salida=lineas.append, entrada=lambda mensaje: "s", redibujar=False)
+        cli.ejecutar_lote(["tirar", "pasar"])
+        self.assertEqual(lineas.count("\nTurno de la computadora..."), 1)
+        self.assertEqual(cli.get_juego().get_color_jugador_actual(), 'blanco')
+
+
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 import unittest
 import random
-from core.dice import Dice
+from core.dice import Dice, StratifiedRolls, TIRADAS_DISTINTAS, TIRADAS_POSIBLES
 
 
 class TestDiceCobertura100(unittest.TestCase):
@@ -389,6 +389,181 @@ class TestDiceCobertura100(unittest.TestCase):
             self.assertFalse(self.dice.es_doble())
         finally:
             random.randint = original
+    
+    def test_misma_semilla_mismas_tiradas(self):
+        """
+        Prueba que dos dados con la misma semilla tiran igual.
+        
+        Recibe: Nada
+        Hace: Compara 50 tiradas y verifica que no usa random global
+        Devuelve: Nada
+        """
+        original = random.randint
+        random.randint = lambda a, b: 1
+        try:
+            dados1 = Dice(semilla=3)
+            dados2 = Dice(azar=random.Random(3))
+            tiradas1 = [dados1.tirar() for _ in range(50)]
+            tiradas2 = [dados2.tirar() for _ in range(50)]
+        finally:
+            random.randint = original
+        
+        self.assertEqual(tiradas1, tiradas2)
+        self.assertNotEqual(tiradas1, [[1, 1, 1, 1]] * 50)
+        self.assertEqual(dados1.get_ultima_tirada(), tiradas1[-1])
+    
+    def test_buffer_de_tiradas(self):
+        """
+        Prueba las tiradas pregeneradas.
+        
+        Recibe: Nada
+        Hace: Usa un buffer de 10 tiradas y lo consume mas de una vez
+        Devuelve: Nada
+        """
+        dados = Dice(semilla=7, tamano_buffer=10)
+        self.assertEqual(dados.get_tiradas_en_buffer(), 0)
+        
+        tiradas = []
+        for _ in range(25):
+            tiradas.append(dados.tirar())
+        self.assertEqual(dados.get_tiradas_en_buffer(), 5)
+        
+        # se repite con la misma semilla y las tiradas son validas
+        otros = Dice(semilla=7, tamano_buffer=10)
+        self.assertEqual([otros.tirar() for _ in range(25)], tiradas)
+        for tirada in tiradas:
+            if len(tirada) == 4:
+                self.assertEqual(len(set(tirada)), 1)
+            else:
+                self.assertEqual(len(tirada), 2)
+                self.assertNotEqual(tirada[0], tirada[1])
+    
+    def test_generar_tiradas_en_bloque(self):
+        """
+        Prueba generar muchas tiradas de una vez.
+        
+        Recibe: Nada
+        Hace: Genera 3600 tiradas y revisa que aparecen las 36
+        Devuelve: Nada
+        """
+        tiradas = Dice(semilla=1).generar_tiradas(3600)
+        self.assertEqual(len(tiradas), 3600)
+        self.assertEqual(len(set(tiradas)), 36)
+        for dado1, dado2 in tiradas:
+            self.assertTrue(1 <= dado1 <= 6 and 1 <= dado2 <= 6)
+    
+    def test_tiradas_distintas(self):
+        """
+        Prueba la tabla exacta de las 21 tiradas.
+        
+        Recibe: Nada
+        Hace: Revisa cantidad, probabilidades, dobles expandidos e
+              inmutabilidad
+        Devuelve: Nada
+        """
+        self.assertEqual(len(TIRADAS_DISTINTAS), 21)
+        self.assertAlmostEqual(sum(probabilidad for _, probabilidad in TIRADAS_DISTINTAS), 1.0)
+        self.assertIsInstance(TIRADAS_DISTINTAS, tuple)
+        
+        dobles = 0
+        for dados, probabilidad in TIRADAS_DISTINTAS:
+            self.assertIsInstance(dados, tuple)
+            if len(dados) == 4:
+                dobles = dobles + 1
+                self.assertEqual(len(set(dados)), 1)
+                self.assertAlmostEqual(probabilidad, 1.0 / 36.0)
+            else:
+                self.assertLess(dados[0], dados[1])
+                self.assertAlmostEqual(probabilidad, 2.0 / 36.0)
+        self.assertEqual(dobles, 6)
+        
+        # las mismas tiradas que puede devolver tirar()
+        dados = Dice(semilla=4)
+        vistas = set()
+        veces = 0
+        while veces < 2000:
+            vistas.add(tuple(sorted(dados.tirar())))
+            veces = veces + 1
+        self.assertEqual(vistas, set(dados for dados, _ in TIRADAS_DISTINTAS))
+    
+    def test_tiradas_fijas_y_antiteticas(self):
+        """
+        Prueba las tiradas fijas y los dados antiteticos.
+        
+        Recibe: Nada
+        Hace: Tira dados con las mismas semillas, normales y antiteticos
+        Devuelve: Nada
+        """
+        dados = Dice(semilla=5, tiradas=[(3, 3), (6, 1)])
+        self.assertEqual(dados.tirar(), [3, 3, 3, 3])
+        self.assertEqual(dados.tirar(), [6, 1])
+        siguiente = dados.tirar()
+        self.assertEqual(siguiente, Dice(semilla=5).tirar())
+        
+        normales = Dice(semilla=9, tiradas=[(2, 5)])
+        opuestos = Dice(semilla=9, tiradas=[(2, 5)], antitetico=True)
+        self.assertEqual(opuestos.tirar(), [5, 2])
+        self.assertEqual(normales.tirar(), [2, 5])
+        veces = 0
+        while veces < 50:
+            tirada = normales.tirar()
+            opuesta = opuestos.tirar()
+            self.assertEqual(len(tirada), len(opuesta))
+            self.assertEqual(tirada[0] + opuesta[0], 7)
+            veces = veces + 1
+    
+    def test_plan_estratificado(self):
+        """
+        Prueba que el primer turno usa las 36 tiradas por partes iguales.
+        
+        Recibe: Nada
+        Hace: Arma un plan de 72 partidas y cuenta las primeras tiradas
+        Devuelve: Nada
+        """
+        plan = StratifiedRolls(72, 'estratificado', semilla=1)
+        conteos = {}
+        for fijas, _, antitetico in plan.lote(0, 72):
+            self.assertEqual(len(fijas), 1)
+            self.assertFalse(antitetico)
+            conteos[fijas[0]] = conteos.get(fijas[0], 0) + 1
+        self.assertEqual(sorted(conteos), sorted(TIRADAS_POSIBLES))
+        self.assertEqual(set(conteos.values()), {2})
+        
+        self.assertEqual(plan.dados_partida(3).tirar()[:2], list(plan.tiradas_partida(3)[0][0]))
+        self.assertRaises(ValueError, StratifiedRolls, 10, 'sobol')
+    
+    def test_plan_hipercubo_antitetico(self):
+        """
+        Prueba el hipercubo latino con pares antiteticos.
+        
+        Recibe: Nada
+        Hace: Revisa que cada turno esta balanceado, que los turnos no
+              repiten el mismo orden y que los pares comparten semilla
+        Devuelve: Nada
+        """
+        plan = StratifiedRolls(72, 'hipercubo', semilla=2, antiteticos=True, turnos=3)
+        self.assertTrue(plan.es_antitetico())
+        self.assertEqual(plan.get_partidas(), 72)
+        
+        pares = plan.lote(0, 72)
+        bases = pares[0::2]
+        turno = 0
+        while turno < 3:
+            columna = [fijas[turno] for fijas, _, _ in bases]
+            self.assertEqual(len(set(columna)), 36)
+            turno = turno + 1
+        self.assertNotEqual([fijas[0] for fijas, _, _ in bases],
+                            [fijas[1] for fijas, _, _ in bases])
+        
+        indice = 0
+        while indice < 72:
+            self.assertEqual(pares[indice][0], pares[indice + 1][0])
+            self.assertEqual(pares[indice][1], pares[indice + 1][1])
+            self.assertFalse(pares[indice][2])
+            self.assertTrue(pares[indice + 1][2])
+            indice = indice + 2
+        
+        self.assertEqual(len(StratifiedRolls(5, 'azar', antiteticos=True).lote(0, 5)), 5)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import Mock
 from core.game import BackgammonGame
 from core.checker import Checker
+from core.zobrist import CLAVES_ZOBRIST
 
 
 class TestBackgammonGame(unittest.TestCase):
@@ -665,8 +666,8 @@ class TestBackgammonGame(unittest.TestCase):
         tablero.get_fichas_en_punto(22).append(ficha_base)
         
         ficha_extra = Checker('negro')
-        ficha_extra.set_posicion(24)
-        tablero.get_fichas_en_punto(24).append(ficha_extra)
+        ficha_extra.set_posicion(20)
+        tablero.get_fichas_en_punto(20).append(ficha_extra)
         
         import random
         original = random.randint
@@ -676,6 +677,11 @@ class TestBackgammonGame(unittest.TestCase):
             self.__juego__.tirar_dados()
             resultado = self.__juego__.puede_hacer_movimiento(22, 4)
             self.assertFalse(resultado)
+            
+            # las fichas mas cerca de la salida (23 y 24) no impiden sacar
+            tablero.get_fichas_en_punto(20).pop()
+            tablero.get_fichas_en_punto(24).append(Checker('negro'))
+            self.assertTrue(self.__juego__.puede_hacer_movimiento(22, 4))
         finally:
             random.randint = original
     
@@ -1883,6 +1889,44 @@ class TestBackgammonGame(unittest.TestCase):
             tiene_formato = False
         
         self.assertTrue(tiene_formato)
+    
+    # ===== TESTS DE HASH =====
+    
+    def test_get_hash_incluye_turno(self):
+        """
+        Prueba que el hash del juego cambia con el lado a mover.
+        
+        Recibe: Nada
+        Hace: Compara el hash antes y despues de terminar el turno
+        Devuelve: Nada
+        """
+        tablero = self.__juego__.get_tablero()
+        hash_blanco = self.__juego__.get_hash()
+        self.assertEqual(hash_blanco, tablero.get_hash())
+        
+        self.__juego__.terminar_turno()
+        hash_negro = self.__juego__.get_hash()
+        
+        self.assertNotEqual(hash_blanco, hash_negro)
+        self.assertEqual(hash_negro ^ hash_blanco, CLAVES_ZOBRIST.get_clave_turno())
+    
+    def test_get_hash_sigue_movimientos(self):
+        """
+        Prueba que el hash del juego cambia al mover.
+        
+        Recibe: Nada
+        Hace: Hace un movimiento y compara con un juego sin mover
+        Devuelve: Nada
+        """
+        movimientos = self.__juego__.get_movimientos_disponibles()
+        movimientos.append(5)
+        movimientos.append(3)
+        
+        otro = BackgammonGame("Ana", "Luis")
+        self.assertEqual(self.__juego__.get_hash(), otro.get_hash())
+        
+        self.__juego__.hacer_movimiento(13, 5)
+        self.assertNotEqual(self.__juego__.get_hash(), otro.get_hash())
 
 
 if __name__ == "__main__":
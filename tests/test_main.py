@@ -0,0 +1,148 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from core.bot import TIEMPO_MAXIMO
+from main import SalidaBuffer, main
+
+
+class TestMain(unittest.TestCase):
+    """
+    Clase de pruebas para el punto de entrada y el modo batch.
+    
+    Recibe: Nada
+    Hace: Corre archivos de comandos y revisa la salida y el codigo
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Crea un directorio temporal para los archivos de comandos.
+        
+        Recibe: Nada
+        Hace: Guarda la ruta del directorio
+        Devuelve: Nada
+        """
+        self.directorio = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """
+        Borra los archivos de comandos.
+        
+        Recibe: Nada
+        Hace: Elimina los archivos y el directorio
+        Devuelve: Nada
+        """
+        for nombre in os.listdir(self.directorio):
+            os.remove(os.path.join(self.directorio, nombre))
+        os.rmdir(self.directorio)
+    
+    def escribir_archivo(self, texto):
+        """
+        Escribe un archivo de comandos.
+        
+        Recibe: Texto (string)
+        Hace: Lo guarda en el directorio temporal
+        Devuelve: Ruta del archivo
+        """
+        ruta = os.path.join(self.directorio, "comandos.txt")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(texto)
+        return ruta
+    
+    def correr(self, argumentos, entrada=""):
+        """
+        Corre main capturando la salida.
+        
+        Recibe: Lista de argumentos y texto de stdin
+        Hace: Reemplaza stdin y stdout por buffers de texto
+        Devuelve: Tupla (codigo, salida)
+        """
+        salida = io.StringIO()
+        with patch("sys.stdin", io.StringIO(entrada)), patch("sys.stdout", salida):
+            codigo = main(argumentos)
+        return codigo, salida.getvalue()
+    
+    def test_batch_desde_archivo(self):
+        """
+        Prueba el modo batch con un archivo sin errores.
+        
+        Recibe: Nada
+        Hace: Crea un juego, tira, pasa y pide el estado
+        Devuelve: Nada
+        """
+        ruta = self.escribir_archivo("nuevo Ana Luis\ntirar\npasar\nestado\n")
+        codigo, salida = self.correr(["--batch", ruta, "--semilla", "1"])
+        self.assertEqual(codigo, 0)
+        self.assertIn("> tirar", salida)
+        self.assertIn("Turno de: Luis (negro)", salida)
+        self.assertIn("=" * 60, salida)
+    
+    def test_batch_repetible_y_sin_tablero(self):
+        """
+        Prueba que la semilla repite la partida y --sin-tablero.
+        
+        Recibe: Nada
+        Hace: Corre dos veces el mismo lote desde stdin
+        Devuelve: Nada
+        """
+        comandos = "tirar\npasar\ntirar\n"
+        codigo1, salida1 = self.correr(["--batch", "--sin-tablero", "--semilla", "7"], comandos)
+        codigo2, salida2 = self.correr(["--batch", "-", "--sin-tablero", "--semilla", "7"], comandos)
+        self.assertEqual(codigo1, 0)
+        self.assertEqual(salida1, salida2)
+        self.assertNotIn("=" * 60, salida1)
+    
+    def test_batch_codigos_de_error(self):
+        """
+        Prueba los codigos de salida con errores.
+        
+        Recibe: Nada
+        Hace: Corre un comando invalido y un archivo que no existe
+        Devuelve: Nada
+        """
+        codigo, salida = self.correr(["--batch", "--sin-tablero"], "volar\n")
+        self.assertEqual(codigo, 1)
+        self.assertIn("Comando no reconocido", salida)
+        
+        with patch("sys.stderr", io.StringIO()):
+            codigo, salida = self.correr(["--batch", os.path.join(self.directorio, "no_existe.txt")])
+        self.assertEqual(codigo, 2)
+    
+    def test_tiempo_del_bot(self):
+        """
+        Prueba el tiempo por jugada que recibe la computadora.
+        
+        Recibe: Nada
+        Hace: Corre --bot sin --tiempo, con un tiempo y con 0
+        Devuelve: Nada
+        """
+        for argumentos, esperado in (([], TIEMPO_MAXIMO), (["--tiempo", "0.5"], 0.5),
+                                     (["--tiempo", "0"], None)):
+            with patch("main.SearchBot") as clase:
+                self.correr(["--bot", "--batch", "--sin-tablero"] + argumentos, "salir\n")
+            self.assertEqual(clase.call_args.kwargs["tiempo_maximo"], esperado)
+    
+    def test_salida_buffer(self):
+        """
+        Prueba que la salida escribe por bloques.
+        
+        Recibe: Nada
+        Hace: Agrega lineas con un bloque de 3 y revisa el destino
+        Devuelve: Nada
+        """
+        destino = io.StringIO()
+        salida = SalidaBuffer(destino, 3)
+        salida.agregar("a")
+        salida.agregar("b")
+        self.assertEqual(destino.getvalue(), "")
+        salida.agregar("c")
+        self.assertEqual(destino.getvalue(), "a\nb\nc\n")
+        salida.agregar("d")
+        salida.volcar()
+        self.assertEqual(destino.getvalue(), "a\nb\nc\nd\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,338 @@
+import copy
+import random
+import unittest
+from core.board import Board
+from core.checker import Checker
+from core.game import BackgammonGame
+from core.move_generator import MoveGenerator
+
+
+class TestMoveGenerator(unittest.TestCase):
+    """
+    Clase de pruebas para el generador de jugadas legales.
+    
+    Recibe: Nada
+    Hace: Prueba las reglas de dados y compara con BackgammonGame
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Prepara el ambiente antes de cada prueba.
+        
+        Recibe: Nada
+        Hace: Crea un generador y un tablero nuevos
+        Devuelve: Nada
+        """
+        self.__generador__ = MoveGenerator()
+        self.__board__ = Board()
+    
+    def limpiar_tablero(self, tablero):
+        """
+        Limpia todas las fichas del tablero.
+        
+        Recibe: Board a limpiar
+        Hace: Deja todos los puntos sin fichas
+        Devuelve: Nada
+        """
+        punto = 0
+        while punto < 26:
+            fichas = tablero.get_fichas_en_punto(punto)
+            while len(fichas) > 0:
+                fichas.pop()
+            punto = punto + 1
+    
+    def poner(self, tablero, punto, color, cantidad):
+        """
+        Pone fichas de un color en un punto.
+        
+        Recibe: Board, punto (int), color (string) y cantidad (int)
+        Hace: Agrega las fichas al punto
+        Devuelve: Nada
+        """
+        contador = 0
+        while contador < cantidad:
+            tablero.get_fichas_en_punto(punto).append(Checker(color))
+            contador = contador + 1
+    
+    def clave(self, tablero):
+        """
+        Arma una clave de la posicion de un tablero.
+        
+        Recibe: Board
+        Hace: Junta conteos, barra y sacadas
+        Devuelve: Tupla comparable
+        """
+        return (tuple(tablero.get_conteos()),
+                tablero.contar_fichas_en_barra('blanco'),
+                tablero.contar_fichas_en_barra('negro'),
+                tablero.contar_fichas_sacadas('blanco'),
+                tablero.contar_fichas_sacadas('negro'))
+    
+    def posiciones_por_fuerza_bruta(self, juego):
+        """
+        Calcula las posiciones finales legales reproduciendo movimientos.
+        
+        Recibe: BackgammonGame con dados disponibles
+        Hace: Prueba todas las secuencias con copias del juego
+        Devuelve: Conjunto de claves de posiciones finales
+        """
+        finales = {}
+        
+        def recorrer(actual, usados, suma):
+            dados = actual.get_movimientos_disponibles()
+            hubo = False
+            for dado in set(dados):
+                for origen in range(0, 25):
+                    if actual.puede_hacer_movimiento(origen, dado):
+                        hubo = True
+                        siguiente = copy.deepcopy(actual)
+                        siguiente.hacer_movimiento(origen, dado)
+                        recorrer(siguiente, usados + 1, suma + dado)
+            if not hubo:
+                clave = self.clave(actual.get_tablero())
+                anterior = finales.get(clave, (0, 0))
+                if (usados, suma) > anterior:
+                    finales[clave] = (usados, suma)
+        
+        distintos = len(set(juego.get_movimientos_disponibles()))
+        recorrer(juego, 0, 0)
+        maximo = max(valor[0] for valor in finales.values())
+        mayor = 0
+        if maximo == 1 and distintos == 2:
+            mayor = max(valor[1] for valor in finales.values() if valor[0] == 1)
+        resultado = set()
+        for clave, valor in finales.items():
+            if valor[0] == maximo and (mayor == 0 or valor[1] == mayor):
+                resultado.add(clave)
+        return resultado
+    
+    def posiciones_de_jugadas(self, juego, jugadas):
+        """
+        Aplica cada jugada sobre una copia y devuelve las posiciones.
+        
+        Recibe: BackgammonGame y lista de jugadas
+        Hace: Reproduce cada jugada con hacer_movimiento
+        Devuelve: Lista de claves de posiciones finales
+        """
+        resultado = []
+        for jugada in jugadas:
+            copia = copy.deepcopy(juego)
+            for origen, dado in jugada:
+                self.assertTrue(copia.hacer_movimiento(origen, dado))
+            resultado.append(self.clave(copia.get_tablero()))
+        return resultado
+    
+    def test_apertura_no_doble(self):
+        """
+        Prueba las jugadas de apertura con 3 y 1.
+        
+        Recibe: Nada
+        Hace: Verifica que todas usan los dos dados y no se repiten
+        Devuelve: Nada
+        """
+        jugadas = self.__generador__.generar_jugadas(self.__board__, 'blanco', [3, 1])
+        
+        self.assertGreater(len(jugadas), 0)
+        for jugada in jugadas:
+            self.assertEqual(len(jugada), 2)
+        self.assertTrue(((8, 3), (6, 1)) in jugadas or ((6, 1), (8, 3)) in jugadas)
+        
+        # no modifica el tablero
+        self.assertEqual(self.__board__.contar_fichas_en_punto(8), 3)
+        self.assertEqual(self.__board__.contar_fichas_en_punto(6), 5)
+    
+    def test_apertura_dobles_usa_cuatro_dados(self):
+        """
+        Prueba que con dobles todas las jugadas usan cuatro dados.
+        
+        Recibe: Nada
+        Hace: Genera jugadas con 6-6 para negro
+        Devuelve: Nada
+        """
+        jugadas = self.__generador__.generar_jugadas(self.__board__, 'negro', [6, 6, 6, 6])
+        
+        self.assertGreater(len(jugadas), 0)
+        for jugada in jugadas:
+            self.assertEqual(len(jugada), 4)
+            for origen, dado in jugada:
+                self.assertEqual(dado, 6)
+    
+    def test_sin_movimientos_desde_barra(self):
+        """
+        Prueba una ficha en barra que no puede entrar.
+        
+        Recibe: Nada
+        Hace: Bloquea las entradas y verifica la jugada vacia
+        Devuelve: Nada
+        """
+        self.limpiar_tablero(self.__board__)
+        self.poner(self.__board__, 0, 'blanco', 1)
+        self.poner(self.__board__, 10, 'blanco', 2)
+        self.poner(self.__board__, 20, 'negro', 2)
+        self.poner(self.__board__, 22, 'negro', 2)
+        
+        jugadas = self.__generador__.generar_jugadas(self.__board__, 'blanco', [5, 3])
+        self.assertEqual(jugadas, [()])
+    
+    def test_regla_del_dado_mayor(self):
+        """
+        Prueba que si solo se puede usar un dado, se usa el mayor.
+        
+        Recibe: Nada
+        Hace: Arma una posicion donde cada dado bloquea al otro
+        Devuelve: Nada
+        """
+        self.limpiar_tablero(self.__board__)
+        self.poner(self.__board__, 13, 'blanco', 1)
+        self.poner(self.__board__, 6, 'negro', 2)
+        
+        jugadas = self.__generador__.generar_jugadas(self.__board__, 'blanco', [1, 6])
+        self.assertEqual(jugadas, [((13, 6),)])
+    
+    def test_bear_off_con_dado_mayor(self):
+        """
+        Prueba sacar fichas con un dado mayor al necesario.
+        
+        Recibe: Nada
+        Hace: Verifica que negro saca desde el punto mas lejano
+        Devuelve: Nada
+        """
+        self.limpiar_tablero(self.__board__)
+        self.poner(self.__board__, 22, 'negro', 1)
+        self.poner(self.__board__, 23, 'negro', 1)
+        
+        jugadas = self.__generador__.generar_jugadas(self.__board__, 'negro', [6, 5])
+        self.assertEqual(len(jugadas), 1)
+        self.assertEqual(len(jugadas[0]), 2)
+    
+    def test_juego_obtener_jugadas_legales(self):
+        """
+        Prueba la API del juego con los dados disponibles.
+        
+        Recibe: Nada
+        Hace: Carga dados y compara con el generador
+        Devuelve: Nada
+        """
+        juego = BackgammonGame("Ana", "Luis")
+        movimientos = juego.get_movimientos_disponibles()
+        movimientos.append(4)
+        movimientos.append(2)
+        
+        jugadas = juego.obtener_jugadas_legales()
+        esperadas = self.__generador__.generar_jugadas(juego.get_tablero(), 'blanco', [4, 2])
+        self.assertEqual(jugadas, esperadas)
+    
+    def test_coincide_con_fuerza_bruta(self):
+        """
+        Compara el generador con reproducir movimientos en BackgammonGame.
+        
+        Recibe: Nada
+        Hace: Juega partidas al azar y compara posiciones finales
+        Devuelve: Nada
+        """
+        azar = random.Random(7)
+        juego = BackgammonGame("Ana", "Luis")
+        turno = 0
+        while turno < 40 and not juego.esta_terminado():
+            dado1 = azar.randint(1, 6)
+            dado2 = azar.randint(1, 6)
+            if dado1 == dado2:
+                dados = [dado1] * 4
+            else:
+                dados = [dado1, dado2]
+            
+            movimientos = juego.get_movimientos_disponibles()
+            movimientos.clear()
+            movimientos.extend(dados)
+            
+            jugadas = juego.obtener_jugadas_legales()
+            if turno % 4 == 0:
+                esperadas = self.posiciones_por_fuerza_bruta(juego)
+                obtenidas = self.posiciones_de_jugadas(juego, jugadas)
+                self.assertEqual(len(obtenidas), len(set(obtenidas)))
+                self.assertEqual(set(obtenidas), esperadas)
+            
+            jugada = jugadas[azar.randrange(len(jugadas))]
+            if len(jugada) == 0:
+                juego.terminar_turno()
+            for origen, dado in jugada:
+                self.assertTrue(juego.hacer_movimiento(origen, dado))
+            if len(juego.get_movimientos_disponibles()) > 0:
+                juego.terminar_turno()
+            turno = turno + 1
+    
+    def posicion_al_azar_en_casa(self, azar, color):
+        """
+        Arma conteos al azar con todas las fichas de un color en su casa.
+        
+        Recibe: random.Random y color que saca (string)
+        Hace: Reparte entre 1 y 15 fichas en la casa del color (el resto
+              sacadas) y pone 15 fichas rivales lejos
+        Devuelve: Tupla (conteos, barra, sacadas)
+        """
+        conteos = [0] * 26
+        en_casa = azar.randint(1, 15)
+        contador = 0
+        while contador < en_casa:
+            if color == 'blanco':
+                conteos[azar.randint(1, 6)] += 1
+            else:
+                conteos[azar.randint(19, 24)] -= 1
+            contador = contador + 1
+        if color == 'blanco':
+            conteos[12] = -15
+            sacadas = {'blanco': 15 - en_casa, 'negro': 0}
+        else:
+            conteos[13] = 15
+            sacadas = {'blanco': 0, 'negro': 15 - en_casa}
+        return (conteos, {'blanco': 0, 'negro': 0}, sacadas)
+    
+    def test_jugadas_se_pueden_reproducir_en_el_juego(self):
+        """
+        Reproduce cada jugada generada con BackgammonGame.hacer_movimiento.
+        
+        Recibe: Nada
+        Hace: Para posiciones de partidas al azar y finales de bear-off de
+              los dos colores, copia el juego con from_snapshot y aplica
+              todos los movimientos de cada jugada legal
+        Devuelve: Nada
+        """
+        azar = random.Random(11)
+        juegos = []
+        
+        # posiciones de partidas jugadas al azar (hasta el final)
+        juego = BackgammonGame("Ana", "Luis")
+        while not juego.esta_terminado():
+            juego.get_movimientos_disponibles().clear()
+            dado1 = azar.randint(1, 6)
+            dado2 = azar.randint(1, 6)
+            juego.get_movimientos_disponibles().extend([dado1] * 4 if dado1 == dado2 else [dado1, dado2])
+            juegos.append(juego.snapshot())
+            jugadas = juego.obtener_jugadas_legales()
+            for origen, dado in jugadas[azar.randrange(len(jugadas))]:
+                self.assertTrue(juego.hacer_movimiento(origen, dado))
+            if len(juego.get_movimientos_disponibles()) > 0:
+                juego.terminar_turno()
+        
+        # finales de bear-off con todas las tiradas
+        for color in ('blanco', 'negro', 'negro', 'blanco', 'negro'):
+            conteos, barra, sacadas = self.posicion_al_azar_en_casa(azar, color)
+            for dado1 in range(1, 7):
+                for dado2 in range(dado1, 7):
+                    dados = [dado1] * 4 if dado1 == dado2 else [dado1, dado2]
+                    final = BackgammonGame("Ana", "Luis")
+                    final.cargar_estado(conteos, barra, sacadas, color, dados)
+                    juegos.append(final.snapshot())
+        
+        for foto in juegos:
+            jugadas = BackgammonGame.from_snapshot(foto).obtener_jugadas_legales()
+            for jugada in jugadas:
+                copia = BackgammonGame.from_snapshot(foto)
+                for origen, dado in jugada:
+                    self.assertTrue(copia.hacer_movimiento(origen, dado),
+                                    (foto, jugada, origen, dado))
+
+
+if __name__ == "__main__":
+    unittest.main()
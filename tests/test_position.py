@@ -0,0 +1,114 @@
+import pickle
+import unittest
+from core.game import BackgammonGame
+from core.position import Position
+
+
+class TestPosition(unittest.TestCase):
+    """
+    Clase de pruebas para la posicion inmutable.
+    
+    Recibe: Nada
+    Hace: Convierte tableros a posiciones y las usa como claves
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Prepara un juego con un movimiento hecho.
+        
+        Recibe: Nada
+        Hace: Juega un 3 de una tirada 3-1 con el blanco
+        Devuelve: Nada
+        """
+        self.juego = BackgammonGame("Ana", "Beto")
+        self.juego.get_movimientos_disponibles().extend([3, 1])
+        self.juego.hacer_movimiento(8, 3)
+    
+    def test_ida_y_vuelta_con_board(self):
+        """
+        Prueba la conversion entre Board y Position.
+        
+        Recibe: Nada
+        Hace: Crea la posicion del juego y un tablero nuevo desde ella
+        Devuelve: Nada
+        """
+        tablero = self.juego.get_tablero()
+        posicion = self.juego.get_posicion()
+        self.assertEqual(posicion.get_conteos(), tuple(tablero.get_conteos()))
+        self.assertEqual(posicion.get_color_en_turno(), 'blanco')
+        self.assertEqual(posicion.get_barra(), {'blanco': 0, 'negro': 0})
+        self.assertEqual(posicion.get_pips('blanco'), tablero.get_pips('blanco'))
+        self.assertEqual(posicion.get_pips('negro'), tablero.get_pips('negro'))
+        
+        nuevo = posicion.crear_tablero()
+        self.assertEqual(nuevo.get_conteos(), tablero.get_conteos())
+        self.assertEqual(nuevo.get_hash(), tablero.get_hash())
+        self.assertEqual(Position.desde_tablero(nuevo), posicion)
+    
+    def test_barra_y_sacadas(self):
+        """
+        Prueba una posicion con fichas en barra y sacadas.
+        
+        Recibe: Nada
+        Hace: Carga un estado a mano y revisa conteos y hash Zobrist
+        Devuelve: Nada
+        """
+        conteos = [0] * 26
+        conteos[3] = 10
+        conteos[20] = -12
+        self.juego.cargar_estado(conteos, {'blanco': 1, 'negro': 2}, {'blanco': 4, 'negro': 1},
+                                 'negro', [])
+        posicion = self.juego.get_posicion()
+        self.assertEqual(posicion.contar_fichas(0, 'negro'), 2)
+        self.assertEqual(posicion.contar_fichas(25, 'blanco'), 4)
+        self.assertEqual(posicion.contar_fichas(20, 'blanco'), 0)
+        self.assertEqual(posicion.get_hash(), self.juego.get_hash())
+        self.assertEqual(posicion.crear_tablero().contar_fichas_en_barra('negro'), 2)
+    
+    def test_inmutable_y_clave(self):
+        """
+        Prueba que la posicion no cambia y sirve como clave.
+        
+        Recibe: Nada
+        Hace: Intenta modificarla, la usa en un diccionario y con pickle
+        Devuelve: Nada
+        """
+        posicion = self.juego.get_posicion()
+        with self.assertRaises(AttributeError):
+            posicion.color = 'negro'
+        
+        cache = {posicion: 0.5}
+        self.assertEqual(cache[self.juego.get_posicion()], 0.5)
+        self.assertNotIn(BackgammonGame("Ana", "Beto").get_posicion(), cache)
+        
+        copia = pickle.loads(pickle.dumps(posicion))
+        self.assertEqual(copia, posicion)
+        self.assertEqual(hash(copia), hash(posicion))
+        self.assertNotEqual(posicion, "posicion")
+        self.assertIn("blanco", repr(posicion))
+    
+    def test_espejar(self):
+        """
+        Prueba el cambio de colores y la vista desde el lado a mover.
+        
+        Recibe: Nada
+        Hace: Espeja la posicion inicial y la del juego
+        Devuelve: Nada
+        """
+        inicial = BackgammonGame("Ana", "Beto").get_posicion()
+        espejada = inicial.espejar()
+        self.assertEqual(espejada.get_color_en_turno(), 'negro')
+        self.assertEqual(espejada.get_conteos(), inicial.get_conteos())
+        self.assertIs(inicial.desde_el_turno(), inicial)
+        self.assertEqual(espejada.desde_el_turno(), inicial)
+        
+        posicion = self.juego.get_posicion()
+        otra = posicion.espejar()
+        self.assertEqual(otra.espejar(), posicion)
+        self.assertEqual(otra.get_pips('negro'), posicion.get_pips('blanco'))
+        self.assertEqual(otra.contar_fichas(20, 'negro'), posicion.contar_fichas(5, 'blanco'))
+
+
+if __name__ == "__main__":
+    unittest.main()
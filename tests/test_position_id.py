@@ -0,0 +1,160 @@
+import unittest
+from core.board import Board
+from core.exceptions import PosicionInvalidaError
+from core.game import BackgammonGame
+from core.position_id import (codificar_posicion, decodificar_lugares, conteos_desde_id,
+                              tablero_desde_id, id_juego, cargar_id_juego)
+
+
+ID_INICIAL = "4HPwATDgc/ABMA"
+
+
+class TestPositionId(unittest.TestCase):
+    """
+    Clase de pruebas para los identificadores de posicion.
+    
+    Recibe: Nada
+    Hace: Codifica y decodifica posiciones y juegos
+    Devuelve: Nada
+    """
+    
+    def test_posicion_inicial(self):
+        """
+        Prueba el identificador conocido de la posicion inicial.
+        
+        Recibe: Nada
+        Hace: Codifica el tablero inicial para los dos colores
+        Devuelve: Nada
+        """
+        tablero = Board()
+        self.assertEqual(codificar_posicion(tablero, 'blanco'), ID_INICIAL)
+        self.assertEqual(codificar_posicion(tablero, 'negro'), ID_INICIAL)
+    
+    def test_decodificar_inicial(self):
+        """
+        Prueba los lugares de la posicion inicial.
+        
+        Recibe: Nada
+        Hace: Decodifica el identificador inicial
+        Devuelve: Nada
+        """
+        en_turno, del_rival = decodificar_lugares(ID_INICIAL)
+        self.assertEqual(len(en_turno), 25)
+        self.assertEqual(en_turno[5], 5)
+        self.assertEqual(en_turno[7], 3)
+        self.assertEqual(en_turno[12], 5)
+        self.assertEqual(en_turno[23], 2)
+        self.assertEqual(en_turno, del_rival)
+    
+    def test_ida_y_vuelta(self):
+        """
+        Prueba que una posicion se recupera igual.
+        
+        Recibe: Nada
+        Hace: Arma una posicion con barra y sacadas y la pasa por el id
+        Devuelve: Nada
+        """
+        conteos = [0] * 26
+        conteos[1] = 2
+        conteos[3] = 4
+        conteos[20] = -3
+        conteos[24] = -6
+        barra = {'blanco': 1, 'negro': 2}
+        sacadas = {'blanco': 8, 'negro': 4}
+        tablero = Board()
+        tablero.cargar_posicion(conteos, barra, sacadas)
+        
+        for color in ('blanco', 'negro'):
+            identificador = codificar_posicion(tablero, color)
+            conteos2, barra2, sacadas2 = conteos_desde_id(identificador, color)
+            self.assertEqual(conteos2, conteos)
+            self.assertEqual(barra2, barra)
+            self.assertEqual(sacadas2, sacadas)
+        
+        copia = tablero_desde_id(codificar_posicion(tablero, 'negro'), 'negro')
+        self.assertEqual(copia.get_hash(), tablero.get_hash())
+    
+    def test_id_juego(self):
+        """
+        Prueba el identificador con turno y dados.
+        
+        Recibe: Nada
+        Hace: Juega un movimiento y carga el id en otro juego
+        Devuelve: Nada
+        """
+        juego = BackgammonGame("Ana", "Beto")
+        juego.get_movimientos_disponibles().extend([3, 1])
+        juego.hacer_movimiento(8, 3)
+        identificador = id_juego(juego)
+        self.assertTrue(identificador.endswith(":b1"))
+        
+        otro = BackgammonGame("Carla", "Dario")
+        cargar_id_juego(otro, identificador)
+        self.assertEqual(otro.get_hash(), juego.get_hash())
+        self.assertEqual(otro.get_movimientos_disponibles(), [1])
+        self.assertEqual(otro.get_color_jugador_actual(), 'blanco')
+        self.assertEqual(otro.get_jugador1().get_nombre(), "Carla")
+        self.assertEqual(id_juego(otro), identificador)
+    
+    def test_cargar_turno_negro(self):
+        """
+        Prueba cargar un juego con turno del negro y sin dados.
+        
+        Recibe: Nada
+        Hace: Carga el id inicial con ":n"
+        Devuelve: Nada
+        """
+        juego = BackgammonGame("Ana", "Beto")
+        cargar_id_juego(juego, ID_INICIAL + ":n")
+        self.assertEqual(juego.get_color_jugador_actual(), 'negro')
+        self.assertEqual(juego.get_movimientos_disponibles(), [])
+        self.assertEqual(juego.get_tablero().get_hash(), Board().get_hash())
+    
+    def test_cargar_victoria(self):
+        """
+        Prueba que cargar una posicion ganada termina el juego.
+        
+        Recibe: Nada
+        Hace: Carga una posicion sin fichas blancas
+        Devuelve: Nada
+        """
+        conteos = [0] * 26
+        conteos[24] = -15
+        tablero = Board()
+        tablero.cargar_posicion(conteos, {'blanco': 0, 'negro': 0}, {'blanco': 15, 'negro': 0})
+        juego = BackgammonGame("Ana", "Beto")
+        cargar_id_juego(juego, codificar_posicion(tablero, 'negro') + ":n")
+        self.assertTrue(juego.esta_terminado())
+        self.assertEqual(juego.get_ganador(), juego.get_jugador1())
+        self.assertEqual(juego.get_jugador1().get_fichas_sacadas(), 15)
+    
+    def test_identificadores_invalidos(self):
+        """
+        Prueba los errores de identificadores mal formados.
+        
+        Recibe: Nada
+        Hace: Pasa textos de largo, base64, fichas y formato incorrectos
+        Devuelve: Nada
+        """
+        with self.assertRaises(PosicionInvalidaError):
+            decodificar_lugares("4HPwATDgc")
+        with self.assertRaises(PosicionInvalidaError):
+            decodificar_lugares("4HPwATDgc/AB**")
+        with self.assertRaises(PosicionInvalidaError):
+            # 16 bits 1 seguidos: mas de 15 fichas
+            decodificar_lugares("//8AAAAAAAAAAA")
+        with self.assertRaises(PosicionInvalidaError):
+            # blanco en su punto 24 y negro en su punto 1: el mismo punto
+            conteos_desde_id("AACABAAAAAAAAA", 'blanco')
+        
+        juego = BackgammonGame("Ana", "Beto")
+        with self.assertRaises(PosicionInvalidaError):
+            cargar_id_juego(juego, ID_INICIAL)
+        with self.assertRaises(PosicionInvalidaError):
+            cargar_id_juego(juego, ID_INICIAL + ":x")
+        with self.assertRaises(PosicionInvalidaError):
+            cargar_id_juego(juego, ID_INICIAL + ":b7")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# sin ventana real: pygame dibuja en memoria
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+try:
+    import pygame
+    from pygame_render import renderizar_png, renderizar_lote, main
+    from pygame_ui import PygameUI
+except ImportError:
+    pygame = None
+
+from core.game import BackgammonGame
+from core.position_id import id_juego
+
+
+@unittest.skipIf(pygame == None, "pygame no esta instalado")
+class TestPygameRender(unittest.TestCase):
+    """
+    Clase de pruebas para guardar posiciones como PNG.
+    
+    Recibe: Nada
+    Hace: Dibuja posiciones sin ventana en un directorio temporal
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Crea el directorio de las imagenes y un juego con dados.
+        
+        Recibe: Nada
+        Hace: Guarda la ruta y mueve una ficha del juego
+        Devuelve: Nada
+        """
+        self.directorio = tempfile.mkdtemp()
+        self.juego = BackgammonGame("Ana", "Beto")
+        self.juego.get_movimientos_disponibles().extend([3, 1])
+        self.juego.hacer_movimiento(8, 3)
+    
+    def tearDown(self):
+        """
+        Borra las imagenes y cierra pygame.
+        
+        Recibe: Nada
+        Hace: Elimina el directorio y llama a pygame.quit
+        Devuelve: Nada
+        """
+        shutil.rmtree(self.directorio)
+        pygame.quit()
+    
+    def ruta(self, nombre):
+        """
+        Arma la ruta de una imagen.
+        
+        Recibe: Nombre del archivo
+        Hace: Lo une al directorio temporal
+        Devuelve: String
+        """
+        return os.path.join(self.directorio, nombre)
+    
+    def test_sin_ventana(self):
+        """
+        Prueba que la interfaz sin ventana no abre el display.
+        
+        Recibe: Nada
+        Hace: Crea la interfaz con ventana=False y guarda una imagen
+        Devuelve: Nada
+        """
+        interfaz = PygameUI(ventana=False)
+        interfaz.set_juego(self.juego)
+        interfaz.guardar_png(self.ruta("juego.png"))
+        self.assertEqual(pygame.display.get_surface(), None)
+        self.assertEqual(pygame.image.load(self.ruta("juego.png")).get_size(), (1300, 900))
+    
+    def test_misma_imagen_desde_id_y_foto(self):
+        """
+        Prueba que el ID y la foto dan la misma imagen que el juego.
+        
+        Recibe: Nada
+        Hace: Guarda la posicion desde el juego, su ID y su snapshot
+        Devuelve: Nada
+        """
+        renderizar_png(self.juego, self.ruta("juego.png"))
+        renderizar_png(self.juego.snapshot(), self.ruta("foto.png"))
+        renderizar_png(BackgammonGame("Ana", "Beto"), self.ruta("inicial.png"))
+        
+        juego = pygame.image.tobytes(pygame.image.load(self.ruta("juego.png")), "RGB")
+        foto = pygame.image.tobytes(pygame.image.load(self.ruta("foto.png")), "RGB")
+        inicial = pygame.image.tobytes(pygame.image.load(self.ruta("inicial.png")), "RGB")
+        self.assertEqual(juego, foto)
+        self.assertNotEqual(juego, inicial)
+        
+        renderizar_png(id_juego(self.juego), self.ruta("id.png"))
+        self.assertTrue(os.path.exists(self.ruta("id.png")))
+    
+    def test_lote_en_procesos(self):
+        """
+        Prueba guardar un lote repartido en dos procesos.
+        
+        Recibe: Nada
+        Hace: Manda 6 IDs en lotes de 2 y revisa los archivos
+        Devuelve: Nada
+        """
+        identificador = id_juego(self.juego)
+        trabajos = [(identificador, self.ruta(str(i) + ".png")) for i in range(6)]
+        self.assertEqual(renderizar_lote(trabajos, procesos=2, tamano_lote=2), 6)
+        self.assertEqual(sorted(os.listdir(self.directorio)),
+                         ["0.png", "1.png", "2.png", "3.png", "4.png", "5.png"])
+    
+    def test_main(self):
+        """
+        Prueba el punto de entrada con un archivo de IDs.
+        
+        Recibe: Nada
+        Hace: Escribe dos IDs (y una linea vacia) y corre main en un proceso
+        Devuelve: Nada
+        """
+        archivo = self.ruta("ids.txt")
+        with open(archivo, "w", encoding="utf-8") as salida:
+            salida.write(id_juego(self.juego) + "\n\n" + id_juego(BackgammonGame("A", "B")) + "\n")
+        
+        destino = self.ruta("imagenes")
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            self.assertEqual(main([archivo, destino, "--procesos", "1"]), 0)
+        self.assertIn("2 imagenes guardadas", salida.getvalue())
+        self.assertEqual(sorted(os.listdir(destino)), ["posicion_00001.png", "posicion_00002.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
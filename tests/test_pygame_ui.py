@@ -0,0 +1,238 @@
+import os
+import unittest
+
+# sin ventana real: pygame dibuja en memoria
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+try:
+    import pygame
+    from pygame_ui import PygameUI, TextCache, BoardGeometry
+except ImportError:
+    pygame = None
+
+from core.game import BackgammonGame
+
+
+@unittest.skipIf(pygame == None, "pygame no esta instalado")
+class TestTextCache(unittest.TestCase):
+    """
+    Clase de pruebas para la cache de textos.
+    
+    Recibe: Nada
+    Hace: Renderiza textos con una fuente de pygame
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Prepara una fuente.
+        
+        Recibe: Nada
+        Hace: Inicia el modulo de fuentes y carga la fuente por defecto
+        Devuelve: Nada
+        """
+        pygame.font.init()
+        self.fuente = pygame.font.Font(None, 18)
+    
+    def test_aciertos_y_fallos(self):
+        """
+        Prueba que el mismo texto se renderiza una sola vez.
+        
+        Recibe: Nada
+        Hace: Pide dos veces el mismo texto y una vez otro color
+        Devuelve: Nada
+        """
+        cache = TextCache()
+        primera = cache.render(self.fuente, "12", True, (0, 0, 0))
+        segunda = cache.render(self.fuente, "12", True, (0, 0, 0))
+        otra = cache.render(self.fuente, "12", True, (255, 0, 0))
+        self.assertIs(primera, segunda)
+        self.assertIsNot(primera, otra)
+        
+        estadisticas = cache.get_estadisticas()
+        self.assertEqual(estadisticas["aciertos"], 1)
+        self.assertEqual(estadisticas["fallos"], 2)
+        self.assertEqual(estadisticas["tamano"], 2)
+        self.assertAlmostEqual(estadisticas["tasa_aciertos"], 1 / 3)
+    
+    def test_descarta_el_menos_usado(self):
+        """
+        Prueba el reemplazo LRU.
+        
+        Recibe: Nada
+        Hace: Llena una cache de 2, usa la primera y agrega una tercera
+        Devuelve: Nada
+        """
+        cache = TextCache(2)
+        uno = cache.render(self.fuente, "1", True, (0, 0, 0))
+        cache.render(self.fuente, "2", True, (0, 0, 0))
+        cache.render(self.fuente, "1", True, (0, 0, 0))
+        cache.render(self.fuente, "3", True, (0, 0, 0))
+        
+        self.assertIs(cache.render(self.fuente, "1", True, (0, 0, 0)), uno)
+        estadisticas = cache.get_estadisticas()
+        self.assertEqual(estadisticas["descartes"], 1)
+        self.assertEqual(estadisticas["tamano"], 2)
+        
+        # "2" fue descartado y se vuelve a renderizar
+        fallos = estadisticas["fallos"]
+        cache.render(self.fuente, "2", True, (0, 0, 0))
+        self.assertEqual(cache.get_estadisticas()["fallos"], fallos + 1)
+        
+        cache.limpiar()
+        self.assertEqual(cache.get_estadisticas()["tamano"], 0)
+
+
+@unittest.skipIf(pygame == None, "pygame no esta instalado")
+class TestBoardGeometry(unittest.TestCase):
+    """
+    Clase de pruebas para la geometria precalculada del tablero.
+    
+    Recibe: Nada
+    Hace: Arma la geometria de la ventana por defecto
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Crea la geometria de 1300x900 con los margenes de la interfaz.
+        
+        Recibe: Nada
+        Hace: Instancia BoardGeometry
+        Devuelve: Nada
+        """
+        self.geometria = BoardGeometry(1300, 900, 70, 110)
+    
+    def test_clicks_en_puntos_barra_y_salida(self):
+        """
+        Prueba la tabla de clicks.
+        
+        Recibe: Nada
+        Hace: Pregunta por el centro de cada punto, la barra y la salida
+        Devuelve: Nada
+        """
+        punto = 1
+        while punto <= 24:
+            x, y = self.geometria.posiciones_fichas(punto, 1)[0]
+            self.assertEqual(self.geometria.punto_en(x, y), punto)
+            punto = punto + 1
+        
+        x_barra, y_barra = self.geometria.posiciones_fichas((0, 'blanco'), 1)[0]
+        self.assertEqual(self.geometria.punto_en(x_barra, y_barra), 0)
+        
+        x_salida, y_salida = self.geometria.posiciones_fichas((25, 'blanco'), 1)[0]
+        self.assertEqual(self.geometria.punto_en(x_salida, y_salida, 'blanco'), 25)
+        self.assertEqual(self.geometria.punto_en(x_salida, y_salida, 'negro'), None)
+        self.assertEqual(self.geometria.punto_en(x_salida, y_salida), None)
+        
+        self.assertEqual(self.geometria.punto_en(10, 10), None)
+    
+    def test_pilas_y_contornos(self):
+        """
+        Prueba las pilas de fichas y los contornos de seleccion.
+        
+        Recibe: Nada
+        Hace: Mira cuantos centros hay por cantidad y los contornos
+        Devuelve: Nada
+        """
+        self.assertEqual(len(self.geometria.posiciones_fichas(6, 5)), 5)
+        self.assertEqual(len(self.geometria.posiciones_fichas(6, 15)), 15)
+        self.assertEqual(len(self.geometria.contorno_seleccion(0)), 4)
+        self.assertEqual(len(self.geometria.contorno_seleccion(13)), 3)
+        self.assertEqual(self.geometria.contorno_seleccion(25), None)
+
+
+@unittest.skipIf(pygame == None, "pygame no esta instalado")
+class TestPygameUI(unittest.TestCase):
+    """
+    Clase de pruebas para el dibujado de la interfaz grafica.
+    
+    Recibe: Nada
+    Hace: Dibuja cuadros con el driver de video "dummy"
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Crea la interfaz con un juego sin pedir nombres.
+        
+        Recibe: Nada
+        Hace: Inyecta un BackgammonGame en la interfaz
+        Devuelve: Nada
+        """
+        self.interfaz = PygameUI()
+        self.juego = BackgammonGame("Ana", "Beto")
+        self.interfaz.__juego__ = self.juego
+    
+    def tearDown(self):
+        """
+        Cierra pygame.
+        
+        Recibe: Nada
+        Hace: Llama a pygame.quit
+        Devuelve: Nada
+        """
+        pygame.quit()
+    
+    def test_solo_actualiza_lo_que_cambia(self):
+        """
+        Prueba las regiones actualizadas en cada cuadro.
+        
+        Recibe: Nada
+        Hace: Dibuja, repite sin cambios, agrega dados y mueve una ficha
+        Devuelve: Nada
+        """
+        primera = self.interfaz.dibujar_cuadro()
+        self.assertEqual(len(primera), 1)
+        self.assertEqual(primera[0].size, (1300, 900))
+        
+        self.assertEqual(self.interfaz.dibujar_cuadro(), [])
+        
+        # los dados solo cambian los paneles de arriba
+        self.juego.get_movimientos_disponibles().extend([3, 1])
+        self.assertEqual(len(self.interfaz.dibujar_cuadro()), 1)
+        
+        # mover cambia los dados y el tablero
+        self.juego.hacer_movimiento(8, 3)
+        self.assertEqual(len(self.interfaz.dibujar_cuadro()), 2)
+    
+    def test_textos_en_cache(self):
+        """
+        Prueba que los textos repetidos salen de la cache.
+        
+        Recibe: Nada
+        Hace: Fuerza varios cuadros completos y mira la tasa de aciertos
+        Devuelve: Nada
+        """
+        self.interfaz.dibujar_cuadro()
+        fallos = self.interfaz.get_estadisticas_textos()["fallos"]
+        
+        veces = 0
+        while veces < 5:
+            self.interfaz.__firmas__ = None
+            self.interfaz.dibujar_cuadro()
+            veces = veces + 1
+        
+        estadisticas = self.interfaz.get_estadisticas_textos()
+        self.assertEqual(estadisticas["fallos"], fallos)
+        self.assertGreater(estadisticas["aciertos"], 0)
+    
+    def test_geometria_se_rearma_al_cambiar_tamano(self):
+        """
+        Prueba que la geometria se reutiliza hasta que cambia la ventana.
+        
+        Recibe: Nada
+        Hace: Pide la geometria dos veces y luego cambia el ancho
+        Devuelve: Nada
+        """
+        geometria = self.interfaz.get_geometria()
+        self.assertIs(self.interfaz.get_geometria(), geometria)
+        
+        self.interfaz.__ancho__ = 1400
+        otra = self.interfaz.get_geometria()
+        self.assertIsNot(otra, geometria)
+        self.assertEqual(otra.get_tamano(), (1400, 900))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+import unittest
+from core.checker import Checker
+from core.dice import StratifiedRolls
+from core.game import BackgammonGame
+from core.rollout import (RolloutEngine, jugar_lote, resultado_partida,
+                          politica_aleatoria, politica_voraz)
+
+
+class TestRollout(unittest.TestCase):
+    """
+    Clase de pruebas para el motor de rollouts.
+    
+    Recibe: Nada
+    Hace: Prueba la repetibilidad con semilla, el paralelismo y los resultados
+    Devuelve: Nada
+    """
+    
+    def limpiar_tablero(self, tablero):
+        """
+        Limpia todas las fichas del tablero.
+        
+        Recibe: Board a limpiar
+        Hace: Deja todos los puntos sin fichas
+        Devuelve: Nada
+        """
+        punto = 0
+        while punto < 26:
+            fichas = tablero.get_fichas_en_punto(punto)
+            while len(fichas) > 0:
+                fichas.pop()
+            punto = punto + 1
+    
+    def test_resultado_partida(self):
+        """
+        Prueba la clasificacion de victoria simple, gammon y backgammon.
+        
+        Recibe: Nada
+        Hace: Arma finales a mano con blanco ganador
+        Devuelve: Nada
+        """
+        juego = BackgammonGame("Ana", "Luis")
+        tablero = juego.get_tablero()
+        self.limpiar_tablero(tablero)
+        tablero.get_fichas_en_punto(12).append(Checker('negro'))
+        juego.verificar_victoria()
+        self.assertTrue(juego.esta_terminado())
+        self.assertEqual(resultado_partida(juego), ('blanco', 2))
+        
+        tablero.get_fichas_en_punto(3).append(Checker('negro'))
+        self.assertEqual(resultado_partida(juego), ('blanco', 3))
+        
+        tablero.get_fichas_en_punto(25).append(Checker('negro'))
+        self.assertEqual(resultado_partida(juego), ('blanco', 1))
+    
+    def test_lote_juega_hasta_el_final(self):
+        """
+        Prueba un lote corto con la politica al azar.
+        
+        Recibe: Nada
+        Hace: Juega 5 partidas y revisa los conteos
+        Devuelve: Nada
+        """
+        juego = BackgammonGame("Ana", "Luis")
+        totales = jugar_lote(juego, 5, 11, politica_aleatoria)
+        
+        self.assertEqual(totales["partidas"], 5)
+        self.assertEqual(totales["cortadas"], 0)
+        self.assertLessEqual(totales["gammons"], totales["ganadas"])
+        
+        # el juego original no cambia
+        self.assertEqual(juego.get_tablero().contar_fichas_en_tablero('blanco'), 15)
+    
+    def test_misma_semilla_mismo_resultado(self):
+        """
+        Prueba que el resultado no depende de la cantidad de procesos.
+        
+        Recibe: Nada
+        Hace: Compara un rollout sin procesos y otro con dos procesos
+        Devuelve: Nada
+        """
+        juego = BackgammonGame("Ana", "Luis")
+        serie = RolloutEngine(politica_voraz, procesos=1, tamano_lote=5)
+        paralelo = RolloutEngine(politica_voraz, procesos=2, tamano_lote=5)
+        
+        resultado1 = serie.ejecutar(juego, partidas=20, semilla=42)
+        resultado2 = paralelo.ejecutar(juego, partidas=20, semilla=42)
+        resultado3 = serie.ejecutar(juego, partidas=20, semilla=43)
+        
+        self.assertEqual(resultado1, resultado2)
+        self.assertEqual(resultado1["partidas"], 20)
+        self.assertNotEqual(resultado1, resultado3)
+    
+    def test_carrera_ganada(self):
+        """
+        Prueba un rollout donde el jugador en turno gana siempre.
+        
+        Recibe: Nada
+        Hace: Deja a blanco con una ficha en el punto 1 y a negro lejos
+        Devuelve: Nada
+        """
+        juego = BackgammonGame("Ana", "Luis")
+        tablero = juego.get_tablero()
+        self.limpiar_tablero(tablero)
+        tablero.get_fichas_en_punto(1).append(Checker('blanco'))
+        tablero.get_fichas_en_punto(12).append(Checker('negro'))
+        tablero.get_fichas_en_punto(25).append(Checker('blanco'))
+        
+        resultado = RolloutEngine(procesos=1).ejecutar(juego, partidas=10, semilla=1)
+        
+        self.assertEqual(resultado["ganar"], (1.0, 1.0, 1.0))
+        self.assertEqual(resultado["gammon"][0], 1.0)
+        self.assertEqual(resultado["equidad"], 2.0)
+    
+    def test_tiradas_con_varianza_reducida(self):
+        """
+        Prueba rollouts con plan de tiradas.
+        
+        Recibe: Nada
+        Hace: Compara serie y paralelo con hipercubo y pares antiteticos,
+              y revisa el intervalo de la equidad
+        Devuelve: Nada
+        """
+        juego = BackgammonGame("Ana", "Luis")
+        serie = RolloutEngine(politica_aleatoria, procesos=1, tamano_lote=5,
+                              modo_tiradas='hipercubo', antiteticos=True)
+        paralelo = RolloutEngine(politica_aleatoria, procesos=2, tamano_lote=5,
+                                 modo_tiradas='hipercubo', antiteticos=True)
+        
+        resultado1 = serie.ejecutar(juego, partidas=24, semilla=3)
+        resultado2 = paralelo.ejecutar(juego, partidas=24, semilla=3)
+        self.assertEqual(resultado1, resultado2)
+        self.assertEqual(resultado1["partidas"], 24)
+        
+        minimo, maximo = resultado1["intervalo_equidad"]
+        self.assertLessEqual(minimo, resultado1["equidad"])
+        self.assertGreaterEqual(maximo, resultado1["equidad"])
+        
+        estratificado = RolloutEngine(politica_aleatoria, procesos=1, modo_tiradas='estratificado')
+        self.assertEqual(estratificado.ejecutar(juego, partidas=6, semilla=3)["partidas"], 6)
+    
+    def test_unidades_antiteticas(self):
+        """
+        Prueba que cada par antitetico cuenta como una unidad.
+        
+        Recibe: Nada
+        Hace: Juega 5 partidas con pares (el ultimo queda solo)
+        Devuelve: Nada
+        """
+        juego = BackgammonGame("Ana", "Luis")
+        tiradas = StratifiedRolls(5, 'estratificado', semilla=1, antiteticos=True).lote(0, 5)
+        totales = jugar_lote(juego, 5, 1, politica_aleatoria, tiradas)
+        self.assertEqual(totales["partidas"], 5)
+        self.assertEqual(totales["unidades"], 3)
+        
+        sin_plan = jugar_lote(juego, 5, 1, politica_aleatoria)
+        self.assertEqual(sin_plan["unidades"], 5)
+        self.assertAlmostEqual(sin_plan["suma_unidades"], sin_plan["puntos"])
+    
+    def test_partidas_terminan_legalmente(self):
+        """
+        Prueba que las partidas del rollout no pierden movimientos.
+        
+        Recibe: Nada
+        Hace: Usa una politica que guarda cada juego simulado y cuenta lo
+              que devuelve hacer_movimiento; al final revisa que no hubo
+              rechazos y que cada color conserva sus 15 fichas
+        Devuelve: Nada
+        """
+        simulados = []
+        resultados = []
+        
+        class Registro:
+            def __init__(self, semilla):
+                self.bot = politica_aleatoria(semilla)
+            
+            def jugar_turno(self, juego):
+                if juego not in simulados:
+                    simulados.append(juego)
+                    original = juego.hacer_movimiento
+                    
+                    def registrar(origen, dado):
+                        resultado = original(origen, dado)
+                        resultados.append(resultado)
+                        return resultado
+                    juego.hacer_movimiento = registrar
+                return self.bot.jugar_turno(juego)
+        
+        juego = BackgammonGame("Ana", "Luis")
+        tiradas = StratifiedRolls(10, 'hipercubo', semilla=2, antiteticos=True).lote(0, 10)
+        totales = jugar_lote(juego, 10, 5, Registro)
+        totales_plan = jugar_lote(juego, 10, 5, Registro, tiradas)
+        
+        self.assertEqual(totales["cortadas"] + totales_plan["cortadas"], 0)
+        self.assertEqual(len(simulados), 20)
+        self.assertGreater(len(resultados), 0)
+        self.assertNotIn(False, resultados)
+        for simulado in simulados:
+            self.assertTrue(simulado.esta_terminado())
+            tablero = simulado.get_tablero()
+            conteos = tablero.get_conteos()
+            en_tablero = {'blanco': sum(valor for valor in conteos if valor > 0),
+                          'negro': -sum(valor for valor in conteos if valor < 0)}
+            for color in ('blanco', 'negro'):
+                total = (en_tablero[color] + tablero.contar_fichas_en_barra(color)
+                         + tablero.contar_fichas_sacadas(color))
+                self.assertEqual(total, 15)
+    
+    def test_intervalo(self):
+        """
+        Prueba el intervalo de confianza.
+        
+        Recibe: Nada
+        Hace: Calcula una proporcion de 0.5 con 100 partidas
+        Devuelve: Nada
+        """
+        motor = RolloutEngine(procesos=1)
+        probabilidad, minimo, maximo = motor.intervalo(50, 100)
+        
+        self.assertEqual(probabilidad, 0.5)
+        self.assertAlmostEqual(minimo, 0.402, places=3)
+        self.assertAlmostEqual(maximo, 0.598, places=3)
+        self.assertEqual(motor.intervalo(0, 0), (0.0, 0.0, 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from core.bot import RandomBot
+from core.dice import Dice
+from core.exceptions import MovimientoInvalidoError
+from core.game import BackgammonGame
+from core.position_id import id_juego
+from selfplay import POLITICAS, jugar_partida, generar_partidas, main
+
+
+class TestSelfPlay(unittest.TestCase):
+    """
+    Clase de pruebas para las partidas sin interfaz.
+    
+    Recibe: Nada
+    Hace: Juega partidas cortas entre bots y mira los registros
+    Devuelve: Nada
+    """
+    
+    def test_partida_completa(self):
+        """
+        Prueba que una partida al azar termina y registra sus jugadas.
+        
+        Recibe: Nada
+        Hace: Juega con dados y bots de semilla fija
+        Devuelve: Nada
+        """
+        registro = jugar_partida(RandomBot(1), RandomBot(2), Dice(semilla=3))
+        self.assertIn(registro["ganador"], ('blanco', 'negro'))
+        self.assertIn(registro["puntos"], (1, 2, 3))
+        self.assertEqual(registro["turnos"], len(registro["jugadas"]))
+        
+        color, tirada, movimientos = registro["jugadas"][0]
+        self.assertEqual(color, 'blanco')
+        self.assertIn(len(tirada), (2, 4))
+        total = 0
+        for jugada in registro["jugadas"]:
+            total = total + len(jugada[2])
+        self.assertEqual(registro["movimientos"], total)
+    
+    def test_registro_se_reproduce_hasta_la_posicion_final(self):
+        """
+        Prueba que el registro lleva a la misma posicion final.
+        
+        Recibe: Nada
+        Hace: Genera partidas, reproduce cada turno con hacer_movimiento
+              en un juego nuevo y compara con posicion_final
+        Devuelve: Nada
+        """
+        salida = io.StringIO()
+        generar_partidas(6, salida, "azar", "voraz", 3)
+        for linea in salida.getvalue().splitlines():
+            registro = json.loads(linea)
+            juego = BackgammonGame("Blanco", "Negro")
+            for color, tirada, movimientos in registro["jugadas"]:
+                self.assertEqual(juego.get_color_jugador_actual(), color)
+                juego.get_movimientos_disponibles().extend(tirada)
+                for origen, dado in movimientos:
+                    self.assertTrue(juego.hacer_movimiento(origen, dado))
+                if len(juego.get_movimientos_disponibles()) > 0:
+                    juego.terminar_turno()
+            self.assertEqual(id_juego(juego), registro["posicion_final"])
+            self.assertEqual(juego.esta_terminado(), registro["ganador"] != None)
+    
+    def test_movimiento_rechazado_hace_fallar_la_partida(self):
+        """
+        Prueba que no se registran partidas con movimientos rechazados.
+        
+        Recibe: Nada
+        Hace: Usa un bot que elige un dado que no salio
+        Devuelve: Nada
+        """
+        tramposo = RandomBot(1)
+        tramposo.elegir_jugada = lambda juego: ((24, 7),)
+        with self.assertRaises(MovimientoInvalidoError):
+            jugar_partida(tramposo, RandomBot(2), Dice(semilla=3))
+    
+    def test_partida_cortada(self):
+        """
+        Prueba el corte por turnos maximos.
+        
+        Recibe: Nada
+        Hace: Juega con un maximo de 3 turnos
+        Devuelve: Nada
+        """
+        registro = jugar_partida(RandomBot(1), RandomBot(2), Dice(semilla=3), turnos_maximos=3)
+        self.assertEqual(registro["ganador"], None)
+        self.assertEqual(registro["turnos"], 3)
+    
+    def test_generar_escribe_una_linea_por_partida(self):
+        """
+        Prueba el archivo de salida, la velocidad y la repetibilidad.
+        
+        Recibe: Nada
+        Hace: Genera dos veces las mismas partidas con la misma semilla
+        Devuelve: Nada
+        """
+        avances = []
+        salida = io.StringIO()
+        resultado = generar_partidas(4, salida, "azar", "voraz", 7, avances.append, 2)
+        lineas = salida.getvalue().splitlines()
+        self.assertEqual(len(lineas), 4)
+        self.assertEqual(len(avances), 1)
+        self.assertEqual(resultado["partidas"], 4)
+        self.assertEqual(resultado["blanco"] + resultado["negro"] + resultado["cortadas"], 4)
+        self.assertGreater(resultado["partidas_por_segundo"], 0)
+        self.assertGreater(resultado["movimientos_por_segundo"], 0)
+        
+        primera = json.loads(lineas[0])
+        self.assertEqual(primera["partida"], 1)
+        self.assertEqual(primera["blanco"], "azar")
+        self.assertEqual(primera["negro"], "voraz")
+        
+        otra = io.StringIO()
+        generar_partidas(4, otra, "azar", "voraz", 7)
+        self.assertEqual(otra.getvalue(), salida.getvalue())
+        
+        # cada 0 no informa el avance
+        avances = []
+        generar_partidas(2, io.StringIO(), "azar", "azar", 7, avances.append, 0)
+        self.assertEqual(avances, [])
+    
+    def test_main(self):
+        """
+        Prueba el punto de entrada.
+        
+        Recibe: Nada
+        Hace: Guarda dos partidas en un archivo temporal
+        Devuelve: Nada
+        """
+        self.assertIn("busqueda", POLITICAS)
+        directorio = tempfile.mkdtemp()
+        try:
+            ruta = os.path.join(directorio, "partidas.jsonl")
+            errores = io.StringIO()
+            with redirect_stderr(errores):
+                self.assertEqual(main([ruta, "--partidas", "2"]), 0)
+            with open(ruta, encoding="utf-8") as archivo:
+                self.assertEqual(len(archivo.read().splitlines()), 2)
+            self.assertIn("partidas/seg", errores.getvalue())
+            
+            # --cada tiene que ser mayor que 0
+            with redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit):
+                    main([ruta, "--cada", "0"])
+        finally:
+            shutil.rmtree(directorio)
+
+
+if __name__ == "__main__":
+    unittest.main()
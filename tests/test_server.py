@@ -0,0 +1,277 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+from core.bot import SearchBot, TIEMPO_MAXIMO
+from core.transposition import TranspositionTable
+from server.server import GameServer, Session, FIN_RESPUESTA, LARGO_MAXIMO_LINEA, main
+
+
+class TestSession(unittest.TestCase):
+    """
+    Clase de pruebas para la sesion de una conexion.
+    
+    Recibe: Nada
+    Hace: Procesa comandos sin abrir sockets
+    Devuelve: Nada
+    """
+    
+    def test_sin_juego(self):
+        """
+        Prueba los comandos antes de crear el juego.
+        
+        Recibe: Nada
+        Hace: Pide tirar sin juego y despues ayuda
+        Devuelve: Nada
+        """
+        sesion = Session(1)
+        lineas, continuar = sesion.procesar("tirar")
+        self.assertTrue(continuar)
+        self.assertIn("No hay juego en curso", lineas[0])
+        
+        lineas, continuar = sesion.procesar("ayuda")
+        self.assertIn("COMANDOS DISPONIBLES:", lineas)
+    
+    def test_nuevo_y_comandos(self):
+        """
+        Prueba crear el juego y usar los comandos de la consola.
+        
+        Recibe: Nada
+        Hace: Crea el juego, tira, pasa y pide el estado
+        Devuelve: Nada
+        """
+        sesion = Session(1)
+        lineas, continuar = sesion.procesar("nuevo Ana Beto")
+        self.assertIn("¡Juego creado! Ana vs Beto", lineas)
+        self.assertEqual(sesion.get_juego().get_jugador2().get_nombre(), "Beto")
+        
+        lineas, continuar = sesion.procesar("tirar")
+        self.assertTrue(any("Dados tirados" in linea for linea in lineas))
+        
+        # pasar se confirma solo aunque queden movimientos
+        lineas, continuar = sesion.procesar("pasar")
+        self.assertIn("Turno terminado.", lineas)
+        self.assertEqual(sesion.get_juego().get_color_jugador_actual(), 'negro')
+        
+        lineas, continuar = sesion.procesar("estado")
+        self.assertIn("Turno de: Beto (negro)", lineas)
+        
+        lineas, continuar = sesion.procesar("salir")
+        self.assertFalse(continuar)
+    
+    def test_nuevo_con_bot(self):
+        """
+        Prueba que con bot el jugador 2 es la computadora.
+        
+        Recibe: Nada
+        Hace: Crea el juego y juega el turno de la computadora
+        Devuelve: Nada
+        """
+        sesion = Session(1, SearchBot(profundidad=0, tabla=TranspositionTable(1024)))
+        sesion.procesar("nuevo Ana")
+        self.assertEqual(sesion.get_juego().get_jugador2().get_nombre(), "Computadora")
+        self.assertFalse(sesion.es_turno_computadora())
+        
+        sesion.procesar("pasar")
+        self.assertTrue(sesion.es_turno_computadora())
+        lineas = sesion.turno_computadora()
+        self.assertIn("Turno de la computadora...", lineas)
+        self.assertFalse(sesion.es_turno_computadora())
+    
+    def test_main_pasa_el_tiempo_al_bot(self):
+        """
+        Prueba que la computadora del servidor tiene tiempo por jugada.
+        
+        Recibe: Nada
+        Hace: Corre main con --bot sin levantar el servidor, sin --tiempo
+              y con --tiempo 0.5
+        Devuelve: Nada
+        """
+        for argumentos, esperado in (([], TIEMPO_MAXIMO), (["--tiempo", "0.5"], 0.5)):
+            with patch("server.server.SearchBot") as clase, patch("server.server.asyncio.run") as correr:
+                main(["--bot", "--profundidad", "2"] + argumentos)
+            self.assertEqual(clase.call_args.kwargs["tiempo_maximo"], esperado)
+            self.assertEqual(clase.call_args.kwargs["profundidad"], 2)
+            correr.call_args.args[0].close()
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """
+    Clase de pruebas para el servidor TCP.
+    
+    Recibe: Nada
+    Hace: Levanta el servidor en localhost con un puerto libre y se conecta
+    Devuelve: Nada
+    """
+    
+    async def asyncSetUp(self):
+        """
+        Inicia un servidor sin bot.
+        
+        Recibe: Nada
+        Hace: Escucha en el puerto 0 para que el sistema elija uno
+        Devuelve: Nada
+        """
+        self.servidor = GameServer("127.0.0.1", 0)
+        self.puerto = await self.servidor.iniciar()
+    
+    async def asyncTearDown(self):
+        """
+        Detiene el servidor.
+        
+        Recibe: Nada
+        Hace: Cierra el socket y las conexiones
+        Devuelve: Nada
+        """
+        await self.servidor.detener()
+    
+    async def leer_respuesta(self, lector):
+        """
+        Lee una respuesta completa.
+        
+        Recibe: StreamReader
+        Hace: Lee lineas hasta la linea de fin
+        Devuelve: Lista de strings
+        """
+        lineas = []
+        while True:
+            linea = (await lector.readline()).decode("utf-8").rstrip("\n")
+            if linea == FIN_RESPUESTA:
+                return lineas
+            lineas.append(linea)
+    
+    async def conectar(self):
+        """
+        Abre una conexion y lee la bienvenida.
+        
+        Recibe: Nada
+        Hace: Se conecta al puerto del servidor
+        Devuelve: Tupla (lector, escritor, lineas de bienvenida)
+        """
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.puerto)
+        bienvenida = await self.leer_respuesta(lector)
+        return lector, escritor, bienvenida
+    
+    async def enviar(self, lector, escritor, comando):
+        """
+        Manda un comando y espera su respuesta.
+        
+        Recibe: StreamReader, StreamWriter y comando (string)
+        Hace: Escribe la linea y lee la respuesta
+        Devuelve: Lista de strings
+        """
+        escritor.write((comando + "\n").encode("utf-8"))
+        await escritor.drain()
+        return await self.leer_respuesta(lector)
+    
+    async def test_partida_por_tcp(self):
+        """
+        Prueba jugar por la red con los comandos de la consola.
+        
+        Recibe: Nada
+        Hace: Crea el juego, tira, pasa y sale
+        Devuelve: Nada
+        """
+        lector, escritor, bienvenida = await self.conectar()
+        self.assertIn("          BIENVENIDO AL BACKGAMMON", bienvenida)
+        
+        lineas = await self.enviar(lector, escritor, "nuevo Ana Beto")
+        self.assertIn("¡Juego creado! Ana vs Beto", lineas)
+        
+        lineas = await self.enviar(lector, escritor, "tirar")
+        self.assertTrue(any("Dados tirados" in linea for linea in lineas))
+        
+        lineas = await self.enviar(lector, escritor, "mover 1 6")
+        self.assertIn("Movimiento inválido. Verifica:", lineas)
+        
+        lineas = await self.enviar(lector, escritor, "pasar")
+        self.assertIn("Turno terminado.", lineas)
+        
+        lineas = await self.enviar(lector, escritor, "salir")
+        self.assertIn("Gracias por jugar Backgammon!", lineas)
+        self.assertEqual(await lector.read(), b"")
+        escritor.close()
+    
+    async def test_muchas_conexiones(self):
+        """
+        Prueba muchas conexiones abiertas con juegos separados.
+        
+        Recibe: Nada
+        Hace: Abre 200 conexiones, crea un juego en cada una y pasa el
+              turno solo en la mitad
+        Devuelve: Nada
+        """
+        conexiones = await asyncio.gather(*[self.conectar() for _ in range(200)])
+        self.assertEqual(self.servidor.get_cantidad_sesiones(), 200)
+        
+        await asyncio.gather(*[self.enviar(lector, escritor, "nuevo A" + str(i) + " B")
+                               for i, (lector, escritor, _) in enumerate(conexiones)])
+        await asyncio.gather(*[self.enviar(lector, escritor, "pasar")
+                               for lector, escritor, _ in conexiones[:100]])
+        
+        colores = {}
+        for sesion in self.servidor.get_sesiones():
+            color = sesion.get_juego().get_color_jugador_actual()
+            colores[color] = colores.get(color, 0) + 1
+        self.assertEqual(colores, {'blanco': 100, 'negro': 100})
+        
+        for lector, escritor, _ in conexiones:
+            escritor.close()
+            await escritor.wait_closed()
+        espera = 0
+        while self.servidor.get_cantidad_sesiones() > 0 and espera < 100:
+            await asyncio.sleep(0.02)
+            espera = espera + 1
+        self.assertEqual(self.servidor.get_cantidad_sesiones(), 0)
+    
+    async def test_linea_demasiado_larga(self):
+        """
+        Prueba que una linea enorme cierra la conexion.
+        
+        Recibe: Nada
+        Hace: Manda mas bytes que el limite sin salto de linea
+        Devuelve: Nada
+        """
+        lector, escritor, _ = await self.conectar()
+        lineas = await self.enviar(lector, escritor, "x" * (LARGO_MAXIMO_LINEA * 2))
+        self.assertEqual(lineas, ["Linea demasiado larga."])
+        self.assertEqual(await lector.read(), b"")
+        escritor.close()
+    
+    async def test_inactividad(self):
+        """
+        Prueba que una conexion sin comandos se cierra sola.
+        
+        Recibe: Nada
+        Hace: Levanta otro servidor con 0.1 segundos de inactividad
+        Devuelve: Nada
+        """
+        servidor = GameServer("127.0.0.1", 0, tiempo_inactivo=0.1)
+        puerto = await servidor.iniciar()
+        lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+        await self.leer_respuesta(lector)
+        lineas = await self.leer_respuesta(lector)
+        self.assertEqual(lineas, ["Conexion cerrada por inactividad."])
+        escritor.close()
+        await servidor.detener()
+    
+    async def test_turno_de_la_computadora(self):
+        """
+        Prueba que el servidor juega solo el turno del bot.
+        
+        Recibe: Nada
+        Hace: Usa un servidor con bot y pasa el turno del jugador
+        Devuelve: Nada
+        """
+        servidor = GameServer("127.0.0.1", 0, SearchBot(profundidad=0, tabla=TranspositionTable(1024)))
+        self.puerto = await servidor.iniciar()
+        lector, escritor, _ = await self.conectar()
+        await self.enviar(lector, escritor, "nuevo Ana")
+        lineas = await self.enviar(lector, escritor, "pasar")
+        self.assertIn("Turno de la computadora...", lineas)
+        self.assertEqual(servidor.get_sesiones()[0].get_juego().get_color_jugador_actual(), 'blanco')
+        escritor.close()
+        await servidor.detener()
+
+
+if __name__ == "__main__":
+    unittest.main()
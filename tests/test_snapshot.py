@@ -0,0 +1,122 @@
+import pickle
+import unittest
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.snapshot import GameSnapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    """
+    Clase de pruebas para las fotos del estado del juego.
+    
+    Recibe: Nada
+    Hace: Saca fotos de juegos y los vuelve a crear
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Prepara un juego con un movimiento hecho.
+        
+        Recibe: Nada
+        Hace: Juega un 3 de una tirada 3-1 con el blanco
+        Devuelve: Nada
+        """
+        self.juego = BackgammonGame("Ana", "Beto")
+        self.juego.get_movimientos_disponibles().extend([3, 1])
+        self.juego.hacer_movimiento(8, 3)
+    
+    def test_contenido(self):
+        """
+        Prueba lo que guarda la foto.
+        
+        Recibe: Nada
+        Hace: Revisa conteos, turno, dados, banderas y cubo
+        Devuelve: Nada
+        """
+        foto = self.juego.snapshot()
+        self.assertEqual(foto.get_nombres(), ("Ana", "Beto"))
+        self.assertEqual(foto.get_conteos(), tuple(self.juego.get_tablero().get_conteos()))
+        self.assertEqual(foto.get_color_en_turno(), 'blanco')
+        self.assertEqual(foto.get_movimientos(), (1,))
+        self.assertEqual(foto.get_barra(), {'blanco': 0, 'negro': 0})
+        self.assertEqual(foto.get_sacadas(), {'blanco': 0, 'negro': 0})
+        self.assertFalse(foto.esta_terminado())
+        self.assertEqual(foto.get_ganador(), None)
+        self.assertEqual(foto.get_cubo(), (1, None))
+    
+    def test_inmutable(self):
+        """
+        Prueba que la foto no se puede modificar.
+        
+        Recibe: Nada
+        Hace: Intenta cambiar atributos y revisa que la foto no cambia al
+              seguir jugando
+        Devuelve: Nada
+        """
+        foto = self.juego.snapshot()
+        with self.assertRaises(AttributeError):
+            foto.color = 'negro'
+        with self.assertRaises(AttributeError):
+            foto.__datos__ = ()
+        
+        self.juego.hacer_movimiento(6, 1)
+        self.assertEqual(foto.get_movimientos(), (1,))
+        self.assertNotEqual(self.juego.snapshot(), foto)
+    
+    def test_restaurar(self):
+        """
+        Prueba que from_snapshot recrea el mismo juego.
+        
+        Recibe: Nada
+        Hace: Restaura y compara hash, dados, nombres y una nueva foto
+        Devuelve: Nada
+        """
+        foto = self.juego.snapshot()
+        dados = Dice(semilla=3)
+        copia = BackgammonGame.from_snapshot(foto, dados)
+        self.assertEqual(copia.get_hash(), self.juego.get_hash())
+        self.assertEqual(copia.get_movimientos_disponibles(), [1])
+        self.assertEqual(copia.get_jugador2().get_nombre(), "Beto")
+        self.assertIs(copia.get_dados(), dados)
+        self.assertEqual(copia.snapshot(), foto)
+        
+        # el juego restaurado se puede seguir jugando
+        self.assertTrue(copia.hacer_movimiento(6, 1))
+        self.assertEqual(copia.get_color_jugador_actual(), 'negro')
+    
+    def test_restaurar_terminado(self):
+        """
+        Prueba restaurar un juego terminado.
+        
+        Recibe: Nada
+        Hace: Arma una foto con el negro ganador
+        Devuelve: Nada
+        """
+        conteos = [0] * 26
+        conteos[3] = 4
+        foto = GameSnapshot("Ana", "Beto", conteos, (0, 0), (11, 15), 'blanco', (),
+                            True, 'negro', False)
+        juego = BackgammonGame.from_snapshot(foto)
+        self.assertTrue(juego.esta_terminado())
+        self.assertEqual(juego.get_ganador(), juego.get_jugador2())
+        self.assertEqual(juego.get_jugador1().get_fichas_sacadas(), 11)
+        self.assertEqual(juego.snapshot(), foto)
+    
+    def test_pickle_y_hash(self):
+        """
+        Prueba guardar la foto con pickle y usarla como clave.
+        
+        Recibe: Nada
+        Hace: Serializa, compara y mete la foto en un conjunto
+        Devuelve: Nada
+        """
+        foto = self.juego.snapshot()
+        leida = pickle.loads(pickle.dumps(foto))
+        self.assertEqual(leida, foto)
+        self.assertEqual(hash(leida), hash(foto))
+        self.assertEqual(len({foto, leida, self.juego.snapshot()}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
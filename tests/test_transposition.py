@@ -0,0 +1,134 @@
+import unittest
+from core.transposition import TranspositionTable, ENTRADAS_POR_BUCKET
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """
+    Clase de pruebas para la tabla de transposicion.
+    
+    Recibe: Nada
+    Hace: Prueba el limite de memoria, la politica de reemplazo y las estadisticas
+    Devuelve: Nada
+    """
+    
+    def setUp(self):
+        """
+        Prepara el ambiente antes de cada prueba.
+        
+        Recibe: Nada
+        Hace: Crea una tabla chica
+        Devuelve: Nada
+        """
+        self.__tabla__ = TranspositionTable(4096)
+    
+    def test_memoria_no_supera_el_limite(self):
+        """
+        Prueba que los arreglos entran en la memoria pedida.
+        
+        Recibe: Nada
+        Hace: Crea tablas de distintos tamaños
+        Devuelve: Nada
+        """
+        for memoria in (100, 4096, 100000):
+            tabla = TranspositionTable(memoria)
+            self.assertLessEqual(tabla.get_memoria(), memoria)
+            self.assertGreater(tabla.get_memoria(), memoria // 2)
+            self.assertEqual(tabla.get_capacidad() % ENTRADAS_POR_BUCKET, 0)
+    
+    def test_guardar_y_buscar(self):
+        """
+        Prueba guardar una posicion y volver a encontrarla.
+        
+        Recibe: Nada
+        Hace: Guarda profundidad, valor y jugada
+        Devuelve: Nada
+        """
+        jugada = ((8, 3), (6, 1))
+        self.__tabla__.guardar(12345, 2, 1.5, jugada)
+        
+        self.assertEqual(self.__tabla__.buscar(12345), (2, 1.5, jugada))
+        self.assertIsNone(self.__tabla__.buscar(54321))
+    
+    def test_codificar_jugada_ida_y_vuelta(self):
+        """
+        Prueba que las jugadas se guardan sin perder informacion.
+        
+        Recibe: Nada
+        Hace: Codifica jugadas con barra, dobles y vacia
+        Devuelve: Nada
+        """
+        for jugada in ((), ((0, 6),), ((24, 6), (24, 6), (18, 6), (13, 6)), ((1, 1), (19, 5))):
+            codigo = self.__tabla__.codificar_jugada(jugada)
+            self.assertLess(codigo, 2 ** 32)
+            self.assertEqual(self.__tabla__.decodificar_jugada(codigo), jugada)
+    
+    def test_misma_posicion_conserva_la_mas_profunda(self):
+        """
+        Prueba que un resultado menos profundo no pisa uno mas profundo.
+        
+        Recibe: Nada
+        Hace: Guarda la misma clave a profundidad 2 y luego 1
+        Devuelve: Nada
+        """
+        self.__tabla__.guardar(7, 2, 3.0)
+        self.__tabla__.guardar(7, 1, -1.0)
+        self.assertEqual(self.__tabla__.buscar(7)[1], 3.0)
+        
+        self.__tabla__.guardar(7, 2, 4.0)
+        self.assertEqual(self.__tabla__.buscar(7)[1], 4.0)
+    
+    def test_politica_de_reemplazo(self):
+        """
+        Prueba las dos entradas de un bucket.
+        
+        Recibe: Nada
+        Hace: Guarda varias claves que caen en el mismo bucket
+        Devuelve: Nada
+        """
+        buckets = self.__tabla__.get_capacidad() // ENTRADAS_POR_BUCKET
+        profunda = 5
+        superficial = 5 + buckets
+        otra = 5 + 2 * buckets
+        
+        self.__tabla__.guardar(profunda, 2, 1.0)
+        self.__tabla__.guardar(superficial, 1, 2.0)
+        self.assertIsNotNone(self.__tabla__.buscar(profunda))
+        self.assertIsNotNone(self.__tabla__.buscar(superficial))
+        
+        # la entrada de reemplazo se pisa siempre, la profunda se conserva
+        self.__tabla__.guardar(otra, 1, 3.0)
+        self.assertIsNotNone(self.__tabla__.buscar(profunda))
+        self.assertIsNone(self.__tabla__.buscar(superficial))
+        self.assertIsNotNone(self.__tabla__.buscar(otra))
+        
+        # una mas profunda desplaza a la primera a la de reemplazo
+        self.__tabla__.guardar(superficial, 3, 4.0)
+        self.assertEqual(self.__tabla__.buscar(superficial)[0], 3)
+        self.assertIsNotNone(self.__tabla__.buscar(profunda))
+        self.assertIsNone(self.__tabla__.buscar(otra))
+    
+    def test_estadisticas_y_limpiar(self):
+        """
+        Prueba los contadores de aciertos, fallos y ocupacion.
+        
+        Recibe: Nada
+        Hace: Busca claves guardadas y no guardadas y luego limpia
+        Devuelve: Nada
+        """
+        self.__tabla__.guardar(1, 1, 0.5)
+        self.__tabla__.buscar(1)
+        self.__tabla__.buscar(2)
+        
+        estadisticas = self.__tabla__.get_estadisticas()
+        self.assertEqual(estadisticas["aciertos"], 1)
+        self.assertEqual(estadisticas["fallos"], 1)
+        self.assertEqual(estadisticas["tasa_aciertos"], 0.5)
+        self.assertEqual(estadisticas["ocupadas"], 1)
+        
+        self.__tabla__.limpiar()
+        self.assertIsNone(self.__tabla__.buscar(1))
+        self.assertEqual(self.__tabla__.get_estadisticas()["ocupadas"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from core.board import Board
+from core.zobrist import Zobrist, CLAVES_ZOBRIST, MAXIMO_FICHAS
+
+
+class TestZobrist(unittest.TestCase):
+    """
+    Clase de pruebas para la tabla de claves Zobrist.
+    
+    Recibe: Nada
+    Hace: Prueba la generacion de claves y el calculo del hash
+    Devuelve: Nada
+    """
+    
+    def test_misma_semilla_mismas_claves(self):
+        """
+        Prueba que la semilla fija genera siempre las mismas claves.
+        
+        Recibe: Nada
+        Hace: Compara dos tablas con la misma semilla y una distinta
+        Devuelve: Nada
+        """
+        tabla1 = Zobrist(5)
+        tabla2 = Zobrist(5)
+        tabla3 = Zobrist(6)
+        
+        self.assertEqual(tabla1.get_clave('blanco', 24, 2), tabla2.get_clave('blanco', 24, 2))
+        self.assertEqual(tabla1.get_clave_turno(), tabla2.get_clave_turno())
+        self.assertNotEqual(tabla1.get_clave('negro', 1, 2), tabla3.get_clave('negro', 1, 2))
+    
+    def test_claves_de_punto_vacio_valen_cero(self):
+        """
+        Prueba que tener cero fichas no cambia el hash.
+        
+        Recibe: Nada
+        Hace: Revisa la clave de cantidad 0 y el rango de la tabla
+        Devuelve: Nada
+        """
+        self.assertEqual(CLAVES_ZOBRIST.get_clave('blanco', 0, 0), 0)
+        self.assertEqual(CLAVES_ZOBRIST.get_clave('negro', 25, 0), 0)
+        clave = CLAVES_ZOBRIST.get_clave('negro', 25, MAXIMO_FICHAS)
+        self.assertTrue(0 < clave < 2 ** 64)
+    
+    def test_calcular_hash_tablero_inicial(self):
+        """
+        Prueba el hash calculado desde cero del tablero inicial.
+        
+        Recibe: Nada
+        Hace: Combina a mano las claves de las fichas iniciales
+        Devuelve: Nada
+        """
+        esperado = 0
+        for punto, cantidad in ((24, 2), (13, 5), (8, 3), (6, 5)):
+            esperado = esperado ^ CLAVES_ZOBRIST.get_clave('blanco', punto, cantidad)
+        for punto, cantidad in ((1, 2), (12, 5), (17, 3), (19, 5)):
+            esperado = esperado ^ CLAVES_ZOBRIST.get_clave('negro', punto, cantidad)
+        
+        self.assertEqual(CLAVES_ZOBRIST.calcular_hash(Board()), esperado)
+    
+    def test_clave_dados(self):
+        """
+        Prueba las claves de los dados que quedan por jugar.
+        
+        Recibe: Nada
+        Hace: Compara tiradas en distinto orden y dobles parciales
+        Devuelve: Nada
+        """
+        self.assertEqual(CLAVES_ZOBRIST.get_clave_dados([3, 1]), CLAVES_ZOBRIST.get_clave_dados([1, 3]))
+        self.assertNotEqual(CLAVES_ZOBRIST.get_clave_dados([3]), CLAVES_ZOBRIST.get_clave_dados([3, 3, 3, 3]))
+        self.assertEqual(CLAVES_ZOBRIST.get_clave_dados([]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()